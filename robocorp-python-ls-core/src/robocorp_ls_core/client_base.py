@@ -11,7 +11,8 @@ from robocorp_ls_core.protocols import (
     IMonitor,
     IRequestHandler,
 )
-from typing import Any, Union, Optional, List, Callable, Dict
+from typing import Any, Union, Optional, List, Callable, Dict, Iterator
+from contextlib import contextmanager
 from robocorp_ls_core.callbacks import Callback
 
 log = get_logger(__name__)
@@ -322,6 +323,17 @@ class LanguageServerClientBase(object):
         t.start()
         self.require_exit_messages = True
         self.next_id = partial(next, itertools.count())
+        self._tls = threading.local()
+
+    @implements(ILanguageServerClientBase.forward_raw_results)
+    @contextmanager
+    def forward_raw_results(self) -> Iterator[None]:
+        initial = getattr(self._tls, "forward_raw_results", False)
+        self._tls.forward_raw_results = True
+        try:
+            yield
+        finally:
+            self._tls.forward_raw_results = initial
 
     @implements(ILanguageServerClientBase.register_request_handler)
     def register_request_handler(self, message: str, handler: IRequestHandler) -> None:
@@ -334,7 +346,15 @@ class LanguageServerClientBase(object):
         if message_matcher is None:
             return None
 
+        keep_raw_result = getattr(self._tls, "forward_raw_results", False) and hasattr(
+            self.reader, "keep_raw_result"
+        )
+        if keep_raw_result:
+            self.reader.keep_raw_result(message_id)
+
         if not self.write(contents):
+            if keep_raw_result:
+                self.reader.discard_raw_result(message_id)
             return None
 
         return message_matcher
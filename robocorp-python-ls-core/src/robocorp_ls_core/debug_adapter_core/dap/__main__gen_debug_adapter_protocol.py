@@ -16,11 +16,15 @@
 # limitations under the License.
 
 """
-Run this module to regenerate the `dap_schema.py` file.
+Run this module to regenerate the `dap_schema.py` (and `dap_schema.pyi`) file.
 
 Note that it'll generate it based on the current debugProtocol.json. Erase it and rerun
 to download the latest version.
 
+Note: the classes in `dap_schema.py` are only created when first used (each
+class is created by a factory registered with `register_class_factory`) and
+`dap_schema.pyi` has the class declarations for type-checking.
+
 Based on: https://github.com/fabioz/PyDev.Debugger/blob/master/_pydevd_bundle/_debug_adapter/__main__pydevd_gen_debug_adapter_protocol.py
 """
 
@@ -256,8 +260,7 @@ def update_class_to_generate_type(classes_to_generate, class_to_generate):
 
 def update_class_to_generate_register_dec(classes_to_generate, class_to_generate):
     # Default
-    class_to_generate["register_request"] = ""
-    class_to_generate["register_dec"] = "@register"
+    class_to_generate["register_args"] = ""
 
     properties = class_to_generate.get("properties")
     enum_type = properties.get("type", {}).get("enum")
@@ -293,12 +296,32 @@ def update_class_to_generate_register_dec(classes_to_generate, class_to_generate
         if command:
             enum = command.get("enum")
             if enum and len(enum) == 1:
-                class_to_generate["register_request"] = "@register_%s(%r)\n" % (
+                class_to_generate["register_args"] = ", %s=%r" % (
                     msg_type,
                     enum[0],
                 )
 
 
+def update_class_to_generate_dependencies(class_to_generate):
+    # The classes which are referenced by the generated code (and thus must be
+    # created along with the class).
+    dependencies = _OrderedSet()
+    for _prop_name, prop in class_to_generate["properties"].items():
+        if prop["type"].__class__ == Ref:
+            dependencies.add(str(prop["type"]))
+
+        elif prop["type"] == "array":
+            ref = prop["items"].get("$ref")
+            if ref is not None:
+                dependencies.add(ref.split("/")[-1])
+
+    dependencies.discard(class_to_generate["name"])
+    if dependencies:
+        class_to_generate["register_args"] = (
+            ", dependencies=(%s,)" % ", ".join(repr(x) for x in dependencies)
+        ) + class_to_generate["register_args"]
+
+
 def extract_prop_name_and_prop(class_to_generate):
     properties = class_to_generate.get("properties")
     required = _OrderedSet(class_to_generate.get("required", _OrderedSet()))
@@ -572,6 +595,7 @@ def update_class_to_generate_init(class_to_generate):
     args = ", ".join(args)
     if args:
         args = ", " + args
+    class_to_generate["init_args"] = args
 
     # Note: added kwargs because some messages are expected to be extended by the user (so, we'll actually
     # make all extendable so that we don't have to worry about which ones -- we loose a little on typing,
@@ -618,16 +642,27 @@ def update_class_to_generate_refs(class_to_generate):
 
 def update_class_to_generate_enums(class_to_generate):
     class_to_generate["enums"] = ""
+    class_to_generate["stub_enums"] = ""
     if class_to_generate.get("is_enum", False):
         enums = ""
+        stub_enums = ""
         for enum in class_to_generate["enum_values"]:
             enums += "    %s = %r\n" % (enum.upper(), enum)
+            stub_enums += "    %s: str\n" % (enum.upper(),)
         enums += "\n"
         enums += (
             "    VALID_VALUES = %s\n\n"
             % _OrderedSet(class_to_generate["enum_values"]).set_repr()
         )
+        stub_enums += "    VALID_VALUES: Set[str]\n"
         class_to_generate["enums"] = enums
+        class_to_generate["stub_enums"] = stub_enums
+
+
+def update_class_to_generate_stub_props(class_to_generate):
+    class_to_generate["stub_props"] = "".join(
+        "    %s: Any\n" % (prop_name,) for prop_name in class_to_generate["properties"]
+    )
 
 
 def update_class_to_generate_objects(classes_to_generate, class_to_generate):
@@ -687,10 +722,18 @@ def gen_debugger_protocol():
         update_class_to_generate_enums(class_to_generate)
         update_class_to_generate_to_json(class_to_generate)
         update_class_to_generate_register_dec(classes_to_generate, class_to_generate)
+        update_class_to_generate_dependencies(class_to_generate)
+        update_class_to_generate_stub_props(class_to_generate)
 
-    class_template = '''
-%(register_request)s%(register_dec)s
-class %(name)s(BaseSchema):
+    factory_template = """
+@register_class_factory(%(name)r%(register_args)s)
+def _create_%(name)s():
+%(class_contents)s
+
+    return %(name)s
+"""
+
+    class_template = '''class %(name)s(BaseSchema):
     """
 %(description)s
 
@@ -704,28 +747,66 @@ class %(name)s(BaseSchema):
 
 %(init)s%(update_dict_ids_from_dap)s
 
-%(to_dict)s%(update_dict_ids_to_dap)s
-'''
+%(to_dict)s%(update_dict_ids_to_dap)s'''
+
+    stub_template = """
+class %(name)s(BaseSchema):
+%(stub_enums)s    __props__: Dict[str, Any]
+    __refs__: Set[str]
+%(stub_props)s    kwargs: Dict[str, Any]
+
+    def __init__(self%(init_args)s, update_ids_from_dap=False, **kwargs) -> None: ...
+"""
 
-    contents = []
-    contents.append("# coding: utf-8")
-    contents.append("# fmt: off")
-    contents.append("# Automatically generated code.")
-    contents.append("# Do not edit manually.")
-    contents.append("# Generated by running: %s" % os.path.basename(__file__))
+    header = [
+        "# coding: utf-8",
+        "# fmt: off",
+        "# Automatically generated code.",
+        "# Do not edit manually.",
+        "# Generated by running: %s" % os.path.basename(__file__),
+    ]
+
+    contents = header[:]
     contents.append(
-        "from .dap_base_schema import BaseSchema, register, register_request, register_response, register_event"
+        "from .dap_base_schema import BaseSchema, register_class_factory, get_class"
     )
     contents.append("")
     for class_to_generate in classes_to_generate.values():
-        contents.append(class_template % class_to_generate)
+        class_contents = _indent_non_empty_lines(class_template % class_to_generate)
+        contents.append(
+            factory_template
+            % dict(class_to_generate, class_contents=class_contents.rstrip())
+        )
+
+    contents.append(
+        """
+def __getattr__(name):
+    try:
+        return get_class(name)
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
+"""
+    )
     contents.append("# fmt: on")
     contents.append("")
+
+    stub_contents = header[:]
+    stub_contents.append("from typing import Any, Dict, Set")
+    stub_contents.append("from .dap_base_schema import BaseSchema")
+    stub_contents.append("")
+    for class_to_generate in classes_to_generate.values():
+        stub_contents.append(stub_template % class_to_generate)
+    stub_contents.append("# fmt: on")
+    stub_contents.append("")
+
     parent_dir = os.path.dirname(__file__)
-    schema = os.path.join(parent_dir, "dap_schema.py")
-    with open(schema, "w", encoding="utf-8") as stream:
-        stream.write("\n".join(contents))
+    for filename, file_contents in (
+        ("dap_schema.py", contents),
+        ("dap_schema.pyi", stub_contents),
+    ):
+        with open(os.path.join(parent_dir, filename), "w", encoding="utf-8") as stream:
+            stream.write("\n".join(file_contents))
 
 
 def _indent_lines(lines, indent="    "):
@@ -736,6 +817,16 @@ def _indent_lines(lines, indent="    "):
     return "".join(out_lines)
 
 
+def _indent_non_empty_lines(lines, indent="    "):
+    out_lines = []
+    for line in lines.splitlines(keepends=True):
+        if line.strip():
+            line = indent + line
+        out_lines.append(line)
+
+    return "".join(out_lines)
+
+
 if __name__ == "__main__":
 
     gen_debugger_protocol()
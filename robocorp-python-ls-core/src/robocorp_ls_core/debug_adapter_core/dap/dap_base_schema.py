@@ -16,7 +16,9 @@
 # limitations under the License.
 import json
 import itertools
+import threading
 from functools import partial
+from types import FunctionType
 from robocorp_ls_core.robotframework_log import get_logger
 
 log = get_logger(__name__)
@@ -70,17 +72,108 @@ class BaseSchema(object):
 
 BaseSchema.initialize_ids_translation()
 
+# Note: the values in the dicts below may be the class or the class name (when
+# registered through `register_class_factory` the class is only created on
+# the first use -- see: `get_class`).
 _requests_to_types = {}
 _responses_to_types = {}
 _event_to_types = {}
 _all_messages = {}
 
+_class_name_to_factory = {}
+_create_classes_lock = threading.RLock()
+
 
 def register(cls):
     _all_messages[cls.__name__] = cls
     return cls
 
 
+def register_class_factory(
+    name, dependencies=(), request=None, response=None, event=None
+):
+    """
+    Registers a function which creates the class with the given name when it's
+    first needed (the class is made available in the module where the factory
+    is defined along with the classes it depends on).
+
+    :param dependencies:
+        The names of the classes which the created class references.
+    """
+
+    def do_register(factory):
+        _class_name_to_factory[name] = (factory, dependencies)
+        if request is not None:
+            _requests_to_types[request] = name
+        if response is not None:
+            _responses_to_types[response] = name
+        if event is not None:
+            _event_to_types[event] = name
+        return factory
+
+    return do_register
+
+
+def get_class(name):
+    """
+    Provides the class with the given name (creating it if it was registered
+    through `register_class_factory` and wasn't created yet).
+
+    :raises KeyError: if there's no class registered with the given name.
+    """
+    cls = _all_messages.get(name)
+    if cls is not None:
+        return cls
+
+    with _create_classes_lock:
+        cls = _all_messages.get(name)
+        if cls is not None:
+            return cls
+
+        # Create the class and all the classes it references which weren't
+        # created yet (they're only published after all are created so that
+        # a class is never visible before the classes it references).
+        name_to_factory = {}
+        stack = [name]
+        while stack:
+            check_name = stack.pop()
+            if check_name in name_to_factory or check_name in _all_messages:
+                continue
+            factory, dependencies = _class_name_to_factory[check_name]
+            name_to_factory[check_name] = factory
+            stack.extend(dependencies)
+
+        name_to_cls = {}
+        module_globals_and_classes = {}
+        for check_name, factory in name_to_factory.items():
+            cls = name_to_cls[check_name] = factory()
+            _fix_qualname(cls, check_name)
+            module_globals_and_classes.setdefault(
+                id(factory.__globals__), (factory.__globals__, {})
+            )[1][check_name] = cls
+
+        for module_globals, classes in module_globals_and_classes.values():
+            module_globals.update(classes)
+        _all_messages.update(name_to_cls)
+        return name_to_cls[name]
+
+
+def _fix_qualname(cls, name):
+    # The class is created inside the factory function: fix the qualified
+    # names to be the same as they'd be if it was created at the module level.
+    cls.__qualname__ = name
+    for attr in cls.__dict__.values():
+        func = getattr(attr, "__func__", attr)
+        if isinstance(func, FunctionType):
+            func.__qualname__ = "%s.%s" % (name, func.__name__)
+
+
+def _get_registered_class(cls_or_name):
+    if cls_or_name.__class__ is str:
+        return get_class(cls_or_name)
+    return cls_or_name
+
+
 def register_request(command):
     def do_register(cls):
         _requests_to_types[command] = cls
@@ -124,6 +217,8 @@ def from_dict(dct, update_ids_from_dap=False, cls=None):
             use = dct["event"]
 
         cls = to_type.get(use)
+        if cls is not None:
+            cls = _get_registered_class(cls)
 
     if cls is None:
         raise ValueError(
@@ -149,7 +244,7 @@ def from_json(json_msg, update_ids_from_dap=False, on_dict_loaded=lambda dct: No
     except:
         if as_dict.get("type") == "response" and not as_dict.get("success"):
             # Error messages may not have required body (return as a generic Response).
-            Response = _all_messages["Response"]
+            Response = get_class("Response")
             return Response(**as_dict)
         else:
             raise
@@ -157,8 +252,8 @@ def from_json(json_msg, update_ids_from_dap=False, on_dict_loaded=lambda dct: No
 
 def get_response_class(request):
     if request.__class__ == dict:
-        return _responses_to_types[request["command"]]
-    return _responses_to_types[request.command]
+        return _get_registered_class(_responses_to_types[request["command"]])
+    return _get_registered_class(_responses_to_types[request.command])
 
 
 def build_response(request, kwargs=None):
@@ -167,6 +262,6 @@ def build_response(request, kwargs=None):
     else:
         if "success" not in kwargs:
             kwargs["success"] = True
-    response_class = _responses_to_types[request.command]
+    response_class = _get_registered_class(_responses_to_types[request.command])
     kwargs.setdefault("seq", -1)  # To be overwritten before sending
     return response_class(command=request.command, request_seq=request.seq, **kwargs)
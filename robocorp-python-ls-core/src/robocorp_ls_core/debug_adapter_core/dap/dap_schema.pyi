@@ -0,0 +1,2937 @@
+# coding: utf-8
+# fmt: off
+# Automatically generated code.
+# Do not edit manually.
+# Generated by running: __main__gen_debug_adapter_protocol.py
+from typing import Any, Dict, Set
+from .dap_base_schema import BaseSchema
+
+
+class ProtocolMessage(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, type, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Request(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, command, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Event(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, event, seq=-1, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Response(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ErrorResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CancelRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CancelArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    requestId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, requestId=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CancelResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class InitializedEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StoppedEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ContinuedEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExitedEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class TerminatedEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ThreadEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class OutputEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class BreakpointEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ModuleEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LoadedSourceEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ProcessEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CapabilitiesEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RunInTerminalRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RunInTerminalRequestArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kind: Any
+    title: Any
+    cwd: Any
+    args: Any
+    env: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, cwd, args, kind=None, title=None, env=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RunInTerminalResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class InitializeRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class InitializeRequestArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    clientID: Any
+    clientName: Any
+    adapterID: Any
+    locale: Any
+    linesStartAt1: Any
+    columnsStartAt1: Any
+    pathFormat: Any
+    supportsVariableType: Any
+    supportsVariablePaging: Any
+    supportsRunInTerminalRequest: Any
+    supportsMemoryReferences: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, adapterID, clientID=None, clientName=None, locale=None, linesStartAt1=None, columnsStartAt1=None, pathFormat=None, supportsVariableType=None, supportsVariablePaging=None, supportsRunInTerminalRequest=None, supportsMemoryReferences=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class InitializeResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ConfigurationDoneRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ConfigurationDoneArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ConfigurationDoneResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LaunchRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LaunchRequestArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    noDebug: Any
+    __restart: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, noDebug=None, __restart=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LaunchResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class AttachRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class AttachRequestArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    __restart: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, __restart=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class AttachResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RestartRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RestartArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RestartResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DisconnectRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DisconnectArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    restart: Any
+    terminateDebuggee: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, restart=None, terminateDebuggee=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DisconnectResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class TerminateRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class TerminateArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    restart: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, restart=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class TerminateResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class BreakpointLocationsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class BreakpointLocationsArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    source: Any
+    line: Any
+    column: Any
+    endLine: Any
+    endColumn: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, source, line, column=None, endLine=None, endColumn=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class BreakpointLocationsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetBreakpointsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetBreakpointsArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    source: Any
+    breakpoints: Any
+    lines: Any
+    sourceModified: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, source, breakpoints=None, lines=None, sourceModified=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetBreakpointsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetFunctionBreakpointsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetFunctionBreakpointsArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    breakpoints: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetFunctionBreakpointsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetExceptionBreakpointsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetExceptionBreakpointsArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    filters: Any
+    exceptionOptions: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, filters, exceptionOptions=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetExceptionBreakpointsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DataBreakpointInfoRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DataBreakpointInfoArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    variablesReference: Any
+    name: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name, variablesReference=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DataBreakpointInfoResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetDataBreakpointsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetDataBreakpointsArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    breakpoints: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetDataBreakpointsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ContinueRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ContinueArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ContinueResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class NextRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class NextArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class NextResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepInRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepInArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    targetId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, targetId=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepInResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepOutRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepOutArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepOutResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepBackRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepBackArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepBackResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ReverseContinueRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ReverseContinueArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ReverseContinueResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RestartFrameRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RestartFrameArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    frameId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, frameId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RestartFrameResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class GotoRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class GotoArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    targetId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, targetId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class GotoResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PauseRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PauseArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PauseResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StackTraceRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StackTraceArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    startFrame: Any
+    levels: Any
+    format: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, startFrame=None, levels=None, format=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StackTraceResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ScopesRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ScopesArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    frameId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, frameId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ScopesResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class VariablesRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class VariablesArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    variablesReference: Any
+    filter: Any
+    start: Any
+    count: Any
+    format: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, variablesReference, filter=None, start=None, count=None, format=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class VariablesResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetVariableRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetVariableArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    variablesReference: Any
+    name: Any
+    value: Any
+    format: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, variablesReference, name, value, format=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetVariableResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SourceRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SourceArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    source: Any
+    sourceReference: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, sourceReference, source=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SourceResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ThreadsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ThreadsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class TerminateThreadsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class TerminateThreadsArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadIds: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadIds=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class TerminateThreadsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ModulesRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ModulesArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    startModule: Any
+    moduleCount: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, startModule=None, moduleCount=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ModulesResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LoadedSourcesRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LoadedSourcesArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LoadedSourcesResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class EvaluateRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class EvaluateArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    expression: Any
+    frameId: Any
+    context: Any
+    format: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, expression, frameId=None, context=None, format=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class EvaluateResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetExpressionRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetExpressionArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    expression: Any
+    value: Any
+    frameId: Any
+    format: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, expression, value, frameId=None, format=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetExpressionResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepInTargetsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepInTargetsArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    frameId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, frameId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepInTargetsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class GotoTargetsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class GotoTargetsArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    source: Any
+    line: Any
+    column: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, source, line, column=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class GotoTargetsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CompletionsRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CompletionsArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    frameId: Any
+    text: Any
+    column: Any
+    line: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, text, column, frameId=None, line=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CompletionsResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExceptionInfoRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExceptionInfoArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExceptionInfoResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ReadMemoryRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ReadMemoryArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    memoryReference: Any
+    offset: Any
+    count: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, memoryReference, count, offset=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ReadMemoryResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DisassembleRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DisassembleArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    memoryReference: Any
+    offset: Any
+    instructionOffset: Any
+    instructionCount: Any
+    resolveSymbols: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, memoryReference, instructionCount, offset=None, instructionOffset=None, resolveSymbols=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DisassembleResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Capabilities(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    supportsConfigurationDoneRequest: Any
+    supportsFunctionBreakpoints: Any
+    supportsConditionalBreakpoints: Any
+    supportsHitConditionalBreakpoints: Any
+    supportsEvaluateForHovers: Any
+    exceptionBreakpointFilters: Any
+    supportsStepBack: Any
+    supportsSetVariable: Any
+    supportsRestartFrame: Any
+    supportsGotoTargetsRequest: Any
+    supportsStepInTargetsRequest: Any
+    supportsCompletionsRequest: Any
+    completionTriggerCharacters: Any
+    supportsModulesRequest: Any
+    additionalModuleColumns: Any
+    supportedChecksumAlgorithms: Any
+    supportsRestartRequest: Any
+    supportsExceptionOptions: Any
+    supportsValueFormattingOptions: Any
+    supportsExceptionInfoRequest: Any
+    supportTerminateDebuggee: Any
+    supportsDelayedStackTraceLoading: Any
+    supportsLoadedSourcesRequest: Any
+    supportsLogPoints: Any
+    supportsTerminateThreadsRequest: Any
+    supportsSetExpression: Any
+    supportsTerminateRequest: Any
+    supportsDataBreakpoints: Any
+    supportsReadMemoryRequest: Any
+    supportsDisassembleRequest: Any
+    supportsCancelRequest: Any
+    supportsBreakpointLocationsRequest: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, supportsConfigurationDoneRequest=None, supportsFunctionBreakpoints=None, supportsConditionalBreakpoints=None, supportsHitConditionalBreakpoints=None, supportsEvaluateForHovers=None, exceptionBreakpointFilters=None, supportsStepBack=None, supportsSetVariable=None, supportsRestartFrame=None, supportsGotoTargetsRequest=None, supportsStepInTargetsRequest=None, supportsCompletionsRequest=None, completionTriggerCharacters=None, supportsModulesRequest=None, additionalModuleColumns=None, supportedChecksumAlgorithms=None, supportsRestartRequest=None, supportsExceptionOptions=None, supportsValueFormattingOptions=None, supportsExceptionInfoRequest=None, supportTerminateDebuggee=None, supportsDelayedStackTraceLoading=None, supportsLoadedSourcesRequest=None, supportsLogPoints=None, supportsTerminateThreadsRequest=None, supportsSetExpression=None, supportsTerminateRequest=None, supportsDataBreakpoints=None, supportsReadMemoryRequest=None, supportsDisassembleRequest=None, supportsCancelRequest=None, supportsBreakpointLocationsRequest=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExceptionBreakpointsFilter(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    filter: Any
+    label: Any
+    default: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, filter, label, default=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Message(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    id: Any
+    format: Any
+    variables: Any
+    sendTelemetry: Any
+    showUser: Any
+    url: Any
+    urlLabel: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, id, format, variables=None, sendTelemetry=None, showUser=None, url=None, urlLabel=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Module(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    id: Any
+    name: Any
+    path: Any
+    isOptimized: Any
+    isUserCode: Any
+    version: Any
+    symbolStatus: Any
+    symbolFilePath: Any
+    dateTimeStamp: Any
+    addressRange: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, id, name, path=None, isOptimized=None, isUserCode=None, version=None, symbolStatus=None, symbolFilePath=None, dateTimeStamp=None, addressRange=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ColumnDescriptor(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    attributeName: Any
+    label: Any
+    format: Any
+    type: Any
+    width: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, attributeName, label, format=None, type=None, width=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ModulesViewDescriptor(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    columns: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, columns, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Thread(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    id: Any
+    name: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, id, name, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Source(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    path: Any
+    sourceReference: Any
+    presentationHint: Any
+    origin: Any
+    sources: Any
+    adapterData: Any
+    checksums: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name=None, path=None, sourceReference=None, presentationHint=None, origin=None, sources=None, adapterData=None, checksums=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StackFrame(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    id: Any
+    name: Any
+    source: Any
+    line: Any
+    column: Any
+    endLine: Any
+    endColumn: Any
+    instructionPointerReference: Any
+    moduleId: Any
+    presentationHint: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, id, name, line, column, source=None, endLine=None, endColumn=None, instructionPointerReference=None, moduleId=None, presentationHint=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Scope(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    presentationHint: Any
+    variablesReference: Any
+    namedVariables: Any
+    indexedVariables: Any
+    expensive: Any
+    source: Any
+    line: Any
+    column: Any
+    endLine: Any
+    endColumn: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name, variablesReference, expensive, presentationHint=None, namedVariables=None, indexedVariables=None, source=None, line=None, column=None, endLine=None, endColumn=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Variable(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    value: Any
+    type: Any
+    presentationHint: Any
+    evaluateName: Any
+    variablesReference: Any
+    namedVariables: Any
+    indexedVariables: Any
+    memoryReference: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name, value, variablesReference, type=None, presentationHint=None, evaluateName=None, namedVariables=None, indexedVariables=None, memoryReference=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class VariablePresentationHint(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kind: Any
+    attributes: Any
+    visibility: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, kind=None, attributes=None, visibility=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class BreakpointLocation(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    line: Any
+    column: Any
+    endLine: Any
+    endColumn: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, line, column=None, endLine=None, endColumn=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SourceBreakpoint(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    line: Any
+    column: Any
+    condition: Any
+    hitCondition: Any
+    logMessage: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, line, column=None, condition=None, hitCondition=None, logMessage=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class FunctionBreakpoint(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    condition: Any
+    hitCondition: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name, condition=None, hitCondition=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DataBreakpointAccessType(BaseSchema):
+    READ: str
+    WRITE: str
+    READWRITE: str
+    VALID_VALUES: Set[str]
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DataBreakpoint(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    dataId: Any
+    accessType: Any
+    condition: Any
+    hitCondition: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, dataId, accessType=None, condition=None, hitCondition=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Breakpoint(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    id: Any
+    verified: Any
+    message: Any
+    source: Any
+    line: Any
+    column: Any
+    endLine: Any
+    endColumn: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, verified, id=None, message=None, source=None, line=None, column=None, endLine=None, endColumn=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepInTarget(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    id: Any
+    label: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, id, label, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class GotoTarget(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    id: Any
+    label: Any
+    line: Any
+    column: Any
+    endLine: Any
+    endColumn: Any
+    instructionPointerReference: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, id, label, line, column=None, endLine=None, endColumn=None, instructionPointerReference=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CompletionItem(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    label: Any
+    text: Any
+    sortText: Any
+    type: Any
+    start: Any
+    length: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, label, text=None, sortText=None, type=None, start=None, length=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CompletionItemType(BaseSchema):
+    METHOD: str
+    FUNCTION: str
+    CONSTRUCTOR: str
+    FIELD: str
+    VARIABLE: str
+    CLASS: str
+    INTERFACE: str
+    MODULE: str
+    PROPERTY: str
+    UNIT: str
+    VALUE: str
+    ENUM: str
+    KEYWORD: str
+    SNIPPET: str
+    TEXT: str
+    COLOR: str
+    FILE: str
+    REFERENCE: str
+    CUSTOMCOLOR: str
+    VALID_VALUES: Set[str]
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ChecksumAlgorithm(BaseSchema):
+    MD5: str
+    SHA1: str
+    SHA256: str
+    TIMESTAMP: str
+    VALID_VALUES: Set[str]
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class Checksum(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    algorithm: Any
+    checksum: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, algorithm, checksum, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ValueFormat(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    hex: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, hex=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StackFrameFormat(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    hex: Any
+    parameters: Any
+    parameterTypes: Any
+    parameterNames: Any
+    parameterValues: Any
+    line: Any
+    module: Any
+    includeAll: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, hex=None, parameters=None, parameterTypes=None, parameterNames=None, parameterValues=None, line=None, module=None, includeAll=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExceptionOptions(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    path: Any
+    breakMode: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, breakMode, path=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExceptionBreakMode(BaseSchema):
+    NEVER: str
+    ALWAYS: str
+    UNHANDLED: str
+    USERUNHANDLED: str
+    VALID_VALUES: Set[str]
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExceptionPathSegment(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    negate: Any
+    names: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, names, negate=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExceptionDetails(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    message: Any
+    typeName: Any
+    fullTypeName: Any
+    evaluateName: Any
+    stackTrace: Any
+    innerException: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, message=None, typeName=None, fullTypeName=None, evaluateName=None, stackTrace=None, innerException=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DisassembledInstruction(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    address: Any
+    instructionBytes: Any
+    instruction: Any
+    symbol: Any
+    location: Any
+    line: Any
+    column: Any
+    endLine: Any
+    endColumn: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, address, instruction, instructionBytes=None, symbol=None, location=None, line=None, column=None, endLine=None, endColumn=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LogMessageEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StartSuiteEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StartTestEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class EndTestEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class EndSuiteEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetDebuggerPropertyRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetDebuggerPropertyArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    ideOS: Any
+    dontTraceStartPatterns: Any
+    dontTraceEndPatterns: Any
+    skipSuspendOnBreakpointException: Any
+    skipPrintBreakpointException: Any
+    multiThreadsSingleNotification: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, ideOS=None, dontTraceStartPatterns=None, dontTraceEndPatterns=None, skipSuspendOnBreakpointException=None, skipPrintBreakpointException=None, multiThreadsSingleNotification=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetDebuggerPropertyResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdInputRequestedEvent(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    event: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetPydevdSourceMapRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetPydevdSourceMapArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    source: Any
+    pydevdSourceMaps: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, source, pydevdSourceMaps=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetPydevdSourceMapResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, seq=-1, message=None, body=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdSourceMap(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    line: Any
+    endLine: Any
+    runtimeSource: Any
+    runtimeLine: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, line, endLine, runtimeSource, runtimeLine, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdSystemInfoRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdSystemInfoArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdSystemInfoResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdPythonInfo(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    version: Any
+    implementation: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, version=None, implementation=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdPythonImplementationInfo(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    version: Any
+    description: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name=None, version=None, description=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdPlatformInfo(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdProcessInfo(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    pid: Any
+    ppid: Any
+    executable: Any
+    bitness: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, pid=None, ppid=None, executable=None, bitness=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdInfo(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    usingCython: Any
+    usingFrameEval: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, usingCython=None, usingFrameEval=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdAuthorizeRequest(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    command: Any
+    arguments: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdAuthorizeArguments(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    debugServerAccessToken: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, debugServerAccessToken=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdAuthorizeResponse(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    seq: Any
+    type: Any
+    request_seq: Any
+    success: Any
+    command: Any
+    message: Any
+    body: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ErrorResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    error: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, error=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StoppedEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    reason: Any
+    description: Any
+    threadId: Any
+    preserveFocusHint: Any
+    text: Any
+    allThreadsStopped: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, reason, description=None, threadId=None, preserveFocusHint=None, text=None, allThreadsStopped=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ContinuedEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threadId: Any
+    allThreadsContinued: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threadId, allThreadsContinued=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExitedEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    exitCode: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, exitCode, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class TerminatedEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    restart: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, restart=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ThreadEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    reason: Any
+    threadId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, reason, threadId, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class OutputEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    category: Any
+    output: Any
+    variablesReference: Any
+    source: Any
+    line: Any
+    column: Any
+    data: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, output, category=None, variablesReference=None, source=None, line=None, column=None, data=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class BreakpointEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    reason: Any
+    breakpoint: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, reason, breakpoint, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ModuleEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    reason: Any
+    module: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, reason, module, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LoadedSourceEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    reason: Any
+    source: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, reason, source, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ProcessEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    systemProcessId: Any
+    isLocalProcess: Any
+    startMethod: Any
+    pointerSize: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name, systemProcessId=None, isLocalProcess=None, startMethod=None, pointerSize=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CapabilitiesEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    capabilities: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, capabilities, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RunInTerminalRequestArgumentsEnv(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class RunInTerminalResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    processId: Any
+    shellProcessId: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, processId=None, shellProcessId=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class BreakpointLocationsResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    breakpoints: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetBreakpointsResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    breakpoints: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetFunctionBreakpointsResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    breakpoints: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DataBreakpointInfoResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    dataId: Any
+    description: Any
+    accessTypes: Any
+    canPersist: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, dataId, description, accessTypes=None, canPersist=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetDataBreakpointsResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    breakpoints: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ContinueResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    allThreadsContinued: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, allThreadsContinued=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StackTraceResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    stackFrames: Any
+    totalFrames: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, stackFrames, totalFrames=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ScopesResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    scopes: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, scopes, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class VariablesResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    variables: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, variables, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetVariableResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    value: Any
+    type: Any
+    variablesReference: Any
+    namedVariables: Any
+    indexedVariables: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, value, type=None, variablesReference=None, namedVariables=None, indexedVariables=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SourceResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    content: Any
+    mimeType: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, content, mimeType=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ThreadsResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    threads: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, threads, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ModulesResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    modules: Any
+    totalModules: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, modules, totalModules=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LoadedSourcesResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    sources: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, sources, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class EvaluateResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    result: Any
+    type: Any
+    presentationHint: Any
+    variablesReference: Any
+    namedVariables: Any
+    indexedVariables: Any
+    memoryReference: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, result, variablesReference, type=None, presentationHint=None, namedVariables=None, indexedVariables=None, memoryReference=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class SetExpressionResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    value: Any
+    type: Any
+    presentationHint: Any
+    variablesReference: Any
+    namedVariables: Any
+    indexedVariables: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, value, type=None, presentationHint=None, variablesReference=None, namedVariables=None, indexedVariables=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StepInTargetsResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    targets: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, targets, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class GotoTargetsResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    targets: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, targets, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class CompletionsResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    targets: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, targets, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ExceptionInfoResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    exceptionId: Any
+    description: Any
+    breakMode: Any
+    details: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, exceptionId, breakMode, description=None, details=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class ReadMemoryResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    address: Any
+    unreadableBytes: Any
+    data: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, address, unreadableBytes=None, data=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class DisassembleResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    instructions: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, instructions, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class MessageVariables(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    kwargs: Dict[str, Any]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class LogMessageEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    message: Any
+    source: Any
+    testName: Any
+    testOrSuiteSource: Any
+    lineno: Any
+    level: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, message=None, source=None, testName=None, testOrSuiteSource=None, lineno=None, level=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StartSuiteEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    source: Any
+    tests: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name=None, source=None, tests=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class StartTestEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    source: Any
+    lineno: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name=None, source=None, lineno=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class EndTestEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    elapsedtime: Any
+    status: Any
+    source: Any
+    message: Any
+    failed_keywords: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name=None, elapsedtime=None, status=None, source=None, message=None, failed_keywords=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class EndSuiteEventBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    name: Any
+    elapsedtime: Any
+    status: Any
+    source: Any
+    message: Any
+    failed_keywords: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, name=None, elapsedtime=None, status=None, source=None, message=None, failed_keywords=None, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdSystemInfoResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    python: Any
+    platform: Any
+    process: Any
+    pydevd: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, python, platform, process, pydevd, update_ids_from_dap=False, **kwargs) -> None: ...
+
+
+class PydevdAuthorizeResponseBody(BaseSchema):
+    __props__: Dict[str, Any]
+    __refs__: Set[str]
+    clientAccessToken: Any
+    kwargs: Dict[str, Any]
+
+    def __init__(self, clientAccessToken, update_ids_from_dap=False, **kwargs) -> None: ...
+
+# fmt: on
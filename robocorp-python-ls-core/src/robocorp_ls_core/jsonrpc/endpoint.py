@@ -30,6 +30,7 @@ from .exceptions import (
 from concurrent import futures
 from robocorp_ls_core.basic import implements
 from robocorp_ls_core.protocols import IEndPoint, IFuture, IMonitor
+from robocorp_ls_core.jsonrpc.metrics import EndpointMetrics, METRICS_METHOD
 from typing import Optional
 
 log = get_logger(__name__)
@@ -76,8 +77,18 @@ class Endpoint(object):
         max_workers = min(15, (os.cpu_count() or 1) + 4)
         self._executor_service = futures.ThreadPoolExecutor(max_workers=max_workers)
 
+        # Per-method metrics of the requests handled (may be requested by
+        # the client with `$/endpointMetrics`).
+        self.metrics = EndpointMetrics()
+
+        from robocorp_ls_core.jsonrpc.metrics import start_periodic_dump_from_env
+
+        self._metrics_dumper = start_periodic_dump_from_env(self.metrics)
+
     def shutdown(self):
         self._executor_service.shutdown(wait=False)
+        if self._metrics_dumper is not None:
+            self._metrics_dumper.dispose()
 
     @implements(IEndPoint.notify)
     def notify(self, method: str, params=None):
@@ -136,30 +147,40 @@ class Endpoint(object):
                 message["id"], message.get("result"), message.get("error")
             )
         else:
+            method = message["method"]
             try:
                 log.debug("Handling request from client %s", message)
-                self._handle_request(
-                    message["id"], message["method"], message.get("params")
-                )
+                self._handle_request(message["id"], method, message.get("params"))
             except JsonRpcException as e:
                 log.exception("Failed to handle request %s", message["id"])
-                self._consumer(
+                self.metrics.on_error(method)
+                self._send_response(
+                    method,
                     {
                         "jsonrpc": JSONRPC_VERSION,
                         "id": message["id"],
                         "error": e.to_dict(),
-                    }
+                    },
                 )
             except Exception:  # pylint: disable=broad-except
                 log.exception("Failed to handle request %s", message["id"])
-                self._consumer(
+                self.metrics.on_error(method)
+                self._send_response(
+                    method,
                     {
                         "jsonrpc": JSONRPC_VERSION,
                         "id": message["id"],
                         "error": JsonRpcInternalError.of(sys.exc_info()).to_dict(),
-                    }
+                    },
                 )
 
+    def _send_response(self, method, message):
+        self.metrics.set_response_method(method)
+        try:
+            self._consumer(message)
+        finally:
+            self.metrics.set_response_method(None)
+
     def _handle_notification(self, method, params):
         """Handle a notification from the client."""
         if method == CANCEL_METHOD:
@@ -219,6 +240,16 @@ class Endpoint(object):
         if request_future.cancel():
             log.debug("Cancelled request with id %s", msg_id)
 
+    def _call_tracking_metrics(self, method, submit_time, func, **kwargs):
+        import time
+
+        initial_time = time.perf_counter()
+        self.metrics.on_queue_wait(method, initial_time - submit_time)
+        try:
+            return self._call_checking_time(func, **kwargs)
+        finally:
+            self.metrics.on_handler_time(method, time.perf_counter() - initial_time)
+
     def _call_checking_time(self, func, **kwargs):
         from robocorp_ls_core import timeouts
         import threading
@@ -269,11 +300,23 @@ class Endpoint(object):
         import time
 
         initial_time = time.time()
+        if method == METRICS_METHOD:
+            self._send_response(
+                method,
+                {
+                    "jsonrpc": JSONRPC_VERSION,
+                    "id": msg_id,
+                    "result": self.metrics.to_dict(),
+                },
+            )
+            return
+
         try:
             handler = self._dispatcher[method]
         except KeyError:
             raise JsonRpcMethodNotFound.of(method)
 
+        self.metrics.on_request(method)
         handler_result = handler(params)
 
         if callable(handler_result):
@@ -289,38 +332,52 @@ class Endpoint(object):
             if FORCE_NON_THREADED_VERSION:
                 # I.e.: non-threaded version without breaking api.
                 handler_result = handler_result(**kwargs)
+                elapsed = time.time() - initial_time
+                self.metrics.on_handler_time(method, elapsed)
                 log.debug(
                     "Got result from synchronous request handler (in %.2fs): %s",
-                    time.time() - initial_time,
+                    elapsed,
                     handler_result,
                 )
-                self._consumer(
-                    {"jsonrpc": JSONRPC_VERSION, "id": msg_id, "result": handler_result}
+                self._send_response(
+                    method,
+                    {
+                        "jsonrpc": JSONRPC_VERSION,
+                        "id": msg_id,
+                        "result": handler_result,
+                    },
                 )
 
             else:
                 request_future = self._executor_service.submit(
-                    self._call_checking_time, handler_result, **kwargs
+                    self._call_tracking_metrics,
+                    method,
+                    time.perf_counter(),
+                    handler_result,
+                    **kwargs,
                 )
                 if monitor is not None:
                     request_future.__monitor__ = monitor
                 self._client_request_futures[msg_id] = request_future
-                request_future.add_done_callback(self._request_callback(msg_id))
+                request_future.add_done_callback(self._request_callback(msg_id, method))
         elif isinstance(handler_result, futures.Future):
             log.debug("Request handler is already a future %s", handler_result)
             self._client_request_futures[msg_id] = handler_result
-            handler_result.add_done_callback(self._request_callback(msg_id))
+            handler_result.add_done_callback(self._request_callback(msg_id, method))
         else:
+            elapsed = time.time() - initial_time
+            self.metrics.on_handler_time(method, elapsed)
             log.debug(
                 "Got result from synchronous request handler (in %.2fs): %s",
-                time.time() - initial_time,
+                elapsed,
                 handler_result,
             )
-            self._consumer(
-                {"jsonrpc": JSONRPC_VERSION, "id": msg_id, "result": handler_result}
+            self._send_response(
+                method,
+                {"jsonrpc": JSONRPC_VERSION, "id": msg_id, "result": handler_result},
             )
 
-    def _request_callback(self, request_id):
+    def _request_callback(self, request_id, method=None):
         """Construct a request callback for the given request ID."""
 
         def callback(future):
@@ -337,14 +394,20 @@ class Endpoint(object):
             except JsonRpcRequestCancelled as e:
                 log.debug("Cancelled request: %s", request_id)
                 message["error"] = e.to_dict()
+                if method is not None:
+                    self.metrics.on_cancelled(method)
             except JsonRpcException as e:
                 log.exception("Failed to handle request %s", request_id)
                 message["error"] = e.to_dict()
+                if method is not None:
+                    self.metrics.on_error(method)
             except Exception:  # pylint: disable=broad-except
                 log.exception("Failed to handle request %s", request_id)
                 message["error"] = JsonRpcInternalError.of(sys.exc_info()).to_dict()
+                if method is not None:
+                    self.metrics.on_error(method)
 
-            self._consumer(message)
+            self._send_response(method, message)
 
         return callback
 
@@ -0,0 +1,91 @@
+"""
+JSON encoding/decoding used in the JSON-RPC streams.
+
+If `orjson` is installed it's used (it's much faster than the stdlib `json`,
+which is used as a fallback when it's not available or when it's not able to
+handle some message).
+"""
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+_orjson: Any = None
+try:
+    import orjson
+
+    _orjson = orjson
+except ImportError:
+    pass
+
+
+def is_orjson_available() -> bool:
+    return _orjson is not None
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except Exception:
+            # i.e.: it's stricter than the stdlib (i.e.: NaN or big ints aren't
+            # accepted), so, give the stdlib a chance before failing.
+            pass
+    return json.loads(data)
+
+
+def create_dumps(**json_dumps_args) -> Callable[[Any], bytes]:
+    """
+    :param json_dumps_args:
+        The arguments which would be passed to `json.dumps`.
+
+    :return:
+        A function which receives an object and returns it as json encoded as
+        utf-8 bytes.
+    """
+    sort_keys = json_dumps_args.pop("sort_keys", False)
+
+    if _orjson is None or json_dumps_args:
+        # Note: the orjson path only supports `sort_keys`.
+        if sort_keys:
+            json_dumps_args["sort_keys"] = True
+
+        def stdlib_dumps(obj: Any) -> bytes:
+            return json.dumps(obj, **json_dumps_args).encode("utf-8")
+
+        return stdlib_dumps
+
+    # Note: datetimes/dataclasses aren't automatically converted so that
+    # the behavior matches the stdlib (which errors in this case).
+    option = (
+        _orjson.OPT_NON_STR_KEYS
+        | _orjson.OPT_PASSTHROUGH_DATETIME
+        | _orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    if sort_keys:
+        option |= _orjson.OPT_SORT_KEYS
+
+    stdlib_args: Dict[str, Any] = {"sort_keys": True} if sort_keys else {}
+    orjson_dumps = _orjson.dumps
+
+    def dumps(obj: Any) -> bytes:
+        try:
+            return orjson_dumps(obj, option=option)
+        except TypeError:
+            # Something unsupported by orjson (i.e.: int bigger than 64 bits
+            # or subclasses of dict/list with custom behavior): let the stdlib
+            # handle it (or raise the proper error).
+            return json.dumps(obj, **stdlib_args).encode("utf-8")
+
+    return dumps
+
+
+_default_dumps: Optional[Callable[[Any], bytes]] = None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    :return: the object as json encoded as utf-8 bytes.
+    """
+    global _default_dumps
+    if _default_dumps is None:
+        _default_dumps = create_dumps()
+    return _default_dumps(obj)
@@ -0,0 +1,257 @@
+"""
+Per-method metrics for the requests handled by the `Endpoint`.
+
+For each method the following is collected (in a rolling window with the
+latest `ROLLING_WINDOW_SIZE` samples):
+
+- queue_wait: time the request waited in the executor before starting.
+- handler_time: time spent computing the result.
+- serialization_time: time to serialize the response to json (only available
+  when the consumer is a `JsonRpcStreamWriter`).
+- payload_size: size (in bytes) of the serialized response (only available
+  when the consumer is a `JsonRpcStreamWriter`).
+
+Besides those, the number of requests, cancelled requests and errors is also
+tracked.
+
+The metrics may be requested by the client through the `$/endpointMetrics`
+request and may also be periodically logged by setting the
+`ROBOTFRAMEWORK_LS_ENDPOINT_METRICS_DUMP_INTERVAL` environment variable
+(with the interval in seconds).
+"""
+from collections import deque
+import threading
+from typing import Any, Deque, Dict, List, Optional
+
+from robocorp_ls_core.robotframework_log import get_logger
+
+log = get_logger(__name__)
+
+METRICS_METHOD = "$/endpointMetrics"
+
+ROLLING_WINDOW_SIZE = 1000
+
+_PERCENTILES = (50, 95, 99)
+
+
+class RollingHistogram(object):
+    """
+    Keeps the latest samples added and computes percentiles on demand.
+    """
+
+    __slots__ = ["_samples", "_total_count"]
+
+    def __init__(self, max_samples: int = ROLLING_WINDOW_SIZE):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._total_count = 0
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self._total_count += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        samples = sorted(self._samples)
+        ret: Dict[str, Any] = {"count": self._total_count}
+        if not samples:
+            return ret
+
+        last_index = len(samples) - 1
+        for percentile in _PERCENTILES:
+            ret[f"p{percentile}"] = samples[round(last_index * percentile / 100)]
+        ret["max"] = samples[-1]
+        return ret
+
+
+class _MethodMetrics(object):
+
+    __slots__ = [
+        "requests",
+        "cancelled",
+        "errors",
+        "queue_wait",
+        "handler_time",
+        "serialization_time",
+        "payload_size",
+    ]
+
+    def __init__(self):
+        self.requests = 0
+        self.cancelled = 0
+        self.errors = 0
+        self.queue_wait = RollingHistogram()
+        self.handler_time = RollingHistogram()
+        self.serialization_time = RollingHistogram()
+        self.payload_size = RollingHistogram()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "cancelled": self.cancelled,
+            "errors": self.errors,
+            "queue_wait": self.queue_wait.to_dict(),
+            "handler_time": self.handler_time.to_dict(),
+            "serialization_time": self.serialization_time.to_dict(),
+            "payload_size": self.payload_size.to_dict(),
+        }
+
+
+class EndpointMetrics(object):
+    """
+    Thread-safe collector of the metrics for the requests handled by an
+    `Endpoint` (times are in seconds and sizes in bytes).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._method_to_metrics: Dict[str, _MethodMetrics] = {}
+
+        # The method of the response being written in the current thread
+        # (used to know to which method the `on_message_written` refers to).
+        self._tls = threading.local()
+
+    def _get(self, method: str) -> _MethodMetrics:
+        # Must be called with the lock held.
+        metrics = self._method_to_metrics.get(method)
+        if metrics is None:
+            metrics = self._method_to_metrics[method] = _MethodMetrics()
+        return metrics
+
+    def on_request(self, method: str) -> None:
+        with self._lock:
+            self._get(method).requests += 1
+
+    def on_queue_wait(self, method: str, queue_wait: float) -> None:
+        with self._lock:
+            self._get(method).queue_wait.add(queue_wait)
+
+    def on_handler_time(self, method: str, handler_time: float) -> None:
+        with self._lock:
+            self._get(method).handler_time.add(handler_time)
+
+    def on_cancelled(self, method: str) -> None:
+        with self._lock:
+            self._get(method).cancelled += 1
+
+    def on_error(self, method: str) -> None:
+        with self._lock:
+            self._get(method).errors += 1
+
+    def set_response_method(self, method: Optional[str]) -> None:
+        """
+        Sets the method of the response which is about to be written in the
+        current thread (or None after it's written).
+        """
+        self._tls.method = method
+
+    def on_message_written(
+        self, message: Any, serialization_time: float, payload_size: int
+    ) -> None:
+        """
+        Callback to be set as the `on_message_written` of the
+        `JsonRpcStreamWriter` (only responses to requests are tracked).
+        """
+        method = getattr(self._tls, "method", None)
+        if method is None:
+            return
+
+        with self._lock:
+            metrics = self._get(method)
+            metrics.serialization_time.add(serialization_time)
+            metrics.payload_size.add(payload_size)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return dict(
+                (method, metrics.to_dict())
+                for method, metrics in self._method_to_metrics.items()
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._method_to_metrics.clear()
+
+    def format(self) -> str:
+        """
+        :return: a human-readable representation of the metrics.
+        """
+        lines: List[str] = ["Endpoint metrics (p50 / p95 / p99):"]
+
+        def format_histogram(info, multiplier, unit):
+            if "p50" not in info:
+                return "-"
+            return " / ".join(
+                f"{info[f'p{p}'] * multiplier:.1f}{unit}" for p in _PERCENTILES
+            )
+
+        for method, info in sorted(self.to_dict().items()):
+            lines.append(
+                f"{method}: requests: {info['requests']}, "
+                f"cancelled: {info['cancelled']}, errors: {info['errors']}"
+            )
+            lines.append(
+                f"    queue wait: {format_histogram(info['queue_wait'], 1000, 'ms')}"
+            )
+            lines.append(
+                f"    handler: {format_histogram(info['handler_time'], 1000, 'ms')}"
+            )
+            lines.append(
+                "    serialization: "
+                f"{format_histogram(info['serialization_time'], 1000, 'ms')}"
+            )
+            lines.append(
+                f"    payload: {format_histogram(info['payload_size'], 1, 'b')}"
+            )
+        return "\n".join(lines)
+
+
+class _PeriodicMetricsDumper(threading.Thread):
+    def __init__(self, metrics: EndpointMetrics, interval: float):
+        threading.Thread.__init__(self)
+        self.name = "_PeriodicMetricsDumper"
+        self.daemon = True
+        self._metrics = metrics
+        self._interval = interval
+        self._disposed = threading.Event()
+
+    def run(self):
+        while not self._disposed.wait(self._interval):
+            try:
+                log.info(self._metrics.format())
+            except Exception:
+                log.exception("Error dumping endpoint metrics.")
+
+    def dispose(self):
+        self._disposed.set()
+
+
+def start_periodic_dump_from_env(
+    metrics: EndpointMetrics,
+) -> Optional[_PeriodicMetricsDumper]:
+    """
+    Starts a thread which logs the metrics periodically if the
+    `ROBOTFRAMEWORK_LS_ENDPOINT_METRICS_DUMP_INTERVAL` environment variable
+    is set (to the interval in seconds).
+
+    :return: the thread started (which must be disposed) or None.
+    """
+    import os
+
+    interval_str = os.environ.get("ROBOTFRAMEWORK_LS_ENDPOINT_METRICS_DUMP_INTERVAL")
+    if not interval_str:
+        return None
+
+    try:
+        interval = float(interval_str)
+    except Exception:
+        log.exception(
+            "Unable to convert ROBOTFRAMEWORK_LS_ENDPOINT_METRICS_DUMP_INTERVAL (%s) to a float.",
+            interval_str,
+        )
+        return None
+
+    if interval <= 0:
+        return None
+
+    dumper = _PeriodicMetricsDumper(metrics, interval)
+    dumper.start()
+    return dumper
@@ -14,15 +14,56 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import re
 import threading
-from robocorp_ls_core.robotframework_log import get_logger
-from typing import Optional
-import json
+import time
+import weakref
+from robocorp_ls_core.robotframework_log import get_logger, get_log_level
+from typing import Optional, Set
+from robocorp_ls_core.jsonrpc import json_codec
 from robocorp_ls_core.options import BaseOptions
 import queue
 
 log = get_logger(__name__)
 
+# Notifications bigger than this are written right away even when coalescing
+# notifications.
+_MAX_COALESCED_NOTIFICATION_SIZE = 32 * 1024
+
+# Responses in the format written by the `Endpoint` (which only need to have
+# the `id` and `result` extracted to be forwarded).
+_RAW_RESULT_PREFIX_RE = re.compile(
+    rb'\{"jsonrpc": ?"2\.0", ?"id": ?(\d+), ?"result": ?'
+)
+
+_FALSY_JSON = frozenset((b"null", b"false", b"0", b'""', b"[]", b"{}"))
+
+
+class RawJson(object):
+    """
+    Contents already serialized as json (i.e.: the result of a request done
+    to another process which is just forwarded to the client, so, it doesn't
+    need to be decoded and encoded again).
+
+    Note: only supported as the `result` of a message to be written.
+    """
+
+    __slots__ = ["raw"]
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+
+    def load(self):
+        return json_codec.loads(self.raw)
+
+    def __bool__(self):
+        return self.raw not in _FALSY_JSON
+
+    def __repr__(self):
+        if len(self.raw) > 200:
+            return "RawJson(%r...)" % (self.raw[:200],)
+        return "RawJson(%r)" % (self.raw,)
+
 
 def read(stream) -> Optional[str]:
     """
@@ -34,76 +75,133 @@ def read(stream) -> Optional[str]:
     :return str|NoneType:
         The message or None if the stream was closed.
     """
-    headers = {}
+    body = read_bytes(stream)
+    if body is None:
+        return None
+    return body.decode("utf-8")
+
+
+def read_bytes(stream) -> Optional[bytearray]:
+    """
+    Reads one message from the stream and returns the message contents (utf-8
+    encoded) or None if EOF was reached.
+    """
+    found_header = False
+    content_length = None
     while True:
         # Interpret the http protocol headers
         line = stream.readline()  # The trailing \r\n should be there.
 
         if not line:  # EOF
             return None
-        line = line.strip().decode("ascii")
+        line = line.strip()
         if not line:  # Read just a new line without any contents
             break
-        try:
-            name, value = line.split(": ", 1)
-        except ValueError:
-            raise RuntimeError("Invalid header line: {}.".format(line))
-        headers[name.strip()] = value.strip()
+        name, sep, value = line.partition(b":")
+        if not sep:
+            raise RuntimeError(
+                "Invalid header line: {}.".format(line.decode("ascii", "replace"))
+            )
+        found_header = True
+        if name.strip() == b"Content-Length":
+            content_length = int(value)
 
-    if not headers:
+    if not found_header:
         raise RuntimeError("Got message without headers.")
 
-    content_length = int(headers["Content-Length"])
+    if content_length is None:
+        raise RuntimeError("Got message without Content-Length header.")
 
     # Get the actual json
-    body = _read_len(stream, content_length)
-    return body.decode("utf-8")
+    return _read_len(stream, content_length)
 
 
-def _read_len(stream, content_length) -> bytes:
-    buf = b""
+def _read_len(stream, content_length) -> Optional[bytearray]:
+    buf = bytearray(content_length)
     if not content_length:
         return buf
 
-    # Grab the body
-    while True:
-        data = stream.read(content_length - len(buf))
-        if not buf and len(data) == content_length:
-            # Common case
-            return data
-        buf += data
-        if len(buf) == content_length:
-            return buf
-        if len(buf) > content_length:
-            raise AssertionError(
-                "Expected to read message up to len == %s (already read: %s). Found:\n%s"
-                % (content_length, len(buf), buf.decode("utf-8", "replace"))
-            )
-        # len(buf) < content_length (just keep on going).
+    readinto = getattr(stream, "readinto", None)
+    read_len = 0
+    with memoryview(buf) as view:
+        while read_len < content_length:
+            if readinto is not None:
+                n = readinto(view[read_len:])
+            else:
+                data = stream.read(content_length - read_len)
+                n = len(data)
+                view[read_len : read_len + n] = data
+
+            if not n:  # EOF in the middle of the message.
+                return None
+            read_len += n
+
+    return buf
+
+
+def _create_raw_result_message(body: bytearray, raw_result_ids: Set[int]):
+    """
+    :return:
+        A message with the result as `RawJson` if it's a response whose
+        id is in `raw_result_ids` (or None otherwise).
+    """
+    match = _RAW_RESULT_PREFIX_RE.match(body)
+    if match is None or not body.endswith(b"}"):
+        return None
+
+    msg_id = int(match.group(1))
+    if msg_id not in raw_result_ids:
+        return None
+    raw_result_ids.discard(msg_id)
+
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "result": RawJson(bytes(body[match.end() : -1]).strip()),
+    }
 
 
 class _JsonRpcStreamReaderThread(threading.Thread):
-    def __init__(self, rfile, queue, message_consumer):
+    def __init__(self, rfile, queue, message_consumer, raw_result_ids=None):
         threading.Thread.__init__(self)
         self._rfile = rfile
         self._queue = queue
         self._message_consumer = message_consumer
+        self._raw_result_ids: Set[int] = (
+            raw_result_ids if raw_result_ids is not None else set()
+        )
         self.name = "_JsonRpcStreamReaderThread"
         self.daemon = True
 
     def run(self):
+        raw_result_ids = self._raw_result_ids
         try:
             while not self._rfile.closed:
-                data = read(self._rfile)
+                data = read_bytes(self._rfile)
                 if data is None:
                     log.debug("Read: %s", data)
                     return
 
-                try:
-                    msg = json.loads(data)
-                except:
-                    log.exception("Failed to parse JSON message %s", data)
-                    continue
+                msg = None
+                if raw_result_ids:
+                    msg = _create_raw_result_message(data, raw_result_ids)
+
+                if msg is None:
+                    try:
+                        msg = json_codec.loads(data)
+                    except:
+                        log.exception(
+                            "Failed to parse JSON message %s",
+                            data.decode("utf-8", "replace"),
+                        )
+                        continue
+
+                    if raw_result_ids and isinstance(msg, dict):
+                        # i.e.: error response to a message which would have
+                        # the raw result.
+                        msg_id = msg.get("id")
+                        if msg_id.__class__ is int:
+                            raw_result_ids.discard(msg_id)
 
                 if isinstance(msg, dict):
                     # Note: parsing is done on a thread so that we can read
@@ -116,10 +214,13 @@ class _JsonRpcStreamReaderThread(threading.Thread):
                             log.exception("Error processing JSON message %s", msg)
                         continue
 
-                    if msg.get("command") not in BaseOptions.HIDE_COMMAND_MESSAGES:
-                        log.debug("Read: %s", data)
+                    if (
+                        get_log_level() >= 2
+                        and msg.get("command") not in BaseOptions.HIDE_COMMAND_MESSAGES
+                    ):
+                        log.debug("Read: %s", data.decode("utf-8", "replace"))
                 else:
-                    log.debug("Read (non dict data): %s", data)
+                    log.debug("Read (non dict data): %s", msg)
 
                 self._queue.put(msg)
 
@@ -148,10 +249,26 @@ class JsonRpcStreamReader(object):
         self._rfile = rfile
         self._queue = queue.Queue()
         self._reader_thread = None
+        self._raw_result_ids: Set[int] = set()
 
     def get_read_queue(self):
         return self._queue
 
+    def keep_raw_result(self, msg_id: int) -> None:
+        """
+        Requests that the result of the response with the given id is kept
+        as `RawJson` (so, it can be forwarded without being decoded/encoded
+        again).
+
+        Note: the result is only kept raw if the response is in the format
+        written by the `Endpoint`, so, clients must still be prepared to
+        receive a regular result.
+        """
+        self._raw_result_ids.add(msg_id)
+
+    def discard_raw_result(self, msg_id: int) -> None:
+        self._raw_result_ids.discard(msg_id)
+
     def close(self):
         pass
         # We don't close the reader because it can deadlock if someone
@@ -165,7 +282,7 @@ class JsonRpcStreamReader(object):
             message_consumer (fn): function that is passed each message as it is read off the socket.
         """
         self._reader_thread = _JsonRpcStreamReaderThread(
-            self._rfile, self._queue, message_consumer
+            self._rfile, self._queue, message_consumer, self._raw_result_ids
         )
         self._reader_thread.start()
         try:
@@ -193,18 +310,129 @@ class JsonRpcStreamReader(object):
             log.debug("Exited JsonRpcStreamReader.")
 
 
+class _PendingNotificationsFlusher(threading.Thread):
+    """
+    Flushes the notifications which were coalesced in a `JsonRpcStreamWriter`
+    after some delay.
+    """
+
+    def __init__(self, writer: "JsonRpcStreamWriter", delay: float):
+        threading.Thread.__init__(self)
+        self.name = "_PendingNotificationsFlusher"
+        self.daemon = True
+        self._writer_ref = weakref.ref(writer)
+        self._delay = delay
+        self._scheduled = threading.Event()
+        self._disposed = False
+
+    def schedule(self):
+        self._scheduled.set()
+
+    def dispose(self):
+        self._disposed = True
+        self._scheduled.set()
+
+    def run(self):
+        while True:
+            self._scheduled.wait()
+            if self._disposed:
+                return
+            time.sleep(self._delay)
+            self._scheduled.clear()
+
+            writer = self._writer_ref()
+            if writer is None:
+                return
+            writer._flush_pending()
+            del writer
+
+
 class JsonRpcStreamWriter(object):
-    def __init__(self, wfile, **json_dumps_args):
+    def __init__(
+        self,
+        wfile,
+        coalesce_notifications_delay: float = 0,
+        **json_dumps_args,
+    ):
+        """
+        :param coalesce_notifications_delay:
+            If > 0, small notifications are not written right away, rather,
+            they're kept in a buffer which is written along with the next
+            message or after the given delay (in seconds), whichever comes
+            first (so, many notifications may be written with a single
+            write/flush).
+        """
         assert wfile is not None
         self._wfile = wfile
         self._wfile_lock = threading.Lock()
         self._json_dumps_args = json_dumps_args
+        self._dumps = json_codec.create_dumps(**json_dumps_args)
+
+        self._coalesce_notifications_delay = coalesce_notifications_delay
+        self._pending = bytearray()
+        self._pending_flusher: Optional[_PendingNotificationsFlusher] = None
+
+        # Optional callback(message, serialization_time, payload_size) called
+        # after a message is written (used to collect metrics).
+        self.on_message_written = None
 
     def close(self):
         log.debug("Will close writer")
         with self._wfile_lock:
+            if self._pending and not self._wfile.closed:
+                try:
+                    self._wfile.write(self._pending)
+                    self._wfile.flush()
+                except Exception:  # pylint: disable=broad-except
+                    log.exception("Failed to write pending notifications.")
+                self._pending = bytearray()
+            if self._pending_flusher is not None:
+                self._pending_flusher.dispose()
             self._wfile.close()
 
+    def _serialize(self, message) -> bytes:
+        if message.__class__ is dict:
+            result = message.get("result")
+            if result.__class__ is RawJson:
+                without_result = self._dumps(
+                    dict((k, v) for k, v in message.items() if k != "result")
+                )
+                return b"".join(
+                    (
+                        without_result[:-1],
+                        b"," if len(without_result) > 2 else b"",
+                        b'"result":',
+                        result.raw,
+                        b"}",
+                    )
+                )
+
+        return self._dumps(message)
+
+    def _flush_pending(self):
+        with self._wfile_lock:
+            if not self._pending or self._wfile.closed:
+                return
+            try:
+                self._wfile.write(self._pending)
+                self._wfile.flush()
+            except Exception:  # pylint: disable=broad-except
+                log.exception(
+                    "Failed to write pending notifications to output file (closed: %s)",
+                    self._wfile.closed,
+                )
+            self._pending = bytearray()
+
+    def _schedule_pending_flush(self):
+        # Must be called with the lock held.
+        pending_flusher = self._pending_flusher
+        if pending_flusher is None:
+            pending_flusher = self._pending_flusher = _PendingNotificationsFlusher(
+                self, self._coalesce_notifications_delay
+            )
+            pending_flusher.start()
+        pending_flusher.schedule()
+
     def write(self, message):
         with self._wfile_lock:
             if self._wfile.closed:
@@ -217,16 +445,38 @@ class JsonRpcStreamWriter(object):
                 else:
                     log.debug("Writing (non dict message): %s", message)
 
-                body = json.dumps(message, **self._json_dumps_args)
-
-                as_bytes = body.encode("utf-8")
-                stream = self._wfile
-                content_len_as_str = "Content-Length: %s\r\n\r\n" % len(as_bytes)
-                content_len_bytes = content_len_as_str.encode("ascii")
-
-                stream.write(content_len_bytes)
-                stream.write(as_bytes)
-                stream.flush()
+                on_message_written = self.on_message_written
+                if on_message_written is not None:
+                    initial_time = time.perf_counter()
+
+                as_bytes = self._serialize(message)
+                if on_message_written is not None:
+                    serialization_time = time.perf_counter() - initial_time
+
+                content_len_bytes = b"Content-Length: %d\r\n\r\n" % (len(as_bytes),)
+
+                if (
+                    self._coalesce_notifications_delay > 0
+                    and isinstance(message, dict)
+                    and "id" not in message
+                    and "method" in message
+                    and len(as_bytes) < _MAX_COALESCED_NOTIFICATION_SIZE
+                ):
+                    self._pending += content_len_bytes
+                    self._pending += as_bytes
+                    self._schedule_pending_flush()
+                else:
+                    stream = self._wfile
+                    if self._pending:
+                        # Write what's pending before (to keep the order).
+                        stream.write(self._pending)
+                        self._pending = bytearray()
+                    stream.write(content_len_bytes)
+                    stream.write(as_bytes)
+                    stream.flush()
+
+                if on_message_written is not None:
+                    on_message_written(message, serialization_time, len(as_bytes))
                 return True
             except Exception:  # pylint: disable=broad-except
                 log.exception(
@@ -730,6 +730,22 @@ class DocumentHighlightTypedDict(TypedDict, total=False):
     kind: int  # Optional
 
 
+class SemanticTokensTypedDict(TypedDict, total=False):
+    resultId: Optional[str]
+    data: List[int]
+
+
+class SemanticTokensEditTypedDict(TypedDict):
+    start: int
+    deleteCount: int
+    data: List[int]  # Optional
+
+
+class SemanticTokensDeltaTypedDict(TypedDict, total=False):
+    resultId: Optional[str]
+    edits: List[SemanticTokensEditTypedDict]
+
+
 class ResponseErrorTypedDict(TypedDict, total=False):
     code: int
     message: str
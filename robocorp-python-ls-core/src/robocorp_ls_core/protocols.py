@@ -13,6 +13,7 @@ from typing import (
     Iterable,
     Tuple,
     Sequence,
+    ContextManager,
 )
 from typing import TypeVar
 import typing
@@ -256,6 +257,18 @@ class ILanguageServerClientBase(IRequestCancellable, Protocol):
     def obtain_id_message_matcher(self, message_id) -> IMessageMatcher:
         pass
 
+    def forward_raw_results(self) -> ContextManager[None]:
+        """
+        Context manager: requests done in the current thread in the context
+        may have the `result` kept as `RawJson` (to be forwarded to another
+        process without being decoded/encoded again).
+
+        i.e.:
+
+        with client.forward_raw_results():
+            message_matcher = client.request_async(contents)
+        """
+
     def register_request_handler(self, message: str, handler: IRequestHandler) -> None:
         pass
 
@@ -284,6 +297,11 @@ class IRobotFrameworkApiClient(ILanguageServerClientBase, Protocol):
     def request_lint(self, doc_uri: str) -> Optional[IIdMessageMatcher]:
         pass
 
+    def request_lint_many(self, doc_uris: List[str]) -> Optional[IIdMessageMatcher]:
+        """
+        The result is a dict(doc_uri -> diagnostics).
+        """
+
     def request_semantic_tokens_full(
         self, text_document: "TextDocumentTypedDict"
     ) -> Optional[IIdMessageMatcher]:
@@ -771,6 +789,11 @@ class IDocument(Protocol):
     def get_line_count(self) -> int:
         pass
 
+    def get_internal_lines(self) -> Tuple[str, ...]:
+        """
+        :return: the lines of the document (with the line endings).
+        """
+
     def apply_change(self, change: "TextDocumentContentChangeEvent") -> None:
         pass
 
@@ -791,6 +814,7 @@ class IWorkspaceFolder(Protocol):
 
 class IWorkspace(Protocol):
     on_file_changed: "Callback"
+    on_files_changed: "Callback"
 
     def on_changed_config(self, config: IConfig) -> None:
         pass
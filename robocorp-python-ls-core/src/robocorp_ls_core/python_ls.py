@@ -235,6 +235,10 @@ class PythonLanguageServer(MethodDispatcher):
     Based on: https://github.com/palantir/python-language-server/blob/develop/pyls/python_ls.py
     """
 
+    # Small notifications (i.e.: progress, log messages) are written in
+    # batches with this delay (in seconds).
+    COALESCE_NOTIFICATIONS_DELAY = 0.005
+
     def __init__(self, read_stream, write_stream):
         from robocorp_ls_core.lsp import LSPMessages
 
@@ -245,8 +249,14 @@ class PythonLanguageServer(MethodDispatcher):
         self.uri_workspace_mapper = {}
 
         self._jsonrpc_stream_reader = JsonRpcStreamReader(read_stream)
-        self._jsonrpc_stream_writer = JsonRpcStreamWriter(write_stream)
+        self._jsonrpc_stream_writer = JsonRpcStreamWriter(
+            write_stream,
+            coalesce_notifications_delay=self.COALESCE_NOTIFICATIONS_DELAY,
+        )
         self._endpoint = Endpoint(self, self._jsonrpc_stream_writer.write)
+        self._jsonrpc_stream_writer.on_message_written = (
+            self._endpoint.metrics.on_message_written
+        )
         self._lsp_messages = LSPMessages(self._endpoint)
 
         self._shutdown = False
@@ -78,6 +78,7 @@ class _RemoteFSServer(threading.Thread):
         self.reader: Optional[JsonRpcStreamReader] = None
         self._observer_provider: ObserverProvider = observer_provider
         self.on_change_id_to_watch: Dict[int, IFSWatch] = {}
+        self._batch_notifier = None
 
     def _on_change(self, src_path, on_change_id):
         # Note: this will be called from the watcher thread.
@@ -92,6 +93,33 @@ class _RemoteFSServer(threading.Thread):
             if watch is not None:
                 watch.stop_tracking()
 
+    def _on_changes(self, changes, on_change_id):
+        # Note: this will be called from the batch notifier thread.
+        if not self.writer.write(
+            {
+                "command": "on_changes",
+                "on_change_id": on_change_id,
+                "paths": changes.paths,
+                "subtrees": changes.subtrees,
+            }
+        ):
+            from robocorp_ls_core.watchdog_wrapper import IFSWatch
+
+            watch: IFSWatch = self.on_change_id_to_watch.pop(on_change_id, None)
+            if watch is not None:
+                watch.stop_tracking()
+
+    def _get_batch_notifier(self):
+        from robocorp_ls_core import watchdog_wrapper
+
+        # Note: a single notifier is shared among the watches from this
+        # connection (changes are grouped by the on_change_id).
+        if self._batch_notifier is None:
+            self._batch_notifier = watchdog_wrapper.create_batch_notifier(
+                self._on_changes
+            )
+        return self._batch_notifier
+
     def run(self):
         from robocorp_ls_core.jsonrpc.streams import JsonRpcStreamWriter
         from robocorp_ls_core.jsonrpc.streams import JsonRpcStreamReader
@@ -105,7 +133,12 @@ class _RemoteFSServer(threading.Thread):
         self.writer = w
         self.reader = r
 
-        r.listen(self._on_read)
+        try:
+            r.listen(self._on_read)
+        finally:
+            batch_notifier = self._batch_notifier
+            if batch_notifier is not None:
+                batch_notifier.dispose()
 
     def _on_read(self, msg):
         command = msg.get("command")
@@ -146,9 +179,14 @@ class _RemoteFSServer(threading.Thread):
             if extensions is not None:
                 extensions = tuple(extensions)
 
+            if msg.get("batched"):
+                on_change = self._get_batch_notifier().on_change
+            else:
+                on_change = self._on_change
+
             observer = self._observer_provider.observer
             self.on_change_id_to_watch[on_change_id] = observer.notify_on_any_change(
-                paths, self._on_change, call_args=(on_change_id,), extensions=extensions
+                paths, on_change, call_args=(on_change_id,), extensions=extensions
             )
             # notify_on_any_change requires an acknowledgement.
             self.writer.write(
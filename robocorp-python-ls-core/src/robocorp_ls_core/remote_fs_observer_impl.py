@@ -5,10 +5,15 @@ import time
 import random
 import threading
 from functools import partial
-from typing import Optional, List, Dict, Tuple, Sequence
+from typing import Optional, List, Dict, Tuple, Sequence, Union
 
 from robocorp_ls_core.robotframework_log import get_logger
-from robocorp_ls_core.watchdog_wrapper import PathInfo, IFSCallback, IFSWatch
+from robocorp_ls_core.watchdog_wrapper import (
+    PathInfo,
+    IFSCallback,
+    IFSWatch,
+    IFSBatchCallback,
+)
 import os
 
 log = get_logger(__name__)
@@ -24,7 +29,7 @@ class _RemoteFSWatch(object):
         self,
         remote_fs_observer: "RemoteFSObserver",
         on_change_id: str,
-        on_change: IFSCallback,
+        on_change: Union[IFSCallback, IFSBatchCallback],
         call_args=(),
     ):
         self.remote_fs_observer = remote_fs_observer
@@ -251,6 +256,31 @@ class RemoteFSObserver(object):
         on_change: IFSCallback,
         call_args=(),
         extensions: Optional[Sequence[str]] = None,
+    ) -> IFSWatch:
+        return self._notify_on_any_change(
+            paths, on_change, call_args, extensions, batched=False
+        )
+
+    def notify_on_any_change_batched(
+        self,
+        paths: List[PathInfo],
+        on_changes: IFSBatchCallback,
+        call_args=(),
+        extensions: Optional[Sequence[str]] = None,
+    ) -> IFSWatch:
+        # Note: the changes are collected and coalesced in the remote process
+        # (so, a single message is received for each batch).
+        return self._notify_on_any_change(
+            paths, on_changes, call_args, extensions, batched=True
+        )
+
+    def _notify_on_any_change(
+        self,
+        paths: List[PathInfo],
+        on_change: Union[IFSCallback, IFSBatchCallback],
+        call_args,
+        extensions: Optional[Sequence[str]],
+        batched: bool,
     ) -> IFSWatch:
         assert (
             self._initialized_event.is_set()
@@ -277,6 +307,7 @@ class RemoteFSObserver(object):
                 "paths": path_args,
                 "on_change_id": on_change_id,
                 "extensions": extensions,
+                "batched": batched,
             }
         )
         # Wait for the command to be acknowledged...
@@ -310,6 +341,16 @@ class RemoteFSObserver(object):
                 src_path = msg["src_path"]
                 remote_fs_watch.on_change(src_path, *remote_fs_watch.call_args)
 
+        elif command == "on_changes":
+            from robocorp_ls_core.watchdog_wrapper import ChangesBatch
+
+            on_change_id = msg["on_change_id"]
+            remote_fs_watch = self._change_id_to_fs_watch.get(on_change_id)
+            # It may be None and that's ok (it may've been disposed in the meanwhile).
+            if remote_fs_watch is not None:
+                changes = ChangesBatch(msg["paths"], msg["subtrees"])
+                remote_fs_watch.on_change(changes, *remote_fs_watch.call_args)
+
     def __typecheckself__(self) -> None:
         from robocorp_ls_core.protocols import check_implements
         from robocorp_ls_core.watchdog_wrapper import IFSObserver
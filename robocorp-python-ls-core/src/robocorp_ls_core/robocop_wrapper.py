@@ -1,7 +1,8 @@
 import os.path
 from pathlib import Path
 import sys
-from typing import List, Dict
+import threading
+from typing import List, Dict, Optional, Sequence, Tuple
 
 from robocorp_ls_core.robotframework_log import get_logger
 
@@ -25,35 +26,169 @@ def _import_robocop():
     log.info("Robocop module: %s", robocop)
 
 
+# The files which may provide the Robocop configuration.
+_CONFIG_FILE_NAMES = (".robocop", "pyproject.toml")
+
+
+def _find_config_files(config_root: Path) -> Tuple[str, ...]:
+    """
+    Provides the config files that Robocop would load for the given root
+    (same lookup done in `robocop.files.find_file_in_project_root`).
+    """
+    ret = []
+    for config_name in _CONFIG_FILE_NAMES:
+        for parent in (config_root, *config_root.parents):
+            if (parent / ".git").exists() or (parent / config_name).is_file():
+                ret.append(str(parent / config_name))
+                break
+    return tuple(ret)
+
+
+def get_config_file_candidates(config_root: Path) -> Tuple[str, ...]:
+    """
+    Provides all the paths checked when looking for the Robocop config files
+    for the given root, including the ones which don't exist (so, creating,
+    changing or removing any of those may change the config used).
+    """
+    ret = []
+    for config_name in _CONFIG_FILE_NAMES:
+        for parent in (config_root, *config_root.parents):
+            ret.append(str(parent / config_name))
+            if (parent / ".git").exists() or (parent / config_name).is_file():
+                break
+    return tuple(ret)
+
+
+def _get_mtimes(filenames: Sequence[str]) -> Tuple[Optional[float], ...]:
+    ret: List[Optional[float]] = []
+    for filename in filenames:
+        try:
+            ret.append(os.path.getmtime(filename))
+        except OSError:
+            ret.append(None)
+    return tuple(ret)
+
+
+class _RobocopRunnerInfo(object):
+    def __init__(self, robocop_runner, tracked_files: Tuple[str, ...]):
+        self.robocop_runner = robocop_runner
+        # The checkers keep the state of the file being checked, so, checks
+        # with the same runner must not be done concurrently.
+        self.lock = threading.Lock()
+        self.tracked_files = tracked_files
+        self.tracked_mtimes = _get_mtimes(tracked_files)
+
+    def is_valid(self) -> bool:
+        return _get_mtimes(self.tracked_files) == self.tracked_mtimes
+
+
+class _RobocopRunnersCache(object):
+    """
+    Robocop loads its rules (importing the related modules) and the config
+    files when a runner is configured, so, runners are reused as long as the
+    config files (and external rules) aren't changed.
+
+    Runners are keyed by the config files which apply (along with their
+    mtimes), so, all the directories which resolve to the same config share
+    the same runner. The least recently used runners are evicted when there
+    are more than `MAX_RUNNERS`.
+
+    The lookup of the config files for a given root is also cached (it must be
+    cleared with `clear` when a config file is created/removed).
+    """
+
+    MAX_RUNNERS = 20
+
+    def __init__(self):
+        from robocorp_ls_core.cache import LRUCache
+
+        self._lock = threading.Lock()
+        self._config_root_to_config_files: Dict[Path, Tuple[str, ...]] = {}
+        self._key_to_runner_info: LRUCache[tuple, _RobocopRunnerInfo] = LRUCache(
+            self.MAX_RUNNERS, resize_to=self.MAX_RUNNERS - 1
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._config_root_to_config_files.clear()
+            self._key_to_runner_info.clear()
+
+    def get_runner_info(self, project_root: Path, config_root: Path):
+        with self._lock:
+            config_files = self._config_root_to_config_files.get(config_root)
+            if config_files is None:
+                config_files = _find_config_files(config_root)
+                self._config_root_to_config_files[config_root] = config_files
+
+            key = (str(project_root), config_files, _get_mtimes(config_files))
+            runner_info = self._key_to_runner_info.get(key)
+            if runner_info is not None:
+                if runner_info.is_valid():
+                    return runner_info
+                log.debug("Robocop configuration changed for: %s", config_root)
+
+            runner_info = _create_runner_info(project_root, config_root, config_files)
+            self._key_to_runner_info[key] = runner_info
+            return runner_info
+
+
+def _create_runner_info(
+    project_root: Path, config_root: Path, config_files: Tuple[str, ...]
+) -> _RobocopRunnerInfo:
+    import robocop
+    from robocop.config import Config
+
+    config = Config(root=config_root)
+
+    # Relative --ext-rules (from the .robocop file) are relative to the
+    # project root (Robocop resolves those based on the cwd).
+    # See: https://github.com/robocorp/robotframework-lsp/issues/703
+    ext_rules = set()
+    for ext_rule in config.ext_rules:
+        if not os.path.isabs(ext_rule):
+            resolved = os.path.join(str(project_root), ext_rule)
+            if os.path.exists(resolved):
+                ext_rule = resolved
+        ext_rules.add(ext_rule)
+    config.ext_rules = ext_rules
+
+    robocop_runner = robocop.Robocop(config=config)
+    robocop_runner.reload_config()
+
+    tracked_files = config_files + tuple(
+        ext_rule for ext_rule in sorted(ext_rules) if os.path.isfile(ext_rule)
+    )
+    return _RobocopRunnerInfo(robocop_runner, tracked_files)
+
+
+_runners_cache = _RobocopRunnersCache()
+
+
+def clear_robocop_runners_cache() -> None:
+    """
+    Should be called when a Robocop config file (.robocop or pyproject.toml) is
+    created/changed/removed.
+    """
+    _runners_cache.clear()
+
+
 def collect_robocop_diagnostics(
     project_root: Path, ast_model, filename: str, source: str
 ) -> List[Dict]:
 
     _import_robocop()
 
-    import robocop
-    from robocop.config import Config
     from robocop.utils import issues_to_lsp_diagnostic
 
+    project_root = Path(project_root)
     filename_parent = Path(filename).parent
-    # Set the working directory to the project root (tricky handling: Robocop
-    # relies on cwd to deal with the --ext-rules
-    # See: https://github.com/robocorp/robotframework-lsp/issues/703).
-    initial_cwd = os.getcwd()
-    try:
-        if os.path.exists(project_root):
-            os.chdir(project_root)
-
-        if filename_parent.exists():
-            config = Config(root=filename_parent)
-        else:
-            # Unsaved files.
-            config = Config(root=project_root)
-        robocop_runner = robocop.Robocop(config=config)
-        robocop_runner.reload_config()
-
-        issues = robocop_runner.run_check(ast_model, filename, source)
-        diag_issues = issues_to_lsp_diagnostic(issues)
-    finally:
-        os.chdir(initial_cwd)
-    return diag_issues
+    if filename_parent.exists():
+        config_root = filename_parent
+    else:
+        # Unsaved files.
+        config_root = project_root
+
+    runner_info = _runners_cache.get_runner_info(project_root, config_root)
+    with runner_info.lock:
+        issues = runner_info.robocop_runner.run_check(ast_model, filename, source)
+    return issues_to_lsp_diagnostic(issues)
@@ -6,8 +6,9 @@ import os.path
 import sys
 import logging
 import threading
+import itertools
 import weakref
-from typing import List, Tuple, Optional, Set, Sequence, Any
+from typing import List, Tuple, Optional, Set, Sequence, Any, Dict, Iterable
 from robocorp_ls_core.uris import normalize_drive
 
 log = logging.getLogger(__name__)
@@ -51,11 +52,126 @@ class PathInfo(object):
     __repr__ = __str__
 
 
+class ChangesBatch(object):
+    """
+    Changes collected during some time window (deduplicated).
+
+    :ivar paths:
+        The paths which changed.
+
+    :ivar subtrees:
+        Directories where anything may have changed (used instead of
+        reporting each path when too many changes are found at once).
+    """
+
+    __slots__ = ["paths", "subtrees"]
+
+    def __init__(self, paths: Sequence[str] = (), subtrees: Sequence[str] = ()):
+        self.paths: Tuple[str, ...] = tuple(paths)
+        self.subtrees: Tuple[str, ...] = tuple(subtrees)
+
+    def __eq__(self, o):
+        if isinstance(o, ChangesBatch):
+            return o.paths == self.paths and o.subtrees == self.subtrees
+
+        return False
+
+    def __ne__(self, o):
+        return not self == o
+
+    def __hash__(self, *args, **kwargs):
+        return hash((self.paths, self.subtrees))
+
+    def __str__(self):
+        return f"ChangesBatch[paths={len(self.paths)}, subtrees={self.subtrees}]"
+
+    __repr__ = __str__
+
+
+# If more than this number of paths changes in a batch, the paths are
+# collapsed into the directories containing them.
+MAX_BATCH_PATHS = 1000
+
+# The time window used to collect the changes for a batch.
+BATCH_TIMEOUT = 0.3
+
+
+def _is_in_subtrees(path: str, subtrees: Set[str]) -> bool:
+    while True:
+        parent = os.path.dirname(path)
+        if not parent or parent == path:
+            return False
+        if parent in subtrees:
+            return True
+        path = parent
+
+
+def coalesce_changes(
+    paths: Iterable[str],
+    subtrees: Iterable[str] = (),
+    max_paths: int = MAX_BATCH_PATHS,
+) -> ChangesBatch:
+    """
+    Creates a batch with the given changes where duplicates (and entries
+    inside a subtree) are removed and, if there are more than `max_paths`
+    entries, the entries are collapsed into their parent directories
+    (starting with the directories which contain more entries) until it
+    fits.
+    """
+    paths = set(paths)
+    subtrees = set(subtrees)
+
+    while len(paths) + len(subtrees) > max_paths:
+        parent_to_entries: Dict[str, List[str]] = {}
+        for entry in itertools.chain(paths, subtrees):
+            parent = os.path.dirname(entry)
+            if parent and parent != entry:
+                parent_to_entries.setdefault(parent, []).append(entry)
+
+        if not parent_to_entries:
+            break  # Everything is already at the root.
+
+        # Collapse the directories with more entries first.
+        groups = sorted(
+            parent_to_entries.items(), key=lambda item: len(item[1]), reverse=True
+        )
+        if len(groups[0][1]) == 1:
+            # Each entry is in a different directory: collapse all of them
+            # (in the next iteration the parents may be grouped).
+            for parent, entries in groups:
+                paths.difference_update(entries)
+                subtrees.difference_update(entries)
+                subtrees.add(parent)
+            continue
+
+        count = len(paths) + len(subtrees)
+        for parent, entries in groups:
+            if count <= max_paths or len(entries) == 1:
+                break
+            paths.difference_update(entries)
+            subtrees.difference_update(entries)
+            subtrees.add(parent)
+            count -= len(entries) - 1
+
+    if subtrees:
+        subtrees = set(s for s in subtrees if not _is_in_subtrees(s, subtrees))
+        paths = set(
+            p for p in paths if p not in subtrees and not _is_in_subtrees(p, subtrees)
+        )
+
+    return ChangesBatch(sorted(paths), sorted(subtrees))
+
+
 class IFSCallback(Protocol):
     def __call__(self, src_path, *call_args):
         pass
 
 
+class IFSBatchCallback(Protocol):
+    def __call__(self, changes: ChangesBatch, *call_args):
+        pass
+
+
 class IFSWatch(Protocol):
     def stop_tracking(self):
         pass
@@ -71,6 +187,18 @@ class IFSObserver(Protocol):
     ) -> IFSWatch:
         pass
 
+    def notify_on_any_change_batched(
+        self,
+        paths: List[PathInfo],
+        on_changes: IFSBatchCallback,
+        call_args=(),
+        extensions: Optional[Sequence[str]] = None,
+    ) -> IFSWatch:
+        """
+        Same as `notify_on_any_change` but the changes are collected during
+        some time and then sent at once in a `ChangesBatch`.
+        """
+
     def dispose(self):
         pass
 
@@ -206,6 +334,125 @@ def create_notifier(callback, timeout, extensions=None):
     return notifier
 
 
+class _BatchNotifier(threading.Thread):
+    def __init__(
+        self,
+        callback: IFSBatchCallback,
+        timeout: float,
+        extensions: Optional[Tuple[str, ...]] = None,
+        max_paths: int = MAX_BATCH_PATHS,
+    ):
+        """
+        :param callback:
+            Callable which should be called with a `ChangesBatch` (along with
+            the call args) when files change.
+        :param timeout:
+            The amount of time which should elapse to send notifications (all
+            the changes in that period are sent in a single batch).
+        :param extensions:
+            Only notify file changes of the given extensions.
+        :param max_paths:
+            Paths are collapsed into subtrees if more than this number of
+            paths change in a batch.
+        """
+        threading.Thread.__init__(self)
+        self.name = "FS Batch Notifier Thread (_BatchNotifier class)"
+        self.daemon = True
+
+        self._lock = threading.Lock()
+        # call args -> changed paths
+        self._changes: Dict[tuple, Set[str]] = {}
+        self._event = threading.Event()
+        self._timeout = timeout
+        self._disposed = False
+        self._callback = callback
+        self._extensions = extensions
+        self._max_paths = max_paths
+
+    def run(self):
+        import time
+
+        while not self._disposed:
+            self._event.wait()
+            time.sleep(self._timeout)
+            if self._disposed:
+                return
+
+            with self._lock:
+                self._event.clear()
+                changes = self._changes
+                self._changes = {}
+
+            for call_args, paths in changes.items():
+                try:
+                    self._callback(
+                        coalesce_changes(paths, max_paths=self._max_paths), *call_args
+                    )
+                except:
+                    log.exception("Error handling changes for: %s", call_args)
+
+    def on_change(self, src_path, *call_args):
+        if self._extensions:
+            if not src_path.lower().endswith(self._extensions):
+                return
+        src_path = normalize_drive(src_path)
+        with self._lock:
+            paths = self._changes.get(call_args)
+            if paths is None:
+                paths = self._changes[call_args] = set()
+            paths.add(src_path)
+            self._event.set()
+
+    def dispose(self):
+        self._disposed = True
+        self._event.set()
+
+
+def create_batch_notifier(
+    callback: IFSBatchCallback,
+    timeout: float = BATCH_TIMEOUT,
+    extensions=None,
+    max_paths: int = MAX_BATCH_PATHS,
+):
+    notifier = _BatchNotifier(callback, timeout, extensions, max_paths)
+    notifier.start()
+    return notifier
+
+
+class _BatchedWatch(object):
+    def __init__(self, watch: IFSWatch, notifier: _BatchNotifier):
+        self._watch = watch
+        self._notifier = notifier
+
+    def stop_tracking(self):
+        self._watch.stop_tracking()
+        self._notifier.dispose()
+
+    def __typecheckself__(self) -> None:
+        from robocorp_ls_core.protocols import check_implements
+
+        _: IFSWatch = check_implements(self)
+
+
+def _notify_on_any_change_batched(
+    observer: IFSObserver,
+    paths: List[PathInfo],
+    on_changes: IFSBatchCallback,
+    call_args=(),
+    extensions: Optional[Sequence[str]] = None,
+) -> IFSWatch:
+    """
+    Helper to implement `IFSObserver.notify_on_any_change_batched` in an
+    observer which is in the current process (the changes are collected in a
+    batch notifier which lives while the watch is active).
+    """
+    notifier = create_batch_notifier(on_changes)
+    watch = observer.notify_on_any_change(
+        paths, notifier.on_change, call_args=call_args, extensions=extensions
+    )
+    return _BatchedWatch(watch, notifier)
+
+
 class _DummyWatchList(object):
     def stop_tracking(self):
         pass
@@ -386,6 +633,17 @@ class _FSNotifyObserver(threading.Thread):
 
         return _FSNotifyWatchList(new_paths_to_track, new_notifications, self)
 
+    def notify_on_any_change_batched(
+        self,
+        paths: List[PathInfo],
+        on_changes: IFSBatchCallback,
+        call_args=(),
+        extensions: Optional[Sequence[str]] = None,
+    ) -> IFSWatch:
+        return _notify_on_any_change_batched(
+            self, paths, on_changes, call_args=call_args, extensions=extensions
+        )
+
     def __typecheckself__(self) -> None:
         from robocorp_ls_core.protocols import check_implements
 
@@ -528,6 +786,17 @@ class _WatchdogObserver(object):
         self._start()
         return _WatchdogWatchList(watches, self._observer, self._info_to_count)
 
+    def notify_on_any_change_batched(
+        self,
+        paths: List[PathInfo],
+        on_changes: IFSBatchCallback,
+        call_args=(),
+        extensions: Optional[Sequence[str]] = None,
+    ) -> IFSWatch:
+        return _notify_on_any_change_batched(
+            self, paths, on_changes, call_args=call_args, extensions=extensions
+        )
+
     def __typecheckself__(self) -> None:
         from robocorp_ls_core.protocols import check_implements
 
@@ -544,6 +813,15 @@ class _DummyFSObserver(object):
     ) -> IFSWatch:
         return _DummyWatchList()
 
+    def notify_on_any_change_batched(
+        self,
+        paths: List[PathInfo],
+        on_changes: IFSBatchCallback,
+        call_args=(),
+        extensions: Optional[Sequence[str]] = None,
+    ) -> IFSWatch:
+        return _DummyWatchList()
+
     def dispose(self):
         pass
 
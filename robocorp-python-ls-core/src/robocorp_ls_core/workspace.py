@@ -41,7 +41,11 @@ from robocorp_ls_core.lsp import (
 import weakref
 from collections import namedtuple
 import time
-from robocorp_ls_core.watchdog_wrapper import IFSObserver
+from robocorp_ls_core.watchdog_wrapper import (
+    IFSObserver,
+    ChangesBatch,
+    coalesce_changes,
+)
 
 log = get_logger(__name__)
 
@@ -53,16 +57,88 @@ def _text_edit_key(text_edit: Union[TextEditTypedDict, TextEdit]):
     return start["line"], start["character"]
 
 
+def _ends_with_line_break(line: str) -> bool:
+    """
+    :param line:
+        A line as returned by `str.splitlines(True)`.
+    """
+    return bool(line) and line.splitlines()[0] != line
+
+
+def _splice_lines(
+    lines: Tuple[str, ...],
+    start_line: int,
+    start_col: int,
+    end_line: int,
+    end_col: int,
+    text: str,
+) -> Tuple[int, int, List[str]]:
+    """
+    Computes the lines which should replace the lines affected by an edit.
+
+    :return:
+        A tuple(first_line, last_line, new_lines) where `lines[first_line:last_line]`
+        should be replaced by `new_lines` (with the same result which would be
+        obtained by applying the edit in the full source and calling
+        `splitlines(True)` on it).
+    """
+    len_lines = len(lines)
+    first_line = start_line
+    prefix = ""
+    if start_line < len_lines:
+        prefix = lines[start_line][:start_col]
+
+    if end_line < len_lines:
+        suffix = lines[end_line][end_col:]
+        last_line = end_line + 1
+    else:
+        suffix = ""
+        last_line = len_lines
+
+    if first_line > 0:
+        previous = lines[first_line - 1]
+        if previous.endswith("\r") or not _ends_with_line_break(previous):
+            # The previous line could be merged with the new contents (i.e.:
+            # '\r' + '\n' or a last line without a new line).
+            first_line -= 1
+            prefix = previous + prefix
+
+    contents = prefix + text + suffix
+    new_lines = contents.splitlines(True)
+    if new_lines and last_line < len_lines:
+        last = new_lines[-1]
+        if not _ends_with_line_break(last) or (
+            last.endswith("\r") and lines[last_line].startswith("\n")
+        ):
+            # The next line must be merged with the new contents.
+            new_lines = (contents + lines[last_line]).splitlines(True)
+            last_line += 1
+    return first_line, last_line, new_lines
+
+
 class _DirInfo(object):
     def __init__(self, scan_path):
         self.scan_path = scan_path
         self.files_in_directory: Set[str] = set()
 
 
+# Should be raised whenever the format of the snapshot changes.
+_VFS_SNAPSHOT_VERSION = 1
+
+
 class _VirtualFSThread(threading.Thread):
 
     SLEEP_AMONG_SCANS = 0.5
-    INNER_SLEEP = 0.1
+
+    # The number of threads used to list directories in the initial scan.
+    SCAN_THREADS = 8
+
+    # Directories modified in less than this number of seconds before being
+    # listed aren't trusted in the snapshot (as a change in the same mtime
+    # tick wouldn't be noticed).
+    SNAPSHOT_MTIME_SAFETY_SECONDS = 2
+
+    MAX_LEVELS = 20
 
     def __init__(self, virtual_fs):
         from robocorp_ls_core.watchdog_wrapper import IFSWatch
@@ -74,68 +150,238 @@ class _VirtualFSThread(threading.Thread):
 
         self._virtual_fs = weakref.ref(virtual_fs)
         self.root_folder_path = virtual_fs.root_folder_path
+        self._extensions = tuple(sorted(virtual_fs._extensions))
+        self._snapshot_filename = self._compute_snapshot_filename(
+            virtual_fs._snapshot_dir
+        )
 
         self.accept_directory = load_ignored_dirs.create_accept_directory_callable()
-        self.accept_file = lambda path_name: path_name.endswith(
-            tuple(virtual_fs._extensions)
-        )
+        self.accept_file = lambda path_name: path_name.endswith(self._extensions)
         self._disposed = threading.Event()
         self.first_check_done = threading.Event()
         self._check_done_events = []
-        self._last_sleep = None
         self._fs_watch: Optional[IFSWatch] = None
-        self._dirs_changed = set()
+        self._changes_lock = threading.Lock()
+        self._dirs_changed: Set[str] = set()
+        self._paths_changed: Set[str] = set()
+        self._subtrees_changed: Set[str] = set()
         self._trigger_loop = threading.Event()
         self.on_file_changed = Callback()
 
-    def _check_need_sleep(self):
-        last_sleep = self._last_sleep
-        if last_sleep is None:
-            self._last_sleep = time.time()
-            return
-        if time.time() - last_sleep > 0.3:
-            time.sleep(self.INNER_SLEEP)
-            self._last_sleep = time.time()
-
-    def _check_dir(self, dir_path: str, directories: Set[str], level=0, recursive=True):
-        # This is the actual poll loop
-        if level > 20:  # At most 20 levels deep...
-            log.critical(
-                "Directory tree more than 20 levels deep: %s. Bailing out.", dir_path
-            )
+        # Called with a `ChangesBatch` after the related directories are
+        # listed again.
+        self.on_files_changed = Callback()
+
+    def _compute_snapshot_filename(self, snapshot_dir: Optional[str]) -> Optional[str]:
+        if not snapshot_dir:
+            return None
+        import hashlib
+
+        digest = hashlib.sha256(
+            repr((self.root_folder_path, self._extensions)).encode("utf-8")
+        ).hexdigest()[:16]
+        basename = os.path.basename(self.root_folder_path) or "root"
+        return os.path.join(snapshot_dir, "%s_%s.json" % (basename, digest))
+
+    def _load_snapshot(self) -> Dict[str, list]:
+        """
+        :return:
+            A dict with the directory path -> [mtime_ns, subdir names, file names]
+            for the directories listed in the last session (or an empty dict
+            if not available).
+        """
+        import json
+
+        filename = self._snapshot_filename
+        if not filename or not os.path.exists(filename):
+            return {}
+        try:
+            with open(filename, "r", encoding="utf-8") as stream:
+                contents = json.load(stream)
+            if (
+                contents.get("version") != _VFS_SNAPSHOT_VERSION
+                or contents.get("root") != self.root_folder_path
+                or contents.get("extensions") != list(self._extensions)
+            ):
+                return {}
+            dirs = contents["dirs"]
+            if not isinstance(dirs, dict):
+                return {}
+            return dirs
+        except Exception:
+            log.exception("Error loading virtual fs snapshot from: %s", filename)
+            return {}
+
+    def _save_snapshot(self, dirs: Dict[str, list]) -> None:
+        import json
+
+        filename = self._snapshot_filename
+        if not filename:
             return
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            tmp_filename = "%s.%s.tmp" % (filename, os.getpid())
+            with open(tmp_filename, "w", encoding="utf-8") as stream:
+                json.dump(
+                    {
+                        "version": _VFS_SNAPSHOT_VERSION,
+                        "root": self.root_folder_path,
+                        "extensions": list(self._extensions),
+                        "dirs": dirs,
+                    },
+                    stream,
+                )
+            os.replace(tmp_filename, filename)
+        except Exception:
+            log.exception("Error saving virtual fs snapshot to: %s", filename)
+
+    def _list_dir(self, dir_path: str, snapshot: Dict[str, list]) -> Optional[list]:
+        """
+        Note: may be called from multiple threads at once.
 
-        self._last_sleep = time.time()
+        :return:
+            [mtime_ns, subdir names, file names] for the given directory (reusing
+            the snapshot if the mtime of the directory didn't change) or None if
+            it couldn't be listed.
+        """
         if self._disposed.is_set():
-            return
+            return None
+        mtime_ns: Optional[int]
+        try:
+            mtime_ns = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            return None  # Directory was removed in the meanwhile.
+
+        entry = snapshot.get(dir_path)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry
 
-        dir_path = normalize_drive(dir_path)
-        directories.add(dir_path)
-        dir_info = _DirInfo(dir_path)
+        subdirs: List[str] = []
+        files: List[str] = []
         try:
-            assert not isinstance(dir_path, bytes)
-            if self._disposed.is_set():
-                return
+            for dir_entry in os.scandir(dir_path):
+                if dir_entry.is_dir():
+                    subdirs.append(dir_entry.name)
 
-            i = 0
-            for entry in os.scandir(dir_path):
-                i += 1
+                elif self.accept_file(dir_entry.name):
+                    files.append(dir_entry.name)
+        except OSError:
+            return None  # Directory was removed in the meanwhile.
 
-                if i % 100 == 0:
-                    self._check_need_sleep()
-                if entry.is_dir():
-                    if recursive and self.accept_directory(entry.path):
-                        self._check_dir(entry.path, directories, level + 1)
+        if time.time() - (mtime_ns / 1e9) < self.SNAPSHOT_MTIME_SAFETY_SECONDS:
+            # Too recent: don't trust it in the next session.
+            mtime_ns = None
+        return [mtime_ns, sorted(subdirs), sorted(files)]
 
-                elif self.accept_file(entry.path):
-                    dir_info.files_in_directory.add(normalize_drive(entry.path))
+    def _scan_tree(
+        self, root: str, snapshot: Dict[str, list]
+    ) -> Optional[Dict[str, list]]:
+        """
+        Lists the directories of the tree starting at `root` (using a thread
+        pool so that multiple directories are listed at once -- which is
+        especially important on network drives).
 
-            virtual_fs = self._virtual_fs()
-            if virtual_fs is None:
-                return
-            virtual_fs._dir_to_info[dir_path] = dir_info
-        except OSError:
-            pass  # Directory was removed in the meanwhile.
+        :return:
+            The entries listed (see: `_list_dir`) or None if the scan was
+            interrupted.
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        new_snapshot: Dict[str, list] = {}
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.SCAN_THREADS, thread_name_prefix="VirtualFS scan"
+        )
+        try:
+            pending = {executor.submit(self._list_dir, root, snapshot)}
+            future_to_dir_and_level = {next(iter(pending)): (root, 0)}
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if self._disposed.is_set():
+                    return None
+
+                virtual_fs = self._virtual_fs()
+                if virtual_fs is None:
+                    return None
+
+                for future in done:
+                    dir_path, level = future_to_dir_and_level.pop(future)
+                    entry = future.result()
+                    if entry is None:
+                        continue
+
+                    new_snapshot[dir_path] = entry
+                    dir_info = _DirInfo(dir_path)
+                    dir_info.files_in_directory.update(
+                        os.path.join(dir_path, name) for name in entry[2]
+                    )
+                    virtual_fs._dir_to_info[dir_path] = dir_info
+
+                    if entry[1] and level >= self.MAX_LEVELS:
+                        log.critical(
+                            "Directory tree more than %s levels deep: %s. Bailing out.",
+                            self.MAX_LEVELS,
+                            dir_path,
+                        )
+                        continue
+
+                    for name in entry[1]:
+                        subdir_path = os.path.join(dir_path, name)
+                        if self.accept_directory(subdir_path):
+                            new_future = executor.submit(
+                                self._list_dir, subdir_path, snapshot
+                            )
+                            future_to_dir_and_level[new_future] = (
+                                subdir_path,
+                                level + 1,
+                            )
+                            pending.add(new_future)
+                virtual_fs = None
+        finally:
+            executor.shutdown(wait=False)
+
+        return new_snapshot
+
+    def _initial_scan(self) -> None:
+        """
+        Lists the directories of the whole tree.
+
+        When a snapshot from a previous session is available, only the
+        directories whose mtime changed are actually listed.
+        """
+        snapshot = self._load_snapshot()
+        new_snapshot = self._scan_tree(normalize_drive(self.root_folder_path), snapshot)
+        if new_snapshot is not None and new_snapshot != snapshot:
+            self._save_snapshot(new_snapshot)
+
+    def _rescan_subtree(self, virtual_fs: "_VirtualFS", subtree: str) -> bool:
+        """
+        Lists the whole subtree again (removing directories which no longer
+        exist).
+
+        :return:
+            False if the scan was interrupted.
+        """
+        root = normalize_drive(self.root_folder_path)
+        if subtree != root and not subtree.startswith(os.path.join(root, "")):
+            # Changes can be collapsed to a directory above the root.
+            subtree = root
+
+        prefix = os.path.join(subtree, "")
+        old_dirs = [
+            dir_path
+            for dir_path in list(virtual_fs._dir_to_info)
+            if dir_path == subtree or dir_path.startswith(prefix)
+        ]
+        new_snapshot = self._scan_tree(subtree, {})
+        if new_snapshot is None:
+            return False
+
+        for dir_path in old_dirs:
+            if dir_path not in new_snapshot:
+                virtual_fs._dir_to_info.pop(dir_path, None)
+        return True
 
     def run(self):
         from robocorp_ls_core.watchdog_wrapper import PathInfo
@@ -144,16 +390,16 @@ class _VirtualFSThread(threading.Thread):
         fs_observer: IFSObserver = virtual_fs._fs_observer
 
         # Setup tracking for changes
-        self._fs_watch = fs_observer.notify_on_any_change(
+        self._fs_watch = fs_observer.notify_on_any_change_batched(
             [PathInfo(self.root_folder_path, recursive=True)],
-            on_change=self._on_change,
+            on_changes=self._on_changes,
             extensions=virtual_fs._extensions,
         )
         check_done_events = self._check_done_events
         self._check_done_events = []
 
         # Do initial scan
-        self._check_dir(self.root_folder_path, set())
+        self._initial_scan()
 
         # Notify of initial scan
         self.first_check_done.set()
@@ -175,18 +421,20 @@ class _VirtualFSThread(threading.Thread):
                 self.dispose()
                 return
 
-            # This would do a clean update, which'd be very cost intensive...
-            # Instead, let's work only on the `_dirs_changed`.
-            # directories = set()
-            # current = list(virtual_fs._dir_to_info)
-            # self._check_dir(self.root_folder_path, directories)
-            #
-            # for d in current:
-            #     if d not in directories:
-            #         virtual_fs._dir_to_info.pop(d, None)
+            # A clean update (listing the whole tree again) would be very
+            # cost intensive... Instead, let's work only on the `_dirs_changed`.
+
+            with self._changes_lock:
+                dirs_changed = self._dirs_changed
+                paths_changed = self._paths_changed
+                subtrees_changed = self._subtrees_changed
+                self._dirs_changed = set()
+                self._paths_changed = set()
+                self._subtrees_changed = set()
 
-            dirs_changed = self._dirs_changed
-            self._dirs_changed = set()
+            for subtree in subtrees_changed:
+                if not self._rescan_subtree(virtual_fs, subtree):
+                    return
 
             for dir_path in dirs_changed:
                 dir_path = normalize_drive(dir_path)
@@ -209,13 +457,20 @@ class _VirtualFSThread(threading.Thread):
             virtual_fs = None
 
             self._trigger_loop.clear()
+            if paths_changed or subtrees_changed:
+                self.on_files_changed(coalesce_changes(paths_changed, subtrees_changed))
+                # Note: subtrees are only notified in `on_files_changed`.
+                for src_path in paths_changed:
+                    self.on_file_changed(src_path)
             self._notify_check_done_events(check_done_events)
 
-    def _on_change(self, src_path):
-        changed_dir = os.path.dirname(src_path)
-        self._dirs_changed.add(changed_dir)
+    def _on_changes(self, changes: ChangesBatch):
+        with self._changes_lock:
+            for src_path in changes.paths:
+                self._dirs_changed.add(os.path.dirname(src_path))
+            self._paths_changed.update(changes.paths)
+            self._subtrees_changed.update(changes.subtrees)
         self._trigger_loop.set()
-        self.on_file_changed(src_path)
 
     def dispose(self):
         fs_watch = self._fs_watch
@@ -239,23 +494,38 @@ class _VirtualFSThread(threading.Thread):
 
 class _VirtualFS(object):
     def __init__(
-        self, root_folder_path: str, extensions: Iterable[str], fs_observer: IFSObserver
+        self,
+        root_folder_path: str,
+        extensions: Iterable[str],
+        fs_observer: IFSObserver,
+        snapshot_dir: Optional[str] = None,
     ):
+        """
+        :param snapshot_dir:
+            If given, the directory listing is saved to a snapshot in this
+            directory so that in a new session only the directories whose
+            mtime changed need to be listed again.
+        """
         self.root_folder_path = normalize_drive(root_folder_path)
 
         self._dir_to_info: Dict[str, _DirInfo] = {}
 
         self._extensions = set(extensions)
         self._fs_observer = fs_observer
+        self._snapshot_dir = snapshot_dir
 
         # Do initial scan and then start tracking changes.
         self._virtual_fsthread = _VirtualFSThread(self)
         self._virtual_fsthread.start()
         self.on_file_changed = self._virtual_fsthread.on_file_changed
+        self.on_files_changed = self._virtual_fsthread.on_files_changed
 
     def wait_for_check_done(self, timeout):
         self._virtual_fsthread.wait_for_check_done(timeout)
 
+    def is_first_check_done(self) -> bool:
+        return self._virtual_fsthread.first_check_done.is_set()
+
     def _iter_all_doc_uris(self, extensions: Tuple[str, ...]) -> Iterable[str]:
         """
         :param extensions:
@@ -283,15 +553,26 @@ class _WorkspaceFolderWithVirtualFS(object):
     invalidating them as needed.
     """
 
-    def __init__(self, uri, name, track_file_extensions, fs_observer: IFSObserver):
+    def __init__(
+        self,
+        uri,
+        name,
+        track_file_extensions,
+        fs_observer: IFSObserver,
+        snapshot_dir: Optional[str] = None,
+    ):
         self.uri = uri
         self.name = name
         self.path = uris.to_fs_path(uri)
 
         self._vs: _VirtualFS = _VirtualFS(
-            self.path, track_file_extensions, fs_observer=fs_observer
+            self.path,
+            track_file_extensions,
+            fs_observer=fs_observer,
+            snapshot_dir=snapshot_dir,
         )
         self.on_file_changed = self._vs.on_file_changed
+        self.on_files_changed = self._vs.on_files_changed
 
     def _iter_all_doc_uris(self, extensions: Tuple[str, ...]) -> Iterable[str]:
         """
@@ -306,6 +587,9 @@ class _WorkspaceFolderWithVirtualFS(object):
     def wait_for_check_done(self, timeout):
         self._vs.wait_for_check_done(timeout)
 
+    def is_first_check_done(self) -> bool:
+        return self._vs.is_first_check_done()
+
     def dispose(self):
         self._vs.dispose()
 
@@ -327,7 +611,13 @@ class Workspace(object):
         fs_observer: IFSObserver,
         workspace_folders: Optional[List[IWorkspaceFolder]] = None,
         track_file_extensions=(".robot", ".resource", ".py", ".yml", ".yaml"),
+        vfs_snapshot_dir: Optional[str] = None,
     ) -> None:
+        """
+        :param vfs_snapshot_dir:
+            A directory where the listing of the workspace folders is saved
+            to speed up the initial scan in new sessions.
+        """
         from robocorp_ls_core.lsp import WorkspaceFolder
         from robocorp_ls_core.callbacks import Callback
         from robocorp_ls_core.cache import LRUCache
@@ -340,6 +630,7 @@ class Workspace(object):
         self._folders: Dict[str, _WorkspaceFolderWithVirtualFS] = {}
         self._track_file_extensions = track_file_extensions
         self._fs_observer = fs_observer
+        self._vfs_snapshot_dir = vfs_snapshot_dir
 
         # Contains the docs with files considered open.
         self._docs: Dict[str, IDocument] = {}
@@ -378,6 +669,10 @@ class Workspace(object):
 
         self.on_file_changed = Callback()
 
+        # Called with a `ChangesBatch` (where subtrees may be reported instead
+        # of the actual paths if too many files changed at once).
+        self.on_files_changed = Callback()
+
         if workspace_folders is not None:
             for folder in workspace_folders:
                 self.add_folder(folder)
@@ -420,8 +715,10 @@ class Workspace(object):
                 folder.name,
                 track_file_extensions=self._track_file_extensions,
                 fs_observer=self._fs_observer,
+                snapshot_dir=self._vfs_snapshot_dir,
             )
             folder.on_file_changed.register(self.on_file_changed)
+            folder.on_files_changed.register(self.on_files_changed)
             folders[folder.uri] = folder
             self._folders = folders
 
@@ -431,6 +728,7 @@ class Workspace(object):
             folders = self._folders.copy()
             folder = folders.pop(folder_uri)
             folder.on_file_changed.unregister(self.on_file_changed)
+            folder.on_files_changed.unregister(self.on_files_changed)
             folder.dispose()
             self._folders = folders
 
@@ -452,6 +750,19 @@ class Workspace(object):
         for folder in self.iter_folders():
             folder.wait_for_check_done(timeout)
 
+    def is_first_check_done(self) -> bool:
+        """
+        :return: whether the initial scan of the files in all the workspace
+            folders was already done (before it's done, files which already
+            exist in the filesystem may not be listed in
+            `iter_all_doc_uris_in_workspace`).
+        """
+        folders = self._folders.values()  # Ok, thread-safe (set as a whole).
+        for folder in folders:
+            if not folder.is_first_check_done():
+                return False
+        return True
+
     @implements(IWorkspace.get_folder_paths)
     def get_folder_paths(self) -> List[str]:
         folders = self._folders  # Ok, thread-safe (folders are always set as a whole)
@@ -539,7 +850,8 @@ class Workspace(object):
 
         # Note: don't mutate an existing doc, always create a new one based on it
         # (so, existing references won't have racing conditions).
-        new_doc = self._create_document(doc_uri, doc.source, text_doc["version"])
+        new_doc = self._create_document(doc_uri, version=text_doc["version"])
+        new_doc._set_contents_from(doc)
         new_doc.apply_change(change)
         self._docs[normalized_uri] = new_doc
         return new_doc
@@ -602,8 +914,10 @@ class Document(object):
         self.version = version
         self.path = uris.to_fs_path(uri)  # Note: may be None.
 
+        self.__source: Optional[str] = None
+        self.__lines: Optional[Tuple[str, ...]] = None
+        self.__line_start_offsets: Optional[List[int]] = None
         self._source = source
-        self.__line_start_offsets = None
 
         # Only set when the source is read from disk.
         self._source_mtime = -1
@@ -628,6 +942,8 @@ class Document(object):
         return str(self.uri)
 
     def __len__(self):
+        if self.__source is None and self.__lines is not None:
+            return sum(len(line) for line in self.__lines)
         return len(self.source)
 
     def __bool__(self):
@@ -641,11 +957,18 @@ class Document(object):
         return DocumentSelection(self, line, col)
 
     @property
-    def _source(self) -> str:
-        return self.__source
+    def _source(self) -> Optional[str]:
+        source = self.__source
+        if source is None:
+            lines = self.__lines
+            if lines is not None:
+                # The contents are kept as lines when changes are applied and
+                # the source is only created when actually requested.
+                source = self.__source = "".join(lines)
+        return source
 
     @_source.setter
-    def _source(self, source: str) -> None:
+    def _source(self, source: Optional[str]) -> None:
         # i.e.: when the source is set, reset the lines.
         self._check_in_mutate_thread()
         if self.immutable:
@@ -655,19 +978,49 @@ class Document(object):
         self.__source = source
         self._clear_caches()
 
+    def _set_lines(
+        self, lines: Tuple[str, ...], line_start_offsets: Optional[List[int]]
+    ) -> None:
+        """
+        Sets the contents of the document as lines (the source is computed
+        lazily from those).
+
+        :param line_start_offsets:
+            The offsets where each line starts (if already computed) or None.
+        """
+        self._check_in_mutate_thread()
+        if self.immutable:
+            raise RuntimeError(
+                "This document is immutable, so, its source cannot be changed."
+            )
+        self.__source = None
+        self._clear_caches()
+        self.__lines = lines
+        self.__line_start_offsets = line_start_offsets
+
+    def _set_contents_from(self, doc: "Document") -> None:
+        """
+        Sets the contents of this document to be the same contents of the
+        given document (sharing the lines already computed).
+        """
+        if doc.__source is None and doc.__lines is not None:
+            self._set_lines(doc.__lines, doc.__line_start_offsets)
+        else:
+            self._source = doc.source
+
     def _clear_caches(self):
         self._check_in_mutate_thread()
         self.__lines = None
         self.__line_start_offsets = None
 
     @property
-    def _lines(self):
+    def _lines(self) -> Tuple[str, ...]:
         lines = self.__lines
         if lines is None:
             lines = self.__lines = tuple(self.source.splitlines(True))
         return lines
 
-    def get_internal_lines(self):
+    def get_internal_lines(self) -> Tuple[str, ...]:
         return self._lines
 
     def iter_lines(self, keep_ends=True):
@@ -821,43 +1174,47 @@ class Document(object):
         end_line = change_range["end"]["line"]
         end_col = change_range["end"]["character"]
 
-        # Check for an edit occurring at the very end of the file
-        if start_line == len(self._lines):
-
-            self._source = self.source + text
+        lines = self._lines
+        if start_line > len(lines):
+            # Edit out of the document range (nothing to do).
             return
 
-        new = io.StringIO()
-
-        # Note: we could probably improve this sometime to work better with big documents
-        # (but the link with the AST must be well thought out too).
+        # The document is kept as a tuple of lines and an edit only creates the
+        # lines which were changed (the remaining lines are shared). The line
+        # start offsets are also updated instead of being fully recomputed,
+        # so, the cost of an edit in a big document is mostly copying
+        # references (and not the whole text).
         # References:
-        # https://news.ycombinator.com/item?id=30415868
-        # https://news.ycombinator.com/item?id=15381886
         # https://code.visualstudio.com/blogs/2018/03/23/text-buffer-reimplementation
-        # https://blog.jetbrains.com/fleet/2022/02/fleet-below-deck-part-ii-breaking-down-the-editor/
         # https://raphlinus.github.io/xi/2020/06/27/xi-retrospective.html
+        first_line, last_line, changed_lines = _splice_lines(
+            lines, start_line, start_col, end_line, end_col, text
+        )
+        new_lines = lines[:first_line] + tuple(changed_lines) + lines[last_line:]
+
+        line_start_offsets = self.__line_start_offsets
+        new_line_start_offsets: Optional[List[int]] = None
+        if line_start_offsets is not None and first_line < len(line_start_offsets):
+            new_line_start_offsets = line_start_offsets[:first_line]
+            offset = line_start_offsets[first_line]
+            for line in changed_lines:
+                new_line_start_offsets.append(offset)
+                offset += len(line)
 
-        # Iterate over the existing document until we hit the edit range,
-        # at which point we write the new text, then loop until we hit
-        # the end of the range and continue writing.
-        for i, line in enumerate(self._lines):
-            if i < start_line:
-                new.write(line)
-                continue
-
-            if i > end_line:
-                new.write(line)
-                continue
-
-            if i == start_line:
-                new.write(line[:start_col])
-                new.write(text)
+            if last_line < len(lines):
+                delta = offset - line_start_offsets[last_line]
+                if delta:
+                    new_line_start_offsets.extend(
+                        o + delta for o in line_start_offsets[last_line:]
+                    )
+                else:
+                    new_line_start_offsets.extend(line_start_offsets[last_line:])
 
-            if i == end_line:
-                new.write(line[end_col:])
+            elif new_lines and new_lines[-1].endswith(("\r", "\n")):
+                # See: iter_lines (an empty line is added at the end).
+                new_line_start_offsets.append(offset)
 
-        self._source = new.getvalue()
+        self._set_lines(new_lines, new_line_start_offsets)
 
     def apply_text_edits(
         self, text_edits: Union[List[TextEditTypedDict], List[TextEdit]]
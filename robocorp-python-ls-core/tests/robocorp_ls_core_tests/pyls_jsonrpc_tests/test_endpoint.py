@@ -427,6 +427,95 @@ def test_consume_request_cancel_monitor(endpoint, dispatcher, consumer, monkeypa
     await_assertion(wait_for_monitor_check_cancelled)
 
 
+def test_endpoint_metrics(endpoint, dispatcher, consumer):
+    from robocorp_ls_core.jsonrpc.streams import JsonRpcStreamWriter
+
+    writer = JsonRpcStreamWriter(io.BytesIO())
+    writer.on_message_written = endpoint.metrics.on_message_written
+    endpoint._consumer = writer.write
+
+    def async_handler():
+        time.sleep(0.05)
+        return "x" * 100
+
+    dispatcher["asyncMethod"] = mock.Mock(return_value=async_handler)
+    dispatcher["syncMethod"] = mock.Mock(return_value=1234)
+    dispatcher["errorMethod"] = mock.Mock(side_effect=ValueError)
+
+    for i in range(3):
+        endpoint.consume({"jsonrpc": "2.0", "id": f"async{i}", "method": "asyncMethod"})
+    endpoint.consume({"jsonrpc": "2.0", "id": "sync", "method": "syncMethod"})
+    endpoint.consume({"jsonrpc": "2.0", "id": "error", "method": "errorMethod"})
+
+    def check_async_finished():
+        assert endpoint.metrics.to_dict()["asyncMethod"]["payload_size"]["count"] == 3
+
+    await_assertion(check_async_finished)
+
+    metrics = endpoint.metrics.to_dict()
+    async_metrics = metrics["asyncMethod"]
+    assert async_metrics["requests"] == 3
+    assert async_metrics["cancelled"] == 0
+    assert async_metrics["queue_wait"]["count"] == 3
+    assert async_metrics["handler_time"]["p50"] >= 0.05
+    assert async_metrics["serialization_time"]["count"] == 3
+    assert async_metrics["payload_size"]["p99"] > 100
+
+    assert metrics["syncMethod"]["requests"] == 1
+    assert metrics["syncMethod"]["handler_time"]["count"] == 1
+    assert metrics["errorMethod"]["errors"] == 1
+
+    # The metrics are available through a custom request.
+    consumer = mock.MagicMock()
+    endpoint._consumer = consumer
+    endpoint.consume({"jsonrpc": "2.0", "id": "metrics", "method": "$/endpointMetrics"})
+    _name, args, _kwargs = consumer.mock_calls[0]
+    assert args[0]["id"] == "metrics"
+    assert args[0]["result"]["asyncMethod"]["requests"] == 3
+
+    formatted = endpoint.metrics.format()
+    assert "asyncMethod: requests: 3, cancelled: 0, errors: 0" in formatted
+
+
+def test_endpoint_metrics_cancelled(endpoint, dispatcher, consumer):
+    @require_monitor
+    def async_handler(monitor: IMonitor):
+        for _ in range(30):
+            time.sleep(0.05)
+            monitor.check_cancelled()
+
+    dispatcher["methodName"] = mock.Mock(return_value=async_handler)
+
+    endpoint.consume({"jsonrpc": "2.0", "id": MSG_ID, "method": "methodName"})
+    endpoint.consume(
+        {"jsonrpc": "2.0", "method": "$/cancelRequest", "params": {"id": MSG_ID}}
+    )
+
+    def check_cancelled():
+        assert endpoint.metrics.to_dict()["methodName"]["cancelled"] == 1
+
+    await_assertion(check_cancelled)
+
+
+def test_rolling_histogram():
+    from robocorp_ls_core.jsonrpc.metrics import RollingHistogram
+
+    histogram = RollingHistogram(max_samples=100)
+    assert histogram.to_dict() == {"count": 0}
+
+    for i in range(200):
+        histogram.add(i)
+
+    # Only the latest 100 samples are considered for the percentiles.
+    assert histogram.to_dict() == {
+        "count": 200,
+        "p50": 150,
+        "p95": 194,
+        "p99": 198,
+        "max": 199,
+    }
+
+
 def test_consume_request_cancel_unknown(endpoint):
     # Verify consume doesn't throw
     endpoint.consume(
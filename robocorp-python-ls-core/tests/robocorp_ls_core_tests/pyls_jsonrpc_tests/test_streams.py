@@ -105,3 +105,143 @@ def test_writer_bad_message(wfile, writer):
     )
 
     assert wfile.getvalue() in (b"", (b"Content-Length: 10\r\n" b"\r\n" b"1546304461"))
+
+
+def test_reader_split_reads(reader):
+    class _SplitStream(object):
+        # Only returns a few bytes on each read.
+
+        closed = False
+
+        def __init__(self, contents):
+            self._stream = BytesIO(contents)
+
+        def readline(self):
+            return self._stream.readline()
+
+        def readinto(self, buf):
+            return self._stream.readinto(buf[:3])
+
+    body = b'{"id": "hello", "method": "method", "params": {"a": "\xc3\xa1"}}'
+    reader = JsonRpcStreamReader(
+        _SplitStream(b"Content-Length: %d\r\n\r\n%s" % (len(body), body) * 2)
+    )
+
+    consumer = mock.Mock()
+    reader.listen(consumer)
+
+    expected = {"id": "hello", "method": "method", "params": {"a": "á"}}
+    assert consumer.call_args_list == [mock.call(expected), mock.call(expected)]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_codec_kind(request, monkeypatch):
+    from robocorp_ls_core.jsonrpc import json_codec
+
+    if request.param == "orjson":
+        if not json_codec.is_orjson_available():
+            pytest.skip("orjson not available.")
+    else:
+        monkeypatch.setattr(json_codec, "_orjson", None)
+    return request.param
+
+
+def test_json_codec(json_codec_kind):
+    from robocorp_ls_core.jsonrpc import json_codec
+
+    dumps = json_codec.create_dumps(sort_keys=True)
+    obj = {"b": [1, 2.5, None, True], "a": "á", "c": 2**70}
+    assert dumps(obj).startswith(b'{"a":')
+    assert json_codec.loads(dumps(obj)) == obj
+    assert json_codec.loads(json_codec.dumps({1: 2})) == {"1": 2}
+
+    import datetime
+
+    with pytest.raises(TypeError):
+        dumps(datetime.datetime(year=2019, month=1, day=1))
+
+
+def test_forward_raw_result(json_codec_kind):
+    from robocorp_ls_core.jsonrpc.streams import RawJson
+
+    # i.e.: the api writes the response, which is read by the language server
+    # and then written to the client.
+    api_wfile = BytesIO()
+    JsonRpcStreamWriter(api_wfile).write(
+        {"jsonrpc": "2.0", "id": 22, "result": {"data": [1, 2, 3]}}
+    )
+    JsonRpcStreamWriter(api_wfile).write(
+        {"jsonrpc": "2.0", "id": 23, "result": {"data": [1, 2, 3]}}
+    )
+    JsonRpcStreamWriter(api_wfile).write({"jsonrpc": "2.0", "id": 24, "result": []})
+
+    api_wfile.seek(0)
+    reader = JsonRpcStreamReader(api_wfile)
+    reader.keep_raw_result(22)
+    reader.keep_raw_result(24)
+    consumer = mock.Mock()
+    reader.listen(consumer)
+
+    msgs = [c[0][0] for c in consumer.call_args_list]
+    assert isinstance(msgs[0]["result"], RawJson)
+    assert msgs[0]["result"].load() == {"data": [1, 2, 3]}
+    assert msgs[1] == {"jsonrpc": "2.0", "id": 23, "result": {"data": [1, 2, 3]}}
+    assert isinstance(msgs[2]["result"], RawJson)
+    assert not msgs[2]["result"]
+    assert not reader._raw_result_ids
+
+    client_wfile = BytesIO()
+    writer = JsonRpcStreamWriter(client_wfile, sort_keys=True)
+    writer.write({"jsonrpc": "2.0", "id": "1", "result": msgs[0]["result"]})
+
+    client_wfile.seek(0)
+    reader = JsonRpcStreamReader(client_wfile)
+    consumer = mock.Mock()
+    reader.listen(consumer)
+    consumer.assert_called_once_with(
+        {"jsonrpc": "2.0", "id": "1", "result": {"data": [1, 2, 3]}}
+    )
+
+
+def test_writer_coalesce_notifications():
+    import threading
+
+    class _Stream(BytesIO):
+        def __init__(self):
+            BytesIO.__init__(self)
+            self.flushes = 0
+            self.flushed = threading.Event()
+
+        def flush(self):
+            self.flushes += 1
+            self.flushed.set()
+
+        def close(self):
+            pass  # Keep it open to check the contents afterwards.
+
+    wfile = _Stream()
+    writer = JsonRpcStreamWriter(wfile, coalesce_notifications_delay=0.05)
+    for i in range(10):
+        writer.write({"jsonrpc": "2.0", "method": "notification", "params": i})
+    assert wfile.flushes == 0
+
+    # A response writes the pending notifications along with it.
+    writer.write({"jsonrpc": "2.0", "id": 1, "result": None})
+    assert wfile.flushes == 1
+
+    # Without other messages, they're written after the delay.
+    wfile.flushed.clear()
+    writer.write({"jsonrpc": "2.0", "method": "notification", "params": 10})
+    assert wfile.flushed.wait(5)
+    assert wfile.flushes == 2
+    writer.close()
+
+    wfile.seek(0)
+    reader = JsonRpcStreamReader(wfile)
+    consumer = mock.Mock()
+    reader.listen(consumer)
+    msgs = [c[0][0] for c in consumer.call_args_list]
+    assert [msg.get("params", msg.get("id")) for msg in msgs] == list(range(10)) + [
+        1,
+        10,
+    ]
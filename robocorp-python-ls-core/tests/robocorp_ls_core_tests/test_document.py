@@ -281,3 +281,28 @@ def test_get_document_range():
     assert d.get_range(0, 0, 3, 1) == "aa\nbb\ncc"
     assert d.get_range(0, 0, 4, 1) == "aa\nbb\ncc"
     assert d.get_range(0, 0, 4, 0) == "aa\nbb\ncc"
+
+
+def test_document_edits_keep_line_offsets():
+    doc = Document("file:///uri", "aa\r\nbb\ncc\rdd")
+    assert doc.offset_to_line_col(8) == (2, 1)
+
+    def check(line, col, endline, endcol, text, expected):
+        doc.apply_change(
+            TextDocumentContentChangeEvent(
+                Range(Position(line, col), Position(endline, endcol)), 0, text
+            )
+        )
+        new_doc = Document("file:///uri", expected)
+        assert doc.get_internal_lines() == new_doc.get_internal_lines()
+        for offset in range(len(expected) + 1):
+            assert doc.offset_to_line_col(offset) == new_doc.offset_to_line_col(offset)
+        assert doc.source == expected
+
+    check(1, 1, 1, 1, "x\ny", "aa\r\nbx\nyb\ncc\rdd")
+    check(0, 2, 0, 3, "", "aa\nbx\nyb\ncc\rdd")
+    check(4, 0, 4, 0, "\n", "aa\nbx\nyb\ncc\r\ndd")
+    check(0, 0, 2, 1, "", "b\ncc\r\ndd")
+    check(3, 0, 3, 0, "\r", "b\ncc\r\ndd\r")
+    check(3, 0, 3, 0, "\n", "b\ncc\r\ndd\r\n")
+    check(0, 0, 5, 0, "new", "new")
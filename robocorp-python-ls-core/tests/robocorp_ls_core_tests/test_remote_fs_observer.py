@@ -180,6 +180,65 @@ def test_remote_fs_observer_conflicts(remote_fs_observer, tmpdir):
         observer.dispose()
 
 
+def test_remote_fs_observer_batched(remote_fs_observer, tmpdir):
+    from robocorp_ls_core.watchdog_wrapper import PathInfo
+    from robocorp_ls_core.watchdog_wrapper import ChangesBatch
+    from robocorp_ls_core.watchdog_wrapper import MAX_BATCH_PATHS
+    from robocorp_ls_core.unittest_tools.fixtures import wait_for_test_condition
+    from robocorp_ls_core.watchdog_wrapper import IFSObserver
+    import os
+    import time
+
+    tmpdir.join("dir_rec").mkdir()
+    many = tmpdir.join("dir_rec").join("many")
+    many.mkdir()
+
+    batches = []
+
+    def on_changes(changes: ChangesBatch, *args):
+        assert args == ("foo", "bar")
+        batches.append(changes)
+
+    observer: IFSObserver = remote_fs_observer
+    watch = observer.notify_on_any_change_batched(
+        [PathInfo(tmpdir.join("dir_rec"), True)],
+        on_changes,
+        call_args=("foo", "bar"),
+        extensions=(".txt",),
+    )
+
+    time.sleep(2)
+    try:
+        # More files than the max in a batch (so, they may be reported as a
+        # subtree change).
+        expected = set()
+        for i in range(MAX_BATCH_PATHS + 100):
+            filename = str(many.join("my%s.txt" % i))
+            with open(filename, "w") as stream:
+                stream.write("foo")
+            expected.add(os.path.normcase(filename))
+
+        def collect_not_found():
+            not_found = set(expected)
+            for changes in batches:
+                not_found.difference_update(os.path.normcase(p) for p in changes.paths)
+                for subtree in changes.subtrees:
+                    prefix = os.path.normcase(os.path.join(subtree, ""))
+                    not_found = set(p for p in not_found if not p.startswith(prefix))
+            return not_found
+
+        wait_for_test_condition(
+            lambda: not collect_not_found(),
+            msg=lambda: f"Not found: {len(collect_not_found())}. Batches: {batches}",
+        )
+        for changes in batches:
+            assert len(changes.paths) + len(changes.subtrees) <= MAX_BATCH_PATHS
+
+    finally:
+        watch.stop_tracking()
+        observer.dispose()
+
+
 def test_glob_matches_path():
     from robocorp_ls_core.load_ignored_dirs import glob_matches_path
     import sys
@@ -0,0 +1,97 @@
+import os
+import time
+from pathlib import Path
+
+_MISSING_DOC_TEST_CASE = "0202"
+
+
+def _collect(project_root, filename, source):
+    from robot.api import get_model
+    from robocorp_ls_core.robocop_wrapper import collect_robocop_diagnostics
+
+    ast = get_model(filename, data_only=False, curdir=os.path.dirname(filename))
+    return collect_robocop_diagnostics(project_root, ast, filename, source)
+
+
+def test_robocop_runner_cache(tmpdir):
+    from robocorp_ls_core import robocop_wrapper
+
+    robocop_wrapper.clear_robocop_runners_cache()
+
+    project_root = str(tmpdir)
+    src = os.path.join(project_root, "src")
+    os.makedirs(src)
+    target_robot = os.path.join(src, "target.robot")
+    source = """
+*** Test Cases ***
+Test
+    Fail
+
+"""
+    with open(target_robot, "w") as stream:
+        stream.write(source)
+
+    initial_cwd = os.getcwd()
+    diagnostics = _collect(project_root, target_robot, source)
+    assert os.getcwd() == initial_cwd
+    assert _MISSING_DOC_TEST_CASE in [d["code"] for d in diagnostics]
+
+    # The runner must be reused while the config is the same.
+    runner_info = robocop_wrapper._runners_cache.get_runner_info(
+        Path(project_root), Path(src)
+    )
+    assert (
+        robocop_wrapper._runners_cache.get_runner_info(Path(project_root), Path(src))
+        is runner_info
+    )
+
+    # A new config file is only seen after the cache is cleared (which is
+    # done when the file watcher reports a change).
+    config_file = os.path.join(project_root, ".robocop")
+    with open(config_file, "w") as stream:
+        stream.write("--exclude missing-doc-test-case\n")
+    robocop_wrapper.clear_robocop_runners_cache()
+
+    diagnostics = _collect(project_root, target_robot, source)
+    assert _MISSING_DOC_TEST_CASE not in [d["code"] for d in diagnostics]
+
+    # Changing the config file (mtime) must also create a new runner.
+    time.sleep(0.05)
+    with open(config_file, "w") as stream:
+        stream.write("--exclude missing-doc-suite\n")
+    mtime = os.path.getmtime(config_file)
+    os.utime(config_file, (mtime + 5, mtime + 5))
+
+    diagnostics = _collect(project_root, target_robot, source)
+    assert _MISSING_DOC_TEST_CASE in [d["code"] for d in diagnostics]
+
+
+def test_robocop_runner_cache_shared_and_lru(tmpdir, monkeypatch):
+    from robocorp_ls_core import robocop_wrapper
+
+    robocop_wrapper._import_robocop()
+    project_root = Path(str(tmpdir))
+    os.makedirs(str(project_root / ".git"))
+    for name in ("a", "b", "c1", "c2", "c3"):
+        os.makedirs(str(project_root / name))
+    for name in ("c1", "c2", "c3"):
+        with open(str(project_root / name / ".robocop"), "w") as stream:
+            stream.write("--exclude missing-doc-test-case\n")
+
+    monkeypatch.setattr(robocop_wrapper._RobocopRunnersCache, "MAX_RUNNERS", 2)
+    cache = robocop_wrapper._RobocopRunnersCache()
+
+    # Directories which resolve to the same config share the runner.
+    assert cache.get_runner_info(project_root, project_root / "a") is (
+        cache.get_runner_info(project_root, project_root / "b")
+    )
+
+    cache.clear()
+    c1 = cache.get_runner_info(project_root, project_root / "c1")
+    c2 = cache.get_runner_info(project_root, project_root / "c2")
+    assert cache.get_runner_info(project_root, project_root / "c1") is c1
+
+    # Only the least recently used (c2) is evicted.
+    cache.get_runner_info(project_root, project_root / "c3")
+    assert cache.get_runner_info(project_root, project_root / "c1") is c1
+    assert cache.get_runner_info(project_root, project_root / "c2") is not c2
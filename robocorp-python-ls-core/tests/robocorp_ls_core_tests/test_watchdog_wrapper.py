@@ -319,6 +319,90 @@ def test_watchdog_extensions(tmpdir, backend):
         observer.dispose()
 
 
+def test_coalesce_changes():
+    from robocorp_ls_core.watchdog_wrapper import coalesce_changes
+    from robocorp_ls_core.watchdog_wrapper import ChangesBatch
+    import os
+
+    root = os.path.abspath("root")
+    a = os.path.join(root, "a")
+    b = os.path.join(root, "b")
+
+    changes = coalesce_changes(
+        [os.path.join(a, "1.py"), os.path.join(a, "1.py"), os.path.join(b, "2.py")]
+    )
+    assert changes == ChangesBatch(
+        [os.path.join(a, "1.py"), os.path.join(b, "2.py")], []
+    )
+
+    # Too many changes: the directory with more changes is collapsed first.
+    paths = [os.path.join(a, "%s.py" % i) for i in range(10)]
+    paths.append(os.path.join(b, "2.py"))
+    changes = coalesce_changes(paths, max_paths=5)
+    assert changes == ChangesBatch([os.path.join(b, "2.py")], [a])
+
+    # Entries inside a subtree aren't reported.
+    changes = coalesce_changes(
+        [os.path.join(a, "c", "1.py"), os.path.join(b, "2.py")], subtrees=[a, root]
+    )
+    assert changes == ChangesBatch([], [root])
+
+    # Each change in a different directory: parents are collapsed until it fits.
+    paths = [os.path.join(root, "d%s" % i, "inner", "1.py") for i in range(10)]
+    changes = coalesce_changes(paths, max_paths=5)
+    assert changes == ChangesBatch([], [root])
+
+
+@pytest.mark.parametrize("backend", ["watchdog", "fsnotify"])
+def test_watchdog_batched(tmpdir, backend):
+    from robocorp_ls_core import watchdog_wrapper
+    from robocorp_ls_core.watchdog_wrapper import PathInfo
+    from robocorp_ls_core.watchdog_wrapper import ChangesBatch
+    from robocorp_ls_core.unittest_tools.fixtures import wait_for_test_condition
+    import os
+
+    tmpdir.join("dir_rec").mkdir()
+
+    found = set()
+    batches = []
+
+    def on_changes(changes: ChangesBatch, *args):
+        assert args == ("foo", "bar")
+        batches.append(changes)
+        found.update(os.path.basename(p) for p in changes.paths)
+
+    observer = watchdog_wrapper.create_observer(backend, None)
+    watch = observer.notify_on_any_change_batched(
+        [PathInfo(tmpdir.join("dir_rec"), True)],
+        on_changes,
+        call_args=("foo", "bar"),
+        extensions=(".txt",),
+    )
+
+    try:
+        for i in range(5):
+            tmpdir.join("dir_rec").join("my%s.txt" % i).write("foo")
+        tmpdir.join("dir_rec").join("my.libspec").write("foo")
+
+        expected = set("my%s.txt" % i for i in range(5))
+        wait_for_test_condition(
+            lambda: found == expected, msg=lambda: f"Basenames found: {found}"
+        )
+        # Multiple changes are received in the same batch.
+        assert len(batches) < 5
+
+        watch.stop_tracking()
+        del batches[:]
+        tmpdir.join("dir_rec").join("another.txt").write("foo")
+
+        # Give time to check if some change arrives.
+        time.sleep(1)
+        assert not batches
+    finally:
+        watch.stop_tracking()
+        observer.dispose()
+
+
 def test_watchdog_only_recursive(tmpdir):
     from robocorp_ls_core import watchdog_wrapper
 
@@ -42,7 +42,13 @@ class RFStream:
 
         config = _Config()
 
-        check_args = ["--dir=", "--port=", "--max-file-size=", "--max-files="]
+        check_args = [
+            "--dir=",
+            "--port=",
+            "--max-file-size=",
+            "--max-files=",
+            "--async-write=",
+        ]
         for arg in args:
             for check_arg in check_args:
                 if arg.startswith(check_arg):
@@ -58,6 +64,10 @@ class RFStream:
         max_file_size_arg = kwargs.get("--max-file-size", "1MB")
         config.max_file_size_in_bytes = _convert_to_bytes(max_file_size_arg)
         config.max_files = int(kwargs.get("--max-files", "5"))
+        config.async_write = str(kwargs.get("--async-write", "false")).lower() in (
+            "1",
+            "true",
+        )
 
         if config.max_file_size_in_bytes < 1000:
             raise ValueError(
@@ -285,6 +295,11 @@ class RFStream:
         if message["level"] in ("FAIL", "ERROR"):
             return self.log_message(message, skip_error=False)
 
+    def close(self):
+        # Called by Robot Framework when the execution finishes (makes sure
+        # that everything is written when the async writer is used).
+        return self._robot_output_impl.close()
+
 
 def iter_decoded_log_format(stream):
     from ._decoder import iter_decoded_log_format
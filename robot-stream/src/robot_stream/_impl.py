@@ -4,9 +4,10 @@ import json
 import itertools
 import string
 import datetime
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
 import os
 import traceback
+import threading
 from contextlib import contextmanager
 
 
@@ -29,6 +30,10 @@ class _Config:
     max_file_size_in_bytes: int
     max_files: int
 
+    # When True, the contents are written to the file in a background thread
+    # (see: _AsyncWriter).
+    async_write: bool = False
+
     # Loaded from constructor kwargs (to be used
     # only when used as an API).
     write: Optional[Callable[[str], None]] = None
@@ -58,15 +63,179 @@ class _RotateHandler:
             return True
         return False
 
-    def register_file(self, filepath: Path):
+    def register_file(self, filepath: Path) -> List[Path]:
+        """
+        :return: the files which must be removed (as the max files was reached).
+        """
         self._found_files.append(filepath)
 
+        remove = []
         while len(self._found_files) > self._max_files:
-            p: Path = self._found_files.pop(0)
-            try:
-                os.remove(p)
-            except:
-                traceback.print_exc()
+            remove.append(self._found_files.pop(0))
+        return remove
+
+
+def _remove_files(files: Sequence[Path]) -> None:
+    for p in files:
+        try:
+            os.remove(p)
+        except:
+            traceback.print_exc()
+
+
+class _SyncWriter:
+    """
+    Writes the contents to the file (flushing after each write) in the
+    thread which is running robot.
+    """
+
+    def __init__(self):
+        self._stream = None
+
+    def write(self, in_bytes: bytes) -> None:
+        stream = self._stream
+        if stream is not None:
+            stream.write(in_bytes)
+            stream.flush()
+
+    def rotate(self, new_file: Path, remove_files: Sequence[Path]) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+        _remove_files(remove_files)
+        self._stream = new_file.open("wb")
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+class _AsyncWriter:
+    """
+    Writes the contents to the file in a background thread.
+
+    The thread running robot just appends the contents to a pending list
+    (which is cheap) and the background thread writes all the pending
+    contents at once when `FLUSH_SIZE_IN_BYTES` is reached, when
+    `FLUSH_INTERVAL_IN_SECONDS` elapses or when `flush()` is explicitly
+    requested.
+
+    The pending contents are bounded: if the background thread can't keep up,
+    the thread running robot blocks until there's space available.
+
+    Note: rotations are added to the same pending list so that they happen
+    exactly in the same place they'd happen in the `_SyncWriter` (the decision
+    on when to rotate is still done by the caller).
+    """
+
+    FLUSH_INTERVAL_IN_SECONDS = 0.5
+    FLUSH_SIZE_IN_BYTES = 256 * 1024
+    MAX_PENDING_SIZE_IN_BYTES = 16 * 1024 * 1024
+
+    _ROTATE = "rotate"
+    _FLUSH = "flush"
+    _CLOSE = "close"
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._pending: list = []
+        self._pending_size = 0
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="RFStream writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, in_bytes: bytes) -> None:
+        with self._condition:
+            while self._pending_size >= self.MAX_PENDING_SIZE_IN_BYTES:
+                self._condition.wait()
+            self._pending.append(in_bytes)
+            self._pending_size += len(in_bytes)
+            if self._pending_size >= self.FLUSH_SIZE_IN_BYTES:
+                self._wake.set()
+
+    def _add_command(self, command: tuple) -> None:
+        with self._condition:
+            self._pending.append(command)
+        self._wake.set()
+
+    def rotate(self, new_file: Path, remove_files: Sequence[Path]) -> None:
+        self._add_command((self._ROTATE, new_file, remove_files))
+
+    def flush(self) -> None:
+        """
+        Blocks until all the contents written so far are flushed to the file.
+        """
+        if self._closed:
+            return
+        event = threading.Event()
+        self._add_command((self._FLUSH, event))
+        event.wait()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._add_command((self._CLOSE,))
+        self._thread.join()
+
+    def _run(self) -> None:
+        stream = None
+
+        def write_contents(contents: List[bytes]) -> None:
+            if contents and stream is not None:
+                try:
+                    stream.write(b"".join(contents))
+                    stream.flush()
+                except:
+                    traceback.print_exc()
+
+        while True:
+            self._wake.wait(self.FLUSH_INTERVAL_IN_SECONDS)
+            self._wake.clear()
+
+            with self._condition:
+                pending = self._pending
+                self._pending = []
+                self._pending_size = 0
+                self._condition.notify_all()
+
+            contents: List[bytes] = []
+            for item in pending:
+                if item.__class__ is bytes:
+                    contents.append(item)
+                    continue
+
+                write_contents(contents)
+                contents = []
+
+                kind = item[0]
+                if kind == self._ROTATE:
+                    if stream is not None:
+                        stream.close()
+                        stream = None
+                    _remove_files(item[2])
+                    try:
+                        stream = item[1].open("wb")
+                    except:
+                        traceback.print_exc()
+
+                elif kind == self._FLUSH:
+                    item[1].set()
+
+                elif kind == self._CLOSE:
+                    if stream is not None:
+                        stream.close()
+                    return
+
+            write_contents(contents)
 
 
 class _StackHandler:
@@ -128,7 +297,12 @@ class _RobotOutputImpl:
 
         self._current_entry = -1
         self._current_file: Optional[Path] = None
-        self._stream = None
+        self._writer: Optional[Union[_SyncWriter, _AsyncWriter]] = None
+        if self._output_dir is not None:
+            if config.async_write:
+                self._writer = _AsyncWriter()
+            else:
+                self._writer = _SyncWriter()
 
         if config.initial_time is None:
             self._initial_time = datetime.datetime.now()
@@ -167,13 +341,8 @@ class _RobotOutputImpl:
             else:
                 self._current_file = self._output_dir / f"output.rfstream"
 
-            if self._stream is not None:
-                self._stream.close()
-                self._stream = None
-
-            self._rotate_handler.register_file(self._current_file)
-
-            self._stream = self._current_file.open("wb")
+            remove_files = self._rotate_handler.register_file(self._current_file)
+            self._writer.rotate(self._current_file, remove_files)
             self._write_on_start_or_after_rotate()
 
     def _write_on_start_or_after_rotate(self):
@@ -208,12 +377,22 @@ class _RobotOutputImpl:
             self._write(s)
 
         in_bytes = s.encode("utf-8", errors="replace")
-        if self._stream is not None:
-            self._stream.write(in_bytes)
-            self._stream.flush()
+        if self._writer is not None:
+            self._writer.write(in_bytes)
         if self._rotate_handler.rotate_after(in_bytes):
             self._rotate_output()
 
+    def flush(self) -> None:
+        """
+        Makes sure that everything written so far is in the file.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
     def _write_json(self, msg_type, args):
         args_as_str = json.dumps(args)
         s = f"{msg_type}{args_as_str}\n"
@@ -287,6 +466,7 @@ class _RobotOutputImpl:
             ],
         )
         self._stack_handler.pop()
+        self.flush()
 
     def start_test(self, name, test_id, test_line, time_delta, tags):
         oid = self._obtain_id
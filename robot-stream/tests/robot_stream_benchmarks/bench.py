@@ -0,0 +1,135 @@
+"""
+Benchmarks for the overhead of the robot_stream listener.
+
+Usage:
+
+    cd robot-stream/tests
+    python -m robot_stream_benchmarks [--size=medium] [--repeat=3] [--output=results.json]
+
+A suite with many tests/keywords/log messages is generated and robot is run:
+
+- without any listener (`no_listener`),
+- with the listener writing synchronously (`sync_write`),
+- with the listener writing in a background thread (`async_write`).
+
+The `overhead` reported is the time relative to the run without a listener.
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": dict(tests=5, keywords_per_test=10, logs_per_keyword=2),
+    "medium": dict(tests=50, keywords_per_test=50, logs_per_keyword=5),
+    "large": dict(tests=200, keywords_per_test=100, logs_per_keyword=10),
+}
+
+MODES = ("no_listener", "sync_write", "async_write")
+
+
+def generate_suite(
+    target: Path, tests: int, keywords_per_test: int, logs_per_keyword: int
+):
+    lines = ["*** Test Cases ***"]
+    for i in range(tests):
+        lines.append(f"Test {i}")
+        for j in range(keywords_per_test):
+            lines.append(f"    My Keyword    {j}")
+        lines.append("")
+
+    lines.append("*** Keywords ***")
+    lines.append("My Keyword")
+    lines.append("    [Arguments]    ${arg}")
+    for k in range(logs_per_keyword):
+        lines.append(f"    Log    Message {k} for ${{arg}}")
+    lines.append("")
+
+    target.write_text("\n".join(lines), "utf-8")
+
+
+def _run_robot(robot_file: Path, outdir: Path, mode: str) -> float:
+    import robot
+
+    args = ["-l", "NONE", "-r", "NONE", "-o", "NONE", "--console", "none"]
+    if mode != "no_listener":
+        listener_dir = str(outdir).replace(":", "<COLON>")
+        async_write = mode == "async_write"
+        args.extend(
+            [
+                "--listener",
+                f"robot_stream.RFStream:--dir={listener_dir}:--max-file-size=100MB:--async-write={async_write}",
+            ]
+        )
+    args.append(str(robot_file))
+
+    initial_time = time.perf_counter()
+    robot.run_cli(args, exit=False)
+    return time.perf_counter() - initial_time
+
+
+def run_benchmarks(size: str, repeat: int, work_dir: Optional[str] = None) -> dict:
+    if work_dir is None:
+        work_dir = tempfile.mkdtemp(prefix="robot_stream_bench_")
+    work_path = Path(work_dir)
+
+    robot_file = work_path / "bench_suite.robot"
+    generate_suite(robot_file, **SIZES[size])
+
+    name_to_times: Dict[str, List[float]] = {mode: [] for mode in MODES}
+    for i in range(repeat):
+        # Interleave the modes so that noise affects all of them equally.
+        for mode in MODES:
+            outdir = work_path / f"out_{mode}_{i}"
+            name_to_times[mode].append(_run_robot(robot_file, outdir, mode))
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for mode, times in name_to_times.items():
+        results[mode] = {
+            "min": min(times),
+            "median": statistics.median(times),
+            "times": times,
+        }
+
+    baseline = results["no_listener"]["min"]
+    for mode in MODES:
+        results[mode]["overhead"] = (
+            (results[mode]["min"] / baseline) - 1 if baseline else 0.0
+        )
+
+    return {
+        "size": size,
+        "repeat": repeat,
+        "python": sys.version,
+        "results": results,
+    }
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for the overhead of the robot_stream listener."
+    )
+    parser.add_argument("--size", choices=sorted(SIZES), default="medium")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Where the json results should be saved.")
+    parser.add_argument(
+        "--work-dir", help="Directory where the suite is generated (temp by default)."
+    )
+    parsed = parser.parse_args(args)
+
+    results = run_benchmarks(parsed.size, parsed.repeat, parsed.work_dir)
+    for mode in MODES:
+        info = results["results"][mode]
+        print(
+            f"{mode:<15} min: {info['min']:.3f}s  median: {info['median']:.3f}s"
+            f"  overhead: {info['overhead'] * 100:+.1f}%"
+        )
+
+    if parsed.output:
+        with open(parsed.output, "w", encoding="utf-8") as stream:
+            json.dump(results, stream, indent=4)
+    return 0
@@ -0,0 +1,10 @@
+def test_benchmarks_small(tmpdir):
+    from robot_stream_benchmarks import bench
+
+    results = bench.run_benchmarks("small", repeat=1, work_dir=str(tmpdir))
+    assert set(results["results"]) == set(bench.MODES)
+    for mode in bench.MODES:
+        assert results["results"][mode]["min"] > 0
+
+    for mode in ("sync_write", "async_write"):
+        assert tuple(tmpdir.join(f"out_{mode}_0").visit("*.rfstream"))
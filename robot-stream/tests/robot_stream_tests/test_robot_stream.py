@@ -46,6 +46,7 @@ def run_with_listener(
     max_file_size="500kb",
     max_files=5,
     robot_file: Optional[Path] = None,
+    async_write=False,
 ) -> _GeneratedInfo:
     import robot
     from robot_stream import RFStream
@@ -76,7 +77,7 @@ def run_with_listener(
                 "-o",
                 str(xml_output),
                 "--listener",
-                f"robot_stream.RFStream:--dir={outdir_to_listener}:--max-file-size={max_file_size}:--max-files={max_files}",
+                f"robot_stream.RFStream:--dir={outdir_to_listener}:--max-file-size={max_file_size}:--max-files={max_files}:--async-write={async_write}",
                 str(robot_file),
             ],
             exit=False,
@@ -100,6 +101,37 @@ def test_rotate_logs(datadir):
     assert len(files) == 2, f"Found: {files}"
 
 
+def test_rotate_logs_async_write(datadir):
+    generated_info = run_with_listener(
+        datadir,
+        robot_file=datadir / "robot2.robot",
+        max_file_size="50kb",
+        max_files=2,
+        async_write=True,
+    )
+    files = tuple(generated_info.outdir.glob("*.rfstream"))
+    assert len(files) == 2, f"Found: {files}"
+
+
+def test_async_write_same_contents(datadir):
+    robot_file = datadir / "robot2.robot"
+    sync_info = run_with_listener(
+        datadir, outdir=datadir / "out_sync", robot_file=robot_file
+    )
+    async_info = run_with_listener(
+        datadir, outdir=datadir / "out_async", robot_file=robot_file, async_write=True
+    )
+
+    sync_impl = sync_info.robot_stream.robot_output_impl
+    async_impl = async_info.robot_stream.robot_output_impl
+    assert sync_impl.current_file.name == async_impl.current_file.name
+
+    sync_contents = list(iter_with_test_replacements(sync_impl.current_file))
+    async_contents = list(iter_with_test_replacements(async_impl.current_file))
+    assert sync_contents
+    assert sync_contents == async_contents
+
+
 def test_robot_stream(datadir):
     from robot_stream import iter_decoded_log_format
     from io import StringIO
@@ -42,6 +42,7 @@ class RobotState {
     public String robotLintIgnoreVariables = "";
     public String robotLintIgnoreEnvironmentVariables = "";
     public String robotLintUnusedKeyword = "";
+    public String robotLintWorkspaceConcurrency = "";
     public String robotCompletionsSectionHeadersForm = "";
     public String robotCompletionsKeywordsFormat = "";
     public String robotCompletionsKeywordsArgumentsSeparator = "";
@@ -79,6 +80,7 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
     public static final String ROBOT_LINT_IGNORE_VARIABLES = "robot.lint.ignoreVariables";
     public static final String ROBOT_LINT_IGNORE_ENVIRONMENT_VARIABLES = "robot.lint.ignoreEnvironmentVariables";
     public static final String ROBOT_LINT_UNUSED_KEYWORD = "robot.lint.unusedKeyword";
+    public static final String ROBOT_LINT_WORKSPACE_CONCURRENCY = "robot.lint.workspaceConcurrency";
     public static final String ROBOT_COMPLETIONS_SECTION_HEADERS_FORM = "robot.completions.section_headers.form";
     public static final String ROBOT_COMPLETIONS_KEYWORDS_FORMAT = "robot.completions.keywords.format";
     public static final String ROBOT_COMPLETIONS_KEYWORDS_ARGUMENTS_SEPARATOR = "robot.completions.keywords.argumentsSeparator";
@@ -118,6 +120,7 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
         robotState.robotLintIgnoreVariables = getRobotLintIgnoreVariables();
         robotState.robotLintIgnoreEnvironmentVariables = getRobotLintIgnoreEnvironmentVariables();
         robotState.robotLintUnusedKeyword = getRobotLintUnusedKeyword();
+        robotState.robotLintWorkspaceConcurrency = getRobotLintWorkspaceConcurrency();
         robotState.robotCompletionsSectionHeadersForm = getRobotCompletionsSectionHeadersForm();
         robotState.robotCompletionsKeywordsFormat = getRobotCompletionsKeywordsFormat();
         robotState.robotCompletionsKeywordsArgumentsSeparator = getRobotCompletionsKeywordsArgumentsSeparator();
@@ -155,6 +158,7 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
         setRobotLintIgnoreVariables(robotState.robotLintIgnoreVariables);
         setRobotLintIgnoreEnvironmentVariables(robotState.robotLintIgnoreEnvironmentVariables);
         setRobotLintUnusedKeyword(robotState.robotLintUnusedKeyword);
+        setRobotLintWorkspaceConcurrency(robotState.robotLintWorkspaceConcurrency);
         setRobotCompletionsSectionHeadersForm(robotState.robotCompletionsSectionHeadersForm);
         setRobotCompletionsKeywordsFormat(robotState.robotCompletionsKeywordsFormat);
         setRobotCompletionsKeywordsArgumentsSeparator(robotState.robotCompletionsKeywordsArgumentsSeparator);
@@ -383,6 +387,15 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
             }
         }
         
+        if(!robotLintWorkspaceConcurrency.isEmpty()){
+            
+            try {
+                jsonObject.add(ROBOT_LINT_WORKSPACE_CONCURRENCY, new JsonPrimitive(Integer.parseInt(robotLintWorkspaceConcurrency)));
+            } catch(Exception e) {
+                LOG.error(e);
+            }
+        }
+        
         if(!robotCompletionsSectionHeadersForm.isEmpty()){
             
             try {
@@ -1581,6 +1594,53 @@ public class RobotPreferences implements PersistentStateComponent<RobotState> {
         }
     }
     
+    private String robotLintWorkspaceConcurrency = "";
+
+    public @NotNull String getRobotLintWorkspaceConcurrency() {
+        return robotLintWorkspaceConcurrency;
+    }
+
+    public @Nullable JsonPrimitive getRobotLintWorkspaceConcurrencyAsJson() {
+        if(robotLintWorkspaceConcurrency.isEmpty()){
+            return null;
+        }
+        
+        return new JsonPrimitive(Integer.parseInt(robotLintWorkspaceConcurrency));
+    }
+
+    public @NotNull String validateRobotLintWorkspaceConcurrency(String robotLintWorkspaceConcurrency) {
+        if(robotLintWorkspaceConcurrency.isEmpty()) {
+            return "";
+        }
+        try {
+            
+            new JsonPrimitive(Integer.parseInt(robotLintWorkspaceConcurrency));
+            
+            return "";
+            
+        } catch(Exception e) {
+            return e.toString();
+        }
+    }
+
+    public void setRobotLintWorkspaceConcurrency(String s) {
+        if (s == null) {
+            s = "";
+        }
+        if (s.equals(robotLintWorkspaceConcurrency)) {
+            return;
+        }
+        String old = robotLintWorkspaceConcurrency;
+        robotLintWorkspaceConcurrency = s;
+        for (LanguageServerDefinition.IPreferencesListener listener : listeners) {
+            try {
+                listener.onChanged(ROBOT_LINT_WORKSPACE_CONCURRENCY, old, s);
+            } catch (CancelledException e) {
+                // just ignore at this point
+            }
+        }
+    }
+    
     private String robotCompletionsSectionHeadersForm = "";
 
     public @NotNull String getRobotCompletionsSectionHeadersForm() {
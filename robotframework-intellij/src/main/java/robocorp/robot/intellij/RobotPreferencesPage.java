@@ -44,6 +44,7 @@ class RobotPreferencesComponent {
     private final JBTextField robotLintIgnoreVariables = new JBTextField();
     private final JBTextField robotLintIgnoreEnvironmentVariables = new JBTextField();
     private final JBTextField robotLintUnusedKeyword = new JBTextField();
+    private final JBTextField robotLintWorkspaceConcurrency = new JBTextField();
     private final JBTextField robotCompletionsSectionHeadersForm = new JBTextField();
     private final JBTextField robotCompletionsKeywordsFormat = new JBTextField();
     private final JBTextField robotCompletionsKeywordsArgumentsSeparator = new JBTextField();
@@ -101,6 +102,8 @@ class RobotPreferencesComponent {
                 .addComponent(createJTextArea("Don't report undefined environment variables for these variables\n(i.e.: [\"VAR1\", \"VAR2\"]).\nNote: expected format: JSON Array\n"))
                 .addLabeledComponent(new JBLabel("Lint Unused Keyword"), robotLintUnusedKeyword, 1, false)
                 .addComponent(createJTextArea("Reports whether a keyword is not used anywhere in the workspace.\nNote: expected 'true' or 'false'\n"))
+                .addLabeledComponent(new JBLabel("Lint Workspace Concurrency"), robotLintWorkspaceConcurrency, 1, false)
+                .addComponent(createJTextArea("The number of batches of files linted concurrently when linting the workspace or the files selected\nin the explorer.\n"))
                 .addLabeledComponent(new JBLabel("Completions Section Headers Form"), robotCompletionsSectionHeadersForm, 1, false)
                 .addComponent(createJTextArea("Defines how completions should be shown for section headers\n(i.e.: *** Setting(s) ***). One of: plural, singular, both.\n"))
                 .addLabeledComponent(new JBLabel("Completions Keywords Format"), robotCompletionsKeywordsFormat, 1, false)
@@ -353,6 +356,15 @@ class RobotPreferencesComponent {
         robotLintUnusedKeyword.setText(newText);
     }
     
+    @NotNull
+    public String getRobotLintWorkspaceConcurrency() {
+        return robotLintWorkspaceConcurrency.getText();
+    }
+
+    public void setRobotLintWorkspaceConcurrency (@NotNull String newText) {
+        robotLintWorkspaceConcurrency.setText(newText);
+    }
+    
     @NotNull
     public String getRobotCompletionsSectionHeadersForm() {
         return robotCompletionsSectionHeadersForm.getText();
@@ -536,6 +548,10 @@ public class RobotPreferencesPage implements Configurable {
             return true;
         }
         
+        if(!settings.getRobotLintWorkspaceConcurrency().equals(component.getRobotLintWorkspaceConcurrency())){
+            return true;
+        }
+        
         if(!settings.getRobotCompletionsSectionHeadersForm().equals(component.getRobotCompletionsSectionHeadersForm())){
             return true;
         }
@@ -596,6 +612,7 @@ public class RobotPreferencesPage implements Configurable {
         component.setRobotLintIgnoreVariables(settings.getRobotLintIgnoreVariables());
         component.setRobotLintIgnoreEnvironmentVariables(settings.getRobotLintIgnoreEnvironmentVariables());
         component.setRobotLintUnusedKeyword(settings.getRobotLintUnusedKeyword());
+        component.setRobotLintWorkspaceConcurrency(settings.getRobotLintWorkspaceConcurrency());
         component.setRobotCompletionsSectionHeadersForm(settings.getRobotCompletionsSectionHeadersForm());
         component.setRobotCompletionsKeywordsFormat(settings.getRobotCompletionsKeywordsFormat());
         component.setRobotCompletionsKeywordsArgumentsSeparator(settings.getRobotCompletionsKeywordsArgumentsSeparator());
@@ -710,6 +727,10 @@ public class RobotPreferencesPage implements Configurable {
         if(!s.isEmpty()) {
             throw new ConfigurationException("Error in Lint Unused Keyword:\n" + s);
         }
+        s = settings.validateRobotLintWorkspaceConcurrency(component.getRobotLintWorkspaceConcurrency());
+        if(!s.isEmpty()) {
+            throw new ConfigurationException("Error in Lint Workspace Concurrency:\n" + s);
+        }
         s = settings.validateRobotCompletionsSectionHeadersForm(component.getRobotCompletionsSectionHeadersForm());
         if(!s.isEmpty()) {
             throw new ConfigurationException("Error in Completions Section Headers Form:\n" + s);
@@ -759,6 +780,7 @@ public class RobotPreferencesPage implements Configurable {
         settings.setRobotLintIgnoreVariables(component.getRobotLintIgnoreVariables());
         settings.setRobotLintIgnoreEnvironmentVariables(component.getRobotLintIgnoreEnvironmentVariables());
         settings.setRobotLintUnusedKeyword(component.getRobotLintUnusedKeyword());
+        settings.setRobotLintWorkspaceConcurrency(component.getRobotLintWorkspaceConcurrency());
         settings.setRobotCompletionsSectionHeadersForm(component.getRobotCompletionsSectionHeadersForm());
         settings.setRobotCompletionsKeywordsFormat(component.getRobotCompletionsKeywordsFormat());
         settings.setRobotCompletionsKeywordsArgumentsSeparator(component.getRobotCompletionsKeywordsArgumentsSeparator());
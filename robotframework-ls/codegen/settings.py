@@ -121,6 +121,11 @@ SETTINGS = {
         "default": False,
         "description": "Reports whether a keyword is not used anywhere in the workspace.",
     },
+    "robot.lint.workspaceConcurrency": {
+        "type": "number",
+        "default": 2,
+        "description": "The number of batches of files linted concurrently when linting the workspace or the files selected in the explorer.",
+    },
     "robot.completions.section_headers.form": {
         "type": "string",
         "default": "plural",
@@ -0,0 +1,183 @@
+"""
+Process which keeps `robot` imported and generates .libspec files on demand
+(used by `libdoc_worker_pool.LibdocWorkerPool`).
+
+Note: this module is executed directly (as a script) in a new interpreter,
+so, it must only depend on the standard library and on `robot`. Its directory
+is removed from the `sys.path` (so that it doesn't shadow user modules) and
+the cwd of each job is put at `sys.path[0]` while it runs (as would be the
+case with `python -m robot.libdoc`).
+
+The protocol is based on json messages (one per line):
+
+- Request (in stdin): {"argv": [...libdoc args...], "cwd": "/path/or/null"}
+- Response (in stdout): {"returncode": 0, "output": "..."}
+"""
+import io
+import json
+import os
+import sys
+
+
+def _get_library_roots(argv, cwd, sys_path_during_job):
+    """
+    :return:
+        The directories from where the library (and its dependencies) may be
+        loaded in the given job: the pythonpath entries (-P/--pythonpath),
+        the entries it added to the sys.path, the cwd and the directory of the
+        library if it's given as a path.
+    """
+    roots = set()
+    base_dir = cwd or os.getcwd()
+    if cwd:
+        roots.add(cwd)
+
+    for i, arg in enumerate(argv[:-1]):
+        if arg in ("-P", "--pythonpath"):
+            roots.add(os.path.join(base_dir, argv[i + 1]))
+
+    if len(argv) >= 2:
+        # libdoc [options] library_or_resource output_file
+        library = argv[-2].split("::")[0]
+        if os.sep in library or (os.altsep and os.altsep in library):
+            roots.add(os.path.dirname(os.path.join(base_dir, library)))
+
+    roots.update(sys_path_during_job)
+    return set(os.path.normcase(os.path.abspath(root)) for root in roots if root)
+
+
+def _get_module_paths(module):
+    paths = []
+    filename = getattr(module, "__file__", None)
+    if isinstance(filename, str):
+        paths.append(filename)
+    else:
+        # i.e.: namespace packages
+        try:
+            paths.extend(p for p in getattr(module, "__path__", ()))
+        except Exception:
+            pass
+    return paths
+
+
+def _get_container(path, directories):
+    # The most specific directory which contains the given path.
+    found = None
+    for directory in directories:
+        if path == directory or path.startswith(directory.rstrip(os.sep) + os.sep):
+            if found is None or len(directory) > len(found):
+                found = directory
+    return found
+
+
+def _unload_library_modules(library_roots, base_sys_path, new_module_names):
+    """
+    Removes the modules loaded from the library roots (they may change and
+    need to be reloaded for a new libspec).
+
+    Other modules (i.e.: robot submodules, docutils or C-extensions imported
+    lazily) are kept: they're not expected to change and are only unloaded
+    when the worker is recycled.
+
+    Note: a library root may contain an entry of the base sys.path (i.e.:
+    a virtual environment inside the workspace), in which case the most
+    specific directory decides whether the module is unloaded.
+    """
+    base_dirs = set(
+        os.path.normcase(os.path.abspath(entry)) for entry in base_sys_path if entry
+    )
+    directories = library_roots | base_dirs
+
+    for name in new_module_names:
+        module = sys.modules.get(name)
+        if module is None:
+            continue
+        for path in _get_module_paths(module):
+            container = _get_container(
+                os.path.normcase(os.path.abspath(path)), directories
+            )
+            if container is not None and container in library_roots:
+                sys.modules.pop(name, None)
+                break
+
+
+def _run_libdoc(argv, cwd):
+    from robot.libdoc import LibDoc  # type:ignore
+
+    original_cwd = os.getcwd()
+    original_sys_path = list(sys.path)
+    original_modules = set(sys.modules)
+    original_stdout = sys.stdout
+    original_stderr = sys.stderr
+
+    # Same as `python -m robot.libdoc` (which has the cwd in the sys.path).
+    job_cwd = cwd or original_cwd
+    sys.path.insert(0, job_cwd)
+
+    output = io.StringIO()
+    sys.stdout = output
+    sys.stderr = output
+    try:
+        if cwd:
+            os.chdir(cwd)
+        try:
+            returncode = LibDoc().execute_cli(argv, exit=False)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except BaseException as e:
+            output.write("Error running libdoc: %s\n" % (e,))
+            returncode = 1
+    finally:
+        sys.stdout = original_stdout
+        sys.stderr = original_stderr
+        os.chdir(original_cwd)
+
+        library_roots = _get_library_roots(
+            argv, job_cwd, set(sys.path).difference(original_sys_path)
+        )
+        sys.path[:] = original_sys_path
+        _unload_library_modules(
+            library_roots,
+            original_sys_path,
+            set(sys.modules).difference(original_modules),
+        )
+
+    return returncode or 0, output.getvalue()
+
+
+def _remove_worker_dir_from_sys_path():
+    # When executed as a script its directory is the first sys.path entry.
+    worker_dir = os.path.normcase(os.path.dirname(os.path.abspath(__file__)))
+    sys.path[:] = [
+        entry
+        for entry in sys.path
+        if not entry or os.path.normcase(os.path.abspath(entry)) != worker_dir
+    ]
+
+
+def main():
+    _remove_worker_dir_from_sys_path()
+
+    # The original stdout is used only to communicate with the pool and
+    # anything else written to it is redirected to stderr.
+    protocol_out = io.open(os.dup(1), "w", encoding="utf-8", newline="\n")
+    os.dup2(2, 1)
+
+    # Import it before receiving requests (so that it's already warm).
+    import robot.libdoc  # type:ignore  # noqa
+
+    stdin = io.open(sys.stdin.fileno(), "r", encoding="utf-8", newline="\n")
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request = json.loads(line)
+        returncode, output = _run_libdoc(request["argv"], request.get("cwd"))
+        protocol_out.write(
+            json.dumps({"returncode": returncode, "output": output}) + "\n"
+        )
+        protocol_out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import Optional, Set, List, Dict, Iterator, Sequence
+from typing import Optional, Set, List, Dict, Iterator, Sequence, Tuple, Iterable
 import weakref
 
 from robocorp_ls_core.protocols import ITestInfoFromSymbolsCacheTypedDict
@@ -8,6 +8,8 @@ from robotframework_ls.impl.protocols import (
     ISymbolsJsonListEntry,
     ICompletionContext,
     ISymbolKeywordInfo,
+    IKeywordNameIndex,
+    KeywordUsageLocation,
 )
 import typing
 import threading
@@ -16,9 +18,14 @@ from robocorp_ls_core.robotframework_log import get_logger
 log = get_logger(__name__)
 
 
+def _get_keyword_info_name(keyword_info: ISymbolKeywordInfo) -> str:
+    return keyword_info.name
+
+
 class BaseSymbolsCache:
     _library_info: "Optional[weakref.ReferenceType[ILibraryDoc]]"
     _doc: "Optional[weakref.ReferenceType[IRobotDocument]]"
+    _keyword_name_index: IKeywordNameIndex
 
     def __init__(
         self,
@@ -30,6 +37,9 @@ class BaseSymbolsCache:
         test_info: Optional[List[ITestInfoFromSymbolsCacheTypedDict]],
         global_variables_defined: Optional[Set[str]] = None,
         variable_references: Optional[Set[str]] = None,
+        keyword_usage_locations: Optional[
+            Dict[str, Sequence[KeywordUsageLocation]]
+        ] = None,
     ):
         self._uri = uri
         if library_info is not None:
@@ -53,6 +63,12 @@ class BaseSymbolsCache:
             variable_references = set()
         self._variable_references: Set[str] = variable_references
 
+        if keyword_usage_locations is None:
+            keyword_usage_locations = {}
+        self._keyword_usage_locations: Dict[
+            str, Sequence[KeywordUsageLocation]
+        ] = keyword_usage_locations
+
         self._test_info = test_info
 
     def get_test_info(self) -> Optional[List[ITestInfoFromSymbolsCacheTypedDict]]:
@@ -64,6 +80,11 @@ class BaseSymbolsCache:
     def has_keyword_usage(self, normalized_keyword_name: str) -> bool:
         return normalized_keyword_name in self._keywords_used
 
+    def iter_keyword_usage_locations(
+        self,
+    ) -> Iterator[Tuple[str, Sequence[KeywordUsageLocation]]]:
+        yield from iter(self._keyword_usage_locations.items())
+
     def has_global_variable_definition(self, normalized_variable_name: str) -> bool:
         return normalized_variable_name in self._global_variables_defined
 
@@ -88,13 +109,56 @@ class BaseSymbolsCache:
     def iter_keyword_info(self) -> Iterator[ISymbolKeywordInfo]:
         raise NotImplementedError("iter_keyword_info abstract in: %s", self.__class__)
 
+    def get_keyword_name_index(self) -> IKeywordNameIndex:
+        try:
+            return self._keyword_name_index
+        except AttributeError:
+            from robotframework_ls.impl.keyword_name_index import KeywordNameIndex
+
+            self._keyword_name_index = KeywordNameIndex(
+                list(self.iter_keyword_info()), _get_keyword_info_name
+            )
+        return self._keyword_name_index
+
+
+class _IndexedUriInfo(object):
+    """
+    The names a given uri contributed to the reverse index (used to remove
+    the uri contributions when it changes).
+    """
+
+    __slots__ = ["global_variables", "variable_references", "keyword_usages"]
+
+    def __init__(self, symbols_cache: BaseSymbolsCache):
+        self.global_variables = frozenset(symbols_cache._global_variables_defined)
+        self.variable_references = frozenset(symbols_cache._variable_references)
+        self.keyword_usages = dict(symbols_cache.iter_keyword_usage_locations())
+
 
 class SymbolsCacheReverseIndex:
+    """
+    Provides an index from names to the uris where those are used/defined.
+
+    It's computed for the whole workspace in the first `synchronize()` and
+    later on only the uris notified as changed are re-indexed.
+
+    Note: the internal dicts are never changed in-place (a new dict is set
+    when some entry changes), so, reading doesn't need the lock.
+    """
+
+    # If more than this number of uris changed, reindex the whole workspace
+    # (instead of updating uri by uri).
+    MAX_URIS_CHANGED_FOR_INCREMENTAL_UPDATE = 200
+
     def __init__(self):
         self._global_var_to_uris: Dict[str, Set[str]] = {}
+        self._variable_reference_to_uris: Dict[str, Set[str]] = {}
+        self._keyword_usages: Dict[str, Dict[str, Sequence[KeywordUsageLocation]]] = {}
+        self._uri_to_indexed_info: Dict[str, _IndexedUriInfo] = {}
 
         self._lock = threading.Lock()
         self._reindex_count = 0
+        self._incremental_update_count = 0
 
         self._uris_changed = set()
         self._force_reindex = True
@@ -105,10 +169,16 @@ class SymbolsCacheReverseIndex:
             self._uris_changed.clear()
 
     def notify_uri_changed(self, uri: str) -> None:
+        self.notify_uris_changed((uri,))
+
+    def notify_uris_changed(self, uris: Iterable[str]) -> None:
         with self._lock:
             if not self._force_reindex:
-                self._uris_changed.add(uri)
-                if len(self._uris_changed) > 1:
+                self._uris_changed.update(uris)
+                if (
+                    len(self._uris_changed)
+                    > self.MAX_URIS_CHANGED_FOR_INCREMENTAL_UPDATE
+                ):
                     self._force_reindex = True
                     self._uris_changed.clear()
 
@@ -120,49 +190,199 @@ class SymbolsCacheReverseIndex:
     ) -> Optional[Set[str]]:
         return self._global_var_to_uris.get(normalized_var_name)
 
+    def get_variable_reference_uris(self, normalized_var_name: str) -> Set[str]:
+        return self._variable_reference_to_uris.get(normalized_var_name, set()).union(
+            self._global_var_to_uris.get(normalized_var_name, ())
+        )
+
+    def get_keyword_usages(
+        self, normalized_keyword_name: str
+    ) -> Dict[str, Sequence[KeywordUsageLocation]]:
+        return self._keyword_usages.get(normalized_keyword_name, {})
+
     def synchronize(self, context: ICompletionContext):
         with self._lock:
             if not self._force_reindex:
-                if not self._uris_changed or self._uris_changed == {context.doc.uri}:
-                    # If the only thing changed is the current uri (or if there
-                    # were no changes), don't do a workspace-wide update.
+                if not self._uris_changed:
                     return
 
+                uris_changed = self._uris_changed
+                self._uris_changed = set()
+                try:
+                    self._incremental_update_count += 1
+                    self._update_uris(context, uris_changed)
+                except:
+                    # Maybe it was cancelled: do it in the next time.
+                    self._uris_changed.update(uris_changed)
+                    raise
+                return
+
             # Reset synchronize-related flags.
             self._force_reindex = False
             self._uris_changed.clear()
 
             self._reindex_count += 1
-            self._compute_new_symbols_cache_reverse_index_state(context)
+            try:
+                self._compute_new_symbols_cache_reverse_index_state(context)
+            except:
+                self._force_reindex = True
+                raise
 
     def dispose(self):
         self._global_var_to_uris = {}
+        self._variable_reference_to_uris = {}
+        self._keyword_usages = {}
+        self._uri_to_indexed_info = {}
+
+    def _update_uris(self, context: ICompletionContext, uris: Set[str]) -> None:
+        from robotframework_ls.impl.robot_workspace import RobotWorkspace
+
+        workspace: Optional[RobotWorkspace] = typing.cast(
+            Optional[RobotWorkspace], context.workspace
+        )
+        if not workspace:
+            return
+
+        workspace_indexer = workspace.workspace_indexer
+        if workspace_indexer is None:
+            return
+
+        global_var_to_uris = self._global_var_to_uris
+        variable_reference_to_uris = self._variable_reference_to_uris
+        keyword_usages = self._keyword_usages
+
+        for uri, symbols_cache in workspace_indexer.iter_uri_and_symbols_cache(
+            uris_to_iter=uris, context=context
+        ):
+            old_info = self._uri_to_indexed_info.pop(uri, None)
+            if old_info is not None:
+                for name in old_info.global_variables:
+                    _discard_uri(global_var_to_uris, name, uri)
+                for name in old_info.variable_references:
+                    _discard_uri(variable_reference_to_uris, name, uri)
+                for name in old_info.keyword_usages:
+                    _discard_keyword_usages(keyword_usages, name, uri)
+
+            if symbols_cache is None:
+                continue
+
+            new_info = self._uri_to_indexed_info[uri] = _IndexedUriInfo(
+                typing.cast(BaseSymbolsCache, symbols_cache)
+            )
+            for name in new_info.global_variables:
+                _add_uri(global_var_to_uris, name, uri)
+            for name in new_info.variable_references:
+                _add_uri(variable_reference_to_uris, name, uri)
+            for name, locations in new_info.keyword_usages.items():
+                _add_keyword_usages(keyword_usages, name, uri, locations)
 
     def _compute_new_symbols_cache_reverse_index_state(
         self, context: ICompletionContext
     ) -> None:
-        from robotframework_ls.impl.workspace_symbols import iter_symbols_caches
+        from robotframework_ls.impl.robot_workspace import RobotWorkspace
 
-        new_global_var_to_uris: Dict[str, Set[str]] = {}
-        symbols_cache: BaseSymbolsCache
+        workspace: Optional[RobotWorkspace] = typing.cast(
+            Optional[RobotWorkspace], context.workspace
+        )
+        if not workspace:
+            return
 
-        # Note: always update as a whole.
-        it = typing.cast(Iterator[BaseSymbolsCache], iter_symbols_caches("", context))
+        workspace_indexer = workspace.workspace_indexer
+        if workspace_indexer is None:
+            return
+
+        if not workspace.is_first_check_done():
+            # Files which are still not found by the initial scan won't be
+            # notified afterwards, so, do a full reindex again later on.
+            self._force_reindex = True
 
+        new_global_var_to_uris: Dict[str, Set[str]] = {}
+        new_variable_reference_to_uris: Dict[str, Set[str]] = {}
+        new_keyword_usages: Dict[str, Dict[str, Sequence[KeywordUsageLocation]]] = {}
+        new_uri_to_indexed_info: Dict[str, _IndexedUriInfo] = {}
+
+        # Note: always considers all the documents in the workspace (the index
+        # is used to find all the references).
         try:
-            for symbols_cache in it:
-                uri = symbols_cache.get_uri()
-                if not uri:
+            for (
+                uri,
+                symbols_cache,
+            ) in workspace_indexer.iter_uri_and_symbols_cache(context=context):
+                if symbols_cache is None:
                     continue
 
-                for global_var_name in symbols_cache._global_variables_defined:
+                info = new_uri_to_indexed_info[uri] = _IndexedUriInfo(
+                    typing.cast(BaseSymbolsCache, symbols_cache)
+                )
+                for global_var_name in info.global_variables:
                     s = new_global_var_to_uris.get(global_var_name)
                     if s is None:
                         s = new_global_var_to_uris[global_var_name] = set()
                     s.add(uri)
+
+                for var_name in info.variable_references:
+                    s = new_variable_reference_to_uris.get(var_name)
+                    if s is None:
+                        s = new_variable_reference_to_uris[var_name] = set()
+                    s.add(uri)
+
+                for keyword_name, locations in info.keyword_usages.items():
+                    d = new_keyword_usages.get(keyword_name)
+                    if d is None:
+                        d = new_keyword_usages[keyword_name] = {}
+                    d[uri] = locations
         except:
             log.exception("Exception computing symbols cache reverse index.")
             raise  # Maybe it was cancelled (or we had another error).
         else:
             # ok, it worked, let's actually update our internal state.
             self._global_var_to_uris = new_global_var_to_uris
+            self._variable_reference_to_uris = new_variable_reference_to_uris
+            self._keyword_usages = new_keyword_usages
+            self._uri_to_indexed_info = new_uri_to_indexed_info
+
+
+def _add_uri(name_to_uris: Dict[str, Set[str]], name: str, uri: str) -> None:
+    # Note: copy-on-write (readers may be using the previous set).
+    uris = name_to_uris.get(name)
+    if uris is None:
+        name_to_uris[name] = {uri}
+    else:
+        name_to_uris[name] = uris.union((uri,))
+
+
+def _discard_uri(name_to_uris: Dict[str, Set[str]], name: str, uri: str) -> None:
+    uris = name_to_uris.get(name)
+    if uris is not None and uri in uris:
+        if len(uris) == 1:
+            del name_to_uris[name]
+        else:
+            name_to_uris[name] = uris.difference((uri,))
+
+
+def _add_keyword_usages(
+    keyword_usages: Dict[str, Dict[str, Sequence[KeywordUsageLocation]]],
+    name: str,
+    uri: str,
+    locations: Sequence[KeywordUsageLocation],
+) -> None:
+    # Note: copy-on-write (readers may be using the previous dict).
+    uri_to_locations = keyword_usages.get(name)
+    new_uri_to_locations = dict(uri_to_locations) if uri_to_locations else {}
+    new_uri_to_locations[uri] = locations
+    keyword_usages[name] = new_uri_to_locations
+
+
+def _discard_keyword_usages(
+    keyword_usages: Dict[str, Dict[str, Sequence[KeywordUsageLocation]]],
+    name: str,
+    uri: str,
+) -> None:
+    uri_to_locations = keyword_usages.get(name)
+    if uri_to_locations is not None and uri in uri_to_locations:
+        if len(uri_to_locations) == 1:
+            del keyword_usages[name]
+        else:
+            new_uri_to_locations = dict(uri_to_locations)
+            del new_uri_to_locations[uri]
+            keyword_usages[name] = new_uri_to_locations
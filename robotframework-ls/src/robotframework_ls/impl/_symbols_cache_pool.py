@@ -0,0 +1,131 @@
+"""
+Helpers to compute the symbols cache of documents in a pool of processes.
+
+This is opt-in (enabled by setting the `ROBOTFRAMEWORK_LS_INDEXING_PROCESSES`
+environment variable to the number of processes to be used) and is meant to
+speed up the indexing of big workspaces (which would otherwise be limited
+to a single core).
+
+The workers just receive the path of the file to be indexed and return the
+same (picklable) payload which is persisted by the `SymbolsCacheStore`.
+"""
+import os
+import threading
+from concurrent.futures import Future
+from typing import Tuple, Dict, Any, Optional, Sequence
+
+from robocorp_ls_core.robotframework_log import get_logger
+
+log = get_logger(__name__)
+
+ENV_INDEXING_PROCESSES = "ROBOTFRAMEWORK_LS_INDEXING_PROCESSES"
+
+
+def get_indexing_processes_from_env() -> int:
+    """
+    :return:
+        The number of processes to be used to index the workspace (0 means
+        that indexing should be done in-process).
+    """
+    value = os.environ.get(ENV_INDEXING_PROCESSES, "").strip()
+    if not value:
+        return 0
+    try:
+        processes = int(value)
+    except ValueError:
+        log.critical(
+            "Expected %s to evaluate to an int. Found: %s",
+            ENV_INDEXING_PROCESSES,
+            value,
+        )
+        return 0
+    if processes < 0:
+        # i.e.: use the number of cpus available.
+        processes = os.cpu_count() or 1
+    return processes
+
+
+def _compute_symbols_cache_data(
+    path: str, language_codes: Sequence[str]
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Called in the worker process.
+
+    :return:
+        A tuple with the digest of the contents which were indexed and the
+        data for the symbols cache.
+    """
+    from robocorp_ls_core import uris
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.robot_workspace import (
+        RobotDocument,
+        _compute_symbols_from_ast,
+    )
+    from robotframework_ls.impl._symbols_cache_store import (
+        get_source_digest,
+        _symbols_cache_to_store_data,
+    )
+    from robotframework_ls.impl import robot_localization
+
+    localization_info = robot_localization.get_global_localization_info()
+    if tuple(localization_info.language_codes) != tuple(language_codes):
+        robot_localization.set_global_localization_info(
+            robot_localization.LocalizationInfo(tuple(language_codes))
+        )
+
+    doc = RobotDocument(uris.from_fs_path(path))
+    source = doc.source
+    symbols_cache = _compute_symbols_from_ast(CompletionContext(doc))
+    return get_source_digest(source), _symbols_cache_to_store_data(symbols_cache)
+
+
+class SymbolsCacheProcessPool(object):
+    def __init__(self, processes: int):
+        self._processes = processes
+        self._lock = threading.Lock()
+        self._executor: Optional[Any] = None
+        self._disposed = False
+
+    @property
+    def processes(self) -> int:
+        return self._processes
+
+    def _get_executor(self):
+        with self._lock:
+            if self._disposed:
+                raise RuntimeError("SymbolsCacheProcessPool already disposed.")
+
+            if self._executor is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                # Note: use spawn because the language server has many
+                # threads running (so, fork isn't safe).
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                log.info(
+                    "Created process pool with %s workers for indexing.",
+                    self._processes,
+                )
+            return self._executor
+
+    def submit(self, path: str) -> "Future[Tuple[str, Dict[str, Any]]]":
+        from robotframework_ls.impl.robot_localization import (
+            get_global_localization_info,
+        )
+
+        language_codes = tuple(get_global_localization_info().language_codes)
+        return self._get_executor().submit(
+            _compute_symbols_cache_data, path, language_codes
+        )
+
+    def dispose(self):
+        with self._lock:
+            self._disposed = True
+            executor = self._executor
+            self._executor = None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,348 @@
+"""
+Provides a way to persist the symbols cache computed for .robot/.resource
+files so that a new language server session doesn't need to re-parse files
+whose contents didn't change since the last time they were indexed.
+
+The information is saved as a json file (one file per workspace root) where
+each entry is keyed by the filesystem path and validated by a digest of the
+document contents.
+"""
+import json
+import os
+import threading
+import typing
+import weakref
+from typing import Optional, Dict, List, Iterator, Set, Any
+
+from robocorp_ls_core.protocols import (
+    check_implements,
+    ITestInfoFromSymbolsCacheTypedDict,
+)
+from robocorp_ls_core.lsp import MarkupContentTypedDict, MarkupKind
+from robocorp_ls_core.robotframework_log import get_logger
+from robotframework_ls.impl._symbols_cache import BaseSymbolsCache
+from robotframework_ls.impl.protocols import (
+    IRobotDocument,
+    ISymbolKeywordInfo,
+    ISymbolsCache,
+    ISymbolsJsonListEntry,
+    KeywordUsageLocation,
+)
+
+log = get_logger(__name__)
+
+# Should be raised whenever the format (or the way that the information is
+# computed) changes.
+SYMBOLS_CACHE_STORE_VERSION = 2
+
+
+def get_source_digest(source: str) -> str:
+    import hashlib
+
+    return hashlib.sha256(source.encode("utf-8", "replace")).hexdigest()
+
+
+class _KeywordInfoFromStore:
+    _documentation: MarkupContentTypedDict
+
+    __slots__ = ["name", "_lineno", "_doc", "_documentation"]
+
+    def __init__(
+        self,
+        name: str,
+        lineno: int,
+        doc: "Optional[weakref.ReferenceType[IRobotDocument]]",
+    ):
+        self.name = name
+        self._lineno = lineno
+        self._doc = doc
+
+    def get_documentation(self) -> MarkupContentTypedDict:
+        """
+        The documentation isn't persisted, so, when it's requested we need to
+        get the AST of the document (which should only happen for the
+        keywords actually shown to the user).
+        """
+        try:
+            return self._documentation
+        except AttributeError:
+            pass
+
+        from robotframework_ls.impl import ast_utils
+        from robotframework_ls.impl.robot_workspace import _KeywordInfo
+        from robotframework_ls.impl.text_utilities import (
+            build_keyword_docs_with_signature,
+        )
+
+        doc = self._doc() if self._doc is not None else None
+        if doc is not None:
+            for keyword_node_info in ast_utils.iter_keywords(doc.get_ast()):
+                if keyword_node_info.node.lineno == self._lineno:
+                    self._documentation = _KeywordInfo(
+                        keyword_node_info.node
+                    ).get_documentation()
+                    return self._documentation
+
+        return {
+            "kind": MarkupKind.Markdown,
+            "value": build_keyword_docs_with_signature(self.name, (), "", "markdown"),
+        }
+
+    def __typecheckself__(self) -> None:
+        _: ISymbolKeywordInfo = check_implements(self)
+
+
+class _SymbolsCacheFromStore(BaseSymbolsCache):
+    _cached_keyword_info: List[ISymbolKeywordInfo]
+
+    def iter_keyword_info(self) -> Iterator[ISymbolKeywordInfo]:
+        try:
+            yield from iter(self._cached_keyword_info)
+        except AttributeError:
+            cache: List[ISymbolKeywordInfo] = []
+            for entry in self._json_list:
+                keyword_info = _KeywordInfoFromStore(
+                    entry["name"],
+                    entry["location"]["range"]["start"]["line"] + 1,
+                    self._doc,
+                )
+                yield keyword_info
+                cache.append(keyword_info)
+            self._cached_keyword_info = cache
+
+    def __typecheckself__(self) -> None:
+        _: ISymbolsCache = check_implements(self)
+
+
+def _symbols_cache_to_store_data(symbols_cache: ISymbolsCache) -> Dict[str, Any]:
+    base_symbols_cache = typing.cast(BaseSymbolsCache, symbols_cache)
+    return {
+        "keywords": [
+            {"name": entry["name"], "range": entry["location"]["range"]}
+            for entry in base_symbols_cache.get_json_list()
+        ],
+        "keywords_used": sorted(base_symbols_cache._keywords_used),
+        "global_variables_defined": sorted(
+            base_symbols_cache._global_variables_defined
+        ),
+        "variable_references": sorted(base_symbols_cache._variable_references),
+        "keyword_usage_locations": dict(
+            (name, [list(location) for location in locations])
+            for name, locations in base_symbols_cache.iter_keyword_usage_locations()
+        ),
+        "test_info": base_symbols_cache.get_test_info(),
+    }
+
+
+def _symbols_cache_from_store_data(
+    doc: IRobotDocument, data: Dict[str, Any]
+) -> ISymbolsCache:
+    from robocorp_ls_core.lsp import SymbolKind
+
+    uri = doc.uri
+    json_list: List[ISymbolsJsonListEntry] = [
+        {
+            "name": keyword["name"],
+            "kind": SymbolKind.Class,
+            "location": {"uri": uri, "range": keyword["range"]},
+            "containerName": doc.path,
+        }
+        for keyword in data["keywords"]
+    ]
+
+    test_info: Optional[List[ITestInfoFromSymbolsCacheTypedDict]] = data["test_info"]
+    return _SymbolsCacheFromStore(
+        json_list,
+        None,
+        doc,
+        set(data["keywords_used"]),
+        uri=uri,
+        test_info=test_info,
+        global_variables_defined=set(data["global_variables_defined"]),
+        variable_references=set(data["variable_references"]),
+        keyword_usage_locations=dict(
+            (name, [KeywordUsageLocation(*location) for location in locations])
+            for name, locations in data["keyword_usage_locations"].items()
+        ),
+    )
+
+
+class SymbolsCacheStore(object):
+    """
+    Keeps the symbols cache information in memory and saves it to disk when
+    requested.
+
+    Note: the information is only considered valid if it was computed with
+    the same Robot Framework version and languages (if either change, the
+    contents saved are discarded).
+    """
+
+    def __init__(self, filename: str, robot_version: str, language_codes: List[str]):
+        self._filename = filename
+        self._header = {
+            "version": SYMBOLS_CACHE_STORE_VERSION,
+            "robot_version": robot_version,
+            "language_codes": sorted(language_codes),
+        }
+        self._lock = threading.Lock()
+        self._path_to_entry: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._loaded = False
+
+    @classmethod
+    def create_for_workspace_root(cls, root_path: str) -> "SymbolsCacheStore":
+        from robotframework_ls import robot_config
+        from robotframework_ls.impl.robot_version import get_robot_version
+        from robotframework_ls.impl.robot_localization import (
+            get_global_localization_info,
+        )
+        from robotframework_ls.impl.text_utilities import get_digest_from_string
+
+        directory = os.path.join(
+            robot_config.get_robotframework_ls_home(), ".cache", "symbols_cache"
+        )
+        filename = os.path.join(
+            directory,
+            "%s_%s.json"
+            % (os.path.basename(root_path), get_digest_from_string(root_path)),
+        )
+        language_codes = list(get_global_localization_info().language_codes)
+        return SymbolsCacheStore(filename, get_robot_version(), language_codes)
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    def _load(self) -> None:
+        # Must be called with the lock held.
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            if not os.path.exists(self._filename):
+                return
+
+            with open(self._filename, "r", encoding="utf-8") as stream:
+                contents = json.load(stream)
+
+            if contents.get("header") != self._header:
+                log.info(
+                    "Symbols cache in %s discarded (header mismatch).", self._filename
+                )
+                return
+
+            path_to_entry = contents["entries"]
+            if not isinstance(path_to_entry, dict):
+                return
+
+            self._path_to_entry = path_to_entry
+            log.debug(
+                "Loaded %s entries from symbols cache: %s",
+                len(path_to_entry),
+                self._filename,
+            )
+        except Exception:
+            log.exception("Error loading symbols cache from: %s", self._filename)
+
+    def get_symbols_cache(self, doc: IRobotDocument) -> Optional[ISymbolsCache]:
+        """
+        :return:
+            The symbols cache for the given document if the digest of its
+            contents matches the one stored or None otherwise.
+        """
+        path = doc.path
+        if not path:
+            return None
+
+        with self._lock:
+            self._load()
+            entry = self._path_to_entry.get(path)
+
+        if entry is None:
+            return None
+
+        try:
+            source = doc.source
+        except Exception:
+            return None
+
+        if entry.get("digest") != get_source_digest(source):
+            return None
+
+        try:
+            return _symbols_cache_from_store_data(doc, entry["data"])
+        except Exception:
+            log.exception("Error loading stored symbols cache for: %s", path)
+            return None
+
+    def put_symbols_cache(
+        self, doc: IRobotDocument, symbols_cache: ISymbolsCache
+    ) -> None:
+        try:
+            source = doc.source
+        except Exception:
+            return
+
+        self.put_symbols_cache_data(
+            doc,
+            get_source_digest(source),
+            _symbols_cache_to_store_data(symbols_cache),
+        )
+
+    def put_symbols_cache_data(
+        self, doc: IRobotDocument, digest: str, data: Dict[str, Any]
+    ) -> None:
+        """
+        :param digest:
+            The digest of the contents used to compute the data (see:
+            `get_source_digest`).
+        """
+        path = doc.path
+        if not path:
+            return
+
+        entry = {"digest": digest, "data": data}
+        with self._lock:
+            self._load()
+            self._path_to_entry[path] = entry
+            self._dirty = True
+
+    def retain_only(self, paths: Set[str]) -> None:
+        """
+        Removes the entries from paths which are no longer in the workspace.
+        """
+        with self._lock:
+            self._load()
+            path_to_entry = self._path_to_entry
+            new_path_to_entry = dict(
+                (path, entry) for path, entry in path_to_entry.items() if path in paths
+            )
+            if len(new_path_to_entry) != len(path_to_entry):
+                self._path_to_entry = new_path_to_entry
+                self._dirty = True
+
+    def save(self) -> bool:
+        """
+        :return: True if the contents were saved and False otherwise (i.e.: no
+            changes were done or there was an error saving).
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            self._dirty = False
+            contents = {"header": self._header, "entries": self._path_to_entry}
+
+            try:
+                os.makedirs(os.path.dirname(self._filename), exist_ok=True)
+
+                # Write to a temporary file and then replace it so that other
+                # processes never see a partially written file.
+                tmp_filename = "%s.%s.tmp" % (self._filename, os.getpid())
+                with open(tmp_filename, "w", encoding="utf-8") as stream:
+                    json.dump(contents, stream)
+                os.replace(tmp_filename, self._filename)
+            except Exception:
+                log.exception("Error saving symbols cache to: %s", self._filename)
+                return False
+            return True
@@ -28,6 +28,7 @@ from robotframework_ls.impl.protocols import (
     IKeywordArg,
     VariableKind,
     AdditionalVarInfo,
+    IKeywordNameIndex,
 )
 from robotframework_ls.impl.text_utilities import normalize_robot_name
 from robocorp_ls_core.basic import isinstance_name
@@ -847,6 +848,30 @@ def iter_keywords(ast) -> Iterator[NodeInfo]:
     yield from ast.iter_indexed("Keyword")
 
 
+@_convert_ast_to_indexer
+def get_keyword_name_index(ast) -> IKeywordNameIndex:
+    """
+    Provides an index where the items are the NodeInfo of the keywords
+    (the same ones provided by `iter_keywords`).
+    """
+    cache_key = "get_keyword_name_index"
+    for index in ast.iter_cached(cache_key, _create_keyword_name_index):
+        return index
+    raise AssertionError("Expected the keyword name index to be computed.")
+
+
+def _get_keyword_node_info_name(node_info: NodeInfo) -> str:
+    return node_info.node.name
+
+
+def _create_keyword_name_index(ast):
+    from robotframework_ls.impl.keyword_name_index import KeywordNameIndex
+
+    yield KeywordNameIndex(
+        tuple(ast.iter_indexed("Keyword")), _get_keyword_node_info_name
+    )
+
+
 @_convert_ast_to_indexer
 def iter_variables(ast) -> Iterator[NodeInfo]:
     yield from ast.iter_indexed("Variable")
@@ -1314,7 +1339,7 @@ def iter_variable_references(ast) -> Iterator[VarTokenInfo]:
                     continue
                 if not _add_match(found, t):
                     continue
-                yield VarTokenInfo(stack, node, t, varid)
+                yield VarTokenInfo(stack, node_info.node, t, varid)
 
 
 @_convert_ast_to_indexer
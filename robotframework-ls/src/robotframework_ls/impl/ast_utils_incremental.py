@@ -0,0 +1,563 @@
+"""
+Helpers to create a new AST (File model) for a document based on the AST of
+a previous version of the same document, re-parsing only the part of the
+document which actually changed.
+
+The granularity used is:
+
+- The TestCase/Keyword blocks touched by the change (when the change is
+  inside a single `*** Test Cases ***`/`*** Keywords ***` section).
+- The top-level sections touched by the change otherwise.
+
+Notes:
+
+- The nodes from the previous AST are never mutated (they may still be in use
+  in other threads). Nodes before the change are reused as is and nodes after
+  the change are reused as is if the number of lines didn't change or are
+  cloned with the new line numbers otherwise.
+
+- Nodes which are reused keep the information indexed in them (see:
+  `ast_utils._obtain_ast_indexer`), so, only the indexes for the parts which
+  changed need to be recomputed.
+
+- If the change touches a `*** Settings ***` section (which can change how
+  other sections are parsed, i.e.: `Test Template`) or if something unexpected
+  is found, None is returned and a full parse must be done.
+"""
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from robocorp_ls_core.robotframework_log import get_logger
+from robotframework_ls.impl.protocols import INode
+from robotframework_ls.impl.robot_localization import LocalizationInfo
+
+log = get_logger(__name__)
+
+# Set to "0" to disable the incremental parsing (always do a full parse).
+ENV_INCREMENTAL_AST = "ROBOTFRAMEWORK_LS_INCREMENTAL_AST"
+
+_BLOCK_SECTIONS = ("TestCaseSection", "KeywordSection")
+_BLOCKS = ("TestCase", "Keyword")
+
+
+def is_incremental_ast_enabled() -> bool:
+    import os
+
+    return os.environ.get(ENV_INCREMENTAL_AST, "1").strip().lower() not in (
+        "0",
+        "false",
+    )
+
+
+def _common_prefix_len(lines_a: Sequence[str], lines_b: Sequence[str]) -> int:
+    i = 0
+    n = min(len(lines_a), len(lines_b))
+    while i < n and lines_a[i] == lines_b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix_len(
+    lines_a: Sequence[str], lines_b: Sequence[str], max_len: int
+) -> int:
+    i = 0
+    len_a = len(lines_a)
+    len_b = len(lines_b)
+    while i < max_len and lines_a[len_a - 1 - i] == lines_b[len_b - 1 - i]:
+        i += 1
+    return i
+
+
+def _iter_child_nodes(node, reverse: bool = False):
+    import ast as ast_module
+
+    fields = reversed(node._fields) if reverse else node._fields
+    for field in fields:
+        value = getattr(node, field, None)
+        if isinstance(value, list):
+            yield from (
+                v
+                for v in (reversed(value) if reverse else value)
+                if isinstance(v, ast_module.AST)
+            )
+        elif isinstance(value, ast_module.AST):
+            yield value
+
+
+def _find_statement(node, reverse: bool):
+    if hasattr(node, "tokens"):
+        return node
+    for child in _iter_child_nodes(node, reverse):
+        statement = _find_statement(child, reverse)
+        if statement is not None:
+            return statement
+    return None
+
+
+def _get_lineno(node) -> int:
+    # Note: `Block.lineno` visits all the nodes of the block in
+    # Robot Framework, which is too slow to be used for every block in
+    # a big file, so, go directly to the first statement.
+    statement = _find_statement(node, False)
+    return statement.lineno if statement is not None else -1
+
+
+def _get_end_lineno(node) -> int:
+    statement = _find_statement(node, True)
+    return statement.end_lineno if statement is not None else -1
+
+
+def _is_contiguous(nodes: Sequence[INode], first_line: int, last_line: int) -> bool:
+    """
+    :param first_line: 1-based line where the first node should start.
+    :param last_line: 1-based line where the last node should end.
+    """
+    expected = first_line
+    for node in nodes:
+        if _get_lineno(node) != expected:
+            return False
+        expected = _get_end_lineno(node) + 1
+    return expected == last_line + 1
+
+
+def _find_nodes_range(
+    nodes: Sequence[INode], dirty_start: int, dirty_end: int
+) -> Tuple[int, int]:
+    """
+    :param dirty_start: 0-based line (inclusive).
+    :param dirty_end: 0-based line (exclusive).
+
+    :return: the indexes of the first and last nodes which intersect the
+        given lines.
+    """
+    i0 = 0
+    for i, node in enumerate(nodes):
+        if _get_end_lineno(node) - 1 >= dirty_start:
+            i0 = i
+            break
+    else:
+        i0 = len(nodes) - 1
+
+    i1 = i0
+    for i in range(i0, len(nodes)):
+        if _get_lineno(nodes[i]) - 1 < dirty_end:
+            i1 = i
+        else:
+            break
+    return i0, i1
+
+
+def _shallow_copy(node):
+    # Note: copy.copy() can't be used because it'd call the constructor of the
+    # node class with the fields (which don't match the constructor).
+    new_node = node.__class__.__new__(node.__class__)
+    new_node.__dict__.update(node.__dict__)
+    return new_node
+
+
+def _container_copy(node):
+    """
+    Creates a copy of a node whose children will be changed.
+    """
+    new_node = _shallow_copy(node)
+    # Indexed info must be recomputed (it references the original children)
+    # and the localization info must be set again in the new children.
+    new_node.__dict__.pop("__ast_indexer__", None)
+    new_node.__dict__.pop("__localization_info__", None)
+    return new_node
+
+
+def _clone_token(token_class, token, delta: int):
+    # Note: using the constructor is much faster than copy.copy().
+    lineno = token.lineno
+    new_token = token_class(
+        token.type,
+        token.value,
+        lineno + delta if lineno != -1 else lineno,
+        token.col_offset,
+        token.error,
+    )
+    cls = token.__class__
+    if cls is not token_class:
+        # i.e.: EOS/END tokens.
+        new_token.__class__ = cls
+    return new_token
+
+
+def _clone_with_line_delta(node, delta: int):
+    """
+    Creates a copy of the given node (recursively) with all the tokens
+    shifted by the given number of lines.
+    """
+    import ast as ast_module
+    from robot.api import Token
+
+    new_node = _shallow_copy(node)
+    # Indexed info must be recomputed (it references the original nodes).
+    new_node.__dict__.pop("__ast_indexer__", None)
+
+    for field in node._fields:
+        value = getattr(node, field, None)
+        if field == "tokens" and value is not None:
+            new_node.tokens = tuple(
+                _clone_token(Token, token, delta) for token in value
+            )
+
+        elif isinstance(value, list):
+            setattr(
+                new_node,
+                field,
+                [
+                    _clone_with_line_delta(v, delta)
+                    if isinstance(v, ast_module.AST)
+                    else v
+                    for v in value
+                ],
+            )
+
+        elif isinstance(value, ast_module.AST):
+            setattr(new_node, field, _clone_with_line_delta(value, delta))
+
+    return new_node
+
+
+def _shift_tokens_in_place(node, delta: int) -> None:
+    """
+    Note: only to be used in nodes which were just created (and thus aren't
+    shared).
+    """
+    from robotframework_ls.impl import ast_utils
+
+    for _stack, child in ast_utils.iter_all_nodes_recursive(node):
+        tokens = getattr(child, "tokens", None)
+        if tokens:
+            for token in tokens:
+                if token.lineno != -1:
+                    token.lineno += delta
+
+
+def _reuse_or_clone(nodes: Sequence[INode], delta: int) -> List[INode]:
+    if delta == 0:
+        return list(nodes)
+    return [_clone_with_line_delta(node, delta) for node in nodes]
+
+
+def _has_header_line(lines: Sequence[str]) -> bool:
+    for line in lines:
+        if line.startswith("*"):
+            return True
+    return False
+
+
+def _has_language_config(section: INode) -> bool:
+    for node in getattr(section, "body", ()):
+        if node.__class__.__name__ == "Config":
+            return True
+    return False
+
+
+def reparse_incremental(
+    previous_ast,
+    previous_lines: Sequence[str],
+    new_lines: Sequence[str],
+    parse: Callable[[str], Any],
+    localization_info: LocalizationInfo,
+):
+    """
+    :param previous_ast:
+        The File model for the previous version of the document.
+
+    :param previous_lines:
+        The lines (with line endings) of the previous version of the document.
+
+    :param new_lines:
+        The lines (with line endings) of the new version of the document.
+
+    :param parse:
+        A callable which parses the given contents (the same which would be
+        used to do a full parse of the document).
+
+    :return:
+        The new File model or None if it wasn't possible to compute it
+        incrementally (in which case a full parse should be done).
+    """
+    sections = previous_ast.sections
+    if not sections:
+        return None
+
+    previous_len = len(previous_lines)
+    new_len = len(new_lines)
+    if previous_len == 0 or new_len == 0:
+        return None
+
+    if not _is_contiguous(sections, 1, previous_len):
+        return None
+
+    prefix = _common_prefix_len(previous_lines, new_lines)
+    if prefix == previous_len == new_len:
+        return previous_ast  # Nothing changed.
+
+    suffix = _common_suffix_len(
+        previous_lines, new_lines, min(previous_len, new_len) - prefix
+    )
+    delta = new_len - previous_len
+
+    # The lines changed are extended by one line on each side so that changes
+    # which create/remove the line which starts a block/section (or pure
+    # insertions in a boundary) also consider the previous/next node.
+    dirty_start = max(0, prefix - 1)
+    dirty_end = min(previous_len, previous_len - suffix + 1)
+
+    i0, i1 = _find_nodes_range(sections, dirty_start, dirty_end)
+    for section in sections[i0 : i1 + 1]:
+        if section.__class__.__name__ == "SettingSection":
+            return None
+
+    # Settings must be added to the contents being parsed because they may
+    # change how the other sections are parsed.
+    context_sections = []
+    for i, section in enumerate(sections):
+        if section.__class__.__name__ == "SettingSection":
+            if i > i0:
+                # Settings after the change: don't deal with it.
+                return None
+            context_sections.append(section)
+
+    if i0 > 0 and _has_language_config(sections[0]):
+        return None
+
+    context_contents: List[str] = []
+    for section in context_sections:
+        context_contents.extend(
+            previous_lines[_get_lineno(section) - 1 : _get_end_lineno(section)]
+        )
+    if context_contents and not context_contents[-1].endswith(("\r", "\n")):
+        context_contents.append("\n")
+
+    new_file = None
+    if i0 == i1 and sections[i0].__class__.__name__ in _BLOCK_SECTIONS:
+        new_file = _reparse_blocks(
+            previous_ast,
+            sections,
+            i0,
+            dirty_start,
+            dirty_end,
+            delta,
+            previous_lines,
+            new_lines,
+            context_contents,
+            context_sections,
+            parse,
+        )
+
+    if new_file is None:
+        new_file = _reparse_sections(
+            previous_ast,
+            sections,
+            i0,
+            i1,
+            delta,
+            new_lines,
+            context_contents,
+            context_sections,
+            parse,
+        )
+
+    if new_file is None:
+        return None
+
+    _set_localization_info_in_new_nodes(new_file, localization_info)
+    return new_file
+
+
+def _parse_region(
+    region_lines: Sequence[str],
+    context_contents: Sequence[str],
+    context_sections: Sequence[INode],
+    parse: Callable[[str], Any],
+    region_start: int,
+    header_line: Optional[str] = None,
+):
+    """
+    Parses the given region (with the needed context) and provides the
+    sections parsed (without the context) with the lines already fixed.
+    """
+    contents = list(context_contents)
+    if header_line is not None:
+        contents.append(header_line)
+    contents_len = len(contents)
+    contents.extend(region_lines)
+
+    parsed = parse("".join(contents))
+    parsed_sections = list(parsed.sections)
+    if len(parsed_sections) < len(context_sections):
+        return None
+
+    for parsed_context, original_context in zip(parsed_sections, context_sections):
+        if parsed_context.__class__ != original_context.__class__:
+            return None
+
+    parsed_sections = parsed_sections[len(context_sections) :]
+    line_delta = region_start - contents_len
+    for section in parsed_sections:
+        _shift_tokens_in_place(section, line_delta)
+    return parsed_sections
+
+
+def _reparse_sections(
+    previous_ast,
+    sections,
+    i0: int,
+    i1: int,
+    delta: int,
+    new_lines: Sequence[str],
+    context_contents: Sequence[str],
+    context_sections: Sequence[INode],
+    parse: Callable[[str], Any],
+):
+    region_start = _get_lineno(sections[i0]) - 1
+    region_end = _get_end_lineno(sections[i1]) + delta
+    if region_end <= region_start:
+        return None
+
+    region_sections = _parse_region(
+        new_lines[region_start:region_end],
+        context_contents if i0 > 0 else (),
+        context_sections if i0 > 0 else (),
+        parse,
+        region_start,
+    )
+    if region_sections is None:
+        return None
+
+    for section in region_sections:
+        if section.__class__.__name__ == "SettingSection":
+            # A new settings section may change how the sections which
+            # follow are parsed.
+            return None
+
+    if i0 == 0 and (
+        _has_language_config(sections[0]) or _has_language_config(region_sections[0])
+    ):
+        # The languages may have changed (which affects the whole file).
+        return None
+
+    new_sections = list(sections[:i0])
+    new_sections.extend(region_sections)
+    new_sections.extend(_reuse_or_clone(sections[i1 + 1 :], delta))
+
+    new_file = _container_copy(previous_ast)
+    new_file.sections = new_sections
+    return new_file
+
+
+def _reparse_blocks(
+    previous_ast,
+    sections,
+    section_index: int,
+    dirty_start: int,
+    dirty_end: int,
+    delta: int,
+    previous_lines: Sequence[str],
+    new_lines: Sequence[str],
+    context_contents: Sequence[str],
+    context_sections: Sequence[INode],
+    parse: Callable[[str], Any],
+):
+    section = sections[section_index]
+    header = section.header
+    if header is None or header.lineno != header.end_lineno:
+        return None
+
+    body = section.body
+    if not body or not _is_contiguous(
+        body, header.end_lineno + 1, _get_end_lineno(section)
+    ):
+        return None
+
+    # The header must not be touched.
+    if dirty_start <= header.end_lineno - 1:
+        return None
+
+    j0, j1 = _find_nodes_range(body, dirty_start, dirty_end)
+    for node in body[j0 : j1 + 1]:
+        if node.__class__.__name__ not in _BLOCKS:
+            return None
+
+    region_start = _get_lineno(body[j0]) - 1
+    previous_region_end = _get_end_lineno(body[j1])
+    region_end = previous_region_end + delta
+    if region_end <= region_start:
+        return None
+
+    # A line starting with '*' is a section header and if it's invalid, the
+    # following lines are parsed differently up to the next valid header,
+    # so, in this case the blocks are not independent.
+    if _has_header_line(
+        previous_lines[header.lineno : previous_region_end]
+    ) or _has_header_line(new_lines[region_start:region_end]):
+        return None
+
+    region_sections = _parse_region(
+        new_lines[region_start:region_end],
+        context_contents,
+        context_sections,
+        parse,
+        region_start,
+        header_line=previous_lines[header.lineno - 1],
+    )
+    if region_sections is None or len(region_sections) != 1:
+        return None
+
+    parsed_section = region_sections[0]
+    if parsed_section.__class__ != section.__class__:
+        return None
+
+    new_blocks = parsed_section.body
+    for node in new_blocks:
+        if node.__class__.__name__ not in _BLOCKS:
+            return None
+
+    new_section = _container_copy(section)
+    new_body = list(body[:j0])
+    new_body.extend(new_blocks)
+    new_body.extend(_reuse_or_clone(body[j1 + 1 :], delta))
+    new_section.body = new_body
+
+    new_sections = list(sections[:section_index])
+    new_sections.append(new_section)
+    new_sections.extend(_reuse_or_clone(sections[section_index + 1 :], delta))
+
+    new_file = _container_copy(previous_ast)
+    new_file.sections = new_sections
+    return new_file
+
+
+def _set_localization_info_in_new_nodes(
+    new_file, localization_info: LocalizationInfo
+) -> None:
+    """
+    Same as `ast_utils.set_localization_info_in_model` but skips the nodes
+    which already have the information (reused from the previous AST).
+    """
+    import weakref
+    import ast as ast_module
+
+    new_file.__localization_info__ = localization_info
+    file_weak_ref = weakref.ref(new_file)
+
+    def set_in_node(node):
+        if node.__dict__.get("__localization_info__") is localization_info:
+            return
+        node.__file_weak_ref__ = file_weak_ref
+        node.__localization_info__ = localization_info
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                for v in value:
+                    if isinstance(v, ast_module.AST):
+                        set_in_node(v)
+            elif isinstance(value, ast_module.AST):
+                set_in_node(value)
+
+    for section in new_file.sections:
+        set_in_node(section)
@@ -11,12 +11,12 @@ from robocorp_ls_core.lsp import (
     CompletionItemTypedDict,
     InsertTextFormat,
 )
-from typing import Optional, List, Set, Dict, Any
+from typing import Optional, List, Set, Dict, Any, Iterator
 from robotframework_ls.impl.protocols import NodeInfo
 import os.path
 from robocorp_ls_core import uris
 from robocorp_ls_core.protocols import IWorkspace
-from robotframework_ls.impl.protocols import ISymbolsCache
+from robotframework_ls.impl.protocols import ISymbolsCache, ISymbolKeywordInfo
 from robotframework_ls.impl.robot_constants import ALL_KEYWORD_RELATED_FILE_EXTENSIONS
 
 
@@ -58,6 +58,24 @@ class _Collector(object):
 
         return False
 
+    def iter_accepted_keyword_info(
+        self, symbols_cache: ISymbolsCache
+    ) -> Iterator[ISymbolKeywordInfo]:
+        """
+        Same as checking `accepts` for each keyword info in the symbols cache
+        (but using its keyword name index).
+        """
+        index = symbols_cache.get_keyword_name_index()
+        if self.exact_match:
+            accepted = index.iter_same_name(self._matcher.filter_text)
+        else:
+            accepted = index.iter_containing(self._matcher.filter_text)
+
+        for i in accepted:
+            keyword_info: ISymbolKeywordInfo = index.get_item(i)
+            if not self.imported_keyword_name_to_keyword.get(keyword_info.name):
+                yield keyword_info
+
     def _create_completion_item(
         self,
         completion_context: ICompletionContext,
@@ -241,23 +259,22 @@ def _collect_auto_import_completions(
                 pass
             convert_keyword_format = noop
 
-        for keyword_info in symbols_cache.iter_keyword_info():
-            if collector.accepts(keyword_info.name):
-                item = collector._create_completion_item(
-                    completion_context,
-                    convert_keyword_format(keyword_info.name),
-                    selection,
-                    token,
-                    0,
-                    memo,
-                    lib_import=lib_import,
-                    resource_path=resource_path,
-                    data=None,
+        for keyword_info in collector.iter_accepted_keyword_info(symbols_cache):
+            item = collector._create_completion_item(
+                completion_context,
+                convert_keyword_format(keyword_info.name),
+                selection,
+                token,
+                0,
+                memo,
+                lib_import=lib_import,
+                resource_path=resource_path,
+                data=None,
+            )
+            if item is not None:
+                completion_context.assign_documentation_resolve(
+                    item, keyword_info.get_documentation
                 )
-                if item is not None:
-                    completion_context.assign_documentation_resolve(
-                        item, keyword_info.get_documentation
-                    )
 
 
 class _ImportLocationInfo:
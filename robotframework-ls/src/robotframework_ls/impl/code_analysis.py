@@ -1,11 +1,13 @@
 from functools import lru_cache
+import itertools
 import re
 import sys
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple, Hashable, Iterator, Set
 
 from robocorp_ls_core.lsp import (
     DiagnosticSeverity,
     DiagnosticTag,
+    Error,
     ICustomDiagnosticDataUndefinedKeywordTypedDict,
     ICustomDiagnosticDataUndefinedResourceTypedDict,
     ICustomDiagnosticDataUndefinedVarImportTypedDict,
@@ -18,6 +20,7 @@ from robotframework_ls.impl.protocols import (
     IKeywordFound,
     IKeywordCollector,
     ICompletionContext,
+    ICompletionContextDependencyGraph,
     ILibraryDoc,
     INode,
     IVariableFound,
@@ -74,6 +77,10 @@ class _KeywordContainer(object):
 
         return ret
 
+    def iter_keywords(self) -> Iterator[IKeywordFound]:
+        for keywords_found in self._name_to_keywords.values():
+            yield from iter(keywords_found)
+
 
 class _VariablesCollector(AbstractVariablesCollector):
     def __init__(self, on_unresolved_variable_import):
@@ -105,6 +112,16 @@ class _VariablesCollector(AbstractVariablesCollector):
     def contains_env_variable(self, variable_name_upper: str) -> bool:
         return variable_name_upper in self._env_variables_collected
 
+    def get_fingerprint(self) -> tuple:
+        """
+        Provides the names of the variables collected (note: the positions
+        aren't considered, so, this is only meant for global variables).
+        """
+        return (
+            tuple(self._variables_collected),
+            tuple(self._env_variables_collected),
+        )
+
     def contains_variable(
         self, variable_name: str, var_line: int, var_col_offset: int
     ) -> bool:
@@ -151,6 +168,9 @@ class _AnalysisKeywordsCollector(object):
     def accepts(self, keyword_name):
         return True
 
+    def iter_accepted_in_index(self, index):
+        return None
+
     def on_keyword(self, keyword_found: IKeywordFound):
         from robotframework_ls.impl.text_utilities import normalize_robot_name
 
@@ -215,10 +235,163 @@ class _AnalysisKeywordsCollector(object):
 
         return ret
 
+    def get_keywords_fingerprint(self, source: str) -> tuple:
+        """
+        Provides the signatures of the keywords collected from the given source.
+        """
+        return tuple(
+            (
+                keyword_found.keyword_name,
+                tuple(arg.original_arg for arg in keyword_found.keyword_args),
+                keyword_found.is_deprecated(),
+            )
+            for keyword_found in self._keywords_container.iter_keywords()
+            if keyword_found.source == source
+        )
+
     def __typecheckself__(self) -> None:
         _: IKeywordCollector = check_implements(self)
 
 
+class _BlockAnalysis(object):
+    """
+    The analysis of a block (a test case, a keyword or a whole section).
+
+    Note: the errors have the positions from the time they were collected
+    (`lineno`), so, they must be shifted if the block is now in a different line.
+    """
+
+    __slots__ = ["lineno", "keyword_usage_errors", "variable_errors"]
+
+    def __init__(self, lineno: int):
+        self.lineno = lineno
+
+        # The errors for each keyword usage (in the block) with errors.
+        self.keyword_usage_errors: Optional[List[List[Error]]] = None
+        self.variable_errors: Optional[List[Error]] = None
+
+
+def _shift_errors(errors: List[Error], delta: int) -> List[Error]:
+    if not delta:
+        return errors
+
+    ret = []
+    for error in errors:
+        new_error = Error(
+            error.msg,
+            (error.start[0] + delta, error.start[1]),
+            (error.end[0] + delta, error.end[1]),
+            error.severity,
+        )
+        new_error.data = error.data
+        tags = getattr(error, "tags", None)
+        if tags is not None:
+            new_error.tags = tags  # type: ignore
+        ret.append(new_error)
+    return ret
+
+
+def _iter_analysis_blocks(
+    completion_context: ICompletionContext,
+) -> Iterator[Tuple[Hashable, int, INode]]:
+    """
+    Provides the blocks which are analyzed separately (each test case/keyword
+    or a whole section otherwise).
+
+    :return: an iterator with tuple(block key, lineno (1-based), block) where
+        the block key is based on the contents of the block.
+    """
+    from robotframework_ls.impl import ast_utils
+    from robotframework_ls.impl.ast_utils_incremental import (
+        _get_lineno,
+        _get_end_lineno,
+    )
+
+    ast = completion_context.get_ast()
+    lines = completion_context.doc.get_internal_lines()
+
+    for _node_info in ast_utils.iter_indexed(ast, "TestTemplate"):
+        # The arguments from the tests are checked against the `Test Template`
+        # (so, the whole document is analyzed as a single block).
+        yield (ast.__class__.__name__, lines), 1, ast
+        return
+
+    for section in ast.sections:
+        nodes: List[INode]
+        if section.__class__.__name__ in ("TestCaseSection", "KeywordSection"):
+            nodes = [
+                node
+                for node in section.body
+                if node.__class__.__name__ in ("TestCase", "Keyword")
+            ]
+        else:
+            nodes = [section]
+
+        for node in nodes:
+            start_lineno = _get_lineno(node)
+            if start_lineno == -1:
+                continue  # i.e.: no statements.
+            end_lineno = _get_end_lineno(node)
+            key = (
+                section.__class__.__name__,
+                node.__class__.__name__,
+                lines[start_lineno - 1 : end_lineno],
+            )
+            yield key, start_lineno, node
+
+
+def _compute_analysis_fingerprint(
+    completion_context: ICompletionContext,
+    dependency_graph: ICompletionContextDependencyGraph,
+    collector: _AnalysisKeywordsCollector,
+    variables_analysis: Optional["_UndefinedVariablesAnalysis"],
+) -> tuple:
+    """
+    Computes the fingerprint of what's available for the blocks of the
+    document (imports, keywords, variables, settings): when it changes, all
+    the blocks must be analyzed again.
+    """
+    from robotframework_ls.impl.ast_utils import get_localization_info_from_model
+    from robotframework_ls.impl.robot_lsp_constants import (
+        OPTION_ROBOT_LINT_UNDEFINED_KEYWORDS,
+        OPTION_ROBOT_LINT_KEYWORD_RESOLVES_TO_MULTIPLE_KEYWORDS,
+        OPTION_ROBOT_LINT_KEYWORD_CALL_ARGUMENTS,
+    )
+
+    config = completion_context.config
+    settings: tuple = ()
+    if config is not None:
+        settings = tuple(
+            config.get_setting(setting, bool, True)
+            for setting in (
+                OPTION_ROBOT_LINT_UNDEFINED_KEYWORDS,
+                OPTION_ROBOT_LINT_KEYWORD_RESOLVES_TO_MULTIPLE_KEYWORDS,
+                OPTION_ROBOT_LINT_KEYWORD_CALL_ARGUMENTS,
+            )
+        ) + tuple(
+            tuple(str(x) for x in config.get_setting(setting, list, []))
+            for setting in (
+                OPTION_ROBOT_LINT_IGNORE_VARIABLES,
+                OPTION_ROBOT_LINT_IGNORE_ENVIRONMENT_VARIABLES,
+            )
+        )
+
+    return (
+        dependency_graph.get_dependencies_fingerprint(),
+        completion_context.workspace.libspec_manager.libspec_generation,
+        tuple(
+            loader.get_variables()
+            for loader in completion_context.variables_from_arguments_files_loader
+        ),
+        collector.get_keywords_fingerprint(completion_context.original_doc.path),
+        variables_analysis.get_fingerprint()
+        if variables_analysis is not None
+        else None,
+        get_localization_info_from_model(completion_context.get_ast()).language_codes,
+        settings,
+    )
+
+
 def collect_analysis_errors(initial_completion_context):
     from robotframework_ls.impl import ast_utils
     from robotframework_ls.impl.ast_utils import create_error_from_node
@@ -376,12 +549,10 @@ def collect_analysis_errors(initial_completion_context):
     collect_keywords(initial_completion_context, collector)
 
     ast = initial_completion_context.get_ast()
-    for keyword_usage_info in ast_utils.iter_keyword_usage_tokens(
-        ast, collect_args_as_keywords=True
-    ):
-        initial_completion_context.check_cancelled()
+
+    def collect_keyword_usage_errors(keyword_usage_info, errors):
         if contains_variable_text(keyword_usage_info.name):
-            continue
+            return
         normalized_name = normalize_robot_name(keyword_usage_info.name)
         keywords_found = collector.get_keywords(normalized_name)
         if not keywords_found and keyword_usage_info.prefix:
@@ -398,7 +569,7 @@ def collect_analysis_errors(initial_completion_context):
                 if config is not None and not config.get_setting(
                     OPTION_ROBOT_LINT_UNDEFINED_KEYWORDS, bool, True
                 ):
-                    continue
+                    return
 
                 node = keyword_usage_info.node
                 error = create_error_from_node(
@@ -513,7 +684,7 @@ def collect_analysis_errors(initial_completion_context):
                 if config is not None and not config.get_setting(
                     OPTION_ROBOT_LINT_KEYWORD_CALL_ARGUMENTS, bool, True
                 ):
-                    continue
+                    return
 
                 from robotframework_ls.impl.keyword_argument_analysis import (
                     KeywordArgumentAnalysis,
@@ -589,20 +760,81 @@ def collect_analysis_errors(initial_completion_context):
                         errors.append(error)
                         break
 
-            if len(errors) >= MAX_ERRORS:
-                # i.e.: Collect at most 100 errors
-                break
         except:
             log.exception("Exception collecting errors")
 
-    if len(errors) >= MAX_ERRORS:
-        return errors
+    def collect_block_keyword_usage_errors(block) -> List[List[Error]]:
+        ret = []
+        for keyword_usage_info in ast_utils.iter_keyword_usage_tokens(
+            block, collect_args_as_keywords=True
+        ):
+            initial_completion_context.check_cancelled()
+            usage_errors: List[Error] = []
+            collect_keyword_usage_errors(keyword_usage_info, usage_errors)
+            if usage_errors:
+                ret.append(usage_errors)
+        return ret
 
-    for error in _collect_undefined_variables_errors(initial_completion_context):
-        errors.append(error)
-        if len(errors) >= MAX_ERRORS:
-            # i.e.: Collect at most 100 errors
-            break
+    variables_analysis = _UndefinedVariablesAnalysis.create(initial_completion_context)
+
+    # The analysis of each block is cached (keyed by its contents) and is
+    # reused while what's imported/defined in the document doesn't change.
+    caches = initial_completion_context.workspace.completion_context_workspace_caches
+    doc_uri = initial_completion_context.doc.uri
+    with caches.invalidation_tracker() as invalidation_tracker:
+        dependency_graph = initial_completion_context.collect_dependency_graph()
+        fingerprint = _compute_analysis_fingerprint(
+            initial_completion_context, dependency_graph, collector, variables_analysis
+        )
+        previous_blocks_analysis = caches.get_cached_blocks_analysis(
+            doc_uri, fingerprint
+        )
+        blocks_analysis: Dict[Hashable, _BlockAnalysis] = {}
+        blocks: List[Tuple[_BlockAnalysis, int, INode]] = []
+        for block_key, lineno, block in _iter_analysis_blocks(
+            initial_completion_context
+        ):
+            block_analysis = blocks_analysis.get(block_key)
+            if block_analysis is None and previous_blocks_analysis is not None:
+                block_analysis = previous_blocks_analysis.get(block_key)
+            if block_analysis is None:
+                block_analysis = _BlockAnalysis(lineno)
+            blocks_analysis[block_key] = block_analysis
+            blocks.append((block_analysis, lineno, block))
+
+        for block_analysis, lineno, block in blocks:
+            if block_analysis.keyword_usage_errors is None:
+                block_analysis.keyword_usage_errors = (
+                    collect_block_keyword_usage_errors(block)
+                )
+
+            delta = lineno - block_analysis.lineno
+            for usage_errors in block_analysis.keyword_usage_errors:
+                errors.extend(_shift_errors(usage_errors, delta))
+                if len(errors) >= MAX_ERRORS:
+                    break
+
+            if len(errors) >= MAX_ERRORS:
+                # i.e.: Collect at most 100 errors
+                break
+
+        if variables_analysis is not None and len(errors) < MAX_ERRORS:
+            for error in itertools.chain(
+                variables_analysis.unresolved_variable_import_errors,
+                _iter_blocks_undefined_variables_errors(variables_analysis, blocks),
+            ):
+                errors.append(error)
+                if len(errors) >= MAX_ERRORS:
+                    # i.e.: Collect at most 100 errors
+                    break
+
+        caches.cache_blocks_analysis(
+            doc_uri,
+            fingerprint,
+            blocks_analysis,
+            dependency_graph,
+            invalidation_tracker,
+        )
 
     if len(errors) >= MAX_ERRORS:
         return errors
@@ -705,193 +937,246 @@ def _env_vars_upper():
     return tuple(x.upper() for x in os.environ)
 
 
-def _collect_undefined_variables_errors(initial_completion_context):
-    from robotframework_ls.impl import ast_utils
-    from robotframework_ls.impl.variable_resolve import normalize_variable_name
-    from robotframework_ls.impl.ast_utils import create_error_from_node
-    from robotframework_ls.impl.variable_resolve import robot_search_variable
+class _UndefinedVariablesAnalysis(object):
+    """
+    Helper to collect the undefined variables in the blocks of a document
+    (the global variables are collected only once for the document).
+    """
 
-    config = initial_completion_context.config
-    if config is not None and not config.get_setting(
-        OPTION_ROBOT_LINT_VARIABLES, bool, True
-    ):
-        return
+    def __init__(self, initial_completion_context: ICompletionContext):
+        from robotframework_ls.impl import ast_utils
+        from robotframework_ls.impl.variable_resolve import normalize_variable_name
+        from robotframework_ls.impl import variable_completions
 
-    unresolved_variable_import_errors = []
+        self._completion_context = initial_completion_context
+        config = initial_completion_context.config
 
-    def on_unresolved_variable_import(
-        completion_context: ICompletionContext,
-        variable_import_name: str,
-        lineno: int,
-        end_lineno: int,
-        col_offset: int,
-        end_col_offset: int,
-        error_msg: Optional[str],
-        resolved_name: str,
-    ):
-        from robotframework_ls.impl.robot_lsp_constants import (
-            OPTION_ROBOT_LINT_UNDEFINED_VARIABLE_IMPORTS,
-        )
+        unresolved_variable_import_errors: List[Error] = []
 
-        if config is not None and not config.get_setting(
-            OPTION_ROBOT_LINT_UNDEFINED_VARIABLE_IMPORTS, bool, True
+        def on_unresolved_variable_import(
+            completion_context: ICompletionContext,
+            variable_import_name: str,
+            lineno: int,
+            end_lineno: int,
+            col_offset: int,
+            end_col_offset: int,
+            error_msg: Optional[str],
+            resolved_name: str,
         ):
-            return
+            from robotframework_ls.impl.robot_lsp_constants import (
+                OPTION_ROBOT_LINT_UNDEFINED_VARIABLE_IMPORTS,
+            )
 
-        doc = completion_context.doc
-        if doc and doc.uri == initial_completion_context.doc.uri:
-            start = (lineno - 1, col_offset)
-            end = (end_lineno - 1, end_col_offset)
-            if not error_msg:
-                error_msg = f"Unresolved variable import: {variable_import_name}"
-                if "{" in variable_import_name and resolved_name:
-                    error_msg += f"\nNote: resolved name: {resolved_name}"
+            if config is not None and not config.get_setting(
+                OPTION_ROBOT_LINT_UNDEFINED_VARIABLE_IMPORTS, bool, True
+            ):
+                return
+
+            doc = completion_context.doc
+            if doc and doc.uri == initial_completion_context.doc.uri:
+                start = (lineno - 1, col_offset)
+                end = (end_lineno - 1, end_col_offset)
+                if not error_msg:
+                    error_msg = f"Unresolved variable import: {variable_import_name}"
+                    if "{" in variable_import_name and resolved_name:
+                        error_msg += f"\nNote: resolved name: {resolved_name}"
 
-            error = ast_utils.Error(error_msg, start, end)
-            undefined_var_import_data: ICustomDiagnosticDataUndefinedVarImportTypedDict = {
-                "kind": "undefined_var_import",
-                "name": variable_import_name,
-                "resolved_name": resolved_name,
-            }
-            error.data = undefined_var_import_data
-            unresolved_variable_import_errors.append(error)
+                error = ast_utils.Error(error_msg, start, end)
+                undefined_var_import_data: ICustomDiagnosticDataUndefinedVarImportTypedDict = {
+                    "kind": "undefined_var_import",
+                    "name": variable_import_name,
+                    "resolved_name": resolved_name,
+                }
+                error.data = undefined_var_import_data
+                unresolved_variable_import_errors.append(error)
+
+        self._ignore_variables: Set[str] = set()
+        if config is not None:
+            self._ignore_variables.update(
+                normalize_variable_name(str(x))
+                for x in config.get_setting(
+                    OPTION_ROBOT_LINT_IGNORE_VARIABLES, list, []
+                )
+            )
 
-    from robotframework_ls.impl import variable_completions
+        self._ignore_environment_variables: Set[str] = set()
+        if config is not None:
+            self._ignore_environment_variables.update(
+                str(x).upper()
+                for x in config.get_setting(
+                    OPTION_ROBOT_LINT_IGNORE_ENVIRONMENT_VARIABLES, list, []
+                )
+            )
 
-    ignore_variables = set()
-    if config is not None:
-        ignore_variables.update(
-            normalize_variable_name(str(x))
-            for x in config.get_setting(OPTION_ROBOT_LINT_IGNORE_VARIABLES, list, [])
+        self._env_vars_upper = _env_vars_upper()
+
+        self._globals_collector = _VariablesCollector(
+            on_unresolved_variable_import=on_unresolved_variable_import
         )
 
-    ignore_environment_variables = set()
-    if config is not None:
-        ignore_environment_variables.update(
-            str(x).upper()
-            for x in config.get_setting(
-                OPTION_ROBOT_LINT_IGNORE_ENVIRONMENT_VARIABLES, list, []
-            )
+        # Collect undefined variables
+        variable_completions.collect_global_variables(
+            initial_completion_context, self._globals_collector, only_current_doc=False
         )
 
-    ast = initial_completion_context.get_ast()
+        self.unresolved_variable_import_errors = unresolved_variable_import_errors
 
-    globals_collector = _VariablesCollector(
-        on_unresolved_variable_import=on_unresolved_variable_import
-    )
+    @classmethod
+    def create(
+        cls, initial_completion_context: ICompletionContext
+    ) -> Optional["_UndefinedVariablesAnalysis"]:
+        """
+        :return: None if the undefined variables shouldn't be analyzed.
+        """
+        config = initial_completion_context.config
+        if config is not None and not config.get_setting(
+            OPTION_ROBOT_LINT_VARIABLES, bool, True
+        ):
+            return None
+        return cls(initial_completion_context)
+
+    def get_fingerprint(self) -> tuple:
+        """
+        Provides the fingerprint of the global (and environment) variables
+        available (if those change, all the variable references must be
+        analyzed again).
+        """
+        return (
+            self._globals_collector.get_fingerprint(),
+            self._env_vars_upper,
+        )
 
-    # Collect undefined variables
-    variable_completions.collect_global_variables(
-        initial_completion_context, globals_collector, only_current_doc=False
-    )
+    def iter_undefined_variables_errors(self, ast) -> Iterator[Error]:
+        from robotframework_ls.impl import ast_utils
+        from robotframework_ls.impl.variable_resolve import normalize_variable_name
+        from robotframework_ls.impl.ast_utils import create_error_from_node
+        from robotframework_ls.impl.variable_resolve import robot_search_variable
+        from robotframework_ls.impl import variable_completions
 
-    yield from iter(unresolved_variable_import_errors)
+        initial_completion_context = self._completion_context
+        globals_collector = self._globals_collector
+        ignore_variables = self._ignore_variables
+        ignore_environment_variables = self._ignore_environment_variables
+        env_vars_upper = self._env_vars_upper
 
-    env_vars_upper = None
+        for token_info in ast_utils.iter_variable_references(ast):
 
-    for token_info in ast_utils.iter_variable_references(ast):
+            initial_completion_context.check_cancelled()
 
-        initial_completion_context.check_cancelled()
+            if token_info.node.__class__.__name__ in (
+                "ResourceImport",
+                "LibraryImport",
+                "VariableImport",
+            ):
+                # These ones are handled differently as it ends up in an unresolved
+                # import.
+                continue
 
-        if token_info.node.__class__.__name__ in (
-            "ResourceImport",
-            "LibraryImport",
-            "VariableImport",
-        ):
-            # These ones are handled differently as it ends up in an unresolved
-            # import.
-            continue
+            if (
+                token_info.node.__class__.__name__ == "KeywordCall"
+                and token_info.node.keyword == "Comment"
+            ):
+                # Special handling for 'Comment' keyword (variables are not
+                # resolved when calling the 'Comment' keyword).
+                # https://github.com/robocorp/robotframework-lsp/issues/665
+                continue
 
-        if (
-            token_info.node.__class__.__name__ == "KeywordCall"
-            and token_info.node.keyword == "Comment"
-        ):
-            # Special handling for 'Comment' keyword (variables are not
-            # resolved when calling the 'Comment' keyword).
-            # https://github.com/robocorp/robotframework-lsp/issues/665
-            continue
+            var_name = token_info.token.value
+            var_line = token_info.token.lineno - 1  # We want it 0-based
+            var_col_offset = token_info.token.col_offset
 
-        var_name = token_info.token.value
-        var_line = token_info.token.lineno - 1  # We want it 0-based
-        var_col_offset = token_info.token.col_offset
+            if token_info.var_info.var_identifier == "%":
 
-        if token_info.var_info.var_identifier == "%":
+                if "=" in var_name + token_info.var_info.extended_part:
+                    # Consider case: %{SOME_VAR=}
+                    # Consider case: %{SOME_VAR=default val}
+                    continue
 
-            if "=" in var_name + token_info.var_info.extended_part:
-                # Consider case: %{SOME_VAR=}
-                # Consider case: %{SOME_VAR=default val}
-                continue
+                var_name_upper = var_name.upper()
+                if var_name_upper in ignore_environment_variables:
+                    continue
 
-            var_name_upper = var_name.upper()
-            if var_name_upper in ignore_environment_variables:
+                if (
+                    var_name_upper not in env_vars_upper
+                    and not globals_collector.contains_env_variable(var_name_upper)
+                ):
+                    # Environment variable
+                    yield create_error_from_node(
+                        token_info.node,
+                        f"Undefined environment variable: {token_info.token.value}",
+                        tokens=[token_info.token],
+                    )
                 continue
 
-            if env_vars_upper is None:
-                env_vars_upper = _env_vars_upper()
+            check_names = [normalize_variable_name(var_name)]
+            if token_info.var_info.extended_part.strip():
 
-            if (
-                var_name_upper not in env_vars_upper
-                and not globals_collector.contains_env_variable(var_name_upper)
-            ):
-                # Environment variable
-                yield create_error_from_node(
-                    token_info.node,
-                    f"Undefined environment variable: {token_info.token.value}",
-                    tokens=[token_info.token],
+                robot_match_in_ext = robot_search_variable(
+                    token_info.var_info.extended_part
                 )
-            continue
-
-        check_names = [normalize_variable_name(var_name)]
-        if token_info.var_info.extended_part.strip():
-
-            robot_match_in_ext = robot_search_variable(
-                token_info.var_info.extended_part
-            )
-            if robot_match_in_ext is not None and robot_match_in_ext.base:
-                continue
+                if robot_match_in_ext is not None and robot_match_in_ext.base:
+                    continue
 
-            check_names.append(
-                normalize_variable_name(var_name + token_info.var_info.extended_part)
-            )
+                check_names.append(
+                    normalize_variable_name(
+                        var_name + token_info.var_info.extended_part
+                    )
+                )
 
-        locals_collector = None
+            locals_collector = None
 
-        found = False
-        for normalized_variable_name in check_names:
-            if normalized_variable_name in ignore_variables:
-                found = True
-                break
+            found = False
+            for normalized_variable_name in check_names:
+                if normalized_variable_name in ignore_variables:
+                    found = True
+                    break
 
-            if _skip_variable_analysis(normalized_variable_name):
-                found = True
-                break
+                if _skip_variable_analysis(normalized_variable_name):
+                    found = True
+                    break
 
-            if globals_collector.contains_variable(
-                normalized_variable_name, sys.maxsize, 0
-            ):
-                found = True
-                break
-
-            if locals_collector is None:
-                locals_collector = _VariablesCollector(lambda *args, **kwargs: None)
-                local_ctx = initial_completion_context.create_copy_with_selection(
-                    line=token_info.token.lineno - 1,
-                    col=token_info.token.col_offset,
-                )
+                if globals_collector.contains_variable(
+                    normalized_variable_name, sys.maxsize, 0
+                ):
+                    found = True
+                    break
+
+                if locals_collector is None:
+                    locals_collector = _VariablesCollector(lambda *args, **kwargs: None)
+                    local_ctx = initial_completion_context.create_copy_with_selection(
+                        line=token_info.token.lineno - 1,
+                        col=token_info.token.col_offset,
+                    )
+
+                    variable_completions.collect_local_variables(
+                        local_ctx, locals_collector, token_info
+                    )
+
+                if locals_collector.contains_variable(
+                    normalized_variable_name, var_line, var_col_offset
+                ):
+                    found = True
+                    break
 
-                variable_completions.collect_local_variables(
-                    local_ctx, locals_collector, token_info
+            if not found:
+                yield create_error_from_node(
+                    token_info.node,
+                    f"Undefined variable: {token_info.token.value}",
+                    tokens=[token_info.token],
                 )
 
-            if locals_collector.contains_variable(
-                normalized_variable_name, var_line, var_col_offset
-            ):
-                found = True
-                break
 
-        if not found:
-            yield create_error_from_node(
-                token_info.node,
-                f"Undefined variable: {token_info.token.value}",
-                tokens=[token_info.token],
+def _iter_blocks_undefined_variables_errors(
+    variables_analysis: _UndefinedVariablesAnalysis,
+    blocks: List[Tuple["_BlockAnalysis", int, INode]],
+) -> Iterator[Error]:
+    for block_analysis, lineno, block in blocks:
+        if block_analysis.variable_errors is None:
+            block_analysis.variable_errors = list(
+                variables_analysis.iter_undefined_variables_errors(block)
             )
+        yield from iter(
+            _shift_errors(
+                block_analysis.variable_errors, lineno - block_analysis.lineno
+            )
+        )
@@ -11,8 +11,11 @@ from robotframework_ls.impl.protocols import (
     LibraryDependencyInfo,
     AbstractKeywordCollector,
     INode,
+    ILibraryDoc,
+    IKeywordDoc,
+    IKeywordsTable,
 )
-from typing import Sequence, List, Dict, Optional, Iterator, Any
+from typing import Sequence, List, Dict, Optional, Iterator, Any, cast
 from robotframework_ls.impl.text_utilities import build_keyword_docs_with_signature
 from robocorp_ls_core.lsp import MarkupContentTypedDict, MarkupKind
 
@@ -20,51 +23,146 @@ from robocorp_ls_core.lsp import MarkupContentTypedDict, MarkupKind
 log = get_logger(__name__)
 
 
+class _KeywordDefinitionFromAst(object):
+    """
+    The information on a keyword defined in a robot document which doesn't
+    depend on the completion context (it's shared by all the
+    `_KeywordFoundFromAst` created for that keyword while the document
+    doesn't change).
+    """
+
+    __slots__ = [
+        "module_ast",
+        "keyword_node",
+        "keyword_name",
+        "keyword_args",
+        "name_token",
+        "__instance_cache__",
+    ]
+
+    def __init__(self, module_ast, keyword_node):
+        from robot.api import Token
+        from robotframework_ls.impl import ast_utils
+
+        self.module_ast = module_ast
+        self.keyword_node = keyword_node
+        self.keyword_name = keyword_node.name
+        self.keyword_args: Sequence[IKeywordArg] = tuple(
+            ast_utils.iter_keyword_arguments_as_kwarg(keyword_node)
+        )
+        self.name_token = keyword_node.header.get_token(Token.KEYWORD_NAME)
+
+    @instance_cache
+    def docs_without_signature(self) -> str:
+        from robotframework_ls.impl import ast_utils
+
+        return ast_utils.get_documentation_as_markdown(self.keyword_node)
+
+    @instance_cache
+    def is_deprecated(self) -> bool:
+        from robotframework_ls.impl import ast_utils
+
+        return ast_utils.is_deprecated(self.keyword_node)
+
+
+class KeywordsTable(object):
+    """
+    The keywords defined in a robot document.
+
+    It's immutable (when the document changes a new table must be created)
+    and is shared among the completion contexts through the
+    `CompletionContextWorkspaceCaches` (see: `get_keywords_table`).
+
+    Note: the definitions are lazily created on the first request (if
+    multiple threads request the same definition at once it may be created
+    more than once, but the result is the same).
+    """
+
+    __slots__ = ["ast", "_index", "_definitions"]
+
+    def __init__(self, ast):
+        from robotframework_ls.impl import ast_utils
+
+        self.ast = ast
+        self._index = ast_utils.get_keyword_name_index(ast)
+        self._definitions: List[Optional[_KeywordDefinitionFromAst]] = [None] * len(
+            self._index
+        )
+
+    def _get_definition(self, i: int) -> _KeywordDefinitionFromAst:
+        definition = self._definitions[i]
+        if definition is None:
+            definition = _KeywordDefinitionFromAst(
+                self.ast, self._index.get_item(i).node
+            )
+            self._definitions[i] = definition
+        return definition
+
+    def iter_accepted(
+        self, collector: IKeywordCollector
+    ) -> Iterator[_KeywordDefinitionFromAst]:
+        accepted = collector.iter_accepted_in_index(self._index)
+        if accepted is not None:
+            for i in accepted:
+                yield self._get_definition(i)
+        else:
+            for i in range(len(self._index)):
+                node_info = self._index.get_item(i)
+                if collector.accepts(node_info.node.name):
+                    yield self._get_definition(i)
+
+    def __typecheckself__(self) -> None:
+        _: IKeywordsTable = check_implements(self)
+
+
+def get_keywords_table(completion_context: ICompletionContext) -> KeywordsTable:
+    """
+    Provides the keywords table for the document of the given completion
+    context (reusing the one cached in the workspace if the document didn't
+    change).
+    """
+    caches = completion_context.workspace.completion_context_workspace_caches
+    uri = completion_context.doc.uri
+
+    with caches.invalidation_tracker() as invalidation_tracker:
+        ast = completion_context.get_ast()
+        table = caches.get_cached_keywords_table(uri, ast)
+        if table is None:
+            table = KeywordsTable(ast)
+            caches.cache_keywords_table(uri, table, invalidation_tracker)
+    return cast(KeywordsTable, table)
+
+
 class _KeywordFoundFromAst(object):
 
     __slots__ = [
-        "_module_ast",
-        "_keyword_node",
-        "_keyword_name",
-        "_keyword_args",
+        "_definition",
         "completion_context",
         "completion_item_kind",
-        "_name_token",
         "__instance_cache__",
     ]
 
     def __init__(
         self,
-        module_ast,
-        keyword_node,
-        keyword_name,
-        keyword_args: Sequence[IKeywordArg],
+        definition: _KeywordDefinitionFromAst,
         completion_context,
         completion_item_kind,
     ):
-        from robot.api import Token
-
-        self._module_ast = module_ast
-        self._keyword_node = keyword_node
-
-        self._name_token = keyword_node.header.get_token(Token.KEYWORD_NAME)
-
-        self._keyword_name = keyword_name
-        self._keyword_args = keyword_args
+        self._definition = definition
         self.completion_context = completion_context
         self.completion_item_kind = completion_item_kind
 
     @property
     def keyword_name(self):
-        return self._keyword_name
+        return self._definition.keyword_name
 
     @property
     def keyword_ast(self) -> Optional[INode]:
-        return self._keyword_node
+        return self._definition.keyword_node
 
     @property
     def keyword_args(self) -> Sequence[IKeywordArg]:
-        return self._keyword_args
+        return self._definition.keyword_args
 
     @property
     def library_alias(self):
@@ -84,14 +182,14 @@ class _KeywordFoundFromAst(object):
     def compute_docs_without_signature(self) -> MarkupContentTypedDict:
         return {
             "kind": MarkupKind.Markdown,
-            "value": self._docs_without_signature(),
+            "value": self._definition.docs_without_signature(),
         }
 
     def compute_docs_with_signature(self) -> MarkupContentTypedDict:
         docs = build_keyword_docs_with_signature(
             self.keyword_name,
             tuple(x.original_arg for x in self.keyword_args),
-            self._docs_without_signature(),
+            self._definition.docs_without_signature(),
             "markdown",
         )
         return {
@@ -99,17 +197,8 @@ class _KeywordFoundFromAst(object):
             "value": docs,
         }
 
-    @instance_cache
-    def _docs_without_signature(self) -> str:
-        from robotframework_ls.impl import ast_utils
-
-        return ast_utils.get_documentation_as_markdown(self._keyword_node)
-
-    @instance_cache
     def is_deprecated(self) -> bool:
-        from robotframework_ls.impl import ast_utils
-
-        return ast_utils.is_deprecated(self._keyword_node)
+        return self._definition.is_deprecated()
 
     @property  # type: ignore
     @instance_cache
@@ -120,35 +209,35 @@ class _KeywordFoundFromAst(object):
 
     @property
     def lineno(self):
-        return self._name_token.lineno - 1
+        return self._definition.name_token.lineno - 1
 
     @property
     def end_lineno(self):
-        return self._name_token.lineno - 1
+        return self._definition.name_token.lineno - 1
 
     @property
     def col_offset(self):
-        return self._name_token.col_offset
+        return self._definition.name_token.col_offset
 
     @property
     def end_col_offset(self):
-        return self._name_token.end_col_offset
+        return self._definition.name_token.end_col_offset
 
     @property
     def scope_lineno(self) -> Optional[int]:
-        return self._keyword_node.lineno - 1
+        return self._definition.keyword_node.lineno - 1
 
     @property
     def scope_end_lineno(self) -> Optional[int]:
-        return self._keyword_node.end_lineno - 1
+        return self._definition.keyword_node.end_lineno - 1
 
     @property
     def scope_col_offset(self) -> Optional[int]:
-        return self._keyword_node.col_offset
+        return self._definition.keyword_node.col_offset
 
     @property
     def scope_end_col_offset(self) -> Optional[int]:
-        return self._keyword_node.end_col_offset
+        return self._definition.keyword_node.end_col_offset
 
     def __typecheckself__(self) -> None:
         _: IKeywordFound = check_implements(self)
@@ -256,9 +345,34 @@ class _KeywordFoundFromLibrary(object):
     def scope_end_col_offset(self) -> Optional[int]:
         return self.end_col_offset
 
+    def _prioritize_conversion_to_markdown(self) -> None:
+        from robotframework_ls.impl.robot_specbuilder import _get_markdown_formatter
+
+        # The docs of this library are being shown to the user: if it's still
+        # not converted to markdown, ask for it to be converted first.
+        library_doc = self._library_doc
+        spec_filename = library_doc.filename
+        if (
+            not spec_filename
+            or not spec_filename.endswith(".libspec")
+            or library_doc.doc_format.lower() == "markdown"
+            # i.e.: TEXT docs are never converted.
+            or _get_markdown_formatter(library_doc.doc_format) is None
+        ):
+            return
+
+        workspace = self.completion_context.workspace
+        if workspace is not None:
+            libspec_manager = workspace.libspec_manager
+            if libspec_manager is not None:
+                libspec_manager.schedule_conversion_to_markdown(
+                    spec_filename, prioritize=True
+                )
+
     def compute_docs_without_signature(self) -> MarkupContentTypedDict:
         from robotframework_ls.impl.robot_specbuilder import docs_and_format
 
+        self._prioritize_conversion_to_markdown()
         docs, docs_format = docs_and_format(self._keyword_doc)
 
         return {"kind": docs_format, "value": docs}
@@ -266,6 +380,7 @@ class _KeywordFoundFromLibrary(object):
     def compute_docs_with_signature(self) -> MarkupContentTypedDict:
         from robotframework_ls.impl.robot_specbuilder import docs_and_format
 
+        self._prioritize_conversion_to_markdown()
         docs, docs_format = docs_and_format(self._keyword_doc)
         docs = build_keyword_docs_with_signature(
             self.keyword_name,
@@ -283,34 +398,52 @@ class _KeywordFoundFromLibrary(object):
         _: IKeywordFound = check_implements(self)
 
 
+def _iter_accepted_keyword_docs(
+    library_doc: ILibraryDoc, collector: IKeywordCollector
+) -> Iterator[IKeywordDoc]:
+    from robotframework_ls.impl.keyword_name_index import (
+        get_library_keyword_name_index,
+    )
+
+    index = get_library_keyword_name_index(library_doc)
+    accepted = collector.iter_accepted_in_index(index)
+    if accepted is not None:
+        for i in accepted:
+            yield index.get_item(i)
+    else:
+        for keyword in library_doc.keywords:
+            if collector.accepts(keyword.name):
+                yield keyword
+
+
 def collect_keywords_from_ast(
     ast, completion_context: ICompletionContext, collector: IKeywordCollector
 ):
-    from robotframework_ls.impl import ast_utils
+    _collect_keywords_from_table(KeywordsTable(ast), completion_context, collector)
+
+
+def _collect_keywords_from_table(
+    table: KeywordsTable,
+    completion_context: ICompletionContext,
+    collector: IKeywordCollector,
+):
     from robocorp_ls_core.lsp import CompletionItemKind
 
-    found = {}
+    found: Dict[str, _KeywordDefinitionFromAst] = {}
 
-    for keyword in ast_utils.iter_keywords(ast):
+    for definition in table.iter_accepted(collector):
         completion_context.check_cancelled()
-        keyword_name = keyword.node.name
-        if collector.accepts(keyword_name):
-            keyword_args = list(ast_utils.iter_keyword_arguments_as_kwarg(keyword.node))
-
-            found[keyword_name] = _KeywordFoundFromAst(
-                ast,
-                keyword.node,
-                keyword_name,
-                keyword_args,
-                completion_context,
-                CompletionItemKind.Function,
-            )
+        found[definition.keyword_name] = definition
 
     # We notify afterwards because if multiple definitions of the same
     # keyword are found, we just want to report the last one (as is the
     # case for the interactive console).
-    for keyword_found in found.values():
-        collector.on_keyword(keyword_found)
+    for definition in found.values():
+        collector.on_keyword(
+            _KeywordFoundFromAst(
+                definition, completion_context, CompletionItemKind.Function
+            )
+        )
 
 
 def _collect_current_doc_keywords(
@@ -320,9 +453,8 @@ def _collect_current_doc_keywords(
     :param CompletionContext completion_context:
     """
     # Get keywords defined in the file itself
-
-    ast = completion_context.get_ast()
-    collect_keywords_from_ast(ast, completion_context, collector)
+    table = get_keywords_table(completion_context)
+    _collect_keywords_from_table(table, completion_context, collector)
 
 
 def _collect_libraries_keywords(
@@ -365,26 +497,22 @@ def _collect_libraries_keywords(
             else:
                 memo[key] = True
 
-            #: :type keyword: KeywordDoc
-            for keyword in library_doc.keywords:
-                keyword_name = keyword.name
-                if collector.accepts(keyword_name):
-
-                    keyword_args: Sequence[IKeywordArg] = ()
-                    if keyword.args:
-                        keyword_args = keyword.args
-
-                    collector.on_keyword(
-                        _KeywordFoundFromLibrary(
-                            library_doc,
-                            keyword,
-                            keyword_name,
-                            keyword_args,
-                            completion_context,
-                            CompletionItemKind.Method,
-                            library_alias=library_info.alias,
-                        )
+            for keyword in _iter_accepted_keyword_docs(library_doc, collector):
+                keyword_args: Sequence[IKeywordArg] = ()
+                if keyword.args:
+                    keyword_args = keyword.args
+
+                collector.on_keyword(
+                    _KeywordFoundFromLibrary(
+                        library_doc,
+                        keyword,
+                        keyword.name,
+                        keyword_args,
+                        completion_context,
+                        CompletionItemKind.Method,
+                        library_alias=library_info.alias,
                     )
+                )
 
             collector.on_resolved_library(
                 completion_context, library_info.node, library_doc
@@ -1,4 +1,14 @@
-from typing import Iterator, Tuple, Optional, Deque, Dict, Sequence, List, Set
+from typing import (
+    Iterator,
+    Tuple,
+    Optional,
+    Deque,
+    Dict,
+    Sequence,
+    List,
+    Set,
+    FrozenSet,
+)
 
 from robocorp_ls_core.ordered_set import OrderedSet
 from robotframework_ls.impl.protocols import (
@@ -14,6 +24,14 @@ from robotframework_ls.impl.robot_constants import BUILTIN_LIB
 from robocorp_ls_core.callbacks import Callback
 from robocorp_ls_core import uris
 import os
+import itertools
+
+
+def normalize_for_basename_check(name: str) -> str:
+    if "}" in name:
+        # Get everything after a variable to account for patterns such as ${/}.
+        name = name.split("}")[-1]
+    return os.path.basename(os.path.splitext(name)[0]).lower()
 
 
 class _Memo(object):
@@ -201,10 +219,33 @@ class CompletionContextDependencyGraph:
         return False
 
     def _normalize_for_basename_check(self, name):
-        if "}" in name:
-            # Get everything after a variable to account for patterns such as ${/}.
-            name = name.split("}")[-1]
-        return os.path.basename(os.path.splitext(name)[0]).lower()
+        return normalize_for_basename_check(name)
+
+    def get_invalidation_info(self) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        root_uri = uris.normalize_uri(self.get_root_doc().uri)
+        return (
+            frozenset(x for x in self._invalidate_on_uri_changes if x != root_uri),
+            frozenset(self._invalidate_on_basename_no_ext_changes),
+        )
+
+    def get_dependencies_fingerprint(self) -> tuple:
+        libraries = tuple(
+            (info.name, info.alias, info.builtin, info.args)
+            for info in self.iter_all_libraries()
+        )
+
+        docs: List[Optional[Tuple[str, int, int]]] = []
+        for _node, doc in itertools.chain(
+            self.iter_all_resource_imports_with_docs(),
+            self.iter_all_variable_imports_as_docs(),
+        ):
+            if doc is None:
+                docs.append(None)
+            else:
+                source = doc.source or ""
+                docs.append((doc.uri, len(source), hash(source)))
+
+        return (libraries, tuple(docs))
 
     @classmethod
     def _collect_library_info_from_completion_context(
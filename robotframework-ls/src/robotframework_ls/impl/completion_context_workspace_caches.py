@@ -1,9 +1,23 @@
-from typing import Optional, Hashable, TypeVar, Generic, Iterator, Tuple, Set
+from typing import (
+    Any,
+    Optional,
+    Hashable,
+    TypeVar,
+    Generic,
+    Iterator,
+    Tuple,
+    Set,
+    Dict,
+    FrozenSet,
+    List,
+    Sequence,
+)
 from robotframework_ls.impl.protocols import (
     IRobotDocument,
     ICompletionContextWorkspaceCaches,
     ICompletionContextDependencyGraph,
     IOnDependencyChanged,
+    IKeywordsTable,
 )
 from robocorp_ls_core import uris
 from collections import OrderedDict
@@ -16,6 +30,7 @@ from robotframework_ls.impl.robot_constants import (
 from contextlib import contextmanager
 from robocorp_ls_core.options import BaseOptions
 from robocorp_ls_core.robotframework_log import get_logger
+from robocorp_ls_core.watchdog_wrapper import ChangesBatch
 import json
 
 T = TypeVar("T")
@@ -59,6 +74,104 @@ class _LRU(Generic[T]):
         yield from self._cache.values()
 
 
+class _DiagnosticsEntry(object):
+    __slots__ = ["uri", "fingerprint", "diagnostics", "dependency_uris", "basenames"]
+
+    def __init__(
+        self,
+        uri: str,
+        fingerprint: Optional[Hashable],
+        diagnostics: list,
+        dependency_uris: FrozenSet[str],
+        basenames: FrozenSet[str],
+    ):
+        self.uri = uri
+        self.fingerprint = fingerprint
+        self.diagnostics = diagnostics
+        self.dependency_uris = dependency_uris
+        self.basenames = basenames
+
+
+class _DiagnosticsCache(object):
+    """
+    Keeps the diagnostics of the linted documents along with a reverse
+    dependency map (dependency -> documents whose diagnostics depend on it).
+
+    Note: not thread-safe (the CompletionContextWorkspaceCaches lock must be
+    held when using it).
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, _DiagnosticsEntry]" = OrderedDict()
+        self._uri_to_dependents: Dict[str, Set[str]] = {}
+        self._basename_to_dependents: Dict[str, Set[str]] = {}
+
+    def get(self, normalized_uri: str, fingerprint: Hashable) -> Optional[list]:
+        entry = self._entries.get(normalized_uri)
+        if (
+            entry is None
+            or entry.fingerprint is None
+            or entry.fingerprint != fingerprint
+        ):
+            return None
+        self._entries.move_to_end(normalized_uri)
+        return entry.diagnostics
+
+    def put(self, normalized_uri: str, entry: _DiagnosticsEntry) -> None:
+        self.pop(normalized_uri)
+        self._entries[normalized_uri] = entry
+        for dependency_uri in entry.dependency_uris:
+            self._uri_to_dependents.setdefault(dependency_uri, set()).add(
+                normalized_uri
+            )
+        for basename in entry.basenames:
+            self._basename_to_dependents.setdefault(basename, set()).add(normalized_uri)
+
+        while len(self._entries) > self._max_size:
+            self.pop(next(iter(self._entries)))
+
+    def pop(self, normalized_uri: str) -> Optional[_DiagnosticsEntry]:
+        entry = self._entries.pop(normalized_uri, None)
+        if entry is not None:
+            for key, key_to_dependents in (
+                (entry.dependency_uris, self._uri_to_dependents),
+                (entry.basenames, self._basename_to_dependents),
+            ):
+                for k in key:
+                    dependents = key_to_dependents.get(k)
+                    if dependents is not None:
+                        dependents.discard(normalized_uri)
+                        if not dependents:
+                            del key_to_dependents[k]
+        return entry
+
+    def pop_dependents(
+        self, normalized_uri: str, basename: str
+    ) -> List[_DiagnosticsEntry]:
+        """
+        Removes the entries which depend on the given uri/basename.
+
+        :return: the entries removed.
+        """
+        dependents = set(self._uri_to_dependents.get(normalized_uri, ()))
+        dependents.update(self._basename_to_dependents.get(basename, ()))
+        ret = []
+        for dependent in dependents:
+            entry = self.pop(dependent)
+            if entry is not None:
+                ret.append(entry)
+        return ret
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._uri_to_dependents.clear()
+        self._basename_to_dependents.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class _InvalidationTracker:
     def __init__(self):
         self._uris_invalidated = set()
@@ -79,8 +192,25 @@ class _InvalidationTracker:
 
         return True
 
+    def is_uri_still_valid(self, uri: str) -> bool:
+        if self._all_invalidated:
+            return False
+        return uri not in self._uris_invalidated
+
 
 class CompletionContextWorkspaceCaches:
+    # The keywords tables are per-document (not per dependency graph), so, more
+    # entries are kept (and invalidating one of those is just a dict removal).
+    MAX_KEYWORDS_TABLES = 500
+
+    # The diagnostics are also per-document (a reverse dependency map is kept
+    # so that the entries are invalidated when a dependency changes).
+    MAX_DIAGNOSTICS = 500
+
+    # The per-block code analysis results are kept for a few documents (usually
+    # only the ones being edited benefit from those).
+    MAX_BLOCKS_ANALYSIS = 100
+
     def __init__(
         self, on_dependency_changed: Optional[IOnDependencyChanged] = None
     ) -> None:
@@ -91,44 +221,73 @@ class CompletionContextWorkspaceCaches:
         self.cache_hits = 0
         self.invalidations = 0
 
+        self._keywords_tables: _LRU[IKeywordsTable] = _LRU(self.MAX_KEYWORDS_TABLES)
+        self.keywords_table_hits = 0
+
+        self._diagnostics = _DiagnosticsCache(self.MAX_DIAGNOSTICS)
+        self.diagnostics_hits = 0
+
+        self._blocks_analysis: _LRU[Tuple[Hashable, Dict[Hashable, Any]]] = _LRU(
+            self.MAX_BLOCKS_ANALYSIS
+        )
+
         self._invalidation_trackers: Set[_InvalidationTracker] = set()
         self._on_dependency_changed = on_dependency_changed
 
-    def _invalidate_uri(self, uri: str) -> None:
+    def _invalidate_uris(self, doc_uris: Sequence[str]) -> None:
+        from robotframework_ls.impl.completion_context_dependency_graph import (
+            normalize_for_basename_check,
+        )
+
+        dependents: List[str] = []
         with self._lock:
-            notified = set()
-            for invalidation_tracker in self._invalidation_trackers:
-                invalidation_tracker.mark_uri_invalidated(uri)
+            for uri in doc_uris:
+                for invalidation_tracker in self._invalidation_trackers:
+                    invalidation_tracker.mark_uri_invalidated(uri)
+                self._keywords_tables.pop(uri, None)
+
+                # The diagnostics are kept until a dependency changes (unlike
+                # the dependency graphs, which may be evicted early), so, those
+                # are used to know which documents must be linted again.
+                normalized_uri = uris.normalize_uri(uri)
+                self._diagnostics.pop(normalized_uri)
+                dependents.extend(
+                    entry.uri
+                    for entry in self._diagnostics.pop_dependents(
+                        normalized_uri, normalize_for_basename_check(uri)
+                    )
+                )
 
             did_invalidate_entry = False
 
             for key, entry in tuple(self._cached.items()):
-                if entry.do_invalidate_on_uri_change(uri):
-
-                    uri = entry.get_root_doc().uri
-                    if uri not in notified:
-                        notified.add(uri)
-                        if self._on_dependency_changed:
-                            self._on_dependency_changed(uri)
-
-                    did_invalidate_entry = True
-                    invalidated: Optional[
-                        ICompletionContextDependencyGraph
-                    ] = self._cached.pop(key, None)
-                    if BaseOptions.DEBUG_CACHE_DEPS and invalidated:
-                        log.info(
-                            "Invalidated: %s\n%s\n",
-                            key,
-                            json.dumps(invalidated.to_dict(), indent=4),
-                        )
+                for uri in doc_uris:
+                    if entry.do_invalidate_on_uri_change(uri):
+                        did_invalidate_entry = True
+                        invalidated: Optional[
+                            ICompletionContextDependencyGraph
+                        ] = self._cached.pop(key, None)
+                        if BaseOptions.DEBUG_CACHE_DEPS and invalidated:
+                            log.info(
+                                "Invalidated: %s\n%s\n",
+                                key,
+                                json.dumps(invalidated.to_dict(), indent=4),
+                            )
+                        break
 
             if BaseOptions.DEBUG_CACHE_DEPS and not did_invalidate_entry:
-                log.info("%s did not invalidate the caches:", uri)
+                log.info("%s did not invalidate the caches:", doc_uris)
                 for key, entry in tuple(self._cached.items()):
                     log.info(
                         json.dumps(entry.to_dict(), indent=4),
                     )
 
+        # Notify without the lock held.
+        on_dependency_changed = self._on_dependency_changed
+        if on_dependency_changed is not None:
+            for dependent_uri in dependents:
+                on_dependency_changed(dependent_uri)
+
     @contextmanager
     def invalidation_tracker(self):
         try:
@@ -147,19 +306,37 @@ class CompletionContextWorkspaceCaches:
         Called when a file is changed in the file-system (i.e.: it was saved).
         """
         if filename:
+            self.on_files_changed(ChangesBatch((filename,)))
+
+    def on_files_changed(self, changes: ChangesBatch):
+        """
+        Called when files are changed in the file-system (all the robot
+        documents changed are invalidated at once).
+        """
+        if changes.subtrees:
+            # We don't know which files changed inside the subtree.
+            self.clear_caches()
+            return
+
+        doc_uris: List[str] = []
+        for filename in changes.paths:
             lower = filename.lower()
             if lower.endswith(ROBOT_AND_TXT_FILE_EXTENSIONS):
-                uri = uris.from_fs_path(filename)
-                self._invalidate_uri(uri)
+                doc_uris.append(uris.from_fs_path(filename))
 
             elif lower.endswith(LIBRARY_FILE_EXTENSIONS):
                 # If a library changes, we consider all caches invalid because
                 # we don't hold an association to know which library maps to
                 # which files at this level.
                 self.clear_caches()
+                return
 
             elif lower.endswith(VARIABLE_FILE_EXTENSIONS):
                 self.clear_caches()
+                return
+
+        if doc_uris:
+            self._invalidate_uris(doc_uris)
 
     def on_updated_document(self, uri: str, document: Optional[IRobotDocument]):
         """
@@ -169,7 +346,7 @@ class CompletionContextWorkspaceCaches:
         :param document:
             The document just updated or None if it was removed.
         """
-        self._invalidate_uri(uri)
+        self._invalidate_uris((uri,))
 
     def clear_caches(self):
         """
@@ -180,6 +357,9 @@ class CompletionContextWorkspaceCaches:
             for invalidation_tracker in self._invalidation_trackers:
                 invalidation_tracker.mark_all_invalidated()
             self._cached.clear()
+            self._keywords_tables.clear()
+            self._diagnostics.clear()
+            self._blocks_analysis.clear()
 
     def dispose(self):
         self.clear_caches()
@@ -222,6 +402,77 @@ class CompletionContextWorkspaceCaches:
             if invalidation_tracker.is_dependency_graph_still_valid(dependency_graph):
                 self._cached.put(cache_key, dependency_graph)
 
+    def get_cached_keywords_table(self, uri: str, ast) -> Optional[IKeywordsTable]:
+        with self._lock:
+            ret = self._keywords_tables.get(uri)
+            if ret is not None:
+                if ret.ast is not ast:
+                    # The document changed (and we weren't notified about it
+                    # yet).
+                    return None
+                self.keywords_table_hits += 1
+            return ret
+
+    def cache_keywords_table(
+        self,
+        uri: str,
+        keywords_table: IKeywordsTable,
+        invalidation_tracker: _InvalidationTracker,
+    ) -> None:
+        with self._lock:
+            if invalidation_tracker.is_uri_still_valid(uri):
+                self._keywords_tables.put(uri, keywords_table)
+
+    def get_cached_diagnostics(self, uri: str, fingerprint: Hashable) -> Optional[list]:
+        with self._lock:
+            ret = self._diagnostics.get(uris.normalize_uri(uri), fingerprint)
+            if ret is not None:
+                self.diagnostics_hits += 1
+            return ret
+
+    def cache_diagnostics(
+        self,
+        uri: str,
+        fingerprint: Optional[Hashable],
+        diagnostics: list,
+        dependency_graph: ICompletionContextDependencyGraph,
+        invalidation_tracker: _InvalidationTracker,
+    ) -> None:
+        dependency_uris, basenames = dependency_graph.get_invalidation_info()
+        entry = _DiagnosticsEntry(
+            uri, fingerprint, diagnostics, dependency_uris, basenames
+        )
+        with self._lock:
+            if invalidation_tracker.is_uri_still_valid(
+                uri
+            ) and invalidation_tracker.is_dependency_graph_still_valid(
+                dependency_graph
+            ):
+                self._diagnostics.put(uris.normalize_uri(uri), entry)
+
+    def get_cached_blocks_analysis(
+        self, uri: str, fingerprint: Hashable
+    ) -> Optional[Dict[Hashable, Any]]:
+        with self._lock:
+            ret = self._blocks_analysis.get(uris.normalize_uri(uri))
+            if ret is None or ret[0] != fingerprint:
+                return None
+            return ret[1]
+
+    def cache_blocks_analysis(
+        self,
+        uri: str,
+        fingerprint: Hashable,
+        blocks_analysis: Dict[Hashable, Any],
+        dependency_graph: ICompletionContextDependencyGraph,
+        invalidation_tracker: _InvalidationTracker,
+    ) -> None:
+        with self._lock:
+            if invalidation_tracker.is_dependency_graph_still_valid(dependency_graph):
+                self._blocks_analysis.put(
+                    uris.normalize_uri(uri), (fingerprint, blocks_analysis)
+                )
+
     def __typecheckself__(self) -> None:
         from robocorp_ls_core.protocols import check_implements
 
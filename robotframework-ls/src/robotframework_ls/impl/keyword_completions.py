@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional, Iterator, Set
 
 from robocorp_ls_core.protocols import check_implements
 from robocorp_ls_core.robotframework_log import get_logger
@@ -8,6 +8,7 @@ from robotframework_ls.impl.protocols import (
     IKeywordCollector,
     AbstractKeywordCollector,
     KeywordUsageInfo,
+    IKeywordNameIndex,
 )
 from robocorp_ls_core.lsp import (
     TextEditTypedDict,
@@ -71,6 +72,21 @@ class _Collector(AbstractKeywordCollector):
                 return True
         return False
 
+    def iter_accepted_in_index(
+        self, index: IKeywordNameIndex
+    ) -> Optional[Iterator[int]]:
+        filter_texts = set([self._matcher.filter_text])
+        for matcher in self._scope_matchers:
+            filter_texts.add(matcher.filter_text)
+
+        if len(filter_texts) == 1:
+            return index.iter_containing(filter_texts.pop())
+
+        accepted: Set[int] = set()
+        for filter_text in filter_texts:
+            accepted.update(index.iter_containing(filter_text))
+        return iter(sorted(accepted))
+
     def _create_completion_item_from_keyword(
         self, keyword_found: IKeywordFound, selection, token, col_delta=0
     ) -> CompletionItemTypedDict:
@@ -0,0 +1,154 @@
+"""
+An index of keyword names used to filter the keywords of a library/resource
+without having to normalize/check every keyword name on each request (i.e.:
+the equivalent of `RobotStringMatcher.accepts_keyword_name` and
+`RobotStringMatcher.is_same_robot_name`).
+
+The index is created when the library/resource is loaded (so, it's
+invalidated along with it), but its contents are only computed on the first
+query (so, it's cheap for users which never query it).
+"""
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from robocorp_ls_core.protocols import check_implements
+from robotframework_ls.impl.protocols import IKeywordNameIndex, ILibraryDoc
+from robotframework_ls.impl.text_utilities import normalize_robot_name
+
+_NGRAM_LEN = 3
+
+
+class _IndexData(object):
+    __slots__ = ["normalized_names", "normalized_name_to_indexes", "ngram_to_indexes"]
+
+    def __init__(self, names: Sequence[str]):
+        normalized_names: List[str] = []
+        normalized_name_to_indexes: Dict[str, List[int]] = {}
+        ngram_to_indexes: Dict[str, List[int]] = {}
+
+        for i, name in enumerate(names):
+            normalized = normalize_robot_name(name)
+            normalized_names.append(normalized)
+
+            lst = normalized_name_to_indexes.get(normalized)
+            if lst is None:
+                lst = normalized_name_to_indexes[normalized] = []
+            lst.append(i)
+
+            for ngram in set(
+                normalized[j : j + _NGRAM_LEN]
+                for j in range(len(normalized) - _NGRAM_LEN + 1)
+            ):
+                lst = ngram_to_indexes.get(ngram)
+                if lst is None:
+                    lst = ngram_to_indexes[ngram] = []
+                lst.append(i)
+
+        self.normalized_names = normalized_names
+        self.normalized_name_to_indexes = normalized_name_to_indexes
+        self.ngram_to_indexes = ngram_to_indexes
+
+
+class KeywordNameIndex(object):
+    def __init__(self, items: Sequence[Any], get_name: Callable[[Any], str]):
+        """
+        :param items:
+            The items to be indexed (i.e.: keyword docs, keyword node infos).
+
+        :param get_name:
+            Callable which provides the keyword name of a given item.
+        """
+        self._items = items
+        self._get_name = get_name
+        self._data: Optional[_IndexData] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_item(self, i: int) -> Any:
+        return self._items[i]
+
+    def _get_data(self) -> _IndexData:
+        data = self._data
+        if data is None:
+            with self._lock:
+                data = self._data
+                if data is None:
+                    get_name = self._get_name
+                    data = self._data = _IndexData(
+                        [get_name(item) for item in self._items]
+                    )
+        return data
+
+    def iter_containing(self, normalized_text: str) -> Iterator[int]:
+        data = self._get_data()
+        normalized_names = data.normalized_names
+
+        if not normalized_text:
+            yield from range(len(normalized_names))
+            return
+
+        if len(normalized_text) < _NGRAM_LEN:
+            for i, normalized in enumerate(normalized_names):
+                if normalized_text in normalized:
+                    yield i
+            return
+
+        ngram_to_indexes = data.ngram_to_indexes
+        postings = []
+        for ngram in set(
+            normalized_text[j : j + _NGRAM_LEN]
+            for j in range(len(normalized_text) - _NGRAM_LEN + 1)
+        ):
+            indexes = ngram_to_indexes.get(ngram)
+            if not indexes:
+                return
+            postings.append(indexes)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for indexes in postings[1:]:
+            candidates.intersection_update(indexes)
+            if not candidates:
+                return
+
+        # The ngrams being there doesn't mean that they're contiguous, so,
+        # the candidates must still be checked.
+        for i in sorted(candidates):
+            if normalized_text in normalized_names[i]:
+                yield i
+
+    def iter_same_name(self, normalized_name: str) -> Iterator[int]:
+        data = self._get_data()
+        yield from iter(data.normalized_name_to_indexes.get(normalized_name, ()))
+
+    def __typecheckself__(self) -> None:
+        _: IKeywordNameIndex = check_implements(self)
+
+
+_library_doc_to_index: "weakref.WeakKeyDictionary[ILibraryDoc, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+_library_doc_to_index_lock = threading.Lock()
+
+
+def _get_keyword_doc_name(keyword_doc) -> str:
+    return keyword_doc.name
+
+
+def get_library_keyword_name_index(library_doc: ILibraryDoc) -> IKeywordNameIndex:
+    """
+    Provides the index for the keywords of the given library doc (cached for
+    as long as the library doc is alive and its keywords aren't changed).
+    """
+    keywords = library_doc.keywords
+    with _library_doc_to_index_lock:
+        cached = _library_doc_to_index.get(library_doc)
+        if cached is not None and cached[0] is keywords:
+            return cached[1]
+
+        index = KeywordNameIndex(keywords, _get_keyword_doc_name)
+        _library_doc_to_index[library_doc] = (keywords, index)
+        return index
@@ -0,0 +1,206 @@
+"""
+A pool of long-lived python processes (which keep `robot` imported) used to
+generate .libspec files (so that we don't pay the interpreter startup and
+the `robot` import for each library).
+
+Environment variables which can be used to customize it:
+
+- `ROBOTFRAMEWORK_LS_LIBDOC_WORKERS`: the max number of worker processes
+  (0 means that the pool is disabled and a new process is created for each
+  libspec).
+
+- `ROBOTFRAMEWORK_LS_LIBDOC_WORKER_MAX_JOBS`: the number of libspecs a
+  worker generates before being recycled.
+"""
+import json
+import os
+import sys
+import threading
+from typing import List, Optional, Tuple
+
+from robocorp_ls_core.robotframework_log import get_logger
+
+log = get_logger(__name__)
+
+ENV_LIBDOC_WORKERS = "ROBOTFRAMEWORK_LS_LIBDOC_WORKERS"
+ENV_LIBDOC_WORKER_MAX_JOBS = "ROBOTFRAMEWORK_LS_LIBDOC_WORKER_MAX_JOBS"
+
+DEFAULT_MAX_JOBS_PER_WORKER = 50
+
+
+def _get_int_from_env(env_var: str, default: int) -> int:
+    value = os.environ.get(env_var, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        log.critical("Expected %s to evaluate to an int. Found: %s", env_var, value)
+        return default
+
+
+def get_libdoc_workers_from_env() -> int:
+    return _get_int_from_env(ENV_LIBDOC_WORKERS, min(4, os.cpu_count() or 1))
+
+
+def get_libdoc_worker_max_jobs_from_env() -> int:
+    return _get_int_from_env(ENV_LIBDOC_WORKER_MAX_JOBS, DEFAULT_MAX_JOBS_PER_WORKER)
+
+
+class LibdocWorkerError(Exception):
+    pass
+
+
+class _LibdocWorker(object):
+    def __init__(self):
+        from robocorp_ls_core.subprocess_wrapper import subprocess
+        from robotframework_ls.impl import _libdoc_worker
+
+        worker_file = _libdoc_worker.__file__
+        if worker_file.endswith((".pyc", ".pyo")):
+            worker_file = worker_file[:-1]
+
+        # Note: the env is always inherited (the process which has the
+        # LibspecManager must be the target env already).
+        self.environ = dict(os.environ)
+        self._process = subprocess.Popen(
+            [sys.executable, "-u", worker_file],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.jobs_done = 0
+
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
+
+    def run(self, argv: List[str], cwd: Optional[str]) -> Tuple[int, str]:
+        process = self._process
+        request = json.dumps({"argv": argv, "cwd": cwd}) + "\n"
+        try:
+            assert process.stdin is not None
+            assert process.stdout is not None
+            process.stdin.write(request.encode("utf-8"))
+            process.stdin.flush()
+            line = process.stdout.readline()
+        except (OSError, ValueError) as e:
+            raise LibdocWorkerError(f"Error communicating with libdoc worker: {e}")
+
+        if not line:
+            raise LibdocWorkerError(
+                f"Libdoc worker exited (exit code: {process.poll()})."
+            )
+
+        self.jobs_done += 1
+        response = json.loads(line.decode("utf-8"))
+        return response["returncode"], response["output"]
+
+    def dispose(self) -> None:
+        process = self._process
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+        except Exception:
+            pass
+        try:
+            process.kill()
+            process.wait(timeout=5)
+        except Exception:
+            log.debug("Error killing libdoc worker.")
+
+
+class LibdocWorkerPool(object):
+    """
+    Workers are created on demand (up to `max_workers`) and are recycled
+    after `max_jobs_per_worker` jobs, if they crash or if the environment
+    variables change.
+    """
+
+    def __init__(self, max_workers: int, max_jobs_per_worker: int):
+        self._max_workers = max(1, max_workers)
+        self._max_jobs_per_worker = max(1, max_jobs_per_worker)
+        self._condition = threading.Condition()
+        self._idle: List[_LibdocWorker] = []
+        self._total_workers = 0
+        self._disposed = False
+
+    def _acquire_worker(self) -> _LibdocWorker:
+        create = False
+        with self._condition:
+            while True:
+                if self._disposed:
+                    raise LibdocWorkerError("Libdoc worker pool already disposed.")
+
+                if self._idle:
+                    worker = self._idle.pop()
+                    if worker.is_alive() and worker.environ == os.environ:
+                        return worker
+
+                    # The environment changed (or it died): create a new one.
+                    worker.dispose()
+                    self._total_workers -= 1
+                    continue
+
+                if self._total_workers < self._max_workers:
+                    self._total_workers += 1
+                    create = True
+                    break
+
+                self._condition.wait()
+
+        assert create
+        try:
+            return _LibdocWorker()
+        except:
+            self._discard_worker(None)
+            raise
+
+    def _release_worker(self, worker: _LibdocWorker) -> None:
+        if (
+            worker.jobs_done >= self._max_jobs_per_worker
+            or not worker.is_alive()
+            or self._disposed
+        ):
+            self._discard_worker(worker)
+            return
+
+        with self._condition:
+            self._idle.append(worker)
+            self._condition.notify()
+
+    def _discard_worker(self, worker: Optional[_LibdocWorker]) -> None:
+        if worker is not None:
+            worker.dispose()
+        with self._condition:
+            self._total_workers -= 1
+            self._condition.notify()
+
+    def run_libdoc(self, argv: List[str], cwd: Optional[str]) -> Tuple[int, str]:
+        """
+        :param argv:
+            The arguments to libdoc (i.e.: what would be passed after
+            `python -m robot.libdoc`).
+
+        :return: a tuple(returncode, output).
+
+        :raises LibdocWorkerError: if the worker crashed (in which case the
+            worker is discarded).
+        """
+        worker = self._acquire_worker()
+        try:
+            ret = worker.run(argv, cwd)
+        except:
+            self._discard_worker(worker)
+            raise
+        self._release_worker(worker)
+        return ret
+
+    def dispose(self) -> None:
+        with self._condition:
+            self._disposed = True
+            idle = self._idle
+            self._idle = []
+            self._condition.notify_all()
+
+        for worker in idle:
+            worker.dispose()
@@ -0,0 +1,313 @@
+"""
+A compact pre-parsed version of a .libspec (so that the XML/json doesn't need
+to be parsed again when a library is loaded).
+
+The file layout is:
+
+- 8 bytes: magic (b"RFLSBIN" + format version).
+- 2 bytes: major/minor python version used to write the file (the structure
+  is saved with `marshal`, whose format is python-specific).
+- 4 bytes: size of the structure (little endian uint32).
+- The structure (marshal): a dict with the mtime of the .libspec it was
+  created from and the library information. Docs are not saved in the
+  structure but as (start, end) byte offsets in the string table.
+- The string table: the utf-8 contents of the docs.
+
+When loaded, the string table is kept as (utf-8) bytes and the docs of the
+library and keywords are only decoded when they're first accessed (so, only
+the docs actually shown to the user are decoded).
+
+Note: the file is read and not memory-mapped (a mapping keeps a file
+descriptor open for each loaded library, which could exhaust the file
+descriptors available to the process in workspaces with many libraries), so,
+each process which loads a library has its own copy of the string table (the
+saving is that docs which are never shown aren't decoded to `str`).
+"""
+import marshal
+import os
+import struct
+import sys
+import typing
+import weakref
+from typing import Any, Dict, Optional, List, Tuple
+
+from robocorp_ls_core.basic import normalize_filename
+from robocorp_ls_core.robotframework_log import get_logger
+from robotframework_ls.impl.protocols import ILibraryDoc
+from robotframework_ls.impl.robot_specbuilder import (
+    LibraryDoc,
+    KeywordDoc,
+    KeywordArg,
+    CustomDoc,
+    EnumDoc,
+    TypedDictDoc,
+)
+from robotframework_ls.impl.text_utilities import get_digest_from_string
+
+log = get_logger(__name__)
+
+_FORMAT_VERSION = 1
+_MAGIC = b"RFLSBIN" + bytes([_FORMAT_VERSION])
+_PREFIX = struct.Struct("<8sBBI")
+
+_DATA_TYPE_CLASSES: Dict[str, Any] = {
+    "Custom": CustomDoc,
+    "Enum": EnumDoc,
+    "TypedDict": TypedDictDoc,
+}
+
+
+class _StringTable(object):
+    def __init__(self, contents: bytes, offset: int):
+        self._contents = contents
+        self._offset = offset
+
+    def get(self, start_end: Tuple[int, int]) -> str:
+        offset = self._offset
+        start, end = start_end
+        return self._contents[offset + start : offset + end].decode("utf-8")
+
+
+class _StringTableBuilder(object):
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._size = 0
+
+    def add(self, s: str) -> Tuple[int, int]:
+        b = s.encode("utf-8")
+        start = self._size
+        self._chunks.append(b)
+        self._size += len(b)
+        return start, self._size
+
+    def getvalue(self) -> bytes:
+        return b"".join(self._chunks)
+
+
+class _CachedLibraryDoc(LibraryDoc):
+    _strings: _StringTable
+
+    @property  # type: ignore
+    def doc(self):
+        doc = self._doc
+        if doc.__class__ is tuple:
+            doc = self._doc = self._strings.get(doc)
+        return doc
+
+    @doc.setter
+    def doc(self, doc):
+        self._doc = doc
+
+
+class _CachedKeywordDoc(KeywordDoc):
+    _strings: _StringTable
+
+    @property  # type: ignore
+    def doc(self):
+        doc = self._doc
+        if doc.__class__ is tuple:
+            doc = self._doc = self._strings.get(doc)
+        return doc
+
+    @doc.setter
+    def doc(self, doc):
+        self._doc = doc
+
+
+def _keyword_to_tuple(keyword, strings: _StringTableBuilder) -> tuple:
+    return (
+        keyword.name,
+        tuple(_arg_to_dict(arg) for arg in keyword.args),
+        strings.add(keyword.doc),
+        tuple(keyword.tags),
+        keyword._source,
+        keyword.lineno,
+        keyword._shortdoc,
+    )
+
+
+def _arg_to_dict(arg) -> Dict[str, Any]:
+    ret = dict(arg.__dict__)
+    arg_type = ret.get("_arg_type")
+    if isinstance(arg_type, list):
+        ret["_arg_type"] = tuple(arg_type)
+    return ret
+
+
+def _arg_from_dict(d: Dict[str, Any]) -> KeywordArg:
+    arg = KeywordArg.__new__(KeywordArg)
+    arg.__dict__.update(d)
+    arg_type = d.get("_arg_type")
+    if isinstance(arg_type, tuple):
+        arg._arg_type = list(arg_type)  # type: ignore
+    return arg
+
+
+def _keyword_from_tuple(weak_libdoc, strings: _StringTable, t: tuple) -> KeywordDoc:
+    name, args, doc, tags, source, lineno, shortdoc = t
+    keyword = _CachedKeywordDoc(
+        weak_libdoc,
+        name=name,
+        args=tuple(_arg_from_dict(arg) for arg in args),
+        doc=doc,
+        tags=list(tags),
+        source=source,
+        lineno=lineno,
+    )
+    keyword._strings = strings
+    keyword._shortdoc = shortdoc
+    return keyword
+
+
+def _library_doc_to_tuple(libdoc, strings: _StringTableBuilder) -> tuple:
+    return (
+        libdoc.name,
+        strings.add(libdoc.doc),
+        libdoc.version,
+        libdoc.specversion,
+        libdoc.type,
+        libdoc.scope,
+        libdoc.named_args,
+        libdoc.doc_format,
+        libdoc._source,
+        libdoc.lineno,
+        tuple(_keyword_to_tuple(kw, strings) for kw in libdoc.inits),
+        tuple(_keyword_to_tuple(kw, strings) for kw in libdoc.keywords),
+        tuple(data_type.to_dictionary() for data_type in libdoc.data_types),
+    )
+
+
+def _library_doc_from_tuple(
+    spec_filename: str, strings: _StringTable, t: tuple
+) -> ILibraryDoc:
+    (
+        name,
+        doc,
+        version,
+        specversion,
+        type_,
+        scope,
+        named_args,
+        doc_format,
+        source,
+        lineno,
+        inits,
+        keywords,
+        data_types,
+    ) = t
+    libdoc = _CachedLibraryDoc(
+        spec_filename,
+        name=name,
+        doc=doc,
+        version=version,
+        specversion=specversion,
+        type=type_,
+        scope=scope,
+        named_args=named_args,
+        doc_format=doc_format,
+        source=source,
+        lineno=lineno,
+    )
+    libdoc._strings = strings
+
+    weak_libdoc = weakref.ref(libdoc)
+    libdoc.inits = [_keyword_from_tuple(weak_libdoc, strings, kw) for kw in inits]
+    libdoc.keywords = [_keyword_from_tuple(weak_libdoc, strings, kw) for kw in keywords]
+
+    new_data_types = []
+    for data_type in data_types:
+        data_type = dict(data_type)
+        cls = _DATA_TYPE_CLASSES[data_type.pop("type")]
+        new_data_types.append(cls(**data_type))
+    libdoc.data_types = new_data_types
+    return typing.cast(ILibraryDoc, libdoc)
+
+
+def get_binary_cache_filename(libspec_manager, spec_filename: str) -> str:
+    spec_filename = normalize_filename(spec_filename)
+    digest = get_digest_from_string(spec_filename)
+
+    return os.path.join(
+        libspec_manager.cache_libspec_dir,
+        f"{digest}_{os.path.basename(spec_filename)}.bin",
+    )
+
+
+def save_binary_cache_version(
+    libspec_manager, spec_filename: str, mtime: float, libdoc, from_markdown: bool
+) -> bool:
+    """
+    :param from_markdown:
+        Whether the libdoc was loaded from the markdown json version.
+
+    :return: True if it was saved and False otherwise.
+    """
+    target = get_binary_cache_filename(libspec_manager, spec_filename)
+    try:
+        strings = _StringTableBuilder()
+        structure = marshal.dumps(
+            {
+                "mtime": str(mtime),
+                "markdown": from_markdown,
+                "libdoc": _library_doc_to_tuple(libdoc, strings),
+            }
+        )
+        prefix = _PREFIX.pack(
+            _MAGIC, sys.version_info[0], sys.version_info[1], len(structure)
+        )
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp_filename = "%s.%s.tmp" % (target, os.getpid())
+        with open(tmp_filename, "wb") as stream:
+            stream.write(prefix)
+            stream.write(structure)
+            stream.write(strings.getvalue())
+        os.replace(tmp_filename, target)
+        return True
+    except Exception:
+        log.exception("Error saving libspec binary cache: %s", target)
+        return False
+
+
+def _read_contents(filename: str) -> bytes:
+    with open(filename, "rb") as stream:
+        return stream.read()
+
+
+def load_binary_cache_version(
+    libspec_manager, spec_filename: str, mtime: float
+) -> Optional[Tuple[ILibraryDoc, bool]]:
+    """
+    :return:
+        A tuple(libdoc, from_markdown) or None if there's no binary cache or
+        if it doesn't match the given mtime of the spec filename.
+    """
+    target = get_binary_cache_filename(libspec_manager, spec_filename)
+    try:
+        contents = _read_contents(target)
+    except Exception:
+        log.debug("Unable to load binary cache: %s (file does not exist)", target)
+        return None
+
+    try:
+        if len(contents) < _PREFIX.size:
+            return None
+        magic, major, minor, structure_len = _PREFIX.unpack(contents[: _PREFIX.size])
+        if magic != _MAGIC or (major, minor) != sys.version_info[:2]:
+            return None
+
+        structure_end = _PREFIX.size + structure_len
+        structure = marshal.loads(contents[_PREFIX.size : structure_end])
+        if structure["mtime"] != str(mtime):
+            log.debug(
+                "Unable to load binary cache: %s because mtime no longer matches.",
+                target,
+            )
+            return None
+
+        strings = _StringTable(contents, structure_end)
+        libdoc = _library_doc_from_tuple(spec_filename, strings, structure["libdoc"])
+        return libdoc, structure["markdown"]
+    except Exception:
+        log.exception("Error loading libdoc from binary cache: %s", target)
+        return None
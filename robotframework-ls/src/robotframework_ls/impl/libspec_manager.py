@@ -1,9 +1,10 @@
 import os
 import sys
+import time
 from robotframework_ls.constants import NULL
 from robocorp_ls_core.robotframework_log import get_logger
 import threading
-from typing import Optional, Dict, Set, Iterator, Union, Any
+from typing import Optional, Dict, Set, Iterator, Union, Any, List, Tuple, Iterable
 from robocorp_ls_core.protocols import Sentinel, IEndPoint
 from robotframework_ls.impl.protocols import (
     ILibraryDoc,
@@ -12,7 +13,7 @@ from robotframework_ls.impl.protocols import (
     ILibraryDocConversions,
 )
 import itertools
-from robocorp_ls_core.watchdog_wrapper import IFSObserver
+from robocorp_ls_core.watchdog_wrapper import IFSObserver, ChangesBatch
 from robotframework_ls.impl.robot_lsp_constants import (
     OPTION_ROBOT_LIBRARIES_LIBDOC_NEEDS_ARGS,
 )
@@ -27,6 +28,9 @@ import typing
 from robotframework_ls.impl.text_utilities import get_digest_from_string
 from robocorp_ls_core.basic import normalize_filename
 
+if typing.TYPE_CHECKING:
+    from robotframework_ls.impl.libdoc_worker_pool import LibdocWorkerPool
+
 log = get_logger(__name__)
 
 
@@ -70,6 +74,11 @@ def _load_library_doc_and_mtime(libspec_manager, spec_filename: str, obtain_mute
     from robotframework_ls.impl import robot_specbuilder
     from robotframework_ls.impl.libspec_markdown_conversion import (
         load_markdown_json_version,
+        _get_markdown_json_version_filename,
+    )
+    from robotframework_ls.impl.libspec_binary_cache import (
+        load_binary_cache_version,
+        save_binary_cache_version,
     )
 
     ctx: Any
@@ -82,15 +91,39 @@ def _load_library_doc_and_mtime(libspec_manager, spec_filename: str, obtain_mute
         try:
             mtime = os.path.getmtime(spec_filename)
             if not libspec_manager.is_copy:
+                libdoc_and_from_markdown = load_binary_cache_version(
+                    libspec_manager, spec_filename, mtime
+                )
+                if libdoc_and_from_markdown is not None:
+                    cached_libdoc, from_markdown = libdoc_and_from_markdown
+                    if from_markdown or not os.path.exists(
+                        _get_markdown_json_version_filename(
+                            libspec_manager, spec_filename
+                        )
+                    ):
+                        if cached_libdoc.doc_format != "markdown":
+                            libspec_manager.schedule_conversion_to_markdown(
+                                spec_filename
+                            )
+                        return cached_libdoc, mtime
+
+                    # The binary cache was created from the raw .libspec but
+                    # the markdown version is now available: update it.
+
                 libdoc = load_markdown_json_version(
                     libspec_manager, spec_filename, mtime
                 )
+                from_markdown = libdoc is not None
 
                 if libdoc is None:
                     builder = robot_specbuilder.SpecDocBuilder()
                     libdoc = builder.build(spec_filename)
                     if libdoc.doc_format != "markdown":
                         libspec_manager.schedule_conversion_to_markdown(spec_filename)
+
+                save_binary_cache_version(
+                    libspec_manager, spec_filename, mtime, libdoc, from_markdown
+                )
                 return libdoc, mtime
 
             else:
@@ -287,15 +320,125 @@ class _LibInfo(object):
         return True
 
 
+class _LibspecHeader(object):
+    """
+    The information from the root element of a .libspec file which is needed
+    to know whether it matches a library import (obtained without loading the
+    whole file).
+    """
+
+    __slots__ = ["mtime", "name_lower", "sources"]
+
+    def __init__(self, mtime: float, name_lower: str, sources: Tuple[str, ...]):
+        self.mtime = mtime
+        self.name_lower = name_lower
+        # The normalized source (and its normalized real path if different).
+        self.sources = sources
+
+
+def _read_libspec_header(spec_filename: str) -> Optional[_LibspecHeader]:
+    from xml.etree import ElementTree
+
+    try:
+        mtime = os.path.getmtime(spec_filename)
+        with open(spec_filename, "rb") as stream:
+            for _event, elem in ElementTree.iterparse(stream, events=("start",)):
+                name = elem.get("name") or ""
+                source = elem.get("source")
+                break
+            else:
+                return None
+    except Exception:
+        log.debug("Unable to read libspec header from: %s", spec_filename)
+        return None
+
+    sources: Tuple[str, ...] = ()
+    if source:
+        if not os.path.isabs(source):
+            # Same thing done in LibraryDoc.source.
+            source = os.path.abspath(
+                os.path.join(os.path.dirname(spec_filename), source)
+            )
+        normalized = normalize_filename(source)
+        normalized_real = _norm_filename(source)
+        if normalized_real != normalized:
+            sources = (normalized, normalized_real)
+        else:
+            sources = (normalized,)
+
+    return _LibspecHeader(mtime, name.lower(), sources)
+
+
+class _LibspecIndex(object):
+    """
+    Indexes the .libspec files of a folder by the library name, library source
+    and .libspec basename (used when the args digest is part of the name).
+
+    The filenames found are always provided in the same order in which they
+    appear in `_FolderInfo.libspec_canonical_filename_to_info` (which is the
+    same order used in `LibspecManager.iter_lib_info`).
+    """
+
+    def __init__(
+        self,
+        canonical_filenames: Iterable[str],
+        filename_to_header: Dict[str, Optional[_LibspecHeader]],
+    ):
+        self._filename_to_position: Dict[str, int] = {}
+        self._name_lower_to_filenames: Dict[str, List[str]] = {}
+        self._source_to_filenames: Dict[str, List[str]] = {}
+        self._basename_to_filenames: Dict[str, List[str]] = {}
+
+        # The ones we weren't able to read the header must be always checked.
+        self._unindexed: List[str] = []
+
+        for i, filename in enumerate(canonical_filenames):
+            self._filename_to_position[filename] = i
+            self._basename_to_filenames.setdefault(
+                os.path.basename(filename), []
+            ).append(filename)
+
+            header = filename_to_header.get(filename)
+            if header is None:
+                self._unindexed.append(filename)
+                continue
+
+            self._name_lower_to_filenames.setdefault(header.name_lower, []).append(
+                filename
+            )
+            for source in header.sources:
+                self._source_to_filenames.setdefault(source, []).append(filename)
+
+    def _sorted(self, found: Iterable[str]) -> List[str]:
+        filenames = set(found)
+        filenames.update(self._unindexed)
+        return sorted(filenames, key=self._filename_to_position.__getitem__)
+
+    def get_by_name(self, name_lower: str) -> List[str]:
+        return self._sorted(self._name_lower_to_filenames.get(name_lower, ()))
+
+    def get_by_sources(self, sources: Iterable[str]) -> List[str]:
+        return self._sorted(
+            itertools.chain.from_iterable(
+                self._source_to_filenames.get(source, ()) for source in sources
+            )
+        )
+
+    def get_by_basename(self, basename: str) -> List[str]:
+        return self._sorted(self._basename_to_filenames.get(basename, ()))
+
+
 class _FolderInfo(object):
     def __init__(self, folder_path, recursive):
         self.folder_path = folder_path
         self.recursive = recursive
         self.libspec_canonical_filename_to_info = {}
+        self.libspec_index = _LibspecIndex((), {})
+        self._filename_to_header: Dict[str, Optional[_LibspecHeader]] = {}
         self._watch = NULL
         self._lock = threading.Lock()
 
-    def start_watch(self, observer, notifier):
+    def start_watch(self, observer, on_changes):
         with self._lock:
             if self._watch is NULL:
                 if not os.path.isdir(self.folder_path):
@@ -315,35 +458,89 @@ class _FolderInfo(object):
                 from robocorp_ls_core.watchdog_wrapper import PathInfo
 
                 folder_path = self.folder_path
-                self._watch = observer.notify_on_any_change(
+                self._watch = observer.notify_on_any_change_batched(
                     [PathInfo(folder_path, recursive=self.recursive)],
-                    notifier.on_change,
-                    (self._on_change_spec,),
+                    on_changes,
+                    (self._on_change_specs,),
                     extensions=(".py", ".libspec"),
                 )
 
-    def _on_change_spec(self, spec_file):
+    def _on_change_specs(self, changes: ChangesBatch):
+        if changes.subtrees:
+            # We don't know which spec files changed: list everything again.
+            self.synchronize()
+            return
+
         with self._lock:
-            spec_file_key = _norm_filename(spec_file)
-            # Just add/remove that specific spec file from the tracked list.
+            changed_spec_file_keys: Set[str] = set()
+            # Just add/remove the specific spec files from the tracked list.
             libspec_canonical_filename_to_info = (
                 self.libspec_canonical_filename_to_info.copy()
             )
-            if os.path.exists(spec_file):
-                libspec_canonical_filename_to_info[spec_file_key] = None
-            else:
-                libspec_canonical_filename_to_info.pop(spec_file_key, None)
+            for spec_file in changes.paths:
+                if not spec_file.lower().endswith(".libspec"):
+                    continue
+                spec_file_key = _norm_filename(spec_file)
+                changed_spec_file_keys.add(spec_file_key)
+                if os.path.exists(spec_file):
+                    libspec_canonical_filename_to_info[spec_file_key] = None
+                else:
+                    libspec_canonical_filename_to_info.pop(spec_file_key, None)
 
+            if not changed_spec_file_keys:
+                return
+
+            self._update_index(
+                libspec_canonical_filename_to_info, changed_spec_file_keys
+            )
             self.libspec_canonical_filename_to_info = libspec_canonical_filename_to_info
 
+    def _update_index(
+        self,
+        libspec_canonical_filename_to_info,
+        changed_spec_file_keys: Optional[Set[str]] = None,
+    ):
+        """
+        Updates the index based on the given files (only the headers of new or
+        changed files are read).
+        """
+        old_filename_to_header = self._filename_to_header
+        filename_to_header: Dict[str, Optional[_LibspecHeader]] = {}
+        for filename in libspec_canonical_filename_to_info:
+            header = old_filename_to_header.get(filename)
+            if header is not None:
+                if changed_spec_file_keys is not None:
+                    # Only the changed files must be checked.
+                    if filename in changed_spec_file_keys:
+                        header = None
+                else:
+                    try:
+                        if os.path.getmtime(filename) != header.mtime:
+                            header = None
+                    except Exception:
+                        header = None
+
+            if header is None:
+                header = _read_libspec_header(filename)
+            filename_to_header[filename] = header
+
+        self._filename_to_header = filename_to_header
+        self.libspec_index = _LibspecIndex(
+            libspec_canonical_filename_to_info, filename_to_header
+        )
+
     def synchronize(self):
         with self._lock:
             try:
-                self.libspec_canonical_filename_to_info = self._collect_libspec_info(
+                libspec_canonical_filename_to_info = self._collect_libspec_info(
                     [self.folder_path],
                     self.libspec_canonical_filename_to_info,
                     recursive=self.recursive,
                 )
+                self._update_index(libspec_canonical_filename_to_info)
+                self.libspec_canonical_filename_to_info = (
+                    libspec_canonical_filename_to_info
+                )
             except Exception:
                 log.exception("Error when synchronizing: %s", self.folder_path)
 
@@ -353,6 +550,8 @@ class _FolderInfo(object):
             self._watch = NULL
             watch.stop_tracking()
             self.libspec_canonical_filename_to_info = {}
+            self._filename_to_header = {}
+            self.libspec_index = _LibspecIndex((), {})
 
     def _collect_libspec_info(self, folders, old_libspec_filename_to_info, recursive):
         seen_libspec_files = set()
@@ -444,6 +643,10 @@ class LibspecManager(object):
     # a libspec for a target filename.
     INTERNAL_VERSION = "v2"
 
+    # The interval (in seconds) to check whether a library whose conversion
+    # to markdown was forwarded to another process was already converted.
+    MARKDOWN_RELOAD_CHECK_INTERVAL = 0.5
+
     def create_copy(self):
         return LibspecManager(
             builtin_libspec_dir=self._builtins_libspec_dir,
@@ -472,7 +675,6 @@ class LibspecManager(object):
         :param __internal_libspec_dir__:
             Only to be used in tests (to regenerate the builtins)!
         """
-        from robocorp_ls_core import watchdog_wrapper
         from robocorp_ls_core.cache import DirCache
         from robotframework_ls import robot_config
 
@@ -528,6 +730,19 @@ class LibspecManager(object):
             self.libspec_markdown_conversion = None
 
         self._libspec_warmup = LibspecWarmup(endpoint, dir_cache)
+        self._endpoint = endpoint
+
+        # When the conversion to markdown isn't done in this process, the
+        # prioritized conversions are forwarded (through the endpoint) to the
+        # process which does it.
+        # spec filename -> next time to check whether it was converted
+        # (at which point the library is reloaded).
+        self._markdown_conversion_forwarded: Dict[str, float] = {}
+
+        # Created on demand (see: _get_libdoc_worker_pool).
+        self._libdoc_worker_pool: Optional["LibdocWorkerPool"] = None
+        self._libdoc_worker_pool_lock = threading.Lock()
+        self._disposed = False
 
         self._libspec_failures_cache: Dict[
             tuple, str
@@ -535,6 +750,10 @@ class LibspecManager(object):
 
         self._main_thread = threading.current_thread()
 
+        # Incremented whenever a change is detected in a tracked file (so,
+        # users can know whether the libraries may have changed).
+        self._libspec_generation = 0
+
         if observer is None:
             from robocorp_ls_core.watchdog_wrapper import create_observer
 
@@ -543,10 +762,6 @@ class LibspecManager(object):
             observer = create_observer("dummy", ())
         self._fs_observer = observer
 
-        self._file_changes_notifier = watchdog_wrapper.create_notifier(
-            self._on_file_changed, timeout=0.5, extensions=(".libspec", ".py")
-        )
-
         # Spec info found in the workspace
         self._workspace_folder_uri_to_folder_info: Dict[str, _FolderInfo] = {}
         self._additional_pythonpath_folder_to_folder_info: Dict[str, _FolderInfo] = {}
@@ -601,12 +816,69 @@ class LibspecManager(object):
     def is_copy(self):
         return self._is_copy
 
-    def schedule_conversion_to_markdown(self, spec_filename: str):
+    def schedule_conversion_to_markdown(
+        self, spec_filename: str, prioritize: bool = False
+    ):
+        """
+        :param prioritize:
+            If True the docs of the library are being shown to the user (so,
+            it should be converted before the other libraries).
+
+        Note: the conversion is only done in the process which pre-generates
+        the libspecs (the lint api). In other processes a prioritized
+        conversion is forwarded to it (through the endpoint) and the library
+        is reloaded when the conversion is finished.
+        """
         if self.libspec_markdown_conversion is not None:
             self.libspec_markdown_conversion.schedule_conversion_to_markdown(
-                spec_filename
+                spec_filename, prioritize
             )
 
+        elif prioritize and not self._is_copy:
+            endpoint = self._endpoint
+            if (
+                endpoint is not None
+                and spec_filename not in self._markdown_conversion_forwarded
+            ):
+                self._markdown_conversion_forwarded[spec_filename] = (
+                    time.monotonic() + self.MARKDOWN_RELOAD_CHECK_INTERVAL
+                )
+                endpoint.notify(
+                    "$/prioritizeMarkdownConversion", {"specFilename": spec_filename}
+                )
+
+    def _reload_if_converted_to_markdown(
+        self,
+        canonical_filename_to_info,
+        canonical_spec_filename: str,
+        info: _LibInfo,
+        can_regenerate: bool,
+    ) -> _LibInfo:
+        from robotframework_ls.impl.libspec_markdown_conversion import (
+            is_markdown_json_version_up_to_date,
+        )
+
+        forwarded = self._markdown_conversion_forwarded
+        next_check = forwarded.get(canonical_spec_filename)
+        if next_check is None or time.monotonic() < next_check:
+            return info
+
+        if not is_markdown_json_version_up_to_date(self, canonical_spec_filename):
+            forwarded[canonical_spec_filename] = (
+                time.monotonic() + self.MARKDOWN_RELOAD_CHECK_INTERVAL
+            )
+            return info
+
+        # The conversion is finished (even if the docs couldn't be converted,
+        # i.e.: the doc format has no markdown conversion): reload it once.
+        del forwarded[canonical_spec_filename]
+        new_info = _load_lib_info(self, canonical_spec_filename, can_regenerate)
+        if new_info is None or new_info.library_doc is None:
+            return info
+
+        canonical_filename_to_info[canonical_spec_filename] = new_info
+        return new_info
+
     @property
     def fs_observer(self) -> IFSObserver:
         return self._fs_observer
@@ -664,29 +936,37 @@ class LibspecManager(object):
     def cache_libspec_dir(self) -> str:
         return self._cache_libspec_dir
 
-    def _on_file_changed(self, spec_file, folder_info_on_change_spec):
-        log.debug("File change detected: %s", spec_file)
+    @property
+    def libspec_generation(self) -> int:
+        """
+        A number which changes whenever a .libspec or a library source tracked
+        by this manager changes or a .libspec is (re)generated (i.e.: because
+        the sources of a library which isn't in a tracked folder changed).
+        """
+        return self._libspec_generation
+
+    def _on_files_changed(self, changes: ChangesBatch, folder_info_on_change_specs):
+        log.debug("File changes detected: %s", changes)
+        self._libspec_generation += 1
 
         # Check if the cache related to libspec generation failure must be
         # cleared.
-        fix = False
-        for cache_key in self._libspec_failures_cache:
-            libname = cache_key[0]
-            if libname in spec_file:
-                fix = True
-                break
-        if fix:
+        if changes.subtrees:
+            # Always set as a whole (to avoid racing conditions).
+            self._libspec_failures_cache = {}
+        else:
+            changed_paths = changes.paths
             new = {}
             for cache_key, value in self._libspec_failures_cache.items():
                 libname = cache_key[0]
-                if libname not in spec_file:
+                if not any(libname in path for path in changed_paths):
                     new[cache_key] = value
-            # Always set as a whole (to avoid racing conditions).
-            self._libspec_failures_cache = new
+            if len(new) != len(self._libspec_failures_cache):
+                # Always set as a whole (to avoid racing conditions).
+                self._libspec_failures_cache = new
 
-        # Notify _FolderInfo._on_change_spec
-        if spec_file.lower().endswith(".libspec"):
-            folder_info_on_change_spec(spec_file)
+        # Notify _FolderInfo._on_change_specs
+        folder_info_on_change_specs(changes)
 
     def add_workspace_folder(self, folder_uri: str):
         self._check_in_main_thread()
@@ -699,7 +979,7 @@ class LibspecManager(object):
                 uris.to_fs_path(folder_uri), recursive=True
             )
             self._workspace_folder_uri_to_folder_info = cp
-            folder_info.start_watch(self._fs_observer, self._file_changes_notifier)
+            folder_info.start_watch(self._fs_observer, self._on_files_changed)
             folder_info.synchronize()
         else:
             log.debug("Workspace folder already added: %s", folder_uri)
@@ -722,7 +1002,7 @@ class LibspecManager(object):
             cp = self._additional_pythonpath_folder_to_folder_info.copy()
             folder_info = cp[folder_path] = _FolderInfo(folder_path, recursive=True)
             self._additional_pythonpath_folder_to_folder_info = cp
-            folder_info.start_watch(self._fs_observer, self._file_changes_notifier)
+            folder_info.start_watch(self._fs_observer, self._on_files_changed)
             folder_info.synchronize()
         else:
             log.debug("Additional pythonpath folder already added: %s", folder_path)
@@ -740,22 +1020,22 @@ class LibspecManager(object):
 
     def synchronize_workspace_folders(self):
         for folder_info in self._workspace_folder_uri_to_folder_info.values():
-            folder_info.start_watch(self._fs_observer, self._file_changes_notifier)
+            folder_info.start_watch(self._fs_observer, self._on_files_changed)
             folder_info.synchronize()
 
     def synchronize_pythonpath_folders(self):
         for folder_info in self._pythonpath_folder_to_folder_info.values():
-            folder_info.start_watch(self._fs_observer, self._file_changes_notifier)
+            folder_info.start_watch(self._fs_observer, self._on_files_changed)
             folder_info.synchronize()
 
     def synchronize_additional_pythonpath_folders(self):
         for folder_info in self._additional_pythonpath_folder_to_folder_info.values():
-            folder_info.start_watch(self._fs_observer, self._file_changes_notifier)
+            folder_info.start_watch(self._fs_observer, self._on_files_changed)
             folder_info.synchronize()
 
     def synchronize_internal_libspec_folders(self):
         for folder_info in self._internal_folder_to_folder_info.values():
-            folder_info.start_watch(self._fs_observer, self._file_changes_notifier)
+            folder_info.start_watch(self._fs_observer, self._on_files_changed)
             folder_info.synchronize()
 
     def _synchronize(self):
@@ -781,49 +1061,129 @@ class LibspecManager(object):
 
         yield from self._additional_pythonpath_folder_to_folder_info.keys()
 
-    def iter_lib_info(self, builtin=False):
+    def _iter_folder_infos(self, builtin=False) -> Iterator[Tuple[_FolderInfo, bool]]:
         """
-        :rtype: generator(_LibInfo)
+        Provides the folder infos (and whether its libspecs can be regenerated).
         """
         # Note: the iteration order is important (first ones are visited earlier
         # and have higher priority).
-        iter_in = []
         for (_uri, info) in self._workspace_folder_uri_to_folder_info.items():
-            if info.libspec_canonical_filename_to_info:
-                iter_in.append((info.libspec_canonical_filename_to_info, False))
+            yield info, False
 
         for (_uri, info) in self._pythonpath_folder_to_folder_info.items():
-            if info.libspec_canonical_filename_to_info:
-                iter_in.append((info.libspec_canonical_filename_to_info, False))
+            yield info, False
 
         for (_uri, info) in self._additional_pythonpath_folder_to_folder_info.items():
-            if info.libspec_canonical_filename_to_info:
-                iter_in.append((info.libspec_canonical_filename_to_info, False))
+            yield info, False
 
         if builtin:
-            info = self._internal_folder_to_folder_info[self._builtins_libspec_dir]
-            if info.libspec_canonical_filename_to_info:
-                iter_in.append((info.libspec_canonical_filename_to_info, True))
+            yield self._internal_folder_to_folder_info[self._builtins_libspec_dir], True
         else:
             for (_uri, info) in self._internal_folder_to_folder_info.items():
-                if info.libspec_canonical_filename_to_info:
-                    iter_in.append((info.libspec_canonical_filename_to_info, True))
+                yield info, True
 
-        for canonical_filename_to_info, can_regenerate in iter_in:
-            for canonical_spec_filename, info in list(
-                canonical_filename_to_info.items()
+    def _load_lib_infos(
+        self, canonical_filename_to_info, canonical_spec_filenames, can_regenerate
+    ) -> Iterator[_LibInfo]:
+        for canonical_spec_filename in canonical_spec_filenames:
+            try:
+                info = canonical_filename_to_info[canonical_spec_filename]
+            except KeyError:
+                # Removed in the meanwhile.
+                continue
+
+            if info is None:
+                info = canonical_filename_to_info[
+                    canonical_spec_filename
+                ] = _load_lib_info(self, canonical_spec_filename, can_regenerate)
+
+            elif (
+                self._markdown_conversion_forwarded
+                and canonical_spec_filename in self._markdown_conversion_forwarded
             ):
+                info = self._reload_if_converted_to_markdown(
+                    canonical_filename_to_info,
+                    canonical_spec_filename,
+                    info,
+                    can_regenerate,
+                )
+
+            # Note: we could end up yielding a library with the same name
+            # multiple times due to its scope. It's up to the caller to
+            # validate that.
+            if info is not None and info.library_doc is not None:
+                yield info
+
+    def iter_lib_info(self, builtin=False):
+        """
+        :rtype: generator(_LibInfo)
+        """
+        iter_in = []
+        for folder_info, can_regenerate in self._iter_folder_infos(builtin):
+            if folder_info.libspec_canonical_filename_to_info:
+                iter_in.append(
+                    (folder_info.libspec_canonical_filename_to_info, can_regenerate)
+                )
+
+        for canonical_filename_to_info, can_regenerate in iter_in:
+            yield from self._load_lib_infos(
+                canonical_filename_to_info,
+                list(canonical_filename_to_info.keys()),
+                can_regenerate,
+            )
+
+    def _iter_lib_info_candidates(
+        self,
+        builtin: bool,
+        libname: str,
+        libname_lower: str,
+        target_file: str,
+        normalized_target_file: str,
+        args: Optional[str],
+    ) -> Iterator[_LibInfo]:
+        """
+        Provides the library infos which may match the given library (in the
+        same order as `iter_lib_info`), loading only those (the caller must
+        still check whether it actually matches).
+        """
+        target_sources: Tuple[str, ...] = ()
+        if target_file and not args:
+            normalized_real_target_file = _norm_filename(target_file)
+            if normalized_real_target_file != normalized_target_file:
+                target_sources = (normalized_target_file, normalized_real_target_file)
+            else:
+                target_sources = (normalized_target_file,)
 
-                if info is None:
-                    info = canonical_filename_to_info[
-                        canonical_spec_filename
-                    ] = _load_lib_info(self, canonical_spec_filename, can_regenerate)
+        for folder_info, can_regenerate in self._iter_folder_infos(builtin):
+            # Get both at once (the index must match the filenames).
+            canonical_filename_to_info = folder_info.libspec_canonical_filename_to_info
+            index = folder_info.libspec_index
+            if not canonical_filename_to_info:
+                continue
 
-                # Note: we could end up yielding a library with the same name
-                # multiple times due to its scope. It's up to the caller to
-                # validate that.
-                if info is not None and info.library_doc is not None:
-                    yield info
+            if target_file and can_regenerate:
+                if args:
+                    filenames = index.get_by_basename(
+                        get_digest_from_string(target_file)
+                        + "_"
+                        + get_digest_from_string(args)
+                        + ".libspec"
+                    )
+                else:
+                    filenames = index.get_by_sources(target_sources)
+            else:
+                if not args:
+                    filenames = index.get_by_name(libname_lower)
+                else:
+                    filenames = index.get_by_basename(
+                        os.path.normcase(
+                            libname + get_digest_from_string(args) + ".libspec"
+                        )
+                    )
+
+            yield from self._load_lib_infos(
+                canonical_filename_to_info, filenames, can_regenerate
+            )
 
     def get_library_names(self):
         return sorted(
@@ -870,11 +1230,56 @@ class LibspecManager(object):
 
         return error_creating
 
-    def _subprocess_check_output(self, *args, **kwargs):
+    def _get_libdoc_worker_pool(self) -> Optional["LibdocWorkerPool"]:
+        if self._is_copy:
+            return None
+
+        pool = self._libdoc_worker_pool
+        if pool is None:
+            from robotframework_ls.impl.libdoc_worker_pool import (
+                LibdocWorkerPool,
+                get_libdoc_workers_from_env,
+                get_libdoc_worker_max_jobs_from_env,
+            )
+
+            with self._libdoc_worker_pool_lock:
+                if self._disposed:
+                    return None
+
+                pool = self._libdoc_worker_pool
+                if pool is None:
+                    max_workers = get_libdoc_workers_from_env()
+                    if max_workers <= 0:
+                        return None
+
+                    pool = self._libdoc_worker_pool = LibdocWorkerPool(
+                        max_workers, get_libdoc_worker_max_jobs_from_env()
+                    )
+        return pool
+
+    def _subprocess_check_output(self, call, *args, **kwargs):
         # Only done for mocking.
         from robocorp_ls_core.subprocess_wrapper import subprocess
 
-        return subprocess.check_output(*args, **kwargs)
+        if call[1:3] == ["-m", "robot.libdoc"]:
+            pool = self._get_libdoc_worker_pool()
+            if pool is not None:
+                from robotframework_ls.impl.libdoc_worker_pool import (
+                    LibdocWorkerError,
+                )
+
+                try:
+                    returncode, output = pool.run_libdoc(call[3:], kwargs.get("cwd"))
+                except LibdocWorkerError as e:
+                    # i.e.: the library may have crashed the worker.
+                    raise subprocess.CalledProcessError(1, call, str(e).encode("utf-8"))
+
+                bytes_output = output.encode("utf-8", "replace")
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, call, bytes_output)
+                return bytes_output
+
+        return subprocess.check_output(call, *args, **kwargs)
 
     def _cached_create_libspec(
         self,
@@ -1010,6 +1415,7 @@ class LibspecManager(object):
                                         is_builtin=is_builtin,
                                         obtain_mutex=False,
                                     )
+                                    self._libspec_generation += 1
                                     return None
                             except:
                                 pass
@@ -1056,6 +1462,7 @@ class LibspecManager(object):
                         is_builtin=is_builtin,
                         obtain_mutex=False,
                     )
+                    self._libspec_generation += 1
                     return None
             except Exception as e:
                 log_exception("Error creating libspec: %s", libname)
@@ -1066,10 +1473,16 @@ class LibspecManager(object):
                 log.debug("Took: %.2fs to generate info for: %s" % (delta, libname))
 
     def dispose(self):
-        self._file_changes_notifier.dispose()
         if self.libspec_markdown_conversion is not None:
             self.libspec_markdown_conversion.dispose()
 
+        with self._libdoc_worker_pool_lock:
+            self._disposed = True
+            pool = self._libdoc_worker_pool
+            self._libdoc_worker_pool = None
+        if pool is not None:
+            pool.dispose()
+
     def _compute_libspec_filename(
         self,
         libname: str,
@@ -1238,7 +1651,14 @@ class LibspecManager(object):
             libname_lower = os.path.basename(libname_lower)
 
         lib_info: _LibInfo
-        for lib_info in self.iter_lib_info(builtin=builtin):
+        for lib_info in self._iter_lib_info_candidates(
+            builtin,
+            libname,
+            libname_lower,
+            target_file,
+            normalized_target_file,
+            args,
+        ):
             library_doc = lib_info.library_doc
 
             # If it maps to a file in the filesystem, that's what we need to match,
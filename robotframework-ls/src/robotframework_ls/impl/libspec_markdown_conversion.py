@@ -1,6 +1,20 @@
+"""
+Converts the docs of .libspec files to markdown (saving a .json version of
+the library with the converted docs).
+
+The conversion is done in a pool of long-lived python processes (so that
+multiple libraries may be converted in parallel without blocking the
+language server).
+
+Environment variables which can be used to customize it:
+
+- `ROBOTFRAMEWORK_LS_MARKDOWN_CONVERSION_WORKERS`: the max number of worker
+  processes.
+"""
 from robotframework_ls.impl.text_utilities import get_digest_from_string
 import os
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Dict, List, Set, Tuple, Callable
 from robotframework_ls.impl.protocols import ILibraryDoc
 from robocorp_ls_core.robotframework_log import get_logger
 import threading
@@ -13,15 +27,15 @@ import sys
 
 log = get_logger(__name__)
 
+ENV_MARKDOWN_CONVERSION_WORKERS = "ROBOTFRAMEWORK_LS_MARKDOWN_CONVERSION_WORKERS"
+
+# Should be raised whenever the format of the markdown docs cache changes.
+_MARKDOWN_DOCS_CACHE_VERSION = 1
+
 
 def _get_mtime_from_stream(stream) -> Optional[float]:
-    lst = []
-    while True:
-        c = stream.read(1)
-        if c == "\n":
-            break
-        lst.append(c)
-    line = "".join(lst).strip()
+    line = stream.readline().strip()
+    target_json = getattr(stream, "name", stream)
 
     if not line.startswith("mtime:"):
         log.info(
@@ -42,6 +56,23 @@ def _get_mtime_from_stream(stream) -> Optional[float]:
         return None
 
 
+def is_markdown_json_version_up_to_date(libspec_manager, spec_filename) -> bool:
+    """
+    :return:
+        True if the json version of the given libspec exists and matches its
+        current mtime (regardless of whether its docs could be converted to
+        markdown).
+    """
+    target_json = _get_markdown_json_version_filename(libspec_manager, spec_filename)
+    try:
+        mtime = os.path.getmtime(spec_filename)
+        with open(target_json, "r", encoding="utf-8") as stream:
+            saved_mtime = _get_mtime_from_stream(stream)
+    except Exception:
+        return False
+    return str(saved_mtime) == str(mtime)
+
+
 def load_markdown_json_version(
     libspec_manager, spec_filename, mtime: float
 ) -> Optional[ILibraryDoc]:
@@ -81,9 +112,94 @@ def load_markdown_json_version(
     return None
 
 
+def get_markdown_conversion_workers_from_env() -> int:
+    from robotframework_ls.impl.libdoc_worker_pool import _get_int_from_env
+
+    return _get_int_from_env(
+        ENV_MARKDOWN_CONVERSION_WORKERS, min(2, os.cpu_count() or 1)
+    )
+
+
+def _get_markdown_docs_cache_filename(target_json: str) -> str:
+    return target_json + ".docs_cache"
+
+
+class _MarkdownDocsCache(object):
+    """
+    Keeps the docs already converted to markdown (so that when a library
+    changes only the docs which actually changed need to be converted again).
+
+    Note: when saved only the docs used in the last conversion are kept.
+    """
+
+    __slots__ = ["_old_docs", "_new_docs", "hits"]
+
+    def __init__(self, old_docs: Dict[str, str]):
+        self._old_docs = old_docs
+        self._new_docs: Dict[str, str] = {}
+        self.hits = 0
+
+    @classmethod
+    def load(cls, filename: str) -> "_MarkdownDocsCache":
+        import json
+
+        old_docs: Dict[str, str] = {}
+        try:
+            with open(filename, "r", encoding="utf-8") as stream:
+                contents = json.load(stream)
+            if contents.get("version") == _MARKDOWN_DOCS_CACHE_VERSION:
+                docs = contents.get("docs")
+                if isinstance(docs, dict):
+                    old_docs = docs
+        except FileNotFoundError:
+            pass
+        except Exception:
+            log.exception("Error loading markdown docs cache: %s", filename)
+        return cls(old_docs)
+
+    def save(self, filename: str) -> None:
+        import json
+
+        if self._new_docs == self._old_docs:
+            return
+
+        try:
+            tmp_filename = "%s.%s.tmp" % (filename, os.getpid())
+            with open(tmp_filename, "w", encoding="utf-8") as stream:
+                json.dump(
+                    {"version": _MARKDOWN_DOCS_CACHE_VERSION, "docs": self._new_docs},
+                    stream,
+                )
+            os.replace(tmp_filename, filename)
+        except Exception:
+            log.exception("Error saving markdown docs cache: %s", filename)
+
+    def wrap_formatter(
+        self, doc_format: str, formatter: Callable[[str], Optional[str]]
+    ) -> Callable[[str], Optional[str]]:
+        import hashlib
+
+        def cached_formatter(doc: str) -> Optional[str]:
+            key = hashlib.sha256(
+                f"{doc_format}:{doc}".encode("utf-8", "replace")
+            ).hexdigest()
+            converted = self._new_docs.get(key)
+            if converted is None:
+                converted = self._old_docs.get(key)
+                if converted is not None:
+                    self.hits += 1
+                else:
+                    converted = formatter(doc)
+                    if converted is None:
+                        return None
+                self._new_docs[key] = converted
+            return converted
+
+        return cached_formatter
+
+
 def _convert_to_markdown_if_needed(spec_filename, target_json) -> None:
     import tempfile
-    import shutil
 
     try:
         with open(target_json, "r", encoding="utf-8") as existing_stream:
@@ -106,13 +222,15 @@ def _convert_to_markdown_if_needed(spec_filename, target_json) -> None:
         # i.e.: it's already in markdown.
         return
 
-    libdoc.convert_docs_to_markdown()
-
     try:
         os.makedirs(os.path.dirname(target_json), exist_ok=True)
     except:
         pass
 
+    docs_cache_filename = _get_markdown_docs_cache_filename(target_json)
+    docs_cache = _MarkdownDocsCache.load(docs_cache_filename)
+    libdoc.convert_docs_to_markdown(wrap_formatter=docs_cache.wrap_formatter)
+
     with tempfile.NamedTemporaryFile(
         mode="w+", dir=os.path.dirname(target_json), delete=False, encoding="utf-8"
     ) as tempf:
@@ -122,54 +240,262 @@ def _convert_to_markdown_if_needed(spec_filename, target_json) -> None:
 
         json.dump(libdoc.to_dictionary(), tempf)
 
-    shutil.copy(tempf.name, target_json)
-    os.remove(tempf.name)
+    os.replace(tempf.name, target_json)
+    docs_cache.save(docs_cache_filename)
 
 
-class _ConversionThread(threading.Thread):
+class _ConversionWorkerError(Exception):
+    pass
+
 
-    DISPOSE = "DISPOSE"
+class _ConversionWorker(object):
+    """
+    A python process which converts libspecs to markdown on demand (see:
+    `_worker_main` for the protocol used).
+    """
 
     def __init__(self):
-        import queue
+        from robocorp_ls_core.subprocess_wrapper import subprocess
 
-        threading.Thread.__init__(self)
-        self.daemon = True
-        self.queue = queue.Queue()
+        env = os.environ.copy()
 
-    def run(self):
-        from robocorp_ls_core.subprocess_wrapper import subprocess
+        # Make sure we're in the pythonpath.
+        env["PYTHONPATH"] = os.pathsep.join(
+            [
+                os.path.dirname(os.path.dirname(robotframework_ls.__file__)),
+                os.path.dirname(os.path.dirname(robocorp_ls_core.__file__)),
+            ]
+        )
+
+        worker_file = __file__
+        if worker_file.endswith((".pyc", ".pyo")):
+            worker_file = worker_file[:-1]
+
+        self._process = subprocess.Popen(
+            [sys.executable, "-u", worker_file, "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
 
-        while True:
-            entry = self.queue.get()
-            if entry == self.DISPOSE:
-                return
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
 
-            spec_filename, target_json = entry
-            env = os.environ.copy()
+    def convert(self, batch: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        :param batch:
+            A list of tuple(spec_filename, target_json).
 
-            # Make sure we're in the pythonpath.
-            env["PYTHONPATH"] = os.pathsep.join(
-                [
-                    os.path.dirname(os.path.dirname(robotframework_ls.__file__)),
-                    os.path.dirname(os.path.dirname(robocorp_ls_core.__file__)),
-                ]
+        :return:
+            The error converting each entry (or None if it was converted).
+        """
+        import json
+
+        process = self._process
+        request = json.dumps({"specs": batch}) + "\n"
+        try:
+            assert process.stdin is not None
+            assert process.stdout is not None
+            process.stdin.write(request.encode("utf-8"))
+            process.stdin.flush()
+            line = process.stdout.readline()
+        except (OSError, ValueError) as e:
+            raise _ConversionWorkerError(
+                f"Error communicating with markdown conversion worker: {e}"
             )
 
-            try:
-                subprocess.check_output(
-                    [sys.executable, __file__, spec_filename, target_json],
-                    stderr=subprocess.STDOUT,
-                    stdin=subprocess.PIPE,
-                    env=env,
-                )
-            except subprocess.CalledProcessError as e:
-                log.exception(
-                    "Error converting libspec to markdown: %s.\nReturn code: %s\nOutput:\n%s",
-                    spec_filename,
-                    e.returncode,
-                    e.output,
-                )
+        if not line:
+            raise _ConversionWorkerError(
+                f"Markdown conversion worker exited (exit code: {process.poll()})."
+            )
+
+        return json.loads(line.decode("utf-8"))["errors"]
+
+    def dispose(self) -> None:
+        process = self._process
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+        except Exception:
+            pass
+        try:
+            process.kill()
+            process.wait(timeout=5)
+        except Exception:
+            log.debug("Error killing markdown conversion worker.")
+
+
+class _ConversionQueue(object):
+    """
+    The libspecs pending conversion (a libspec requested multiple times is
+    only converted once and the prioritized ones are converted first).
+
+    A libspec which is being converted (in flight) isn't given to another
+    thread until its conversion is finished (`mark_done` or `retry`).
+    """
+
+    # The number of times a libspec is put back in the queue when its
+    # conversion couldn't be finished (i.e.: the worker crashed).
+    MAX_RETRIES = 2
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        # spec_filename -> target_json
+        self._pending: "OrderedDict[str, str]" = OrderedDict()
+        # The prioritized spec filenames (the last one is the most important).
+        self._prioritized: "OrderedDict[str, None]" = OrderedDict()
+        # spec_filename -> number of retries
+        self._retries: Dict[str, int] = {}
+        # The spec filenames currently being converted.
+        self._in_flight: Set[str] = set()
+        self._disposed = False
+
+    def put(self, spec_filename: str, target_json: str, prioritize=False) -> None:
+        with self._condition:
+            self._pending[spec_filename] = target_json
+            if prioritize:
+                self._prioritized[spec_filename] = None
+                self._prioritized.move_to_end(spec_filename)
+            self._condition.notify()
+
+    def get_batch(self, max_size: int) -> Optional[List[Tuple[str, str]]]:
+        """
+        Blocks until some entry is available.
+
+        :return:
+            A list of tuple(spec_filename, target_json) or None if disposed.
+        """
+        with self._condition:
+            while True:
+                if self._disposed:
+                    return None
+                available = self._get_available()
+                if available:
+                    break
+                self._condition.wait()
+
+            batch: List[Tuple[str, str]] = []
+            for spec_filename in available:
+                if len(batch) >= max_size:
+                    break
+
+                is_retry = spec_filename in self._retries
+                if is_retry and batch:
+                    break
+
+                self._prioritized.pop(spec_filename, None)
+                batch.append((spec_filename, self._pending.pop(spec_filename)))
+                self._in_flight.add(spec_filename)
+                if is_retry:
+                    # Retried entries are converted alone (so that a libspec
+                    # which crashes the worker doesn't make others fail too).
+                    break
+            return batch
+
+    def _get_available(self) -> List[str]:
+        # The prioritized ones (most recent first) or the pending ones (in
+        # the order requested), skipping the ones in flight.
+        in_flight = self._in_flight
+        available = [s for s in reversed(self._prioritized) if s not in in_flight]
+        if not available:
+            available = [s for s in self._pending if s not in in_flight]
+        return available
+
+    def retry(self, batch: List[Tuple[str, str]]) -> List[str]:
+        """
+        Puts back the entries of a batch whose conversion couldn't be finished.
+
+        :return:
+            The spec filenames which won't be retried anymore (as those
+            already failed `MAX_RETRIES` times).
+        """
+        dropped = []
+        with self._condition:
+            for spec_filename, target_json in batch:
+                self._in_flight.discard(spec_filename)
+                retries = self._retries.get(spec_filename, 0) + 1
+                if retries > self.MAX_RETRIES:
+                    self._retries.pop(spec_filename, None)
+                    dropped.append(spec_filename)
+                    continue
+                self._retries[spec_filename] = retries
+                self._pending.setdefault(spec_filename, target_json)
+            self._condition.notify_all()
+        return dropped
+
+    def mark_done(self, batch: List[Tuple[str, str]]) -> None:
+        with self._condition:
+            for spec_filename, _target_json in batch:
+                self._retries.pop(spec_filename, None)
+                self._in_flight.discard(spec_filename)
+            # The ones requested again while in flight may now be converted.
+            self._condition.notify_all()
+
+    def dispose(self) -> None:
+        with self._condition:
+            self._disposed = True
+            self._condition.notify_all()
+
+
+class _ConversionThread(threading.Thread):
+    """
+    Sends the batches from the queue to its worker process (the process is
+    kept alive and is only recreated if it crashes).
+    """
+
+    BATCH_SIZE = 10
+
+    def __init__(self, conversion_queue: _ConversionQueue):
+        threading.Thread.__init__(self)
+        self.name = "Libspec markdown conversion"
+        self.daemon = True
+        self._conversion_queue = conversion_queue
+
+    def run(self):
+        worker: Optional[_ConversionWorker] = None
+        try:
+            while True:
+                batch = self._conversion_queue.get_batch(self.BATCH_SIZE)
+                if batch is None:
+                    return
+
+                if worker is None or not worker.is_alive():
+                    if worker is not None:
+                        worker.dispose()
+                    worker = _ConversionWorker()
+
+                try:
+                    errors = worker.convert(batch)
+                except _ConversionWorkerError:
+                    log.exception(
+                        "Error converting libspecs to markdown: %s",
+                        [spec_filename for spec_filename, _ in batch],
+                    )
+                    worker.dispose()
+                    worker = None
+
+                    # Note: the ones already converted are skipped in the retry
+                    # (as the converted version is up to date).
+                    dropped = self._conversion_queue.retry(batch)
+                    if dropped:
+                        log.info(
+                            "Giving up converting libspecs to markdown: %s", dropped
+                        )
+                    continue
+
+                self._conversion_queue.mark_done(batch)
+
+                for (spec_filename, _target_json), error in zip(batch, errors):
+                    if error:
+                        log.info(
+                            "Error converting libspec to markdown: %s.\n%s",
+                            spec_filename,
+                            error,
+                        )
+        finally:
+            if worker is not None:
+                worker.dispose()
 
 
 def _get_markdown_json_version_filename(libspec_manager, spec_filename: str) -> str:
@@ -184,9 +510,13 @@ def _get_markdown_json_version_filename(libspec_manager, spec_filename: str) ->
 
 
 class LibspecMarkdownConversion:
-    def __init__(self, libspec_manager):
-        self._conversion_thread = _ConversionThread()
-        self._started = False
+    def __init__(self, libspec_manager, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = get_markdown_conversion_workers_from_env()
+        self._max_workers = max(1, max_workers)
+        self._conversion_queue = _ConversionQueue()
+        self._conversion_threads: List[_ConversionThread] = []
+        self._lock = threading.Lock()
         self._weak_libspec_manager = weakref.ref(libspec_manager)
 
     def get_markdown_json_version_filename(self, spec_filename: str) -> str:
@@ -194,10 +524,21 @@ class LibspecMarkdownConversion:
         assert libspec_manager is not None
         return _get_markdown_json_version_filename(libspec_manager, spec_filename)
 
-    def schedule_conversion_to_markdown(self, spec_filename: str) -> Optional[str]:
-        if not self._started:
-            self._conversion_thread.start()
-            self._started = True
+    def schedule_conversion_to_markdown(
+        self, spec_filename: str, prioritize: bool = False
+    ) -> Optional[str]:
+        """
+        :param prioritize:
+            If True the conversion should be done before the other pending
+            conversions (i.e.: the docs are being shown to the user).
+        """
+        if not self._conversion_threads:
+            with self._lock:
+                if not self._conversion_threads:
+                    for _i in range(self._max_workers):
+                        t = _ConversionThread(self._conversion_queue)
+                        t.start()
+                        self._conversion_threads.append(t)
 
         libspec_manager = self._weak_libspec_manager()
         if libspec_manager is None:
@@ -206,16 +547,55 @@ class LibspecMarkdownConversion:
 
         target_json = self.get_markdown_json_version_filename(spec_filename)
 
-        self._conversion_thread.queue.put((spec_filename, target_json))
+        self._conversion_queue.put(spec_filename, target_json, prioritize)
         return target_json
 
     def dispose(self):
-        self._conversion_thread.queue.put(_ConversionThread.DISPOSE)
+        self._conversion_queue.dispose()
+
+
+def _worker_main():
+    """
+    The protocol is based on json messages (one per line):
+
+    - Request (in stdin): {"specs": [[spec_filename, target_json], ...]}
+    - Response (in stdout): {"errors": [null or "error message", ...]}
+    """
+    import io
+    import json
+    import traceback
+
+    # The original stdout is used only to communicate with the parent and
+    # anything else written to it is redirected to stderr.
+    protocol_out = io.open(os.dup(1), "w", encoding="utf-8", newline="\n")
+    os.dup2(2, 1)
+
+    stdin = io.open(sys.stdin.fileno(), "r", encoding="utf-8", newline="\n")
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request = json.loads(line)
+        errors: List[Optional[str]] = []
+        for spec_filename, target_json in request["specs"]:
+            try:
+                _convert_to_markdown_if_needed(spec_filename, target_json)
+            except Exception:
+                errors.append(traceback.format_exc())
+            else:
+                errors.append(None)
+
+        protocol_out.write(json.dumps({"errors": errors}) + "\n")
+        protocol_out.flush()
 
 
 if __name__ == "__main__":
     args = sys.argv[1:]
 
+    if args == ["--worker"]:
+        _worker_main()
+        sys.exit(0)
+
     try:
         spec_filename = args[0]
         target_json = args[1]
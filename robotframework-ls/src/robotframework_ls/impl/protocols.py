@@ -13,6 +13,7 @@ from typing import (
     Hashable,
     Dict,
     Set,
+    FrozenSet,
     Union,
 )
 from robocorp_ls_core.protocols import (
@@ -36,6 +37,7 @@ from robocorp_ls_core.lsp import (
 )
 import typing
 from robocorp_ls_core.ordered_set import OrderedSet
+from robocorp_ls_core.watchdog_wrapper import ChangesBatch
 from contextlib import contextmanager
 
 if sys.version_info[:2] < (3, 8):
@@ -311,6 +313,25 @@ class KeywordUsageInfo:
     __str__ = __repr__
 
 
+class KeywordUsageLocation(typing.NamedTuple):
+    """
+    The location of a keyword usage in a document (kept in the symbols cache
+    so that references can be found without traversing the AST).
+
+    Note: lines and columns are 0-based.
+    """
+
+    line: int
+    # The start of the keyword usage token.
+    token_col_offset: int
+    # The start of the keyword name (without the library/resource prefix
+    # for dotted usages).
+    name_col_offset: int
+    end_col_offset: int
+    # The keyword name as used (may be dotted).
+    name: str
+
+
 class IKeywordArg(Protocol):
     @property
     def original_arg(self) -> str:
@@ -402,6 +423,31 @@ class ILibraryDocOrError(Protocol):
     error: Optional[str]
 
 
+class IKeywordNameIndex(Protocol):
+    """
+    Index for the keyword names of a library/resource (the items are the
+    objects which were indexed, such as keyword docs or keyword node infos).
+    """
+
+    def __len__(self) -> int:
+        pass
+
+    def get_item(self, i: int) -> Any:
+        pass
+
+    def iter_containing(self, normalized_text: str) -> Iterator[int]:
+        """
+        Provides the indexes (in ascending order) of the items whose
+        normalized keyword name contains the given (normalized) text.
+        """
+
+    def iter_same_name(self, normalized_name: str) -> Iterator[int]:
+        """
+        Provides the indexes (in ascending order) of the items whose
+        normalized keyword name is the same as the given (normalized) name.
+        """
+
+
 class IRobotDocument(IDocument, Protocol):
     def get_type(self) -> str:
         pass
@@ -444,6 +490,14 @@ class ISymbolsCache(Protocol):
     def has_keyword_usage(self, normalized_keyword_name: str) -> bool:
         pass
 
+    def iter_keyword_usage_locations(
+        self,
+    ) -> Iterator[Tuple[str, Sequence[KeywordUsageLocation]]]:
+        """
+        Provides the normalized keyword name (without the library/resource
+        prefix for dotted usages) and the locations where it's used.
+        """
+
     def has_global_variable_definition(self, normalized_variable_name: str) -> bool:
         pass
 
@@ -465,6 +519,20 @@ class ISymbolsCache(Protocol):
     def iter_keyword_info(self) -> Iterator[ISymbolKeywordInfo]:
         pass
 
+    def get_keyword_name_index(self) -> IKeywordNameIndex:
+        """
+        Provides an index where the items are the ISymbolKeywordInfo.
+        """
+
+
+class IKeywordsTable(Protocol):
+    """
+    The keywords defined in a robot document (immutable: when the document
+    changes a new table is created).
+    """
+
+    ast: Any
+
 
 class ICompletionContextWorkspaceCaches(Protocol):
     cache_hits: int
@@ -472,6 +540,9 @@ class ICompletionContextWorkspaceCaches(Protocol):
     def on_file_changed(self, filename: str):
         pass
 
+    def on_files_changed(self, changes: ChangesBatch):
+        pass
+
     def on_updated_document(self, uri: str, document: Optional[IRobotDocument]):
         pass
 
@@ -507,6 +578,77 @@ class ICompletionContextWorkspaceCaches(Protocol):
     ) -> None:
         pass
 
+    def get_cached_keywords_table(self, uri: str, ast) -> Optional[IKeywordsTable]:
+        """
+        :return:
+            The keywords table cached for the given uri or None if there's no
+            table cached or if it was created for a different ast.
+        """
+
+    def cache_keywords_table(
+        self, uri: str, keywords_table: IKeywordsTable, invalidation_tracker
+    ) -> None:
+        """
+        Caches the keywords table for the given uri (unless the uri was
+        invalidated while it was being computed).
+        """
+
+    def get_cached_diagnostics(self, uri: str, fingerprint: Hashable) -> Optional[list]:
+        """
+        :return:
+            The diagnostics cached for the given uri or None if there are no
+            diagnostics cached or if those were computed for a different
+            fingerprint.
+        """
+
+    def cache_diagnostics(
+        self,
+        uri: str,
+        fingerprint: Optional[Hashable],
+        diagnostics: list,
+        dependency_graph: "ICompletionContextDependencyGraph",
+        invalidation_tracker,
+    ) -> None:
+        """
+        Caches the diagnostics for the given uri (unless the uri or one of its
+        dependencies was invalidated while those were being computed).
+
+        When one of the dependencies of the uri changes afterwards, the entry
+        is removed and `on_dependency_changed(uri)` is called.
+
+        :param fingerprint:
+            If None the diagnostics are never reused (only the dependencies are
+            tracked to notify when one of those changes).
+        """
+
+    def get_cached_blocks_analysis(
+        self, uri: str, fingerprint: Hashable
+    ) -> Optional[Dict[Hashable, Any]]:
+        """
+        :return:
+            The code analysis results for each block of the given uri (as
+            cached in the last analysis) or None if there's nothing cached or if
+            those were computed for a different fingerprint.
+
+        Note: unlike the diagnostics, these are kept when the document itself
+        changes (the caller must only reuse the results for blocks whose
+        contents didn't change).
+        """
+
+    def cache_blocks_analysis(
+        self,
+        uri: str,
+        fingerprint: Hashable,
+        blocks_analysis: Dict[Hashable, Any],
+        dependency_graph: "ICompletionContextDependencyGraph",
+        invalidation_tracker,
+    ) -> None:
+        """
+        Caches the code analysis results for each block of the given uri
+        (unless one of its dependencies was invalidated while those were being
+        computed).
+        """
+
 
 class IRobotWorkspace(IWorkspace, Protocol):
     completion_context_workspace_caches: ICompletionContextWorkspaceCaches
@@ -625,6 +767,18 @@ class IKeywordCollector(Protocol):
             called).
         """
 
+    def iter_accepted_in_index(
+        self, index: IKeywordNameIndex
+    ) -> Optional[Iterator[int]]:
+        """
+        Used instead of calling `accepts` for each keyword when the keywords
+        are indexed.
+
+        :return:
+            The indexes (in ascending order) of the keywords which would be
+            accepted or None if `accepts` should be called for each keyword.
+        """
+
     def on_keyword(self, keyword_found: IKeywordFound):
         """
         :param IKeywordFound keyword_found:
@@ -666,6 +820,11 @@ class IKeywordCollector(Protocol):
 
 
 class AbstractKeywordCollector:
+    def iter_accepted_in_index(
+        self, index: IKeywordNameIndex
+    ) -> Optional[Iterator[int]]:
+        return None
+
     def on_resolved_library(
         self,
         completion_context: "ICompletionContext",
@@ -819,6 +978,25 @@ class ISymbolsCacheReverseIndex(Protocol):
     def has_global_variable(self, normalized_var_name: str) -> bool:
         pass
 
+    def get_keyword_usages(
+        self, normalized_keyword_name: str
+    ) -> Dict[str, Sequence[KeywordUsageLocation]]:
+        """
+        :param normalized_keyword_name:
+            The normalized keyword name (without the library/resource prefix).
+
+        :return:
+            A dict with the uris where the keyword is used mapping to the
+            locations of the usages.
+        """
+
+    def get_variable_reference_uris(self, normalized_var_name: str) -> Set[str]:
+        """
+        :return:
+            The uris with references to the given variable (or where it's
+            defined as a global variable).
+        """
+
 
 class ICompletionContextDependencyGraph(Protocol):
     def add_library_infos(
@@ -883,6 +1061,22 @@ class ICompletionContextDependencyGraph(Protocol):
     def do_invalidate_on_uri_change(self, uri: str) -> bool:
         pass
 
+    def get_invalidation_info(self) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """
+        :return:
+            A tuple with the normalized uris and the basenames (lower-case and
+            without extension) which invalidate this dependency graph when
+            changed (changes in the root document aren't included).
+        """
+
+    def get_dependencies_fingerprint(self) -> tuple:
+        """
+        :return:
+            A hashable fingerprint of the inputs of this dependency graph (the
+            libraries imported and the contents of the resource/variable
+            documents resolved), to be used as a part of cache keys.
+        """
+
 
 class IVariablesFromArgumentsFileLoader(Protocol):
     def get_variables(self) -> Tuple["IVariableFound", ...]:
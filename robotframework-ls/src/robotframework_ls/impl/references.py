@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Iterator, Tuple
+from typing import List, Optional, Dict, Iterator, Tuple, Sequence, Iterable
 
 from robocorp_ls_core.lsp import LocationTypedDict, RangeTypedDict, PositionTypedDict
 from robocorp_ls_core.robotframework_log import get_logger
@@ -14,6 +14,7 @@ from robotframework_ls.impl.protocols import (
     VarTokenInfo,
     VariableKind,
     KeywordUsageInfo,
+    KeywordUsageLocation,
 )
 import typing
 from robocorp_ls_core.protocols import check_implements
@@ -261,6 +262,53 @@ def iter_keyword_references_in_doc(
         }
 
 
+def iter_keyword_references_from_locations(
+    completion_context: ICompletionContext,
+    doc: IRobotDocument,
+    locations: Sequence[KeywordUsageLocation],
+    keyword_found: IKeywordFound,
+) -> Iterator[RangeTypedDict]:
+    """
+    Provides the same results as `iter_keyword_references_in_doc` but based
+    on the locations previously indexed (so, the document AST doesn't need to
+    be traversed to find the usages).
+    """
+    from robotframework_ls.impl.find_definition import find_definition
+
+    # Dict with the name used (possibly dotted) -> whether it maps to the
+    # keyword found.
+    found_in_this_doc: Dict[str, bool] = {}
+
+    for location in locations:
+        completion_context.check_cancelled()
+        found_once_in_this_doc = found_in_this_doc.get(location.name)
+        if found_once_in_this_doc is None:
+            # Verify if it's actually the same one (not one defined in
+            # a different place with the same name).
+            new_ctx = completion_context.create_copy_doc_line_col(
+                doc, location.line, location.token_col_offset
+            )
+            for definition in find_definition(new_ctx):
+                if matches_source(definition.source, keyword_found.source):
+                    found_once_in_this_doc = True
+                    break
+            else:
+                found_once_in_this_doc = False
+            found_in_this_doc[location.name] = found_once_in_this_doc
+
+        if found_once_in_this_doc:
+            yield {
+                "start": {
+                    "line": location.line,
+                    "character": location.name_col_offset,
+                },
+                "end": {
+                    "line": location.line,
+                    "character": location.end_col_offset,
+                },
+            }
+
+
 def collect_variable_references(
     completion_context: ICompletionContext, var_token_info: VarTokenInfo
 ):
@@ -483,6 +531,43 @@ def _references_for_variable_found(
 
     normalized_variable_name = normalize_robot_name(variable_found.variable_name)
 
+    symbols_cache_reverse_index = (
+        initial_completion_context.obtain_symbols_cache_reverse_index()
+    )
+    if symbols_cache_reverse_index is not None:
+        # Fast path: use the index to know which documents may have references
+        # (the document must still be analyzed to get the proper scopes).
+        if (
+            is_local_variable
+            and named_argument_var_references_computer.check_keyword_usage_normalized_name
+        ):
+            candidate_uris: Iterable[
+                str
+            ] = symbols_cache_reverse_index.get_keyword_usages(
+                named_argument_var_references_computer.check_keyword_usage_normalized_name
+            ).keys()
+        else:
+            candidate_uris = symbols_cache_reverse_index.get_variable_reference_uris(
+                normalized_variable_name
+            )
+
+        for candidate_uri in sorted(candidate_uris):
+            initial_completion_context.check_cancelled()
+            if initial_completion_context.doc.uri == candidate_uri:
+                continue  # Skip (already analyzed).
+
+            candidate_doc = _get_document(initial_completion_context, candidate_uri)
+            if candidate_doc is None:
+                continue
+
+            _add_variable_references_from_doc(
+                initial_completion_context.create_copy(candidate_doc),
+                variable_found,
+                named_argument_var_references_computer,
+                ret,
+            )
+        return ret.lst
+
     for symbols_cache in iter_symbols_caches(
         None,
         initial_completion_context,
@@ -530,24 +615,50 @@ def _references_for_variable_found(
         if initial_completion_context.doc.uri == doc.uri:
             continue  # Skip (already analyzed).
 
-        new_completion_context = initial_completion_context.create_copy(doc)
-        if not is_local_variable:
-            # Collect references to global variables as well as named arguments.
-            for ref_range in iter_variable_references_in_doc(
-                new_completion_context,
-                variable_found,
-                named_argument_var_references_computer,
-            ):
-                ret.append({"uri": doc.uri, "range": ref_range})
-        else:
-            # We still need to collect references to named arguments.
-            named_argument_var_references_computer.add_references_to_named_keyword_arguments_from_doc(
-                new_completion_context, ret
-            )
+        _add_variable_references_from_doc(
+            initial_completion_context.create_copy(doc),
+            variable_found,
+            named_argument_var_references_computer,
+            ret,
+        )
 
     return ret.lst
 
 
+def _get_document(
+    completion_context: ICompletionContext, uri: str
+) -> Optional[IRobotDocument]:
+    doc = typing.cast(
+        Optional[IRobotDocument],
+        completion_context.workspace.get_document(doc_uri=uri, accept_from_file=True),
+    )
+    if doc is None:
+        log.debug("Unable to load document for getting references with uri: %s", uri)
+    return doc
+
+
+def _add_variable_references_from_doc(
+    completion_context: ICompletionContext,
+    variable_found: IVariableFound,
+    named_argument_var_references_computer: _NamedArgumentVarReferencesComputer,
+    ret: _PreventDuplicatesInList,
+) -> None:
+    doc = completion_context.doc
+    if not variable_found.is_local_variable:
+        # Collect references to global variables as well as named arguments.
+        for ref_range in iter_variable_references_in_doc(
+            completion_context,
+            variable_found,
+            named_argument_var_references_computer,
+        ):
+            ret.append({"uri": doc.uri, "range": ref_range})
+    else:
+        # We still need to collect references to named arguments.
+        named_argument_var_references_computer.add_references_to_named_keyword_arguments_from_doc(
+            completion_context, ret
+        )
+
+
 def references_for_keyword_found(
     completion_context: ICompletionContext,
     keyword_found: IKeywordFound,
@@ -578,6 +689,29 @@ def references_for_keyword_found(
             }
         )
 
+    symbols_cache_reverse_index = (
+        completion_context.obtain_symbols_cache_reverse_index()
+    )
+    if symbols_cache_reverse_index is not None:
+        # Fast path: the index has the locations of the usages (so, only the
+        # candidate definitions must be verified).
+        for usage_uri, locations in symbols_cache_reverse_index.get_keyword_usages(
+            normalized_name
+        ).items():
+            completion_context.check_cancelled()
+            usage_doc = _get_document(completion_context, usage_uri)
+            if usage_doc is None:
+                continue
+
+            for usage_range in iter_keyword_references_from_locations(
+                completion_context.create_copy(usage_doc),
+                usage_doc,
+                locations,
+                keyword_found,
+            ):
+                ret.append({"uri": usage_doc.uri, "range": usage_range})
+        return ret.lst
+
     from robotframework_ls.impl.workspace_symbols import iter_symbols_caches
 
     for symbols_cache in iter_symbols_caches(
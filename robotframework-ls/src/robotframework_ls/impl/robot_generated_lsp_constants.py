@@ -25,6 +25,7 @@ OPTION_ROBOT_LINT_VARIABLES = "robot.lint.variables"
 OPTION_ROBOT_LINT_IGNORE_VARIABLES = "robot.lint.ignoreVariables"
 OPTION_ROBOT_LINT_IGNORE_ENVIRONMENT_VARIABLES = "robot.lint.ignoreEnvironmentVariables"
 OPTION_ROBOT_LINT_UNUSED_KEYWORD = "robot.lint.unusedKeyword"
+OPTION_ROBOT_LINT_WORKSPACE_CONCURRENCY = "robot.lint.workspaceConcurrency"
 OPTION_ROBOT_COMPLETIONS_SECTION_HEADERS_FORM = "robot.completions.section_headers.form"
 OPTION_ROBOT_COMPLETIONS_KEYWORDS_FORMAT = "robot.completions.keywords.format"
 OPTION_ROBOT_COMPLETIONS_KEYWORDS_ARGUMENTS_SEPARATOR = "robot.completions.keywords.argumentsSeparator"
@@ -66,6 +67,7 @@ ALL_ROBOT_OPTIONS = frozenset(
         OPTION_ROBOT_LINT_IGNORE_VARIABLES,
         OPTION_ROBOT_LINT_IGNORE_ENVIRONMENT_VARIABLES,
         OPTION_ROBOT_LINT_UNUSED_KEYWORD,
+        OPTION_ROBOT_LINT_WORKSPACE_CONCURRENCY,
         OPTION_ROBOT_COMPLETIONS_SECTION_HEADERS_FORM,
         OPTION_ROBOT_COMPLETIONS_KEYWORDS_FORMAT,
         OPTION_ROBOT_COMPLETIONS_KEYWORDS_ARGUMENTS_SEPARATOR,
@@ -304,11 +304,27 @@ class LibraryDoc(object):
                 type_doc.doc = formatter.html(type_doc.doc)
         self.doc_format = "HTML"
 
-    def convert_docs_to_markdown(self) -> bool:
+    def convert_docs_to_markdown(
+        self,
+        wrap_formatter: Optional[
+            Callable[
+                [str, Callable[[str], Optional[str]]], Callable[[str], Optional[str]]
+            ]
+        ] = None,
+    ) -> bool:
+        """
+        :param wrap_formatter:
+            If given it's called as `wrap_formatter(doc_format, formatter)` and
+            the returned formatter is used instead (i.e.: to cache the docs
+            which were already converted).
+        """
         old_doc_format = self.doc_format
         formatter = _get_markdown_formatter(old_doc_format)
 
         if formatter is not None:
+            if wrap_formatter is not None:
+                formatter = wrap_formatter(old_doc_format, formatter)
+
             new_doc = formatter(self.doc)
             if new_doc is None:
                 # We can't format it (docutils not installed?)
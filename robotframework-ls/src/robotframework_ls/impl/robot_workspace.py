@@ -1,5 +1,18 @@
+from concurrent.futures import Future
+from functools import partial
+import queue
 import threading
-from typing import Optional, Any, Set, List, Dict, Iterable, Tuple, Iterator
+from typing import (
+    Optional,
+    Any,
+    Set,
+    List,
+    Dict,
+    Iterable,
+    Tuple,
+    Iterator,
+    Callable,
+)
 import typing
 import weakref
 
@@ -22,7 +35,7 @@ from robocorp_ls_core.protocols import (
     IConfig,
 )
 from robocorp_ls_core.robotframework_log import get_logger
-from robocorp_ls_core.watchdog_wrapper import IFSObserver
+from robocorp_ls_core.watchdog_wrapper import IFSObserver, ChangesBatch
 from robocorp_ls_core.workspace import Workspace, Document
 from robotframework_ls.constants import NULL
 from robotframework_ls.impl._symbols_cache import BaseSymbolsCache
@@ -39,9 +52,13 @@ from robotframework_ls.impl.protocols import (
     IOnDependencyChanged,
     AbstractVariablesCollector,
     IVariableFound,
+    KeywordUsageLocation,
 )
 from robotframework_ls.impl.robot_constants import ROBOT_FILE_EXTENSIONS
 
+if typing.TYPE_CHECKING:
+    from robotframework_ls.impl._symbols_cache_store import SymbolsCacheStore
+
 
 log = get_logger(__name__)
 
@@ -144,12 +161,30 @@ def _compute_symbols_from_ast(completion_context: ICompletionContext) -> ISymbol
         )
 
     keywords_used: Set[str] = set()
+    keyword_usage_locations: Dict[str, List[KeywordUsageLocation]] = {}
     for keyword_usage_info in ast_utils.iter_keyword_usage_tokens(
         ast, collect_args_as_keywords=True
     ):
-        normalized = normalize_robot_name(keyword_usage_info.name)
+        keyword_name = keyword_usage_info.name
+        normalized = normalize_robot_name(keyword_name)
         keywords_used.add(normalized)
 
+        token = keyword_usage_info.token
+        name_not_dotted = keyword_name.split(".")[-1]
+        normalized_not_dotted = normalize_robot_name(name_not_dotted)
+        locations = keyword_usage_locations.get(normalized_not_dotted)
+        if locations is None:
+            locations = keyword_usage_locations[normalized_not_dotted] = []
+        locations.append(
+            KeywordUsageLocation(
+                token.lineno - 1,
+                token.col_offset,
+                token.col_offset + len(keyword_name) - len(name_not_dotted),
+                token.end_col_offset,
+                keyword_name,
+            )
+        )
+
         for name, remainder in text_utilities.iter_dotted_names(
             normalize_robot_name(keyword_usage_info.name)
         ):
@@ -181,6 +216,7 @@ def _compute_symbols_from_ast(completion_context: ICompletionContext) -> ISymbol
         keywords=keywords,
         global_variables_defined=global_variables_collector.global_variables_defined,
         variable_references=variable_references,
+        keyword_usage_locations=keyword_usage_locations,
     )
 
 
@@ -218,9 +254,12 @@ class _ReindexManager(object):
         self._reindex_event.set()
 
     def request_uri_collection(self, doc_uri: str) -> _ReindexInfo:
+        return self.request_uris_collection((doc_uri,))
+
+    def request_uris_collection(self, doc_uris: Iterable[str]) -> _ReindexInfo:
         with self._lock:
             if not self._disposed:
-                self._reindex_info.uris_to_iter.add(doc_uri)
+                self._reindex_info.uris_to_iter.update(doc_uris)
 
             self._reindex_event.set()
             return self._reindex_info
@@ -278,17 +317,38 @@ class WorkspaceIndexer(object):
         robot_workspace,
         endpoint: Optional[IEndPoint],
         collect_tests: bool = False,
+        indexing_processes: Optional[int] = None,
     ) -> None:
+        """
+        :param indexing_processes:
+            The number of processes to be used to compute the symbols cache
+            (if not given it's gotten from the
+            `ROBOTFRAMEWORK_LS_INDEXING_PROCESSES` environment variable and
+            0 means that everything is computed in-process).
+        """
         from robotframework_ls.impl._symbols_cache import SymbolsCacheReverseIndex
+        from robotframework_ls.impl._symbols_cache_pool import (
+            get_indexing_processes_from_env,
+            SymbolsCacheProcessPool,
+        )
 
         self._robot_workspace = weakref.ref(robot_workspace)
-        robot_workspace.on_file_changed.register(self._on_file_changed)
+        robot_workspace.on_files_changed.register(self._on_files_changed)
         self._endpoint = endpoint
         self._collect_tests = collect_tests
         self._clear_caches = threading.Event()
         self._reindex_manager = _ReindexManager()
         self._disposed = threading.Event()
         self.symbols_cache_reverse_index = SymbolsCacheReverseIndex()
+        self._symbols_cache_store = self._create_symbols_cache_store(robot_workspace)
+
+        if indexing_processes is None:
+            indexing_processes = get_indexing_processes_from_env()
+        self._symbols_cache_pool: Optional[SymbolsCacheProcessPool] = (
+            SymbolsCacheProcessPool(indexing_processes)
+            if indexing_processes > 0
+            else None
+        )
 
         if collect_tests:
             assert endpoint is not None
@@ -297,14 +357,41 @@ class WorkspaceIndexer(object):
         t.daemon = True
         t.start()
 
-    def _on_file_changed(self, filename: str):
-        # with open("x:/temp/rara.txt", "a+") as stream:
-        #     stream.write("%s\n" % filename)
+    def _create_symbols_cache_store(
+        self, robot_workspace
+    ) -> "Optional[SymbolsCacheStore]":
+        from robotframework_ls.impl._symbols_cache_store import SymbolsCacheStore
+
+        root_path = robot_workspace.root_path
+        if not root_path:
+            return None
+        try:
+            return SymbolsCacheStore.create_for_workspace_root(root_path)
+        except Exception:
+            log.exception("Unable to create symbols cache store for: %s", root_path)
+            return None
 
-        if filename and filename.endswith(ROBOT_FILE_EXTENSIONS):
-            uri = uris.from_fs_path(filename)
-            self._reindex_manager.request_uri_collection(uri)
-            self.symbols_cache_reverse_index.notify_uri_changed(uri)
+    def save_symbols_cache_store(self) -> bool:
+        store = self._symbols_cache_store
+        if store is None:
+            return False
+        return store.save()
+
+    def _on_files_changed(self, changes: ChangesBatch):
+        if changes.subtrees:
+            # Too many changes (i.e.: git checkout): just collect everything.
+            self._reindex_manager.request_full_collection()
+            self.symbols_cache_reverse_index.request_full_reindex()
+            return
+
+        doc_uris = [
+            uris.from_fs_path(filename)
+            for filename in changes.paths
+            if filename.endswith(ROBOT_FILE_EXTENSIONS)
+        ]
+        if doc_uris:
+            self._reindex_manager.request_uris_collection(doc_uris)
+            self.symbols_cache_reverse_index.notify_uris_changed(doc_uris)
 
     def wait_for_full_test_collection(self):
         assert (
@@ -329,6 +416,7 @@ class WorkspaceIndexer(object):
                 # Do a single collection at startup, afterwards only
                 # collect again on demand.
                 pass
+            self.save_symbols_cache_store()
         else:
             endpoint = self._endpoint
             assert endpoint
@@ -410,13 +498,18 @@ class WorkspaceIndexer(object):
                                         "$/testsCollected",
                                         test_info_for_uri,
                                     )
+                    self.save_symbols_cache_store()
                 finally:
                     reindex_info.finished_collection.set()
 
     def dispose(self):
         self._disposed.set()
+        self.save_symbols_cache_store()
         self._reindex_manager.dispose()
         self.symbols_cache_reverse_index.dispose()
+        pool = self._symbols_cache_pool
+        if pool is not None:
+            pool.dispose()
 
     def on_updated_document(self, doc_uri: str):
         self._reindex_manager.request_uri_collection(doc_uri)
@@ -438,6 +531,14 @@ class WorkspaceIndexer(object):
         from typing import cast
         import time
 
+        store = self._symbols_cache_store
+        # Note: if something was already found we can't know whether it's
+        # still in the workspace, so, it's not considered a full iteration.
+        full_workspace_iteration = (
+            uris_to_iter is None and not only_for_open_docs and not found
+        )
+        paths_found: Set[str] = set()
+
         if not found:
             found = set()
 
@@ -478,56 +579,167 @@ class WorkspaceIndexer(object):
                         if uri not in doc_uris:
                             yield uri
 
-        for uri in iter_in():
-            if not uri:
-                continue
+        pool = self._symbols_cache_pool
+        # Contains (uri, doc) for the documents being computed in the pool
+        # after the related future finishes.
+        pool_done_queue: "queue.Queue[Tuple[str, IRobotDocument, Future]]" = (
+            queue.Queue()
+        )
+        pool_futures: Set[Future] = set()
 
-            if context is not None:
-                context.check_cancelled()
+        def on_pool_future_done(uri, doc, future):
+            pool_done_queue.put((uri, doc, future))
 
-            if time.time() - initial_time > timeout:
-                log.info(
-                    "Timed out gathering information from workspace symbols (only partial information was collected). Consider enabling the 'robot.workspaceSymbolsOnlyForOpenDocs' setting."
+        def iter_pool_done(block):
+            while pool_futures:
+                try:
+                    uri, doc, future = pool_done_queue.get(block, 0.1 if block else 0)
+                except queue.Empty:
+                    return
+                pool_futures.discard(future)
+                symbols_cache = self._symbols_cache_from_pool_result(
+                    doc, future, workspace, context
                 )
-                break
+                doc.symbols_cache = symbols_cache
+                yield uri, symbols_cache
 
-            if uri in found:
-                continue
-            found.add(uri)
+        try:
+            for uri in iter_in():
+                if not uri:
+                    continue
 
-            doc = cast(
-                Optional[IRobotDocument],
-                workspace.get_document(uri, accept_from_file=True),
-            )
-            if doc is None:
-                yield uri, None  # i.e.: No longer there...
-                continue
+                if context is not None:
+                    context.check_cancelled()
 
-            # Note that this can be accessed in multiple threads... We let it
-            # compute at the same time but only one will be saved in the end
-            # (which means we'll spend some more cpu cycles but we shouldn't
-            # have any bad behavior due to it).
-            symbols_cache = doc.symbols_cache
-            if symbols_cache is None:
-                from robotframework_ls.impl.completion_context import (
-                    CompletionContext,
+                if time.time() - initial_time > timeout:
+                    log.info(
+                        "Timed out gathering information from workspace symbols (only partial information was collected). Consider enabling the 'robot.workspaceSymbolsOnlyForOpenDocs' setting."
+                    )
+                    full_workspace_iteration = False
+                    break
+
+                if pool_futures:
+                    yield from iter_pool_done(False)
+
+                if uri in found:
+                    continue
+                found.add(uri)
+
+                doc = cast(
+                    Optional[IRobotDocument],
+                    workspace.get_document(uri, accept_from_file=True),
                 )
+                if doc is None:
+                    yield uri, None  # i.e.: No longer there...
+                    continue
+
+                if doc.path:
+                    paths_found.add(doc.path)
+
+                # Note that this can be accessed in multiple threads... We let it
+                # compute at the same time but only one will be saved in the end
+                # (which means we'll spend some more cpu cycles but we shouldn't
+                # have any bad behavior due to it).
+                symbols_cache = doc.symbols_cache
+                if symbols_cache is None:
+                    # Only documents loaded from the filesystem are persisted
+                    # (open documents are constantly changing).
+                    doc_store = store if doc.immutable else None
+                    if doc_store is not None:
+                        symbols_cache = doc_store.get_symbols_cache(doc)
+
+                    if symbols_cache is None:
+                        if pool is not None and doc.immutable and doc.path:
+                            # The result is provided later on (when the
+                            # future is done).
+                            future = pool.submit(doc.path)
+                            pool_futures.add(future)
+                            future.add_done_callback(
+                                partial(on_pool_future_done, uri, doc)
+                            )
+                            continue
 
-                if context is not None:
-                    ctx = CompletionContext(
-                        doc,
-                        monitor=context.monitor,
-                        config=context.config,
-                        workspace=workspace,
-                    )
-                else:
-                    ctx = CompletionContext(
-                        doc,
-                        workspace=workspace,
-                    )
-                symbols_cache = _compute_symbols_from_ast(ctx)
-            doc.symbols_cache = symbols_cache
-            yield uri, symbols_cache
+                        symbols_cache = self._compute_symbols_cache(
+                            doc, workspace, context
+                        )
+                doc.symbols_cache = symbols_cache
+                yield uri, symbols_cache
+
+            else:
+                # Wait for what's still being computed in the pool.
+                while pool_futures:
+                    if context is not None:
+                        context.check_cancelled()
+
+                    if time.time() - initial_time > timeout:
+                        log.info(
+                            "Timed out gathering information from workspace symbols (only partial information was collected). Consider enabling the 'robot.workspaceSymbolsOnlyForOpenDocs' setting."
+                        )
+                        full_workspace_iteration = False
+                        break
+
+                    yield from iter_pool_done(True)
+        finally:
+            for future in pool_futures:
+                future.cancel()
+
+        if store is not None and full_workspace_iteration:
+            # Remove the entries which are no longer in the workspace.
+            store.retain_only(paths_found)
+
+    def _compute_symbols_cache(
+        self,
+        doc: IRobotDocument,
+        workspace: IRobotWorkspace,
+        context: Optional[IBaseCompletionContext],
+    ) -> ISymbolsCache:
+        from robotframework_ls.impl.completion_context import CompletionContext
+
+        if context is not None:
+            ctx = CompletionContext(
+                doc,
+                monitor=context.monitor,
+                config=context.config,
+                workspace=workspace,
+            )
+        else:
+            ctx = CompletionContext(
+                doc,
+                workspace=workspace,
+            )
+        symbols_cache = _compute_symbols_from_ast(ctx)
+
+        store = self._symbols_cache_store
+        if store is not None and doc.immutable:
+            store.put_symbols_cache(doc, symbols_cache)
+        return symbols_cache
+
+    def _symbols_cache_from_pool_result(
+        self,
+        doc: IRobotDocument,
+        future: Future,
+        workspace: IRobotWorkspace,
+        context: Optional[IBaseCompletionContext],
+    ) -> ISymbolsCache:
+        from robotframework_ls.impl._symbols_cache_store import (
+            get_source_digest,
+            _symbols_cache_from_store_data,
+        )
+
+        try:
+            digest, data = future.result()
+        except Exception:
+            log.exception("Error computing symbols cache in pool for: %s", doc.uri)
+        else:
+            # The file could've changed after it was loaded in this process,
+            # so, only use the result if it matches the contents we have.
+            if digest == get_source_digest(doc.source):
+                store = self._symbols_cache_store
+                if store is not None:
+                    store.put_symbols_cache_data(doc, digest, data)
+                return _symbols_cache_from_store_data(doc, data)
+
+        return self._compute_symbols_cache(doc, workspace, context)
 
 
 class RobotWorkspace(Workspace):
@@ -556,7 +768,11 @@ class RobotWorkspace(Workspace):
         )
 
         Workspace.__init__(
-            self, root_uri, fs_observer, workspace_folders=workspace_folders
+            self,
+            root_uri,
+            fs_observer,
+            workspace_folders=workspace_folders,
+            vfs_snapshot_dir=self._get_vfs_snapshot_dir(),
         )
         self._generate_ast = generate_ast
         self._lock_setup_workspace_indexer = threading.Lock()
@@ -573,8 +789,16 @@ class RobotWorkspace(Workspace):
         else:
             self.workspace_indexer = None
 
-        self.on_file_changed.register(
-            self.completion_context_workspace_caches.on_file_changed
+        self.on_files_changed.register(
+            self.completion_context_workspace_caches.on_files_changed
+        )
+
+    def _get_vfs_snapshot_dir(self) -> Optional[str]:
+        from robotframework_ls import robot_config
+        import os
+
+        return os.path.join(
+            robot_config.get_robotframework_ls_home(), ".cache", "vfs_snapshots"
         )
 
     def setup_workspace_indexer(self):
@@ -594,9 +818,12 @@ class RobotWorkspace(Workspace):
     def update_document(
         self, text_doc: TextDocumentItem, change: TextDocumentContentChangeEvent
     ) -> IDocument:
+        previous_doc = self._docs.get(uris.normalize_uri(text_doc["uri"]))
         doc = typing.cast(
             IRobotDocument, Workspace.update_document(self, text_doc, change)
         )
+        if isinstance(previous_doc, RobotDocument) and isinstance(doc, RobotDocument):
+            doc.set_incremental_ast_base(previous_doc)
         self.completion_context_workspace_caches.on_updated_document(doc.uri, doc)
         if self.workspace_indexer is not None:
             self.workspace_indexer.on_updated_document(doc.uri)
@@ -656,6 +883,22 @@ class RobotWorkspace(Workspace):
         _: IRobotWorkspace = check_implements(self)
 
 
+class _IncrementalASTBase:
+    """
+    The information from a previous version of a document needed to compute
+    the AST of a new version incrementally.
+    """
+
+    __slots__ = ["ast", "lines", "input_language_codes"]
+
+    def __init__(
+        self, ast: Any, lines: Tuple[str, ...], input_language_codes: Tuple[str, ...]
+    ):
+        self.ast = ast
+        self.lines = lines
+        self.input_language_codes = input_language_codes
+
+
 class RobotDocument(Document):
 
     TYPE_TEST_CASE = "test_case"
@@ -683,12 +926,14 @@ class RobotDocument(Document):
 
         self._generate_ast = generate_ast
         self._ast = None
+        self._incremental_ast_base: Optional[_IncrementalASTBase] = None
         self.symbols_cache = None
 
     @overrides(Document._clear_caches)
     def _clear_caches(self):
         Document._clear_caches(self)
-        self._symbols_cache = None
+        self.symbols_cache = None
+        self._ast = None
         self.get_ast.cache_clear(self)  # noqa (clear the instance_cache).
         self.get_python_ast.cache_clear(self)  # noqa (clear the instance_cache).
         self.get_yaml_contents.cache_clear(self)  # noqa (clear the instance_cache).
@@ -717,13 +962,119 @@ class RobotDocument(Document):
                 "The AST can only be accessed in the RobotFrameworkServerApi, not in the RobotFrameworkLanguageServer."
             )
 
-        return self.generate_ast_uncached()
+        ast = None
+        base = self._incremental_ast_base
+        if base is not None:
+            self._incremental_ast_base = None
+            ast = self._generate_ast_incremental(base)
+
+        if ast is None:
+            ast = self.generate_ast_uncached()
+        self._ast = ast
+        return ast
+
+    def set_incremental_ast_base(self, previous_doc: "RobotDocument") -> None:
+        """
+        Provides the previous version of this document so that its AST may be
+        used to compute the AST of this document incrementally (only the
+        parts which changed are re-parsed).
+        """
+        from robotframework_ls.impl.ast_utils_incremental import (
+            is_incremental_ast_enabled,
+        )
+
+        if not self._generate_ast or not is_incremental_ast_enabled():
+            return
 
-    def generate_ast_uncached(self) -> None:
+        if previous_doc.get_type() == self.get_type():
+            self._incremental_ast_base = previous_doc._get_incremental_ast_base()
+
+    def _get_incremental_ast_base(self) -> "Optional[_IncrementalASTBase]":
+        ast = self._ast
+        if ast is None:
+            # The AST of this version was never computed: use the one from
+            # the version it was based on (if any).
+            return self._incremental_ast_base
+
+        return _IncrementalASTBase(
+            ast,
+            self.get_internal_lines(),
+            self._get_input_language_codes(),
+        )
+
+    def _get_input_language_codes(self) -> Tuple[str, ...]:
+        from robotframework_ls.impl.robot_localization import (
+            get_global_localization_info,
+        )
+
+        return tuple(get_global_localization_info().language_codes)
+
+    def _generate_ast_incremental(self, base: "_IncrementalASTBase"):
+        from robotframework_ls.impl.ast_utils_incremental import reparse_incremental
+
+        try:
+            if base.input_language_codes != self._get_input_language_codes():
+                return None
+
+            localization_info = getattr(base.ast, "__localization_info__", None)
+            if localization_info is None:
+                return None
+
+            ast = reparse_incremental(
+                base.ast,
+                base.lines,
+                self.get_internal_lines(),
+                self._get_parse_function(),
+                localization_info,
+            )
+            if ast is not None:
+                ast.source = self.path
+            return ast
+        except:
+            log.exception(f"Error parsing {self.uri} incrementally.")
+            return None
+
+    def _get_parse_function(self) -> Callable[[str], Any]:
         from robot.api import get_model, get_resource_model, get_init_model
         from robotframework_ls.impl.robot_localization import (
             get_global_localization_info,
         )
+        from robotframework_ls.impl.robot_version import robot_version_supports_language
+
+        kwargs: Dict[str, Any] = {}
+
+        if robot_version_supports_language():
+            try:
+                # Input localization
+                localization_info = get_global_localization_info()
+                from robot.api import Languages
+
+                languages = Languages()
+                for code in localization_info.language_codes:
+                    languages.add_language(code)
+
+                kwargs["lang"] = languages
+            except Exception:
+                log.exception(
+                    "Error: Unable to use expected language API in this version of Robot Framework."
+                )
+
+        t = self.get_type()
+        if t == self.TYPE_TEST_CASE:
+            return partial(get_model, **kwargs)
+
+        elif t == self.TYPE_RESOURCE:
+            return partial(get_resource_model, **kwargs)
+
+        elif t == self.TYPE_INIT:
+            return partial(get_init_model, **kwargs)
+
+        else:
+            log.critical("Unrecognized section: %s", t)
+            return partial(get_model, **kwargs)
+
+    def generate_ast_uncached(self) -> None:
+        from robot.api import get_model
         from robotframework_ls.impl import ast_utils
         from robotframework_ls.impl.robot_version import robot_version_supports_language
         from robotframework_ls.impl.robot_localization import LocalizationInfo
@@ -736,37 +1087,8 @@ class RobotDocument(Document):
 
         language_codes: List[str] = []
         try:
-            kwargs: Dict[str, Any] = {}
-
-            if robot_version_supports_language():
-                try:
-                    # Input localization
-                    localization_info = get_global_localization_info()
-                    from robot.api import Languages
-
-                    languages = Languages()
-                    for code in localization_info.language_codes:
-                        languages.add_language(code)
-
-                    kwargs["lang"] = languages
-                except Exception:
-                    log.exception(
-                        "Error: Unable to use expected language API in this version of Robot Framework."
-                    )
-
-            t = self.get_type()
-            if t == self.TYPE_TEST_CASE:
-                ast = get_model(source, **kwargs)
 
-            elif t == self.TYPE_RESOURCE:
-                ast = get_resource_model(source, **kwargs)
-
-            elif t == self.TYPE_INIT:
-                ast = get_init_model(source, **kwargs)
-
-            else:
-                log.critical("Unrecognized section: %s", t)
-                ast = get_model(source, **kwargs)
+            ast = self._get_parse_function()(source)
 
             # Output localization
             if robot_version_supports_language():
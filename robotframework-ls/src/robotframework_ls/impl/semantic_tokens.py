@@ -1,7 +1,15 @@
-from typing import List, Tuple, Iterator, Optional, Any
+from typing import List, Tuple, Iterator, Optional, Any, Dict, Union
+from functools import partial
 import itertools
+import threading
+from robocorp_ls_core.lsp import (
+    RangeTypedDict,
+    SemanticTokensTypedDict,
+    SemanticTokensDeltaTypedDict,
+    SemanticTokensEditTypedDict,
+)
 from robocorp_ls_core.protocols import IDocument
-from robotframework_ls.impl.protocols import ICompletionContext, IRobotToken
+from robotframework_ls.impl.protocols import ICompletionContext, IRobotToken, INode
 import os
 
 from robotframework_ls.impl.robot_constants import (
@@ -223,10 +231,6 @@ def _tokenize_variables(token: IRobotToken) -> Iterator[IRobotToken]:
         return token.tokenize_variables()
 
 
-def semantic_tokens_range(context, range):
-    return []
-
-
 def _tokenize_token(
     node, use_token, scope: "_SemanticTokensScope"
 ) -> Iterator[Tuple[IRobotToken, int]]:
@@ -537,59 +541,341 @@ class _SemanticTokensScope:
         return self._gherkin_regexp
 
 
-def semantic_tokens_full(context: ICompletionContext):
-    from robotframework_ls.impl import ast_utils_keyword_usage
-    from robotframework_ls.impl.ast_utils import get_localization_info_from_model
+class _UnitTokens(object):
+    """
+    The semantic tokens of a unit of the document (a section header, a test
+    case, a keyword or a statement directly inside a section).
 
-    try:
-        ast = context.doc.get_ast()
-    except:
-        return []
+    The tokens are kept encoded as required by the LSP, except for the
+    position of the first token (which is relative to the last token of the
+    previous unit and is only set when the units are joined).
+
+    Note: `first_line` and `last_line` are relative to the unit first line.
+    """
+
+    __slots__ = ["data", "first_line", "first_col", "last_line", "last_col"]
+
+    def __init__(self):
+        self.data: List[int] = []
+        self.first_line = 0
+        self.first_col = 0
+        self.last_line = 0
+        self.last_col = 0
 
+
+def _iter_units(ast) -> Iterator[Tuple[List[INode], INode]]:
     from robotframework_ls.impl import ast_utils
 
-    monitor = context.monitor
+    for section in getattr(ast, "sections", ()):
+        for stack, node in ast_utils._iter_nodes(section, recursive=False):
+            yield list(stack), node
 
-    ret: List[int] = []
-    append = ret.append
 
-    last_line = 0
-    last_column = 0
+def _compute_unit_tokens(
+    stack: List[INode],
+    node: INode,
+    first_line: int,
+    scope: "_SemanticTokensScope",
+    monitor,
+) -> _UnitTokens:
+    """
+    :param first_line: the (0-based) line where the unit starts.
+    """
+    from robotframework_ls.impl import ast_utils
+    from robotframework_ls.impl import ast_utils_keyword_usage
 
-    localization_info = get_localization_info_from_model(ast)
+    unit_tokens = _UnitTokens()
+    append = unit_tokens.data.append
+    last_line = -1
+    last_column = 0
 
-    scope = _SemanticTokensScope(context, localization_info)
-    for stack, node in ast_utils.iter_all_nodes_recursive(ast):
+    for node_stack, n in itertools.chain(
+        iter(((stack, node),)), ast_utils._iter_nodes(node, stack + [node])
+    ):
         if monitor:
             monitor.check_cancelled()
-        tokens = getattr(node, "tokens", None)
+        tokens = getattr(n, "tokens", None)
         if tokens:
             scope.keyword_usage_handler = (
-                ast_utils_keyword_usage.obtain_keyword_usage_handler(stack, node)
+                ast_utils_keyword_usage.obtain_keyword_usage_handler(node_stack, n)
             )
 
             for token in tokens:
-                for token_part, token_type_index in _tokenize_token(node, token, scope):
-                    lineno = token_part.lineno - 1
+                for token_part, token_type_index in _tokenize_token(n, token, scope):
+                    lineno = token_part.lineno - 1 - first_line
                     if lineno < 0:
                         lineno = 0
-                    append(lineno - last_line)
-                    if lineno != last_line:
-                        last_column = token_part.col_offset
-                        if last_column < 0:
-                            last_column = 0
-                        append(last_column)
+                    col = token_part.col_offset
+                    if col < 0:
+                        col = 0
+
+                    if last_line == -1:
+                        # The position of the first one is set when joining.
+                        unit_tokens.first_line = lineno
+                        unit_tokens.first_col = col
+                        append(0)
+                        append(0)
                     else:
-                        col_delta = token_part.col_offset - last_column
-                        append(col_delta)
-                        last_column += col_delta
+                        append(lineno - last_line)
+                        append(col if lineno != last_line else col - last_column)
+                    last_line = lineno
+                    last_column = col
 
                     append(token_part.end_col_offset - token_part.col_offset)  # len
                     append(token_type_index)
                     append(0)  # i.e.: no modifier
-                    last_line = lineno
 
-    return ret
+    unit_tokens.last_line = last_line
+    unit_tokens.last_col = last_column
+    return unit_tokens
+
+
+class _SemanticTokensComputer(object):
+    """
+    Computes the semantic tokens for a document unit by unit, reusing the
+    tokens of the units whose contents didn't change (when a previous state
+    is given).
+    """
+
+    def __init__(self, context: ICompletionContext):
+        self.context = context
+        self.unit_key_to_tokens: Dict[Tuple[Any, ...], _UnitTokens] = {}
+        self.scope_key: Optional[Tuple[Any, ...]] = None
+        self.tokenized_units = 0
+
+    def compute(
+        self,
+        line_range: Optional[Tuple[int, int]] = None,
+        previous_unit_key_to_tokens: Optional[
+            Dict[Tuple[Any, ...], _UnitTokens]
+        ] = None,
+        previous_scope_key: Optional[Tuple[Any, ...]] = None,
+    ) -> List[int]:
+        """
+        :param line_range:
+            If given only the units which intersect the given (0-based) lines
+            are considered.
+        """
+        from robotframework_ls.impl.ast_utils import get_localization_info_from_model
+        from robotframework_ls.impl.ast_utils_incremental import (
+            _get_lineno,
+            _get_end_lineno,
+        )
+
+        context = self.context
+        try:
+            ast = context.doc.get_ast()
+        except:
+            return []
+
+        localization_info = get_localization_info_from_model(ast)
+        scope = _SemanticTokensScope(context, localization_info)
+        self.scope_key = scope_key = (
+            frozenset(scope.imported_libraries),
+            scope.get_gherkin_regexp().pattern,
+        )
+        if previous_scope_key != scope_key:
+            previous_unit_key_to_tokens = None
+
+        lines = context.doc.get_internal_lines()
+        monitor = context.monitor
+
+        ret: List[int] = []
+        extend = ret.extend
+        unit_key_to_tokens = self.unit_key_to_tokens
+        last_line = 0
+        last_column = 0
+
+        for stack, node in _iter_units(ast):
+            start_lineno = _get_lineno(node)
+            if start_lineno == -1:
+                continue  # i.e.: no statements (so, no tokens).
+            end_lineno = _get_end_lineno(node)
+
+            if line_range is not None:
+                if end_lineno - 1 < line_range[0]:
+                    continue
+                if start_lineno - 1 > line_range[1]:
+                    break
+
+            key = (
+                stack[-1].__class__.__name__,
+                node.__class__.__name__,
+                lines[start_lineno - 1 : end_lineno],
+            )
+            unit_tokens = None
+            if previous_unit_key_to_tokens is not None:
+                unit_tokens = previous_unit_key_to_tokens.get(key)
+            if unit_tokens is None:
+                unit_tokens = unit_key_to_tokens.get(key)
+            if unit_tokens is None:
+                self.tokenized_units += 1
+                unit_tokens = _compute_unit_tokens(
+                    stack, node, start_lineno - 1, scope, monitor
+                )
+            unit_key_to_tokens[key] = unit_tokens
+
+            data = unit_tokens.data
+            if not data:
+                continue
+
+            first_line = start_lineno - 1 + unit_tokens.first_line
+            ret.append(first_line - last_line)
+            if first_line != last_line:
+                ret.append(unit_tokens.first_col)
+            else:
+                ret.append(unit_tokens.first_col - last_column)
+            extend(itertools.islice(data, 2, None))
+
+            last_line = start_lineno - 1 + unit_tokens.last_line
+            last_column = unit_tokens.last_col
+
+        return ret
+
+
+def semantic_tokens_full(context: ICompletionContext) -> List[int]:
+    return _SemanticTokensComputer(context).compute()
+
+
+def semantic_tokens_range(
+    context: ICompletionContext, range: RangeTypedDict
+) -> List[int]:
+    """
+    Provides the semantic tokens for the units (section headers, test cases,
+    keywords and statements directly inside sections) which intersect the
+    given range (note: tokens outside of the range may also be returned).
+    """
+    return _SemanticTokensComputer(context).compute(
+        line_range=(range["start"]["line"], range["end"]["line"])
+    )
+
+
+def compute_semantic_tokens_edits(
+    previous: List[int], current: List[int]
+) -> List[SemanticTokensEditTypedDict]:
+    """
+    :return:
+        The edits (in the format expected by `textDocument/semanticTokens/full/delta`)
+        to transform the `previous` tokens into the `current` tokens.
+    """
+    len_previous = len(previous)
+    len_current = len(current)
+    max_common = min(len_previous, len_current)
+
+    prefix = 0
+    while prefix < max_common and previous[prefix] == current[prefix]:
+        prefix += 1
+    # Edits are done at token boundaries (each token has 5 ints).
+    prefix -= prefix % 5
+
+    suffix = 0
+    max_suffix = max_common - prefix
+    while (
+        suffix < max_suffix
+        and previous[len_previous - 1 - suffix] == current[len_current - 1 - suffix]
+    ):
+        suffix += 1
+    suffix -= suffix % 5
+
+    delete_count = len_previous - prefix - suffix
+    data = current[prefix : len_current - suffix]
+    if not delete_count and not data:
+        return []
+    return [{"start": prefix, "deleteCount": delete_count, "data": data}]
+
+
+class _DocSemanticTokensInfo(object):
+    __slots__ = ["result_id", "data", "unit_key_to_tokens", "scope_key"]
+
+    def __init__(
+        self,
+        result_id: str,
+        data: List[int],
+        unit_key_to_tokens: Dict[Tuple[Any, ...], _UnitTokens],
+        scope_key: Optional[Tuple[Any, ...]],
+    ):
+        self.result_id = result_id
+        self.data = data
+        self.unit_key_to_tokens = unit_key_to_tokens
+        self.scope_key = scope_key
+
+
+class SemanticTokensCache(object):
+    """
+    Keeps the semantic tokens last computed for each document so that:
+
+    - Only the units (test cases, keywords, statements in sections) whose
+      contents changed are re-tokenized.
+    - `textDocument/semanticTokens/full/delta` is answered with the edits
+      from the previous result.
+
+    Note: thread-safe.
+    """
+
+    MAX_DOCS = 50
+
+    def __init__(self):
+        from collections import OrderedDict
+        import uuid
+
+        self._lock = threading.Lock()
+        # The prefix makes sure that ids from a previous process (i.e.: if the
+        # server is restarted) aren't mistakenly matched.
+        self._result_id_prefix = uuid.uuid4().hex[:8]
+        self._uri_to_info: "OrderedDict[str, _DocSemanticTokensInfo]" = OrderedDict()
+        self._next_result_id = partial(next, itertools.count(1))
+
+    def _compute(
+        self, context: ICompletionContext
+    ) -> Tuple[Optional[_DocSemanticTokensInfo], _DocSemanticTokensInfo]:
+        uri = context.doc.uri
+        with self._lock:
+            previous_info = self._uri_to_info.get(uri)
+
+        computer = _SemanticTokensComputer(context)
+        if previous_info is not None:
+            data = computer.compute(
+                previous_unit_key_to_tokens=previous_info.unit_key_to_tokens,
+                previous_scope_key=previous_info.scope_key,
+            )
+        else:
+            data = computer.compute()
+
+        with self._lock:
+            info = _DocSemanticTokensInfo(
+                "%s-%s" % (self._result_id_prefix, self._next_result_id()),
+                data,
+                computer.unit_key_to_tokens,
+                computer.scope_key,
+            )
+            self._uri_to_info[uri] = info
+            self._uri_to_info.move_to_end(uri)
+            while len(self._uri_to_info) > self.MAX_DOCS:
+                self._uri_to_info.popitem(last=False)
+        return previous_info, info
+
+    def semantic_tokens_full(
+        self, context: ICompletionContext
+    ) -> SemanticTokensTypedDict:
+        _previous_info, info = self._compute(context)
+        return {"resultId": info.result_id, "data": info.data}
+
+    def semantic_tokens_full_delta(
+        self, context: ICompletionContext, previous_result_id: str
+    ) -> Union[SemanticTokensTypedDict, SemanticTokensDeltaTypedDict]:
+        previous_info, info = self._compute(context)
+        if previous_info is None or previous_info.result_id != previous_result_id:
+            # We don't have the tokens the client has: provide all the tokens.
+            return {"resultId": info.result_id, "data": info.data}
+
+        return {
+            "resultId": info.result_id,
+            "edits": compute_semantic_tokens_edits(previous_info.data, info.data),
+        }
+
+    def forget(self, uri: str) -> None:
+        with self._lock:
+            self._uri_to_info.pop(uri, None)
 
 
 def decode_semantic_tokens(
@@ -0,0 +1,623 @@
+"""
+Command line entry point to lint a tree of robot files without an LSP client
+(i.e.: to run the same analysis done by the language server in CI).
+
+Usage:
+
+    python -m robotframework_ls.lint_cli [options] <path> [<path> ...]
+
+The files are linted in a pool of processes (each one with its own in-process
+server api). The processes use the same libspec/cache dirs, so, the libspecs
+generated (and the binary cache created when a libspec is loaded) by one are
+reused by the others (and by later runs).
+
+When `--incremental` is passed, a state file is kept with the content digest
+and the dependencies (resources, variable files, library sources and Robocop
+config files, along with their mtime/size) of each file. In the next run only files whose
+contents or dependencies changed are analyzed again (the diagnostics of the
+other files are reused from the state file).
+
+Note: the sources of a library are the module of the library and the modules
+where its keywords are defined (a change in some other module imported by the
+library isn't detected).
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_STATE_VERSION = 1
+
+_EXTENSIONS = (".robot", ".resource")
+
+# LSP DiagnosticSeverity -> SARIF level.
+_SEVERITY_TO_SARIF_LEVEL = {1: "error", 2: "warning", 3: "note", 4: "note"}
+_SEVERITY_TO_NAME = {1: "error", 2: "warning", 3: "info", 4: "hint"}
+
+# The number of files sent to a worker at once (files of the same directory
+# are kept together as those usually share the same dependencies).
+_BATCH_SIZE = 20
+
+
+def add_arguments(parser):
+    parser.description = (
+        "Lints Robot Framework files using the Robot Framework Language Server "
+        "analysis."
+    )
+
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Files or directories to lint (directories are searched recursively "
+        "for .robot and .resource files).",
+    )
+    parser.add_argument(
+        "--root",
+        help="The root of the workspace (default: the current working directory).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json", "sarif"),
+        default="text",
+        help="The output format (default: text).",
+    )
+    parser.add_argument(
+        "--output",
+        help="Write the output to the given file instead of the standard output.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="The number of processes used to lint (default: the number of cpus).",
+    )
+    parser.add_argument(
+        "--settings",
+        help="A .json file with the language server settings to be used "
+        '(i.e.: {"robot.pythonpath": ["./libs"]}).',
+    )
+    parser.add_argument(
+        "--pythonpath",
+        action="append",
+        default=[],
+        help="Entry to be added to the robot.pythonpath setting (may be passed "
+        "multiple times).",
+    )
+    parser.add_argument(
+        "--robocop",
+        action="store_true",
+        help="Also collect Robocop diagnostics.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only analyze files whose contents or dependencies changed since "
+        "the last run (information is kept in the file specified by --state-file). "
+        "Note: for libraries only the library module and the modules defining "
+        "its keywords are tracked.",
+    )
+    parser.add_argument(
+        "--state-file",
+        help="The file with the state for --incremental (default: "
+        ".robotframework-ls-lint.json in the root).",
+    )
+    parser.add_argument(
+        "--log-file",
+        help="Write logs to the given file (i.e.: c:/temp/my_log.log).",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Increase verbosity of log output (i.e.: -vv).",
+    )
+
+
+def _iter_robot_files(paths: Sequence[str]) -> Iterable[str]:
+    from robocorp_ls_core.load_ignored_dirs import create_accept_directory_callable
+
+    accept_directory = create_accept_directory_callable()
+    for path in paths:
+        path = os.path.abspath(path)
+        if os.path.isfile(path):
+            if path.lower().endswith(_EXTENSIONS):
+                yield path
+            continue
+
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames[:] = [
+                d for d in dirnames if accept_directory(os.path.join(dirpath, d))
+            ]
+            for filename in filenames:
+                if filename.lower().endswith(_EXTENSIONS):
+                    yield os.path.join(dirpath, filename)
+
+
+def _get_file_digest(path: str) -> str:
+    with open(path, "rb") as stream:
+        return hashlib.sha256(stream.read()).hexdigest()
+
+
+def _get_stamp(path: str) -> Optional[List[Any]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime, stat.st_size]
+
+
+def _create_batches(paths: Sequence[str]) -> List[List[str]]:
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    for path in sorted(paths):
+        if len(batch) >= _BATCH_SIZE:
+            batches.append(batch)
+            batch = []
+        batch.append(path)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class _Linter(object):
+    """
+    Lints files using an in-process server api (so, the same analysis which is
+    done by the language server is done here).
+    """
+
+    def __init__(self, root: str, settings: Dict[str, Any]):
+        from io import BytesIO
+        from robocorp_ls_core import uris
+        from robotframework_ls.server_api.server import RobotFrameworkServerApi
+
+        self._robocop_enabled = bool(settings.get("robot.lint.robocop.enabled"))
+        self._server = RobotFrameworkServerApi(BytesIO(), BytesIO())
+        self._server.m_initialize(rootUri=uris.from_fs_path(root))
+        self._server.m_workspace__did_change_configuration(settings=settings)
+
+    def dispose(self):
+        self._server.m_shutdown()
+
+    def lint(self, path: str) -> Dict[str, Any]:
+        from robocorp_ls_core import uris
+        from robocorp_ls_core.jsonrpc.monitor import Monitor
+
+        doc_uri = uris.from_fs_path(path)
+        monitor = Monitor()
+        diagnostics = self._server.lint_document(doc_uri, monitor)
+        dependencies, unresolved = self._collect_dependencies(doc_uri, monitor)
+        return {
+            "digest": _get_file_digest(path),
+            "diagnostics": diagnostics,
+            "dependencies": dependencies,
+            "unresolved": unresolved,
+        }
+
+    def _collect_dependencies(
+        self, doc_uri: str, monitor
+    ) -> Tuple[Dict[str, Optional[List[Any]]], bool]:
+        """
+        :return:
+            A tuple with a dict(path -> stamp) with the dependencies of the
+            given document (including the Robocop config files when Robocop is
+            enabled) and whether some dependency could not be resolved.
+        """
+        completion_context = self._server.create_completion_context(doc_uri, monitor)
+        if completion_context is None:
+            return {}, True
+
+        libspec_manager = completion_context.workspace.libspec_manager
+        dependency_graph = completion_context.collect_dependency_graph()
+
+        unresolved = False
+        dependency_paths = set()
+        docs = [completion_context.doc]
+        for doc in completion_context.iter_dependency_and_init_resource_docs(
+            dependency_graph
+        ):
+            docs.append(doc)
+            if doc.path:
+                dependency_paths.add(doc.path)
+
+        for (
+            _node,
+            resource_doc,
+        ) in dependency_graph.iter_all_resource_imports_with_docs():
+            if resource_doc is None:
+                unresolved = True
+
+        for (
+            _node,
+            variables_doc,
+        ) in dependency_graph.iter_all_variable_imports_as_docs():
+            if variables_doc is None:
+                unresolved = True
+            elif variables_doc.path:
+                dependency_paths.add(variables_doc.path)
+
+        for doc in docs:
+            # Library names may be relative to the document importing it.
+            ctx = completion_context.create_copy(doc)
+            for library_info in dependency_graph.iter_libraries(doc.uri):
+                library_doc_or_error = libspec_manager.get_library_doc_or_error(
+                    library_info.name,
+                    create=False,
+                    completion_context=ctx,
+                    builtin=library_info.builtin,
+                    args=library_info.args,
+                )
+                library_doc = library_doc_or_error.library_doc
+                if library_doc is None:
+                    unresolved = True
+                else:
+                    dependency_paths.update(_iter_library_sources(library_doc))
+
+        if self._robocop_enabled and completion_context.doc.path:
+            # The Robocop config is looked up from the directory of the file.
+            from pathlib import Path
+            from robocorp_ls_core.robocop_wrapper import get_config_file_candidates
+
+            dependency_paths.update(
+                get_config_file_candidates(Path(completion_context.doc.path).parent)
+            )
+
+        dependency_paths.discard(completion_context.doc.path)
+        dependencies = dict((p, _get_stamp(p)) for p in sorted(dependency_paths))
+        return dependencies, unresolved
+
+
+def _iter_library_sources(library_doc) -> Iterable[str]:
+    """
+    Provides the module of the library and the modules where its keywords are
+    defined (as the `LibspecManager` does to know whether a libspec must be
+    regenerated).
+    """
+    sources = set()
+    if library_doc.source:
+        sources.add(library_doc.source)
+    for keyword in itertools.chain(library_doc.inits, library_doc.keywords):
+        if keyword.source:
+            sources.add(keyword.source)
+    return (source for source in sources if os.path.isfile(source))
+
+
+_worker_linter: Optional[_Linter] = None
+
+
+def _initialize_worker(root: str, settings: Dict[str, Any]) -> None:
+    global _worker_linter
+    _worker_linter = _Linter(root, settings)
+
+
+def _lint_batch(paths: List[str]) -> Dict[str, Dict[str, Any]]:
+    linter = _worker_linter
+    assert linter is not None, "_initialize_worker not called."
+    return dict((path, linter.lint(path)) for path in paths)
+
+
+def _lint(
+    root: str, settings: Dict[str, Any], paths: Sequence[str], jobs: int
+) -> Dict[str, Dict[str, Any]]:
+    ret: Dict[str, Dict[str, Any]] = {}
+    if not paths:
+        return ret
+
+    batches = _create_batches(paths)
+    if jobs <= 1 or len(batches) == 1:
+        linter = _Linter(root, settings)
+        try:
+            for path in paths:
+                ret[path] = linter.lint(path)
+        finally:
+            linter.dispose()
+        return ret
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(batches)),
+        initializer=_initialize_worker,
+        initargs=(root, settings),
+    ) as executor:
+        for result in executor.map(_lint_batch, batches):
+            ret.update(result)
+    return ret
+
+
+def _compute_environment_key(settings: Dict[str, Any]) -> str:
+    """
+    Provides a key which changes if the results of a previous run can't be
+    reused at all (i.e.: settings or Robot Framework version changed).
+    """
+    from robotframework_ls.impl.robot_version import get_robot_version
+    import robotframework_ls
+    import robocorp_ls_core
+
+    # The libraries vendored in the language server (i.e.: robocop) are added
+    # to the sys.path when first used (and are covered by its version).
+    vendored_libs_dir = os.path.join(
+        os.path.dirname(os.path.abspath(robocorp_ls_core.__file__)), "libs"
+    )
+    contents = json.dumps(
+        [
+            settings,
+            sys.executable,
+            [
+                entry
+                for entry in sys.path
+                if not os.path.abspath(entry).startswith(vendored_libs_dir)
+            ],
+            get_robot_version(),
+            robotframework_ls.__version__,
+        ],
+        sort_keys=True,
+    )
+    return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+
+def _is_up_to_date(path: str, file_state: Dict[str, Any], files_changed: bool) -> bool:
+    if file_state.get("unresolved") and files_changed:
+        # Some dependency wasn't found before and files were added/removed
+        # (so, it could be resolved now).
+        return False
+
+    try:
+        if _get_file_digest(path) != file_state["digest"]:
+            return False
+    except OSError:
+        return False
+
+    for dependency_path, stamp in file_state["dependencies"].items():
+        if _get_stamp(dependency_path) != stamp:
+            return False
+    return True
+
+
+def _load_state(state_file: str, environment_key: str) -> Dict[str, Any]:
+    try:
+        with open(state_file, "r", encoding="utf-8") as stream:
+            state = json.load(stream)
+    except (OSError, ValueError):
+        return {}
+
+    if (
+        state.get("version") != _STATE_VERSION
+        or state.get("environment_key") != environment_key
+    ):
+        return {}
+    return state
+
+
+def _save_state(
+    state_file: str,
+    environment_key: str,
+    all_paths: Sequence[str],
+    path_to_result: Dict[str, Dict[str, Any]],
+) -> None:
+    state = {
+        "version": _STATE_VERSION,
+        "environment_key": environment_key,
+        "all_paths": sorted(all_paths),
+        "files": path_to_result,
+    }
+    tmp_filename = "%s.%s.tmp" % (state_file, os.getpid())
+    with open(tmp_filename, "w", encoding="utf-8") as stream:
+        json.dump(state, stream)
+    os.replace(tmp_filename, state_file)
+
+
+def _to_text(path_to_diagnostics: Dict[str, List[dict]], root: str) -> str:
+    lines = []
+    for path, diagnostics in sorted(path_to_diagnostics.items()):
+        try:
+            relative = os.path.relpath(path, root)
+        except ValueError:
+            relative = path
+
+        for diagnostic in diagnostics:
+            start = diagnostic["range"]["start"]
+            severity = _SEVERITY_TO_NAME.get(diagnostic.get("severity", 1), "error")
+            lines.append(
+                "%s:%s:%s: [%s] %s (%s)"
+                % (
+                    relative,
+                    start["line"] + 1,
+                    start["character"] + 1,
+                    severity,
+                    diagnostic["message"],
+                    diagnostic.get("source", "robotframework"),
+                )
+            )
+    return "\n".join(lines)
+
+
+def _get_rule_id(diagnostic: dict) -> str:
+    code = diagnostic.get("code")
+    if code:
+        return str(code)
+    data = diagnostic.get("data")
+    if isinstance(data, dict) and data.get("kind"):
+        return str(data["kind"])
+    return str(diagnostic.get("source", "robotframework"))
+
+
+def _to_sarif(path_to_diagnostics: Dict[str, List[dict]]) -> dict:
+    import robotframework_ls
+    from robocorp_ls_core import uris
+
+    results = []
+    rule_ids = set()
+    for path, diagnostics in sorted(path_to_diagnostics.items()):
+        uri = uris.from_fs_path(path)
+        for diagnostic in diagnostics:
+            rule_id = _get_rule_id(diagnostic)
+            rule_ids.add(rule_id)
+            diagnostic_range = diagnostic["range"]
+            start = diagnostic_range["start"]
+            end = diagnostic_range["end"]
+            results.append(
+                {
+                    "ruleId": rule_id,
+                    "level": _SEVERITY_TO_SARIF_LEVEL.get(
+                        diagnostic.get("severity", 1), "error"
+                    ),
+                    "message": {"text": diagnostic["message"]},
+                    "locations": [
+                        {
+                            "physicalLocation": {
+                                "artifactLocation": {"uri": uri},
+                                "region": {
+                                    "startLine": start["line"] + 1,
+                                    "startColumn": start["character"] + 1,
+                                    "endLine": end["line"] + 1,
+                                    "endColumn": end["character"] + 1,
+                                },
+                            }
+                        }
+                    ],
+                }
+            )
+
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "robotframework-ls",
+                        "version": robotframework_ls.__version__,
+                        "informationUri": "https://github.com/robocorp/robotframework-lsp",
+                        "rules": [{"id": rule_id} for rule_id in sorted(rule_ids)],
+                    }
+                },
+                "results": results,
+            }
+        ],
+    }
+
+
+def lint(
+    paths: Sequence[str],
+    root: str,
+    settings: Dict[str, Any],
+    jobs: int = 1,
+    state_file: Optional[str] = None,
+) -> Tuple[Dict[str, List[dict]], List[str]]:
+    """
+    :param state_file:
+        If given, only files which changed since the run which saved the state
+        file are analyzed (and the state file is updated afterwards).
+
+    :return:
+        A tuple with a dict(path -> lsp diagnostics) and the paths which were
+        actually analyzed in this run.
+    """
+    all_paths = sorted(set(_iter_robot_files(paths)))
+
+    environment_key = ""
+    previous_files: Dict[str, Dict[str, Any]] = {}
+    files_changed = True
+    if state_file:
+        environment_key = _compute_environment_key(settings)
+        state = _load_state(state_file, environment_key)
+        if state:
+            previous_files = state["files"]
+            files_changed = state["all_paths"] != all_paths
+
+    path_to_result: Dict[str, Dict[str, Any]] = {}
+    to_analyze = []
+    for path in all_paths:
+        file_state = previous_files.get(path)
+        if file_state is not None and _is_up_to_date(path, file_state, files_changed):
+            path_to_result[path] = file_state
+        else:
+            to_analyze.append(path)
+
+    path_to_result.update(_lint(root, settings, to_analyze, jobs))
+
+    if state_file:
+        _save_state(state_file, environment_key, all_paths, path_to_result)
+
+    path_to_diagnostics = dict(
+        (path, result["diagnostics"]) for path, result in path_to_result.items()
+    )
+    return path_to_diagnostics, to_analyze
+
+
+def main(args=None) -> int:
+    """
+    :return:
+        0 if no errors were found and 1 otherwise (warnings/infos don't
+        affect the exit code).
+    """
+    try:
+        import robotframework_ls
+    except ImportError:
+        # Automatically add it to the path if __main__ is being executed.
+        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        import robotframework_ls  # @UnusedImport
+    robotframework_ls.import_robocorp_ls_core()
+
+    from robocorp_ls_core.robotframework_log import configure_logger
+
+    parser = argparse.ArgumentParser()
+    add_arguments(parser)
+    options = parser.parse_args(args=args)
+
+    configure_logger("lint", options.verbose, options.log_file or "")
+
+    root = os.path.abspath(options.root or os.getcwd())
+
+    settings: Dict[str, Any] = {}
+    if options.settings:
+        with open(options.settings, "r", encoding="utf-8") as stream:
+            settings.update(json.load(stream))
+
+    if options.pythonpath:
+        pythonpath = list(settings.get("robot.pythonpath") or [])
+        pythonpath.extend(os.path.abspath(p) for p in options.pythonpath)
+        settings["robot.pythonpath"] = pythonpath
+
+    if options.robocop:
+        settings["robot.lint.robocop.enabled"] = True
+
+    state_file = None
+    if options.incremental:
+        state_file = options.state_file or os.path.join(
+            root, ".robotframework-ls-lint.json"
+        )
+
+    path_to_diagnostics, _analyzed = lint(
+        options.paths, root, settings, jobs=options.jobs, state_file=state_file
+    )
+
+    if options.format == "json":
+        contents = json.dumps(path_to_diagnostics, indent=2, sort_keys=True)
+    elif options.format == "sarif":
+        contents = json.dumps(_to_sarif(path_to_diagnostics), indent=2)
+    else:
+        contents = _to_text(path_to_diagnostics, root)
+
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as stream:
+            stream.write(contents)
+    elif contents:
+        sys.stdout.write(contents)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+
+    for diagnostics in path_to_diagnostics.values():
+        for diagnostic in diagnostics:
+            if diagnostic.get("severity", 1) == 1:
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
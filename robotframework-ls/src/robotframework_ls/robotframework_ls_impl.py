@@ -15,7 +15,7 @@ from robotframework_ls.constants import (
     DEFAULT_LIST_TESTS_TIMEOUT,
 )
 from robocorp_ls_core.robotframework_log import get_logger
-from typing import Any, Optional, Dict, Sequence, Set, ContextManager, Union
+from typing import Any, Optional, Dict, Sequence, Set, ContextManager, Union, List
 from robocorp_ls_core.protocols import (
     IConfig,
     IWorkspace,
@@ -141,9 +141,72 @@ def run_in_new_thread(func, thread_name):
     t.start()
 
 
+class _BulkLintInfo(object):
+    """
+    A batch of files (which must use the same lint api) from the files
+    scheduled through `_LintManager.schedule_manual_lint`.
+    """
+
+    def __init__(
+        self,
+        rf_lint_api_client: IRobotFrameworkApiClient,
+        doc_uris: List[str],
+        on_finish,
+    ) -> None:
+        from robocorp_ls_core.jsonrpc.monitor import Monitor
+
+        self._rf_lint_api_client = rf_lint_api_client
+        self.doc_uris = doc_uris
+        self._monitor = Monitor()
+        self._on_finish = on_finish
+
+    def __call__(self) -> None:
+        from robocorp_ls_core.jsonrpc.exceptions import JsonRpcRequestCancelled
+        from robocorp_ls_core.client_base import wait_for_message_matcher
+        from robotframework_ls.server_api.client import SubprocessDiedError
+
+        uri_to_diagnostics: Dict[str, list] = {}
+        try:
+            self._monitor.check_cancelled()
+            message_matcher = self._rf_lint_api_client.request_lint_many(self.doc_uris)
+            if message_matcher is not None:
+                if wait_for_message_matcher(
+                    message_matcher,
+                    monitor=self._monitor,
+                    request_cancel=self._rf_lint_api_client.request_cancel,
+                    timeout=60 * 3 * len(self.doc_uris),
+                ):
+                    diagnostics_msg = message_matcher.msg
+                    if diagnostics_msg:
+                        uri_to_diagnostics = diagnostics_msg.get("result") or {}
+                    self._monitor.check_cancelled()
+        except JsonRpcRequestCancelled:
+            log.debug("Cancelled linting: %s.", self.doc_uris)
+
+        except SubprocessDiedError:
+            log.debug("Subprocess exited while linting: %s.", self.doc_uris)
+
+        except Exception:
+            log.exception("Error linting: %s.", self.doc_uris)
+
+        finally:
+            self._on_finish(self, uri_to_diagnostics)
+
+    def cancel(self):
+        self._monitor.cancel()
+
+
 class _LintManager(object):
+    # The max number of files sent in a single `lint_many` request.
+    BULK_LINT_BATCH_SIZE = 10
+
     def __init__(
-        self, server_manager, lsp_messages, endpoint: IEndPoint, read_queue
+        self,
+        server_manager,
+        lsp_messages,
+        endpoint: IEndPoint,
+        read_queue,
+        config_provider: Optional[EPConfigurationProvider] = None,
     ) -> None:
         import threading
         import queue
@@ -153,16 +216,40 @@ class _LintManager(object):
         self._lsp_messages = lsp_messages
         self._endpoint = endpoint
         self._read_queue: queue.Queue = read_queue
+        self._config_provider = config_provider
 
         self._next_id = partial(next, itertools.count())
 
         self._lock = threading.Lock()
         self._doc_id_to_info: Dict[str, _CurrLintInfo] = {}  # requires lock
+
+        # Files scheduled through `schedule_manual_lint` (and the batches
+        # currently being linted from those).
         self._uris_to_lint: Set[str] = set()  # requires lock
+        self._bulk_lints: Set[_BulkLintInfo] = set()  # requires lock
+
+        # Files which were linted directly while in a bulk lint (so, the
+        # bulk lint results must not override those).
+        self._skip_bulk_publish: Set[str] = set()  # requires lock
 
         self._progress_context: Optional[ContextManager[IProgressReporter]] = None
         self._progress_reporter: Optional[IProgressReporter] = None
 
+    def _get_bulk_lint_concurrency(self) -> int:
+        from robotframework_ls.impl.robot_lsp_constants import (
+            OPTION_ROBOT_LINT_WORKSPACE_CONCURRENCY,
+        )
+
+        concurrency = 2
+        config_provider = self._config_provider
+        if config_provider is not None:
+            config = config_provider.config
+            if config is not None:
+                concurrency = config.get_setting(
+                    OPTION_ROBOT_LINT_WORKSPACE_CONCURRENCY, int, concurrency
+                )
+        return max(1, concurrency)
+
     def schedule_lint(self, doc_uri: str, is_saved: bool, timeout: float) -> None:
         self.cancel_lint(doc_uri)
 
@@ -178,59 +265,20 @@ class _LintManager(object):
         weak_self = weakref.ref(self)
 
         def on_finish(curr_info: _CurrLintInfo):
-            from robocorp_ls_core.progress_report import progress_context
-
             # When it's finished, remove it from our references (if it's still
             # the current one...).
             #
             # Also, if we have remaining items which were manually scheduled,
-            # we need to lint those.
+            # we need to lint those (which is done after the files linted
+            # directly are finished as those have a higher priority).
             try:
-                s = weak_self()
-                next_uri_to_lint = None
-                remaining_count = 0
                 with lock:
                     if doc_id_to_info.get(curr_info.doc_uri) is curr_info:
                         del doc_id_to_info[curr_info.doc_uri]
 
-                    if s is not None:
-                        if self._progress_reporter is not None:
-                            if self._progress_reporter.cancelled:
-                                s._uris_to_lint.clear()
-
-                        if s._uris_to_lint:
-                            next_uri_to_lint = s._uris_to_lint.pop()
-                            remaining_count = len(self._uris_to_lint)
-
-                    if self._progress_context is None:
-                        if remaining_count > 0:
-                            self._progress_context = progress_context(
-                                self._endpoint,
-                                "Linting files... ",
-                                None,
-                                cancellable=True,
-                            )
-                            self._progress_reporter = self._progress_context.__enter__()
-                    else:
-                        if remaining_count == 0:
-                            self._progress_context.__exit__(None, None, None)
-                            self._progress_context = None
-                            self._progress_reporter = None
-                        else:
-                            if self._progress_reporter is not None:
-                                self._progress_reporter.set_additional_info(
-                                    f"(remaining: {remaining_count})"
-                                )
-
-                if next_uri_to_lint and s is not None:
-                    # As schedule lint must be done in the main thread, we
-                    # we put an item in the queue to process the main thread.
-                    def _schedule():
-                        s = weak_self()
-                        if s is not None:
-                            s.schedule_lint(next_uri_to_lint, True, 0.0)
-
-                    self._read_queue.put(_schedule)
+                s = weak_self()
+                if s is not None:
+                    s._request_schedule_bulk_lints()
             except:
                 log.exception("Unhandled error on lint finish.")
 
@@ -241,6 +289,12 @@ class _LintManager(object):
         with self._lock:
             self._doc_id_to_info[doc_uri] = curr_info
 
+            # If it was scheduled for a bulk lint it's not needed anymore.
+            self._uris_to_lint.discard(doc_uri)
+            for bulk_lint in self._bulk_lints:
+                if doc_uri in bulk_lint.doc_uris:
+                    self._skip_bulk_publish.add(doc_uri)
+
         from robocorp_ls_core.timeouts import TimeoutTracker
 
         timeout_tracker = TimeoutTracker.get_singleton()
@@ -265,6 +319,11 @@ class _LintManager(object):
         It doesn't require files to be open and folders are recursively checked
         for files (.robot and .resource files).
 
+        The files are linted in batches (a `lint_many` request for each batch)
+        and up to `robot.lint.workspaceConcurrency` batches are linted
+        concurrently. Files linted directly (i.e.: due to changes in the
+        editor) have priority over those.
+
         :param lint_paths: The paths that should be linted.
         """
         from robocorp_ls_core import uris
@@ -286,14 +345,154 @@ class _LintManager(object):
                     uri = uris.from_fs_path(str(f))
                     new_uris_to_lint_set.add(uri)
 
-        next_uri_to_lint = None
         with self._lock:
             self._uris_to_lint.update(new_uris_to_lint_set)
-            if new_uris_to_lint_set:
-                next_uri_to_lint = new_uris_to_lint_set.pop()
 
-        if next_uri_to_lint:
-            self.schedule_lint(next_uri_to_lint, True, 0.0)
+        self._schedule_bulk_lints()
+
+    def schedule_dependency_lint(self, doc_uri: str) -> None:
+        """
+        Schedules a (low priority) lint for a document whose dependencies
+        changed. It's linted along with the files scheduled through
+        `schedule_manual_lint` (so, files linted directly have priority).
+
+        Note: may be called from any thread.
+        """
+        with self._lock:
+            if doc_uri in self._doc_id_to_info:
+                # It's already being linted directly.
+                return
+            self._uris_to_lint.add(doc_uri)
+
+        self._request_schedule_bulk_lints()
+
+    def _request_schedule_bulk_lints(self) -> None:
+        # As getting the lint api must be done in the main thread, we
+        # put an item in the queue to process in the main thread.
+        weak_self = weakref.ref(self)
+
+        def _schedule():
+            s = weak_self()
+            if s is not None:
+                s._schedule_bulk_lints()
+
+        self._read_queue.put(_schedule)
+
+    def _schedule_bulk_lints(self) -> None:
+        """
+        Note: must be called in the main thread.
+        """
+        concurrency = self._get_bulk_lint_concurrency()
+        while True:
+            with self._lock:
+                self._update_progress()
+
+                if self._doc_id_to_info:
+                    # Files being linted directly have priority (this will be
+                    # called again when those finish).
+                    return
+
+                if len(self._bulk_lints) >= concurrency or not self._uris_to_lint:
+                    return
+
+                doc_uris = []
+                for _i in range(
+                    min(self.BULK_LINT_BATCH_SIZE, len(self._uris_to_lint))
+                ):
+                    doc_uris.append(self._uris_to_lint.pop())
+
+            # Create a batch with the files which use the same lint api (the
+            # remaining ones are put back to be linted in another batch).
+            rf_lint_api_client = None
+            batch_doc_uris: List[str] = []
+            put_back: List[str] = []
+            for doc_uri in doc_uris:
+                api_client = self._server_manager.get_lint_rf_api_client(doc_uri)
+                if api_client is None:
+                    log.info("Unable to get lint api for: %s", doc_uri)
+                    continue
+
+                if rf_lint_api_client is None:
+                    rf_lint_api_client = api_client
+
+                if api_client is rf_lint_api_client:
+                    batch_doc_uris.append(doc_uri)
+                else:
+                    put_back.append(doc_uri)
+
+            with self._lock:
+                self._uris_to_lint.update(put_back)
+                if rf_lint_api_client is None:
+                    continue
+
+                bulk_lint = _BulkLintInfo(
+                    rf_lint_api_client, batch_doc_uris, self._on_bulk_lint_finished
+                )
+                self._bulk_lints.add(bulk_lint)
+
+            log.debug("Schedule bulk lint for: %s", batch_doc_uris)
+            run_in_new_thread(bulk_lint, f"Lint: {len(batch_doc_uris)} files")
+
+    def _on_bulk_lint_finished(
+        self, bulk_lint: _BulkLintInfo, uri_to_diagnostics: Dict[str, list]
+    ) -> None:
+        try:
+            with self._lock:
+                self._bulk_lints.discard(bulk_lint)
+
+                publish = []
+                for doc_uri in bulk_lint.doc_uris:
+                    if doc_uri in self._skip_bulk_publish:
+                        continue
+                    diagnostics = uri_to_diagnostics.get(doc_uri)
+                    if diagnostics is not None:
+                        publish.append((doc_uri, diagnostics))
+
+                if not self._bulk_lints:
+                    self._skip_bulk_publish.clear()
+
+            for doc_uri, diagnostics in publish:
+                self._lsp_messages.publish_diagnostics(doc_uri, diagnostics)
+
+            self._request_schedule_bulk_lints()
+        except:
+            log.exception("Unhandled error on bulk lint finish.")
+
+    def _update_progress(self) -> None:
+        """
+        Note: must be called with the lock held.
+        """
+        from robocorp_ls_core.progress_report import progress_context
+
+        if self._progress_reporter is not None:
+            if self._progress_reporter.cancelled:
+                self._uris_to_lint.clear()
+                for bulk_lint in self._bulk_lints:
+                    bulk_lint.cancel()
+
+        remaining_count = len(self._uris_to_lint)
+        for bulk_lint in self._bulk_lints:
+            remaining_count += len(bulk_lint.doc_uris)
+
+        if self._progress_context is None:
+            if remaining_count > 0:
+                self._progress_context = progress_context(
+                    self._endpoint,
+                    "Linting files... ",
+                    None,
+                    cancellable=True,
+                )
+                self._progress_reporter = self._progress_context.__enter__()
+
+        elif remaining_count == 0:
+            self._progress_context.__exit__(None, None, None)
+            self._progress_context = None
+            self._progress_reporter = None
+
+        if self._progress_reporter is not None:
+            self._progress_reporter.set_additional_info(
+                f"(remaining: {remaining_count})"
+            )
 
 
 command_dispatcher = _CommandDispatcher()
@@ -402,6 +601,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
             self._lsp_messages,
             self._endpoint,
             self._jsonrpc_stream_reader.get_read_queue(),
+            self._config_provider,
         )
         self._robot_framework_ls_completion_impl = _RobotFrameworkLsCompletionImpl(
             self._server_manager, self
@@ -488,6 +688,23 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         method = msg["method"]
         self._endpoint.notify(method, msg["params"])
 
+    def prioritize_markdown_conversion(
+        self, markdown_conversion_api, spec_filename: str
+    ) -> None:
+        """
+        Forwards a request to prioritize the conversion of the given libspec
+        to markdown to the api which does the conversion.
+
+        Note: may be called from any thread.
+        """
+
+        def on_main_thread():
+            markdown_conversion_api.forward_async(
+                "prioritize_markdown_conversion", {"spec_filename": spec_filename}
+            )
+
+        self._execute_on_main_thread(on_main_thread)
+
     @overrides(PythonLanguageServer.capabilities)
     def capabilities(self):
         from robocorp_ls_core.lsp import TextDocumentSyncKind
@@ -544,8 +761,8 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
                     "tokenTypes": TOKEN_TYPES,
                     "tokenModifiers": TOKEN_MODIFIERS,
                 },
-                "range": False,
-                "full": True,
+                "range": True,
+                "full": {"delta": True},
             },
         }
         log.debug("Server capabilities: %s", server_capabilities)
@@ -1063,6 +1280,12 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
     def cancel_lint(self, doc_uri) -> None:
         self._lint_manager.cancel_lint(doc_uri)
 
+    def schedule_dependency_lint(self, doc_uri: str) -> None:
+        """
+        Called when a dependency of the given (opened) document changed.
+        """
+        self._lint_manager.schedule_dependency_lint(doc_uri)
+
     def m_completion_item__resolve(self, **params):
         completion_item: CompletionItemTypedDict = params
         return self._robot_framework_ls_completion_impl.resolve_completion_item(
@@ -1087,6 +1310,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         __timeout__=DEFAULT_COMPLETIONS_TIMEOUT,
         __log__=False,
         __convert_result__=None,
+        __forward_raw_result__=False,
         **kwargs,
     ):
         from robocorp_ls_core.client_base import wait_for_message_matcher
@@ -1108,7 +1332,13 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
             return None
 
         # Asynchronous completion.
-        message_matcher: Optional[IIdMessageMatcher] = func(doc_uri, **kwargs)
+        message_matcher: Optional[IIdMessageMatcher]
+        if __forward_raw_result__ and __convert_result__ is None and not __log__:
+            # The result is just forwarded to the client.
+            with rf_api_client.forward_raw_results():
+                message_matcher = func(doc_uri, **kwargs)
+        else:
+            message_matcher = func(doc_uri, **kwargs)
         if message_matcher is None:
             log.debug("Message matcher for %s returned None.", request_method_name)
             return None
@@ -1143,6 +1373,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         monitor: Optional[IMonitor],
         __timeout__=DEFAULT_COMPLETIONS_TIMEOUT,
         __convert_result__=None,
+        __forward_raw_result__=False,
         **kwargs,
     ):
         from robocorp_ls_core.client_base import wait_for_message_matcher
@@ -1150,7 +1381,13 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         func = getattr(rf_api_client, request_method_name)
 
         # Asynchronous completion.
-        message_matcher: Optional[IIdMessageMatcher] = func(**kwargs)
+        message_matcher: Optional[IIdMessageMatcher]
+        if __forward_raw_result__ and __convert_result__ is None:
+            # The result is just forwarded to the client.
+            with rf_api_client.forward_raw_results():
+                message_matcher = func(**kwargs)
+        else:
+            message_matcher = func(**kwargs)
         if message_matcher is None:
             log.debug("Message matcher for %s returned None.", request_method_name)
             return None
@@ -1198,6 +1435,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
                     rf_api_client,
                     api_client_method_name,
                     doc_uri=doc_uri,
+                    __forward_raw_result__=True,
                     **kwargs,
                 )
             else:
@@ -1205,6 +1443,7 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
                     self._threaded_api_request_no_doc,
                     rf_api_client,
                     api_client_method_name,
+                    __forward_raw_result__=True,
                     **kwargs,
                 )
             func = require_monitor(func)
@@ -1351,7 +1590,17 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
         return []
 
     def m_text_document__semantic_tokens__range(self, textDocument=None, range=None):
-        raise RuntimeError("Not currently implemented!")
+        doc_uri = textDocument["uri"]
+
+        return self.async_api_forward(
+            "request_semantic_tokens_range",
+            "others",
+            doc_uri,
+            default_return={"resultId": None, "data": []},
+            text_document=textDocument,
+            range=range,
+            __add_doc_uri_in_args__=False,
+        )
 
     def m_text_document__semantic_tokens__full(self, textDocument=None):
         doc_uri = textDocument["uri"]
@@ -1365,6 +1614,21 @@ class RobotFrameworkLanguageServer(PythonLanguageServer):
             __add_doc_uri_in_args__=False,
         )
 
+    def m_text_document__semantic_tokens__full__delta(
+        self, textDocument=None, previousResultId=None
+    ):
+        doc_uri = textDocument["uri"]
+
+        return self.async_api_forward(
+            "request_semantic_tokens_full_delta",
+            "others",
+            doc_uri,
+            default_return={"resultId": None, "data": []},
+            text_document=textDocument,
+            previous_result_id=previousResultId,
+            __add_doc_uri_in_args__=False,
+        )
+
     def m_workspace__symbol(self, query: Optional[str] = None) -> Any:
         doc_uri = self._last_doc_uri
         return self.async_api_forward(
@@ -15,6 +15,7 @@ from robocorp_ls_core.lsp import (
     CompletionsResponseTypedDict,
     CompletionResolveResponseTypedDict,
     TextDocumentCodeActionTypedDict,
+    RangeTypedDict,
 )
 from robocorp_ls_core.basic import implements
 
@@ -121,6 +122,12 @@ class RobotFrameworkApiClient(LanguageServerClientBase):
         """
         return self.request_async(self._build_msg("lint", doc_uri=doc_uri))
 
+    def request_lint_many(self, doc_uris: List[str]) -> Optional[IIdMessageMatcher]:
+        """
+        :Note: async complete.
+        """
+        return self.request_async(self._build_msg("lint_many", doc_uris=doc_uris))
+
     def request_semantic_tokens_full(
         self, text_document: TextDocumentTypedDict
     ) -> Optional[IIdMessageMatcher]:
@@ -133,6 +140,34 @@ class RobotFrameworkApiClient(LanguageServerClientBase):
             )
         )
 
+    def request_semantic_tokens_full_delta(
+        self, text_document: TextDocumentTypedDict, previous_result_id: str
+    ) -> Optional[IIdMessageMatcher]:
+        """
+        :Note: async complete.
+        """
+        return self.request_async(
+            self._build_msg(
+                "textDocument/semanticTokens/full/delta",
+                textDocument=text_document,
+                previousResultId=previous_result_id,
+            )
+        )
+
+    def request_semantic_tokens_range(
+        self, text_document: TextDocumentTypedDict, range: RangeTypedDict
+    ) -> Optional[IIdMessageMatcher]:
+        """
+        :Note: async complete.
+        """
+        return self.request_async(
+            self._build_msg(
+                "textDocument/semanticTokens/range",
+                textDocument=text_document,
+                range=range,
+            )
+        )
+
     def request_semantic_tokens_from_code_full(
         self, prefix: str, full_code: str, indent: str, uri: str
     ) -> Optional[IIdMessageMatcher]:
@@ -36,7 +36,7 @@ from robotframework_ls.impl.protocols import (
     EvaluatableExpressionTypedDict,
     IVariablesFromArgumentsFileLoader,
 )
-from robocorp_ls_core.watchdog_wrapper import IFSObserver
+from robocorp_ls_core.watchdog_wrapper import IFSObserver, IFSWatch
 import itertools
 import typing
 import sys
@@ -144,6 +144,17 @@ class RobotFrameworkServerApi(PythonLanguageServer):
             IVariablesFromArgumentsFileLoader
         ] = []
 
+        self._robocop_config_watches_lock = threading.Lock()
+        self._robocop_config_watches: Dict[str, IFSWatch] = {}
+
+        # Incremented when a robocop config changes (used in the fingerprint
+        # of the cached lint diagnostics).
+        self._robocop_config_generation = 0
+
+        from robotframework_ls.impl.semantic_tokens import SemanticTokensCache
+
+        self._semantic_tokens_cache = SemanticTokensCache()
+
     @overrides(PythonLanguageServer._create_config)
     def _create_config(self) -> IConfig:
         from robotframework_ls.robot_config import RobotConfig
@@ -272,23 +283,16 @@ class RobotFrameworkServerApi(PythonLanguageServer):
         self, root_uri: str, fs_observer: IFSObserver, workspace_folders
     ) -> IWorkspace:
         from robotframework_ls.impl.robot_workspace import RobotWorkspace
+        import weakref
+
+        weak_self = weakref.ref(self)
 
-        # Note: note done because our caches are removed promptly
-        # for this to work it should be invalidate but the info
-        # should be kept around so that we lint dependencies always
-        # not just on the first cache invalidation.
-        # WIP: test_dependency_graph_integration_lint
-        # weak_self = weakref.ref(self)
-        #
-        # def on_dependency_changed(uri):
-        #     s = weak_self()
-        #     if s is not None:
-        #         endpoint = s._endpoint
-        #         if endpoint:
-        #             endpoint.notify(
-        #                 "$/dependencyChanged",
-        #                 {"uri": uri},
-        #             )
+        def on_dependency_changed(uri):
+            # The diagnostics cached for `uri` were invalidated because one of
+            # its dependencies changed: ask for a new lint if it's opened.
+            s = weak_self()
+            if s is not None:
+                s._on_dependency_changed(uri)
 
         robot_workspace = RobotWorkspace(
             root_uri,
@@ -298,10 +302,22 @@ class RobotFrameworkServerApi(PythonLanguageServer):
             index_workspace=self._index_workspace,
             collect_tests=self._collect_tests,
             endpoint=self._endpoint,
+            on_dependency_changed=on_dependency_changed,
         )
 
         return robot_workspace
 
+    def _on_dependency_changed(self, uri: str) -> None:
+        workspace = self.workspace
+        endpoint = self._endpoint
+        if workspace is None or endpoint is None:
+            return
+
+        if workspace.get_document(uri, accept_from_file=False) is None:
+            return  # Only opened documents are linted again.
+
+        endpoint.notify("$/dependencyChanged", {"uri": uri})
+
     def m_lint(self, doc_uri):
         error = self._compute_min_version_error((3, 2))
         if error is not None:
@@ -313,86 +329,130 @@ class RobotFrameworkServerApi(PythonLanguageServer):
         func = require_monitor(func)
         return func
 
-    def _threaded_lint(self, doc_uri, monitor: IMonitor):
-        from robocorp_ls_core.jsonrpc.exceptions import JsonRpcRequestCancelled
-        from robotframework_ls.impl.robot_lsp_constants import (
-            OPTION_ROBOT_LINT_ROBOCOP_ENABLED,
-        )
-        from robocorp_ls_core import uris
-        from robocorp_ls_core.lsp import Error
-        from robotframework_ls.impl.robot_lsp_constants import (
-            OPTION_ROBOT_LINT_ENABLED,
+    def m_lint_many(self, doc_uris: List[str]):
+        error = self._compute_min_version_error((3, 2))
+        if error is not None:
+            from robocorp_ls_core.lsp import Error
+
+            diagnostic = Error(error, (0, 0), (1, 0)).to_lsp_diagnostic()
+            return dict((doc_uri, [diagnostic]) for doc_uri in doc_uris)
+
+        func = partial(self._threaded_lint_many, doc_uris)
+        func = require_monitor(func)
+        return func
+
+    def m_prioritize_markdown_conversion(self, spec_filename: str) -> None:
+        """
+        The docs of the given library were requested in another api process
+        (so, its conversion to markdown should be done before the others).
+        """
+        self.libspec_manager.schedule_conversion_to_markdown(
+            spec_filename, prioritize=True
         )
 
-        try:
-            from robotframework_ls.impl.ast_utils import collect_errors
-            from robotframework_ls.impl import code_analysis
-            import os.path
+    def lint_document(self, doc_uri: str, monitor: Optional[IMonitor] = None) -> list:
+        """
+        Lints the given document synchronously in the current thread (i.e.:
+        for clients using the server api in-process such as the lint command
+        line).
 
-            log.debug("Lint: starting (in thread).")
+        :return: the lsp diagnostics for the document.
+        """
+        from robocorp_ls_core.jsonrpc.monitor import Monitor
 
-            completion_context = self._create_completion_context(doc_uri, 0, 0, monitor)
-            if completion_context is None:
-                return []
+        error = self._compute_min_version_error((3, 2))
+        if error is not None:
+            from robocorp_ls_core.lsp import Error
 
-            config = completion_context.config
-            robocop_enabled = config is None or config.get_setting(
-                OPTION_ROBOT_LINT_ROBOCOP_ENABLED, bool, False
-            )
+            return [Error(error, (0, 0), (1, 0)).to_lsp_diagnostic()]
 
-            ast = completion_context.get_ast()
-            source = completion_context.doc.source
-            monitor.check_cancelled()
-            errors = collect_errors(ast)
-            log.debug("Collected AST errors (in thread): %s", len(errors))
+        if monitor is None:
+            monitor = Monitor()
+        return self._threaded_lint(doc_uri, monitor)
+
+    def create_completion_context(
+        self, doc_uri: str, monitor: Optional[IMonitor] = None
+    ) -> Optional[ICompletionContext]:
+        """
+        :return:
+            A completion context for the start of the given document (or None
+            if the workspace or document are not available).
+        """
+        return self._create_completion_context(doc_uri, 0, 0, monitor)
+
+    def _threaded_lint_many(
+        self, doc_uris: List[str], monitor: IMonitor
+    ) -> Dict[str, list]:
+        """
+        Lints the given files in the same request (so, the files linted later
+        reuse what was already cached in the workspace when linting the
+        previous ones, such as libraries and the dependency graph of the
+        resources).
+        """
+        ret: Dict[str, list] = {}
+        for doc_uri in doc_uris:
             monitor.check_cancelled()
+            ret[doc_uri] = self._threaded_lint(doc_uri, monitor)
+        return ret
 
-            lint_ls_enabled = config is None or config.get_setting(
-                OPTION_ROBOT_LINT_ENABLED, bool, True
+    def _track_robocop_config_changes(self, project_root: str) -> None:
+        """
+        The Robocop runners are cached (see: `robocop_wrapper`), so, they must
+        be cleared when a Robocop config file is added/removed in the project.
+        """
+        from robocorp_ls_core.robocop_wrapper import clear_robocop_runners_cache
+        from robocorp_ls_core.watchdog_wrapper import PathInfo
+
+        with self._robocop_config_watches_lock:
+            if project_root in self._robocop_config_watches:
+                return
+
+            def on_change(src_path, *args):
+                log.debug("Robocop config changed: %s", src_path)
+                clear_robocop_runners_cache()
+                self._robocop_config_generation += 1
+
+            self._robocop_config_watches[
+                project_root
+            ] = self._obtain_fs_observer().notify_on_any_change(
+                [PathInfo(project_root, recursive=True)],
+                on_change=on_change,
+                extensions=(".robocop", "pyproject.toml"),
             )
-            if lint_ls_enabled:
-                analysis_errors = code_analysis.collect_analysis_errors(
-                    completion_context
-                )
-                monitor.check_cancelled()
-                log.debug(
-                    "Collected analysis errors (in thread): %s", len(analysis_errors)
-                )
-                errors.extend(analysis_errors)
-            else:
-                log.debug("Language server linting disabled.")
 
-            lsp_diagnostics = [error.to_lsp_diagnostic() for error in errors]
+    def _threaded_lint(self, doc_uri, monitor: IMonitor):
+        from robocorp_ls_core.jsonrpc.exceptions import JsonRpcRequestCancelled
+        from robocorp_ls_core.lsp import Error
+
+        try:
+            log.debug("Lint: starting (in thread).")
 
-            try:
-                if robocop_enabled:
-                    from robocorp_ls_core.robocop_wrapper import (
-                        collect_robocop_diagnostics,
-                    )
+            completion_context = self._create_completion_context(doc_uri, 0, 0, monitor)
+            if completion_context is None:
+                return []
 
-                    workspace = completion_context.workspace
-                    if workspace is not None:
-                        project_root = workspace.root_path
-                    else:
-                        project_root = os.path.abspath(".")
+            caches = completion_context.workspace.completion_context_workspace_caches
+            with caches.invalidation_tracker() as invalidation_tracker:
+                dependency_graph = completion_context.collect_dependency_graph()
+                fingerprint = self._compute_lint_fingerprint(
+                    completion_context, dependency_graph
+                )
+                cached = caches.get_cached_diagnostics(doc_uri, fingerprint)
+                if cached is not None:
+                    log.debug("Lint: diagnostics cache hit for: %s", doc_uri)
+                    return list(cached)
 
-                    monitor.check_cancelled()
-                    lsp_diagnostics.extend(
-                        collect_robocop_diagnostics(
-                            project_root, ast, uris.to_fs_path(doc_uri), source
-                        )
-                    )
-            except Exception as e:
-                log.exception(
-                    "Error collecting Robocop errors (possibly an unsupported Robocop version is installed)."
+                lsp_diagnostics, cacheable = self._collect_lint_diagnostics(
+                    completion_context, monitor
                 )
-                lsp_diagnostics.append(
-                    Error(
-                        f"Error collecting Robocop errors: {e}", (0, 0), (1, 0)
-                    ).to_lsp_diagnostic()
+                caches.cache_diagnostics(
+                    doc_uri,
+                    fingerprint if cacheable else None,
+                    lsp_diagnostics,
+                    dependency_graph,
+                    invalidation_tracker,
                 )
-
-            return lsp_diagnostics
+                return list(lsp_diagnostics)
         except JsonRpcRequestCancelled:
             raise JsonRpcRequestCancelled("Lint cancelled (inside lint)")
         except Exception as e:
@@ -404,6 +464,163 @@ class RobotFrameworkServerApi(PythonLanguageServer):
             ]
             return ret
 
+    def _compute_lint_fingerprint(
+        self, completion_context: ICompletionContext, dependency_graph
+    ) -> tuple:
+        """
+        Computes the fingerprint of the inputs for the lint of a document (its
+        contents, the dependencies from the dependency graph, the libspecs and
+        the robocop config).
+
+        Note: changes in the configuration clear the workspace caches (so, it's
+        not a part of the fingerprint).
+        """
+        source = completion_context.doc.source or ""
+
+        # Note: resolving the libraries may regenerate libspecs (which changes
+        # the libspec generation), so, it must be done first.
+        libraries_fingerprint = self._get_libraries_fingerprint(
+            completion_context, dependency_graph
+        )
+        return (
+            len(source),
+            hash(source),
+            dependency_graph.get_dependencies_fingerprint(),
+            libraries_fingerprint,
+            self.libspec_manager.libspec_generation,
+            self._robocop_config_generation,
+            tuple(
+                loader.get_variables()
+                for loader in completion_context.variables_from_arguments_files_loader
+            ),
+        )
+
+    def _get_libraries_fingerprint(
+        self, completion_context: ICompletionContext, dependency_graph
+    ) -> tuple:
+        """
+        Provides the libspec (and its mtime) of each library the document
+        depends on.
+
+        Note: libraries which aren't in a tracked folder (i.e.: site-packages)
+        don't change the `libspec_generation`, but resolving those checks the
+        mtime of their sources (regenerating the libspec if needed).
+        """
+        libspec_manager = self.libspec_manager
+        uri_to_context = {completion_context.doc.uri: completion_context}
+        for (
+            _node,
+            resource_doc,
+        ) in dependency_graph.iter_all_resource_imports_with_docs():
+            if resource_doc is not None and resource_doc.uri not in uri_to_context:
+                uri_to_context[resource_doc.uri] = completion_context.create_copy(
+                    resource_doc
+                )
+
+        ret: list = []
+        for doc_uri, ctx in uri_to_context.items():
+            for library_info in dependency_graph.iter_libraries(doc_uri):
+                ctx.check_cancelled()
+                library_doc_or_error = libspec_manager.get_library_doc_or_error(
+                    library_info.name,
+                    create=True,
+                    completion_context=ctx,
+                    builtin=library_info.builtin,
+                    args=library_info.args,
+                )
+                library_doc = library_doc_or_error.library_doc
+                if library_doc is None or not library_doc.filename:
+                    ret.append((library_info.name, library_doc_or_error.error))
+                    continue
+                try:
+                    mtime = os.path.getmtime(library_doc.filename)
+                except OSError:
+                    mtime = None
+                ret.append((library_info.name, library_doc.filename, mtime))
+        return tuple(ret)
+
+    def _collect_lint_diagnostics(
+        self, completion_context: ICompletionContext, monitor: IMonitor
+    ) -> Tuple[list, bool]:
+        """
+        :return:
+            A tuple(lsp diagnostics, cacheable) where cacheable is False if the
+            diagnostics depend on more than the document dependencies (i.e.:
+            unused keywords analysis uses the whole workspace) or if some error
+            happened while collecting those (in which case the diagnostics
+            aren't reused, but the document is still linted again when one of
+            its dependencies changes).
+        """
+        from robotframework_ls.impl.robot_lsp_constants import (
+            OPTION_ROBOT_LINT_ROBOCOP_ENABLED,
+            OPTION_ROBOT_LINT_ENABLED,
+            OPTION_ROBOT_LINT_UNUSED_KEYWORD,
+        )
+        from robocorp_ls_core.lsp import Error
+        from robotframework_ls.impl.ast_utils import collect_errors
+        from robotframework_ls.impl import code_analysis
+
+        doc_uri = completion_context.doc.uri
+        config = completion_context.config
+        robocop_enabled = config is None or config.get_setting(
+            OPTION_ROBOT_LINT_ROBOCOP_ENABLED, bool, False
+        )
+        cacheable = config is None or not config.get_setting(
+            OPTION_ROBOT_LINT_UNUSED_KEYWORD, bool, False
+        )
+
+        ast = completion_context.get_ast()
+        source = completion_context.doc.source
+        monitor.check_cancelled()
+        errors = collect_errors(ast)
+        log.debug("Collected AST errors (in thread): %s", len(errors))
+        monitor.check_cancelled()
+
+        lint_ls_enabled = config is None or config.get_setting(
+            OPTION_ROBOT_LINT_ENABLED, bool, True
+        )
+        if lint_ls_enabled:
+            analysis_errors = code_analysis.collect_analysis_errors(completion_context)
+            monitor.check_cancelled()
+            log.debug("Collected analysis errors (in thread): %s", len(analysis_errors))
+            errors.extend(analysis_errors)
+        else:
+            log.debug("Language server linting disabled.")
+
+        lsp_diagnostics = [error.to_lsp_diagnostic() for error in errors]
+
+        try:
+            if robocop_enabled:
+                from robocorp_ls_core.robocop_wrapper import (
+                    collect_robocop_diagnostics,
+                )
+
+                workspace = completion_context.workspace
+                if workspace is not None:
+                    project_root = workspace.root_path
+                else:
+                    project_root = os.path.abspath(".")
+
+                self._track_robocop_config_changes(project_root)
+                monitor.check_cancelled()
+                lsp_diagnostics.extend(
+                    collect_robocop_diagnostics(
+                        project_root, ast, uris.to_fs_path(doc_uri), source
+                    )
+                )
+        except Exception as e:
+            log.exception(
+                "Error collecting Robocop errors (possibly an unsupported Robocop version is installed)."
+            )
+            lsp_diagnostics.append(
+                Error(
+                    f"Error collecting Robocop errors: {e}", (0, 0), (1, 0)
+                ).to_lsp_diagnostic()
+            )
+            cacheable = False
+
+        return lsp_diagnostics, cacheable
+
     def m_resolve_completion_item(
         self,
         completion_item: CompletionItemTypedDict,
@@ -1131,8 +1348,33 @@ class RobotFrameworkServerApi(PythonLanguageServer):
             BaseContext(workspace=robot_workspace, config=self.config, monitor=monitor),
         )
 
+    @overrides(PythonLanguageServer.m_text_document__did_close)
+    def m_text_document__did_close(self, textDocument=None, **_kwargs) -> None:
+        PythonLanguageServer.m_text_document__did_close(
+            self, textDocument=textDocument, **_kwargs
+        )
+        self._semantic_tokens_cache.forget(textDocument["uri"])
+
     def m_text_document__semantic_tokens__range(self, textDocument=None, range=None):
-        raise RuntimeError("Not currently implemented!")
+        func = partial(
+            self.threaded_semantic_tokens_range, textDocument=textDocument, range=range
+        )
+        func = require_monitor(func)
+        return func
+
+    def threaded_semantic_tokens_range(
+        self,
+        textDocument: TextDocumentTypedDict,
+        range: RangeTypedDict,
+        monitor: Optional[IMonitor] = None,
+    ):
+        from robotframework_ls.impl.semantic_tokens import semantic_tokens_range
+
+        doc_uri = textDocument["uri"]
+        context = self._create_completion_context(doc_uri, -1, -1, monitor)
+        if context is None:
+            return {"resultId": None, "data": []}
+        return {"resultId": None, "data": semantic_tokens_range(context, range)}
 
     def m_text_document__semantic_tokens__full(self, textDocument=None):
         func = partial(self.threaded_semantic_tokens_full, textDocument=textDocument)
@@ -1142,13 +1384,36 @@ class RobotFrameworkServerApi(PythonLanguageServer):
     def threaded_semantic_tokens_full(
         self, textDocument: TextDocumentTypedDict, monitor: Optional[IMonitor] = None
     ):
-        from robotframework_ls.impl.semantic_tokens import semantic_tokens_full
+        doc_uri = textDocument["uri"]
+        context = self._create_completion_context(doc_uri, -1, -1, monitor)
+        if context is None:
+            return {"resultId": None, "data": []}
+        return self._semantic_tokens_cache.semantic_tokens_full(context)
+
+    def m_text_document__semantic_tokens__full__delta(
+        self, textDocument=None, previousResultId=None
+    ):
+        func = partial(
+            self.threaded_semantic_tokens_full_delta,
+            textDocument=textDocument,
+            previousResultId=previousResultId,
+        )
+        func = require_monitor(func)
+        return func
 
+    def threaded_semantic_tokens_full_delta(
+        self,
+        textDocument: TextDocumentTypedDict,
+        previousResultId: str,
+        monitor: Optional[IMonitor] = None,
+    ):
         doc_uri = textDocument["uri"]
         context = self._create_completion_context(doc_uri, -1, -1, monitor)
         if context is None:
             return {"resultId": None, "data": []}
-        return {"resultId": None, "data": semantic_tokens_full(context)}
+        return self._semantic_tokens_cache.semantic_tokens_full_delta(
+            context, previousResultId
+        )
 
     def m_monaco_completions_from_code_full(
         self,
@@ -1356,6 +1621,10 @@ class RobotFrameworkServerApi(PythonLanguageServer):
 
     def m_shutdown(self, **_kwargs):
         PythonLanguageServer.m_shutdown(self, **_kwargs)
+        with self._robocop_config_watches_lock:
+            for watch in self._robocop_config_watches.values():
+                watch.stop_tracking()
+            self._robocop_config_watches.clear()
         self.libspec_manager.dispose()
         workspace = self._workspace
         if workspace is not None:
@@ -75,6 +75,10 @@ class _ServerApi(object):
 
         self._last_settings_sent: Optional[dict] = None
 
+        # The api which converts the libspecs to markdown (requests to
+        # prioritize a conversion are forwarded to it).
+        self.markdown_conversion_api: Optional[_ServerApi] = None
+
     @property
     def stats(self) -> Optional[dict]:
         client = self._robotframework_api_client
@@ -289,6 +293,7 @@ class _ServerApi(object):
                 r = JsonRpcStreamReader(read_from)
 
                 language_server_ref = self._language_server_ref
+                markdown_conversion_api = self.markdown_conversion_api
 
                 def on_received_message(msg):
                     method = msg.get("method")
@@ -302,21 +307,34 @@ class _ServerApi(object):
                         if robot_framework_language_server is not None:
                             robot_framework_language_server.forward_msg(msg)
 
-                    # Note: note done because our caches are removed promptly
-                    # for this to work it should be invalidate but the info
-                    # should be kept around so that we lint dependencies always
-                    # not just on the first cache invalidation.
-                    # WIP: test_dependency_graph_integration_lint
-                    # elif method == "$/dependencyChanged":
-                    #     robot_framework_language_server = language_server_ref()
-                    #     if robot_framework_language_server is not None:
-                    #         params = msg.get("params")
-                    #         if params:
-                    #             uri = params.get("uri")
-                    #             if uri:
-                    #                 robot_framework_language_server.lint(
-                    #                     doc_uri=uri, is_saved=False
-                    #                 )
+                    elif method == "$/dependencyChanged":
+                        # Sent by the lint api when a dependency of an opened
+                        # document changes (so, its diagnostics may be stale).
+                        robot_framework_language_server = language_server_ref()
+                        if robot_framework_language_server is not None:
+                            params = msg.get("params")
+                            if params:
+                                uri = params.get("uri")
+                                if uri:
+                                    robot_framework_language_server.schedule_dependency_lint(
+                                        uri
+                                    )
+
+                    elif method == "$/prioritizeMarkdownConversion":
+                        # Sent by the api/others api when the docs of a library
+                        # which still wasn't converted to markdown are requested.
+                        robot_framework_language_server = language_server_ref()
+                        if (
+                            robot_framework_language_server is not None
+                            and markdown_conversion_api is not None
+                        ):
+                            params = msg.get("params")
+                            if params:
+                                spec_filename = params.get("specFilename")
+                                if spec_filename:
+                                    robot_framework_language_server.prioritize_markdown_conversion(
+                                        markdown_conversion_api, spec_filename
+                                    )
 
                 api = self._robotframework_api_client = RobotFrameworkApiClient(
                     w, r, server_process, on_received_message=on_received_message
@@ -557,6 +575,10 @@ class ServerManager(object):
 
         others_api = _ServerApi(".others.api", self._language_server_ref)
 
+        # The lint api is the one which converts the libspecs to markdown.
+        api.markdown_conversion_api = lint_api
+        others_api.markdown_conversion_api = lint_api
+
         config = self._config
         if config is not None:
             api.config = config
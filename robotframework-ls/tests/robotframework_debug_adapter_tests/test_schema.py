@@ -86,3 +86,36 @@ def test_schema():
         "type": "event",
         "event": "initialized",
     }
+
+
+def test_schema_classes_created_on_demand():
+    import pytest
+    from robocorp_ls_core.debug_adapter_core.dap import dap_base_schema
+    from robocorp_ls_core.debug_adapter_core.dap import dap_schema
+
+    # Some class which shouldn't be used elsewhere in the tests.
+    if "ReadMemoryRequest" not in dap_base_schema._all_messages:
+        assert "ReadMemoryRequest" not in dap_schema.__dict__
+        assert "ReadMemoryArguments" not in dap_schema.__dict__
+
+    request = dap_base_schema.from_dict(
+        {
+            "seq": 1,
+            "type": "request",
+            "command": "readMemory",
+            "arguments": {"memoryReference": "ref", "count": 1},
+        }
+    )
+    from robocorp_ls_core.debug_adapter_core.dap.dap_schema import (
+        ReadMemoryRequest,
+        ReadMemoryArguments,
+    )
+
+    assert request.__class__ is ReadMemoryRequest
+    assert request.arguments.__class__ is ReadMemoryArguments
+    assert dap_schema.__dict__["ReadMemoryArguments"] is ReadMemoryArguments
+    assert ReadMemoryRequest.__qualname__ == "ReadMemoryRequest"
+    assert ReadMemoryRequest.__init__.__qualname__ == "ReadMemoryRequest.__init__"
+
+    with pytest.raises(AttributeError):
+        dap_schema.NotAvailableSchemaClass
@@ -0,0 +1,6 @@
+import sys
+
+from robotframework_ls_benchmarks.bench import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,420 @@
+"""
+Benchmarks for the language server hot paths.
+
+Usage:
+
+    cd robotframework-ls/tests
+    python -m robotframework_ls_benchmarks --output=results.json [--baseline=baseline.json]
+
+The timings are collected both in-process (calling the `impl` functions
+directly) and through the `RobotFrameworkServerApi` (which is what the
+language server actually calls in the subprocess).
+
+For each benchmark the first call is reported as `cold` and the next calls as
+`warm` (so, the `cold` timing includes the time to parse/load what's needed
+and the `warm` timing shows how the caches behave).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+_RESULTS_VERSION = 1
+
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": dict(
+        suites=5,
+        resources=6,
+        import_depth=3,
+        libraries=1,
+        library_keywords=100,
+        resource_keywords=5,
+        tests_per_suite=3,
+    ),
+    "medium": dict(
+        suites=50,
+        resources=60,
+        import_depth=5,
+        libraries=2,
+        library_keywords=1000,
+        resource_keywords=20,
+        tests_per_suite=10,
+    ),
+    "large": dict(
+        suites=200,
+        resources=300,
+        import_depth=10,
+        libraries=4,
+        library_keywords=3000,
+        resource_keywords=30,
+        tests_per_suite=20,
+    ),
+}
+
+
+class _Results(object):
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.name_to_times: Dict[str, List[float]] = {}
+
+    def measure(self, name: str, func: Callable[[], Any], cold=True) -> None:
+        """
+        :param cold:
+            If True the first call is reported as `<name>.cold` and the
+            remaining as `<name>.warm`.
+        """
+        times = []
+        for _i in range(self.repeat + (1 if cold else 0)):
+            initial_time = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - initial_time)
+
+        if cold:
+            self.add(name + ".cold", times[:1])
+            self.add(name + ".warm", times[1:])
+        else:
+            self.add(name, times)
+
+    def add(self, name: str, times: List[float]) -> None:
+        if times:
+            self.name_to_times.setdefault(name, []).extend(times)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        ret = {}
+        for name, times in sorted(self.name_to_times.items()):
+            ret[name] = {
+                "times": times,
+                "min": min(times),
+                "median": statistics.median(times),
+                "mean": statistics.mean(times),
+            }
+        return ret
+
+
+def _create_libspec_manager(cache_dir: str):
+    from robotframework_ls.impl.libspec_manager import LibspecManager
+
+    return LibspecManager(
+        user_libspec_dir=os.path.join(cache_dir, "user_libspec"),
+        cache_libspec_dir=os.path.join(cache_dir, "cache_libspec"),
+        dir_cache_dir=os.path.join(cache_dir, ".cache"),
+    )
+
+
+def _create_workspace(root: str, libspec_manager, index_workspace=False):
+    from robocorp_ls_core import uris
+    from robocorp_ls_core.watchdog_wrapper import create_observer
+    from robotframework_ls.impl.robot_workspace import RobotWorkspace
+
+    return RobotWorkspace(
+        uris.from_fs_path(root),
+        create_observer("dummy", ()),
+        libspec_manager=libspec_manager,
+        index_workspace=index_workspace,
+    )
+
+
+def _create_completion_context(workspace, filename: str, line: int, col: int):
+    from robocorp_ls_core import uris
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.robot_config import RobotConfig
+
+    doc = workspace.get_document(uris.from_fs_path(filename), accept_from_file=True)
+    return CompletionContext(doc, line, col, workspace=workspace, config=RobotConfig())
+
+
+def _bench_libspec_manager(results: _Results, workspace_info, cache_dir: str):
+    """
+    Cold: libspecs must be generated. Warm: the libspecs (and the related
+    caches) were already created by a previous LibspecManager.
+    """
+    from robotframework_ls.impl.robot_workspace import RobotDocument
+    from robotframework_ls.impl.completion_context import CompletionContext
+
+    def load_libraries():
+        libspec_manager = _create_libspec_manager(cache_dir)
+        try:
+            workspace = _create_workspace(workspace_info.root, libspec_manager)
+            doc = RobotDocument(
+                os.path.join(workspace_info.root, "suites", "__bench__.robot"), ""
+            )
+            ctx = CompletionContext(doc, workspace=workspace)
+            for name in ["BuiltIn"] + [
+                "../libs/" + os.path.basename(lib) for lib in workspace_info.libraries
+            ]:
+                library_doc_or_error = libspec_manager.get_library_doc_or_error(
+                    name, create=True, completion_context=ctx
+                )
+                assert (
+                    library_doc_or_error.library_doc is not None
+                ), library_doc_or_error.error
+        finally:
+            libspec_manager.dispose()
+
+    results.measure("libspec_manager.start", load_libraries)
+
+
+def _bench_in_process(results: _Results, workspace_info, libspec_manager) -> None:
+    from robotframework_ls.impl import code_analysis
+    from robotframework_ls.impl import keyword_completions
+    from robotframework_ls.impl.find_definition import find_definition
+    from robotframework_ls.impl.references import references
+    from robotframework_ls.impl.semantic_tokens import semantic_tokens_full
+    from robotframework_ls.impl.workspace_symbols import workspace_symbols
+
+    # Note: the workspace is indexed as workspace symbols require it.
+    workspace = _create_workspace(
+        workspace_info.root, libspec_manager, index_workspace=True
+    )
+    filename, line, col = workspace_info.keyword_usage
+
+    def create_ctx():
+        return _create_completion_context(workspace, filename, line, col)
+
+    results.measure(
+        "inprocess.keyword_completions",
+        lambda: keyword_completions.complete(create_ctx()),
+    )
+    results.measure(
+        "inprocess.semantic_tokens_full",
+        lambda: semantic_tokens_full(create_ctx()),
+    )
+    results.measure(
+        "inprocess.collect_analysis_errors",
+        lambda: code_analysis.collect_analysis_errors(create_ctx()),
+    )
+    results.measure(
+        "inprocess.find_definition",
+        lambda: find_definition(create_ctx()),
+    )
+    results.measure(
+        "inprocess.workspace_symbols",
+        lambda: workspace_symbols("Keyword", create_ctx()),
+    )
+
+    filename, line, col = workspace_info.keyword_definition
+    results.measure(
+        "inprocess.references",
+        lambda: references(
+            _create_completion_context(workspace, filename, line, col),
+            include_declaration=True,
+        ),
+    )
+    workspace.dispose()
+
+
+def _call_server_api(result):
+    from robocorp_ls_core.jsonrpc.monitor import Monitor
+
+    if callable(result):
+        if getattr(result, "__require_monitor__", False):
+            return result(monitor=Monitor())
+        return result()
+    return result
+
+
+def _bench_server_api(results: _Results, workspace_info, libspec_manager) -> None:
+    from io import BytesIO
+    from robocorp_ls_core import uris
+    from robotframework_ls.server_api.server import RobotFrameworkServerApi
+
+    api = RobotFrameworkServerApi(
+        BytesIO(), BytesIO(), libspec_manager=libspec_manager, index_workspace=True
+    )
+    api.m_initialize(rootUri=uris.from_fs_path(workspace_info.root))
+
+    filename, line, col = workspace_info.keyword_usage
+    doc_uri = uris.from_fs_path(filename)
+
+    results.measure(
+        "server_api.complete_all",
+        lambda: _call_server_api(api.m_complete_all(doc_uri, line, col)),
+    )
+    results.measure(
+        "server_api.semantic_tokens_full",
+        lambda: _call_server_api(
+            api.m_text_document__semantic_tokens__full(textDocument={"uri": doc_uri})
+        ),
+    )
+    last_semantic_tokens = _call_server_api(
+        api.m_text_document__semantic_tokens__full(textDocument={"uri": doc_uri})
+    )
+
+    def semantic_tokens_full_delta():
+        nonlocal last_semantic_tokens
+        last_semantic_tokens = _call_server_api(
+            api.m_text_document__semantic_tokens__full__delta(
+                textDocument={"uri": doc_uri},
+                previousResultId=last_semantic_tokens["resultId"],
+            )
+        )
+
+    results.measure("server_api.semantic_tokens_full_delta", semantic_tokens_full_delta)
+    results.measure(
+        "server_api.lint",
+        lambda: _call_server_api(api.m_lint(doc_uri)),
+    )
+    results.measure(
+        "server_api.find_definition",
+        lambda: _call_server_api(api.m_find_definition(doc_uri, line, col)),
+    )
+    results.measure(
+        "server_api.workspace_symbols",
+        lambda: _call_server_api(api.m_workspace_symbols("Keyword")),
+    )
+
+    filename, line, col = workspace_info.keyword_definition
+    definition_uri = uris.from_fs_path(filename)
+    results.measure(
+        "server_api.references",
+        lambda: _call_server_api(
+            api.m_references(definition_uri, line, col, include_declaration=True)
+        ),
+    )
+    # Note: the libspec manager is disposed by the caller.
+    workspace = api.workspace
+    if workspace is not None:
+        workspace.dispose()
+
+
+def _get_environment() -> Dict[str, str]:
+    import robotframework_ls
+    from robotframework_ls.impl.robot_version import get_robot_version
+
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "robot": get_robot_version(),
+        "robotframework_ls": robotframework_ls.__version__,
+    }
+
+
+def run_benchmarks(
+    size: str = "medium", repeat: int = 5, work_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    :return:
+        A dict which may be saved as json with the results.
+    """
+    from robotframework_ls_benchmarks.workspace_generator import generate_workspace
+
+    if work_dir is None:
+        work_dir = tempfile.mkdtemp(prefix="rf_ls_bench_")
+
+    workspace_info = generate_workspace(
+        os.path.join(work_dir, "workspace"), **SIZES[size]
+    )
+    cache_dir = os.path.join(work_dir, "cache")
+
+    results = _Results(repeat)
+    _bench_libspec_manager(results, workspace_info, cache_dir)
+
+    libspec_manager = _create_libspec_manager(cache_dir)
+    try:
+        _bench_in_process(results, workspace_info, libspec_manager)
+        _bench_server_api(results, workspace_info, libspec_manager)
+    finally:
+        libspec_manager.dispose()
+
+    return {
+        "version": _RESULTS_VERSION,
+        "size": size,
+        "repeat": repeat,
+        "workspace": workspace_info.params,
+        "environment": _get_environment(),
+        "results": results.to_dict(),
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Compares the median of each benchmark with the baseline.
+
+    :param threshold:
+        The ratio (i.e.: 0.2 means 20% slower) from which a benchmark is
+        considered a regression.
+    """
+    ret = []
+    baseline_results = baseline.get("results", {})
+    for name, info in sorted(current["results"].items()):
+        baseline_info = baseline_results.get(name)
+        if not baseline_info or not baseline_info["median"]:
+            continue
+        ratio = info["median"] / baseline_info["median"]
+        ret.append(
+            {
+                "name": name,
+                "median": info["median"],
+                "baseline_median": baseline_info["median"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return ret
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks for the Robot Framework Language Server."
+    )
+    parser.add_argument("--size", choices=sorted(SIZES), default="medium")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of warm calls for each benchmark.",
+    )
+    parser.add_argument("--output", help="Where the json results should be saved.")
+    parser.add_argument("--baseline", help="Results to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Ratio from which a slowdown is considered a regression (default: 0.2).",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with 1 if some regression is found compared to the baseline.",
+    )
+    parser.add_argument(
+        "--work-dir",
+        help="Directory where the workspace/caches are created (default: a new "
+        "temporary directory).",
+    )
+    options = parser.parse_args(args=args)
+
+    current = run_benchmarks(options.size, options.repeat, options.work_dir)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as stream:
+            json.dump(current, stream, indent=2)
+
+    for name, info in current["results"].items():
+        print(f"{name:<45} median: {info['median'] * 1000:10.2f}ms")
+
+    if not options.baseline:
+        return 0
+
+    with open(options.baseline, "r", encoding="utf-8") as stream:
+        baseline = json.load(stream)
+
+    print()
+    print(f"Compared to: {options.baseline}")
+    found_regression = False
+    for comparison in compare(current, baseline, options.threshold):
+        marker = ""
+        if comparison["regression"]:
+            found_regression = True
+            marker = "  <-- REGRESSION"
+        print(f"{comparison['name']:<45} ratio: {comparison['ratio']:6.2f}{marker}")
+
+    if found_regression and options.fail_on_regression:
+        return 1
+    return 0
@@ -0,0 +1,157 @@
+"""
+Generates a synthetic workspace to be used in the benchmarks.
+
+The generated layout is:
+
+    libs/BenchLibrary<i>.py
+        Python libraries with many keywords.
+
+    resources/res<j>.resource
+        Resources organized in import chains (each resource imports the next
+        one in its chain, so, the last resource of a chain is `depth` imports
+        away from the suites).
+
+    suites/suite<k>.robot
+        Suites importing the start of a resource chain and all the libraries,
+        with tests calling keywords from the resources, libraries and BuiltIn.
+"""
+import os
+from typing import Dict, List, Tuple
+
+
+class WorkspaceInfo(object):
+    def __init__(self, root: str, params: Dict[str, int]):
+        self.root = root
+        self.params = params
+        self.suites: List[str] = []
+        self.resources: List[str] = []
+        self.libraries: List[str] = []
+
+        # Some position of interest (filename, line, col) -- 0-based.
+
+        # The end of a keyword call which resolves to a keyword in a resource
+        # at the end of an import chain.
+        self.keyword_usage: Tuple[str, int, int] = ("", 0, 0)
+
+        # The name of a keyword defined in a resource (used by many suites).
+        self.keyword_definition: Tuple[str, int, int] = ("", 0, 0)
+
+
+def _write(path: str, contents: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as stream:
+        stream.write(contents)
+
+
+def _resource_keyword_name(resource_index: int, keyword_index: int) -> str:
+    return f"Resource {resource_index} Keyword {keyword_index}"
+
+
+def generate_workspace(
+    root: str,
+    suites: int = 50,
+    resources: int = 60,
+    import_depth: int = 5,
+    libraries: int = 2,
+    library_keywords: int = 1000,
+    resource_keywords: int = 20,
+    tests_per_suite: int = 10,
+) -> WorkspaceInfo:
+    """
+    :param root:
+        The directory where the workspace should be created.
+
+    :param resources:
+        The total number of resources (split in chains of `import_depth`
+        resources).
+    """
+    info = WorkspaceInfo(
+        root,
+        dict(
+            suites=suites,
+            resources=resources,
+            import_depth=import_depth,
+            libraries=libraries,
+            library_keywords=library_keywords,
+            resource_keywords=resource_keywords,
+            tests_per_suite=tests_per_suite,
+        ),
+    )
+    import_depth = max(1, min(import_depth, resources))
+
+    for i in range(libraries):
+        lines = [f"class BenchLibrary{i}(object):"]
+        for k in range(library_keywords):
+            lines.append(f"    def library_{i}_keyword_{k}(self, arg1, arg2=None):")
+            lines.append(f'        """Keyword {k} of library {i}.')
+            lines.append("")
+            lines.append("        Some *documentation* with `arg1` and `arg2`.")
+            lines.append('        """')
+            lines.append("")
+        path = os.path.join(root, "libs", f"BenchLibrary{i}.py")
+        _write(path, "\n".join(lines) + "\n")
+        info.libraries.append(path)
+
+    for j in range(resources):
+        is_chain_end = (j + 1) % import_depth == 0 or j + 1 == resources
+        lines = ["*** Settings ***"]
+        if not is_chain_end:
+            lines.append(f"Resource    res{j + 1}.resource")
+        lines.append("")
+        lines.append("*** Variables ***")
+        lines.append(f"${{RESOURCE_{j}_VAR}}    value {j}")
+        lines.append("")
+        lines.append("*** Keywords ***")
+        for k in range(resource_keywords):
+            lines.append(_resource_keyword_name(j, k))
+            lines.append("    [Arguments]    ${arg}=default")
+            lines.append(f"    Log    ${{arg}} ${{RESOURCE_{j}_VAR}}")
+            if not is_chain_end:
+                lines.append(f"    {_resource_keyword_name(j + 1, k)}")
+            lines.append("")
+        path = os.path.join(root, "resources", f"res{j}.resource")
+        _write(path, "\n".join(lines))
+        info.resources.append(path)
+
+    chain_starts = list(range(0, resources, import_depth)) or [0]
+    for s in range(suites):
+        chain_start = chain_starts[s % len(chain_starts)]
+        chain_end = min(chain_start + import_depth, resources) - 1
+
+        lines = ["*** Settings ***"]
+        if resources:
+            lines.append(f"Resource    ../resources/res{chain_start}.resource")
+        for i in range(libraries):
+            lines.append(f"Library    ../libs/BenchLibrary{i}.py")
+        lines.append("")
+        lines.append("*** Variables ***")
+        lines.append(f"${{SUITE_VAR}}    suite {s}")
+        lines.append("")
+        lines.append("*** Test Cases ***")
+        for t in range(tests_per_suite):
+            lines.append(f"Test {t}")
+            lines.append("    Log    ${SUITE_VAR}")
+            if libraries:
+                keyword = t % library_keywords
+                lines.append(f"    Library {t % libraries} Keyword {keyword}    arg")
+            if resources:
+                keyword_line = len(lines)
+                keyword_usage = _resource_keyword_name(chain_end, t % resource_keywords)
+                lines.append(f"    {keyword_usage}")
+                if s == 0 and t == 0:
+                    info.keyword_usage = (
+                        os.path.join(root, "suites", f"suite{s}.robot"),
+                        keyword_line,
+                        4 + len(keyword_usage),
+                    )
+            lines.append("")
+        path = os.path.join(root, "suites", f"suite{s}.robot")
+        _write(path, "\n".join(lines))
+        info.suites.append(path)
+
+    if resources:
+        # The first keyword of the resource at the end of the first chain.
+        chain_end = min(import_depth, resources) - 1
+        info.keyword_definition = (info.resources[chain_end], 6, 0)
+
+    return info
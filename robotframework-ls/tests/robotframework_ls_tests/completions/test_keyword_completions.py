@@ -1137,3 +1137,38 @@ My Keyword
 My Test
     [Template]    My Keyword"""
     )
+
+
+def test_keyword_name_index():
+    from robotframework_ls.impl.keyword_name_index import KeywordNameIndex
+    from robotframework_ls.impl.string_matcher import RobotStringMatcher
+
+    names = [
+        "Should Be Equal",
+        "Should_Be_Equal_As_Integers",
+        "Log",
+        "Log Many",
+        "Log To Console",
+        "Catenate",
+        "Set ${var} Value",
+        "should be equal",
+    ]
+    index = KeywordNameIndex(names, lambda name: name)
+    assert len(index) == len(names)
+
+    for filter_text in ["", "l", "lo", "log", "beeq", "equal", "Be Equal", "xyz", "${"]:
+        matcher = RobotStringMatcher(filter_text)
+        expected = [
+            i for i, name in enumerate(names) if matcher.accepts_keyword_name(name)
+        ]
+        assert list(index.iter_containing(matcher.filter_text)) == expected
+
+        expected = [
+            i for i, name in enumerate(names) if matcher.is_same_robot_name(name)
+        ]
+        assert list(index.iter_same_name(matcher.filter_text)) == expected
+
+    assert [index.get_item(i) for i in index.iter_same_name("shouldbeequal")] == [
+        "Should Be Equal",
+        "should be equal",
+    ]
@@ -90,6 +90,115 @@ def test_server(server_api_process_io: IRobotFrameworkApiClient, data_regression
     data_regression.check(sort_diagnostics(diag), basename="errors")
 
 
+def test_server_lint_many(server_api_process_io: IRobotFrameworkApiClient):
+    server_api_process_io.initialize(process_id=os.getpid())
+
+    server_api_process_io.open("untitled1.resource", 1, "*** foo bar ***")
+    server_api_process_io.open("untitled2.resource", 1, "*** Keywords ***")
+
+    message_matcher = server_api_process_io.request_lint_many(
+        ["untitled1.resource", "untitled2.resource"]
+    )
+    assert message_matcher is not None
+    assert message_matcher.event.wait(30)
+    result = message_matcher.msg["result"]
+    assert set(result.keys()) == {"untitled1.resource", "untitled2.resource"}
+    assert len(result["untitled1.resource"]) == 1
+    assert result["untitled2.resource"] == []
+
+
+def test_server_lint_dependency_changed(
+    server_api_process_io: IRobotFrameworkApiClient, tmpdir
+):
+    from robocorp_ls_core import uris
+
+    root_uri = uris.from_fs_path(str(tmpdir))
+    server_api_process_io.initialize(process_id=os.getpid(), root_uri=root_uri)
+
+    resource_uri = uris.from_fs_path(str(tmpdir.join("shared.resource")))
+    robot_uri = uris.from_fs_path(str(tmpdir.join("my.robot")))
+
+    server_api_process_io.open(resource_uri, 1, "*** Keywords ***\n")
+    server_api_process_io.open(
+        robot_uri,
+        1,
+        """*** Settings ***
+Resource    shared.resource
+
+*** Test Cases ***
+My Test
+    My Keyword
+""",
+    )
+
+    diag = server_api_process_io.lint(robot_uri)["result"]
+    assert len(diag) == 1
+    assert "My Keyword" in diag[0]["message"]
+
+    # Nothing changed: the same diagnostics are provided (from the cache).
+    assert server_api_process_io.lint(robot_uri)["result"] == diag
+
+    # Changing the resource must notify that the (opened) robot file depends on
+    # it (so, it should be linted again).
+    message_matcher = server_api_process_io.obtain_pattern_message_matcher(
+        {"method": "$/dependencyChanged"}
+    )
+    server_api_process_io.open(
+        resource_uri,
+        2,
+        """*** Keywords ***
+My Keyword
+    No Operation
+""",
+    )
+    assert message_matcher.event.wait(10)
+    assert message_matcher.msg["params"] == {"uri": robot_uri}
+
+    assert server_api_process_io.lint(robot_uri)["result"] == []
+
+
+def test_server_lint_library_outside_workspace_changed(
+    server_api_process_io: IRobotFrameworkApiClient, tmpdir
+):
+    from robocorp_ls_core import uris
+
+    workspace_dir = str(tmpdir.join("ws"))
+    os.makedirs(workspace_dir)
+    # i.e.: not in a tracked folder (such as site-packages).
+    library = str(tmpdir.join("site", "outside_lib.py"))
+    os.makedirs(os.path.dirname(library))
+    with open(library, "w") as stream:
+        stream.write("def my_keyword():\n    pass\n")
+
+    server_api_process_io.initialize(
+        process_id=os.getpid(), root_uri=uris.from_fs_path(workspace_dir)
+    )
+    robot_uri = uris.from_fs_path(os.path.join(workspace_dir, "my.robot"))
+    server_api_process_io.open(
+        robot_uri,
+        1,
+        f"""*** Settings ***
+Library    {library}
+
+*** Test Cases ***
+My Test
+    My Keyword
+    Other Keyword
+""",
+    )
+
+    diag = server_api_process_io.lint(robot_uri)["result"]
+    assert [d["message"] for d in diag] == ["Undefined keyword: Other Keyword."]
+
+    with open(library, "w") as stream:
+        stream.write("def my_keyword():\n    pass\n\ndef other_keyword():\n    pass\n")
+    mtime = os.path.getmtime(library) + 5
+    os.utime(library, (mtime, mtime))
+
+    # The cached diagnostics must not be used as the library changed.
+    assert server_api_process_io.lint(robot_uri)["result"] == []
+
+
 def test_server_cancel(
     server_api_process_io: IRobotFrameworkApiClient, data_regression
 ):
@@ -0,0 +1,70 @@
+def test_benchmarks_small(tmpdir):
+    from robotframework_ls_benchmarks import bench
+
+    results = bench.run_benchmarks("small", repeat=1, work_dir=str(tmpdir))
+    names = set(results["results"])
+    for name in (
+        "libspec_manager.start",
+        "inprocess.keyword_completions",
+        "inprocess.semantic_tokens_full",
+        "inprocess.collect_analysis_errors",
+        "inprocess.find_definition",
+        "inprocess.references",
+        "inprocess.workspace_symbols",
+        "server_api.complete_all",
+        "server_api.semantic_tokens_full",
+        "server_api.semantic_tokens_full_delta",
+        "server_api.lint",
+        "server_api.find_definition",
+        "server_api.references",
+        "server_api.workspace_symbols",
+    ):
+        assert name + ".cold" in names
+        assert name + ".warm" in names
+
+    def scaled(factor):
+        return {
+            "results": {
+                name: dict(info, median=info["median"] * factor)
+                for name, info in results["results"].items()
+            }
+        }
+
+    comparison = bench.compare(scaled(1.5), results, threshold=0.2)
+    assert len(comparison) == len(names)
+    assert all(c["regression"] for c in comparison)
+
+    comparison = bench.compare(scaled(0.5), results, threshold=0.2)
+    assert len(comparison) == len(names)
+    assert not any(c["regression"] for c in comparison)
+
+
+def test_benchmarks_compare():
+    from robotframework_ls_benchmarks import bench
+
+    baseline = {
+        "results": {
+            "slower": {"median": 1.0},
+            "within_threshold": {"median": 1.0},
+            "faster": {"median": 1.0},
+            "no_baseline_median": {"median": 0.0},
+        }
+    }
+    current = {
+        "results": {
+            "slower": {"median": 1.5},
+            "within_threshold": {"median": 1.1},
+            "faster": {"median": 0.5},
+            "no_baseline_median": {"median": 1.0},
+            "new_benchmark": {"median": 1.0},
+        }
+    }
+
+    comparison = bench.compare(current, baseline, threshold=0.2)
+    name_to_regression = {c["name"]: c["regression"] for c in comparison}
+    assert name_to_regression == {
+        "slower": True,
+        "within_threshold": False,
+        "faster": False,
+    }
+    assert [c["ratio"] for c in comparison if c["name"] == "slower"] == [1.5]
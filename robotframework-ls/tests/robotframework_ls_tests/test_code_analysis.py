@@ -2900,3 +2900,75 @@ Mark unused used
     # It'll turn out ok when our indexes are updated based on changes in the
     # filesystem.
     wait_for_non_error_condition(check)
+
+
+def test_code_analysis_reuses_unchanged_blocks(workspace, libspec_manager):
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.code_analysis import collect_analysis_errors
+
+    workspace.set_root("case2", libspec_manager=libspec_manager)
+    caches = workspace.ws.completion_context_workspace_caches
+
+    def collect(source):
+        doc = workspace.put_doc("case2.robot", source)
+        errors = collect_analysis_errors(CompletionContext(doc, workspace=workspace.ws))
+        return dict((error.msg, error) for error in errors)
+
+    def check_same_as_full_analysis(source, errors):
+        caches.clear_caches()
+        expected = collect(source)
+        assert sorted(expected) == sorted(errors)
+        for msg, error in expected.items():
+            assert error.to_dict() == errors[msg].to_dict()
+
+    source = """
+*** Test Cases ***
+Test A
+    Undefined A    ${undefined_a}
+
+Test B
+    Undefined B
+"""
+    errors1 = collect(source)
+    assert sorted(errors1) == [
+        "Undefined keyword: Undefined A.",
+        "Undefined keyword: Undefined B.",
+        "Undefined variable: undefined_a",
+    ]
+
+    # Changing `Test B` reuses the analysis of `Test A`.
+    source = source.replace("Undefined B", "Undefined B2")
+    errors2 = collect(source)
+    assert errors2["Undefined keyword: Undefined A."] is (
+        errors1["Undefined keyword: Undefined A."]
+    )
+    assert errors2["Undefined variable: undefined_a"] is (
+        errors1["Undefined variable: undefined_a"]
+    )
+    assert "Undefined keyword: Undefined B2." in errors2
+    check_same_as_full_analysis(source, errors2)
+
+    # Adding a test before `Test A` shifts the errors reused.
+    source = source.replace(
+        "*** Test Cases ***\n", "*** Test Cases ***\nTest C\n    Undefined C\n\n"
+    )
+    errors3 = collect(source)
+    assert errors3["Undefined keyword: Undefined A."].start[0] == (
+        errors2["Undefined keyword: Undefined A."].start[0] + 3
+    )
+    check_same_as_full_analysis(source, errors3)
+
+    # Defining a keyword in the document analyzes all the tests again.
+    source += """
+*** Keywords ***
+Undefined A
+    [Arguments]    ${arg}
+    No Operation
+"""
+    errors4 = collect(source)
+    assert sorted(errors4) == [
+        "Undefined keyword: Undefined B2.",
+        "Undefined keyword: Undefined C.",
+        "Undefined variable: undefined_a",
+    ]
+    check_same_as_full_analysis(source, errors4)
@@ -383,3 +383,114 @@ def test_dependency_graph_invalidate_unresolved_with_vars_2(workspace):
     context = CompletionContext(robot_doc, workspace=workspace.ws)
     dependency_graph = context.collect_dependency_graph()
     assert caches.cache_hits == 2  # i.e. no hits...
+
+
+def test_keywords_table_shared_among_contexts(workspace):
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.collect_keywords import (
+        collect_keyword_name_to_keyword_found,
+    )
+
+    workspace.set_root("case_deps")
+    workspace.put_doc(
+        "my_resource.robot",
+        """
+*** Keywords ***
+Resource Keyword
+    [Arguments]    ${arg}
+    Log    ${arg}
+""",
+    )
+    doc = workspace.get_doc("root.robot")
+
+    ws: IRobotWorkspace = workspace.ws
+    caches: ICompletionContextWorkspaceCaches = ws.completion_context_workspace_caches
+
+    context = CompletionContext(doc, workspace=workspace.ws)
+    found1 = collect_keyword_name_to_keyword_found(context)["Resource Keyword"][0]
+    hits = caches.keywords_table_hits
+
+    context = CompletionContext(doc, workspace=workspace.ws)
+    found2 = collect_keyword_name_to_keyword_found(context)["Resource Keyword"][0]
+    assert caches.keywords_table_hits > hits
+
+    # The definition is shared but the keyword found is bound to each context.
+    assert found1 is not found2
+    assert found1._definition is found2._definition
+    assert found2.completion_context.original_doc is doc
+    assert [x.original_arg for x in found2.keyword_args] == ["${arg}"]
+
+    # Changing the resource must provide a new table.
+    workspace.put_doc(
+        "my_resource.robot",
+        """
+*** Keywords ***
+Resource Keyword
+    [Arguments]    ${arg}    ${arg2}
+    Log    ${arg}
+""",
+    )
+    context = CompletionContext(doc, workspace=workspace.ws)
+    found3 = collect_keyword_name_to_keyword_found(context)["Resource Keyword"][0]
+    assert found3._definition is not found2._definition
+    assert [x.original_arg for x in found3.keyword_args] == ["${arg}", "${arg2}"]
+
+
+def test_diagnostics_cache_reverse_dependencies(workspace):
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.completion_context_workspace_caches import (
+        CompletionContextWorkspaceCaches,
+    )
+
+    workspace.set_root("case_deps")
+    resource_doc = workspace.get_doc("my_resource.robot")
+    other_doc = workspace.get_doc("some_resource.resource")
+    doc = workspace.get_doc("root.robot")
+
+    context = CompletionContext(doc, workspace=workspace.ws)
+    dependency_graph = context.collect_dependency_graph()
+    fingerprint = dependency_graph.get_dependencies_fingerprint()
+
+    changed = []
+    caches = CompletionContextWorkspaceCaches(on_dependency_changed=changed.append)
+    diagnostics = [{"message": "Some error"}]
+    with caches.invalidation_tracker() as invalidation_tracker:
+        caches.cache_diagnostics(
+            doc.uri, fingerprint, diagnostics, dependency_graph, invalidation_tracker
+        )
+
+    assert caches.get_cached_diagnostics(doc.uri, fingerprint) == diagnostics
+    assert caches.get_cached_diagnostics(doc.uri, "other") is None
+    assert caches.diagnostics_hits == 1
+
+    # Changing something which isn't a dependency keeps the diagnostics.
+    caches.on_updated_document(other_doc.uri, None)
+    assert caches.get_cached_diagnostics(doc.uri, fingerprint) == diagnostics
+    assert changed == []
+
+    # Changing a dependency removes the diagnostics and notifies about it.
+    caches.on_updated_document(resource_doc.uri, None)
+    assert changed == [doc.uri]
+    assert caches.get_cached_diagnostics(doc.uri, fingerprint) is None
+
+    # Only notified again after it's cached again.
+    caches.on_updated_document(resource_doc.uri, None)
+    assert changed == [doc.uri]
+
+    # When not cacheable the diagnostics aren't reused, but the dependency is
+    # still tracked.
+    with caches.invalidation_tracker() as invalidation_tracker:
+        caches.cache_diagnostics(
+            doc.uri, None, diagnostics, dependency_graph, invalidation_tracker
+        )
+    assert caches.get_cached_diagnostics(doc.uri, None) is None
+    caches.on_file_changed(resource_doc.path)
+    assert changed == [doc.uri, doc.uri]
+
+    # A change in the dependency while linting prevents it from being cached.
+    with caches.invalidation_tracker() as invalidation_tracker:
+        caches.on_updated_document(resource_doc.uri, None)
+        caches.cache_diagnostics(
+            doc.uri, fingerprint, diagnostics, dependency_graph, invalidation_tracker
+        )
+    assert caches.get_cached_diagnostics(doc.uri, fingerprint) is None
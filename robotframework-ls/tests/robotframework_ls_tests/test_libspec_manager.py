@@ -334,6 +334,56 @@ def test_libspec_manager_caches(libspec_manager, workspace_dir):
     wait_for_test_condition(check_spec_2_a, sleep=1 / 5.0)
 
 
+def test_libspec_manager_index(libspec_manager, workspace_dir):
+    from robotframework_ls_tests.fixtures import LIBSPEC_1
+    from robotframework_ls_tests.fixtures import LIBSPEC_2
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.robot_workspace import RobotDocument
+    from robotframework_ls.impl.libspec_warmup import _norm_filename
+
+    workspace_dir_a = os.path.join(workspace_dir, "workspace_dir_a")
+    os.makedirs(workspace_dir_a)
+    with open(os.path.join(workspace_dir_a, "my.libspec"), "w") as stream:
+        stream.write(LIBSPEC_1)
+    with open(os.path.join(workspace_dir_a, "my2.libspec"), "w") as stream:
+        stream.write(LIBSPEC_2)
+    folder_uri = uris.from_fs_path(workspace_dir_a)
+    libspec_manager.add_workspace_folder(folder_uri)
+
+    uri = uris.from_fs_path(os.path.join(workspace_dir, "case.robot"))
+    folder_info = libspec_manager._workspace_folder_uri_to_folder_info[folder_uri]
+    filename_to_info = folder_info.libspec_canonical_filename_to_info
+
+    assert (
+        libspec_manager.get_library_doc_or_error(
+            "not_there",
+            create=False,
+            completion_context=CompletionContext(RobotDocument(uri, "")),
+        ).library_doc
+        is None
+    )
+    # Nothing loaded as nothing matched.
+    assert set(filename_to_info.values()) == {None}
+
+    library_doc = libspec_manager.get_library_doc_or_error(
+        "CASE1_LIBRARY",
+        create=False,
+        completion_context=CompletionContext(RobotDocument(uri, "")),
+    ).library_doc
+    assert library_doc is not None
+    assert library_doc.name == "case1_library"
+
+    # Only the matched libspec must be loaded.
+    assert (
+        filename_to_info[_norm_filename(os.path.join(workspace_dir_a, "my.libspec"))]
+        is not None
+    )
+    assert (
+        filename_to_info[_norm_filename(os.path.join(workspace_dir_a, "my2.libspec"))]
+        is None
+    )
+
+
 def test_libspec_manager_json_html(workspace, libspec_manager):
     from robotframework_ls.impl.completion_context import CompletionContext
     import json
@@ -460,3 +510,208 @@ def test_libspec_manager_basic(workspace, libspec_manager):
 
     assert get_library_doc_or_error("case1_library", create=False).library_doc is None
     assert get_library_doc_or_error("case1_library").library_doc is not None
+
+
+def test_libdoc_worker_pool(tmpdir):
+    from robotframework_ls.impl.libdoc_worker_pool import LibdocWorkerPool
+
+    lib_dir = str(tmpdir.join("lib"))
+    os.makedirs(lib_dir)
+    lib_filename = os.path.join(lib_dir, "pool_lib.py")
+    spec_filename = str(tmpdir.join("pool_lib.libspec"))
+
+    def write_lib(keyword_name):
+        with open(lib_filename, "w") as stream:
+            stream.write(f"def {keyword_name}():\n    pass\n")
+
+    def run_libdoc():
+        returncode, output = pool.run_libdoc(
+            ["--format", "XML", "-P", lib_dir, "pool_lib", spec_filename], None
+        )
+        assert returncode == 0, output
+        with open(spec_filename, "r", encoding="utf-8") as stream:
+            return stream.read()
+
+    pool = LibdocWorkerPool(1, 2)
+    try:
+        write_lib("first_keyword")
+        assert "First Keyword" in run_libdoc()
+        worker = pool._idle[0]
+
+        # The library must be re-imported (not kept in the worker).
+        write_lib("second_keyword")
+        contents = run_libdoc()
+        assert "Second Keyword" in contents
+        assert "First Keyword" not in contents
+
+        # Recycled after 2 jobs.
+        assert not pool._idle
+        assert not worker.is_alive()
+
+        returncode, output = pool.run_libdoc(["invalid_lib", spec_filename], None)
+        assert returncode != 0
+        assert "invalid_lib" in output
+    finally:
+        pool.dispose()
+
+
+def test_libdoc_worker_pool_cwd(tmpdir):
+    from robotframework_ls.impl.libdoc_worker_pool import LibdocWorkerPool
+
+    cwd = str(tmpdir.join("cwd"))
+    os.makedirs(cwd)
+    with open(os.path.join(cwd, "cwdlib.py"), "w") as stream:
+        stream.write("def cwd_keyword():\n    pass\n")
+
+    # Same name of a module in the directory of the worker.
+    with open(os.path.join(cwd, "hover.py"), "w") as stream:
+        stream.write("def cwd_hover_keyword():\n    pass\n")
+
+    pool = LibdocWorkerPool(1, 10)
+    try:
+        for library, keyword in (
+            ("cwdlib", "Cwd Keyword"),
+            ("hover", "Cwd Hover Keyword"),
+        ):
+            spec_filename = str(tmpdir.join(library + ".libspec"))
+            # Only importable from the cwd.
+            returncode, output = pool.run_libdoc(
+                ["--format", "XML", library, spec_filename], cwd
+            )
+            assert returncode == 0, output
+            with open(spec_filename, "r", encoding="utf-8") as stream:
+                assert keyword in stream.read()
+
+        # The cwd is only in the sys.path while the job runs.
+        returncode, output = pool.run_libdoc(
+            ["--format", "XML", "cwdlib", str(tmpdir.join("fail.libspec"))], None
+        )
+        assert returncode != 0
+        assert "cwdlib" in output
+    finally:
+        pool.dispose()
+
+
+def test_libdoc_worker_unload_library_modules(tmpdir):
+    import sys
+    import types
+    from robotframework_ls.impl import _libdoc_worker
+
+    workspace = str(tmpdir.join("workspace"))
+    site_packages = os.path.join(workspace, ".venv", "site-packages")
+    other = str(tmpdir.join("other"))
+
+    module_files = {
+        "_test_unload_lib": os.path.join(workspace, "my_lib.py"),
+        "_test_unload_lib_helper": os.path.join(workspace, "sub", "helper.py"),
+        "_test_unload_venv_dep": os.path.join(site_packages, "dep.py"),
+        "_test_unload_other": os.path.join(other, "lazy.py"),
+    }
+    for name, filename in module_files.items():
+        module = types.ModuleType(name)
+        module.__file__ = filename
+        sys.modules[name] = module
+    try:
+        library_roots = _libdoc_worker._get_library_roots(
+            ["--format", "XML", "my_lib", "out.libspec"], workspace, set()
+        )
+        _libdoc_worker._unload_library_modules(
+            library_roots, [site_packages, other], set(module_files)
+        )
+
+        # Only the modules loaded from the library paths are unloaded.
+        assert "_test_unload_lib" not in sys.modules
+        assert "_test_unload_lib_helper" not in sys.modules
+        assert "_test_unload_venv_dep" in sys.modules
+        assert "_test_unload_other" in sys.modules
+    finally:
+        for name in module_files:
+            sys.modules.pop(name, None)
+
+
+def test_libspec_binary_cache(libspec_manager):
+    import time
+    from robotframework_ls.impl import robot_specbuilder
+    from robotframework_ls.impl.libspec_manager import _load_library_doc_and_mtime
+    from robotframework_ls.impl.libspec_binary_cache import (
+        load_binary_cache_version,
+        get_binary_cache_filename,
+    )
+
+    spec_filenames = [
+        lib_info.library_doc.filename
+        for lib_info in libspec_manager.iter_lib_info(builtin=True)
+    ]
+    assert spec_filenames
+
+    # Loading it through the LibspecManager must create the binary cache.
+    for spec_filename in spec_filenames:
+        _load_library_doc_and_mtime(libspec_manager, spec_filename)
+        assert os.path.exists(get_binary_cache_filename(libspec_manager, spec_filename))
+
+    def load_from_spec():
+        builder = robot_specbuilder.SpecDocBuilder()
+        return [builder.build(spec_filename) for spec_filename in spec_filenames]
+
+    def load_from_binary_cache():
+        ret = []
+        for spec_filename in spec_filenames:
+            libdoc_and_from_markdown = load_binary_cache_version(
+                libspec_manager, spec_filename, os.path.getmtime(spec_filename)
+            )
+            assert libdoc_and_from_markdown is not None
+            ret.append(libdoc_and_from_markdown[0])
+        return ret
+
+    for from_spec, from_binary_cache in zip(load_from_spec(), load_from_binary_cache()):
+        assert from_spec.to_dictionary() == from_binary_cache.to_dictionary()
+
+    def timed(func):
+        best = None
+        for _i in range(3):
+            initial_time = time.time()
+            func()
+            elapsed = time.time() - initial_time
+            if best is None or elapsed < best:
+                best = elapsed
+        return best
+
+    assert timed(load_from_binary_cache) < timed(load_from_spec)
+
+    # If the .libspec changes the binary cache is no longer used.
+    spec_filename = spec_filenames[0]
+    mtime = os.path.getmtime(spec_filename)
+    assert load_binary_cache_version(libspec_manager, spec_filename, mtime + 1) is None
+
+
+def test_libspec_binary_cache_docs_lazy(libspec_manager):
+    from robotframework_ls.impl.libspec_manager import _load_library_doc_and_mtime
+
+    # Note: use a library whose keywords have docs (the order isn't fixed).
+    lib_info = next(
+        lib_info
+        for lib_info in libspec_manager.iter_lib_info(builtin=True)
+        if lib_info.library_doc.name == "BuiltIn"
+    )
+    spec_filename = lib_info.library_doc.filename
+
+    # The first load creates the binary cache and the second one uses it
+    # (in both cases the docs are only decoded from the string table when
+    # first accessed and the file isn't kept open).
+    for _i in range(2):
+        library_doc, _mtime = _load_library_doc_and_mtime(
+            libspec_manager, spec_filename
+        )
+        assert isinstance(library_doc._strings._contents, bytes)
+        keyword = library_doc.keywords[0]
+        assert isinstance(keyword._doc, tuple)
+        assert isinstance(library_doc._doc, tuple)
+
+        doc = keyword.doc
+        assert doc
+        assert library_doc.doc
+
+        # Decoded only once.
+        assert isinstance(keyword._doc, str)
+        assert isinstance(library_doc._doc, str)
+        assert keyword.doc is doc
@@ -32,3 +32,323 @@ def test_libspec_markdown_conversion(cases, libspec_manager):
         libspec_manager, spec_filename, os.path.getmtime(spec_filename)
     )
     assert loaded is not None
+    conversion.dispose()
+
+
+def test_libspec_markdown_conversion_queue():
+    from robotframework_ls.impl.libspec_markdown_conversion import _ConversionQueue
+
+    queue = _ConversionQueue()
+    queue.put("a.libspec", "a.json")
+    queue.put("b.libspec", "b.json")
+    queue.put("a.libspec", "a.json")  # Already pending: not added again.
+    queue.put("c.libspec", "c.json")
+    queue.put("d.libspec", "d.json", prioritize=True)
+    queue.put("b.libspec", "b.json", prioritize=True)
+
+    # Prioritized ones first (the last one prioritized comes first).
+    assert queue.get_batch(10) == [("b.libspec", "b.json"), ("d.libspec", "d.json")]
+    assert queue.get_batch(1) == [("a.libspec", "a.json")]
+    assert queue.get_batch(10) == [("c.libspec", "c.json")]
+
+    queue.dispose()
+    assert queue.get_batch(10) is None
+
+
+def test_libspec_markdown_conversion_queue_in_flight():
+    import threading
+    from robotframework_ls.impl.libspec_markdown_conversion import _ConversionQueue
+
+    queue = _ConversionQueue()
+    queue.put("a.libspec", "a.json")
+    batch = queue.get_batch(10)
+    assert batch == [("a.libspec", "a.json")]
+
+    # Requested again while being converted: held back until it's done.
+    queue.put("a.libspec", "a.json", prioritize=True)
+    queue.put("b.libspec", "b.json")
+    assert queue.get_batch(10) == [("b.libspec", "b.json")]
+
+    batches = []
+    t = threading.Thread(target=lambda: batches.append(queue.get_batch(10)))
+    t.start()
+    t.join(0.2)
+    assert not batches
+
+    queue.mark_done(batch)
+    t.join(5)
+    assert batches == [[("a.libspec", "a.json")]]
+    queue.dispose()
+
+
+def test_libspec_markdown_conversion_queue_retry():
+    from robotframework_ls.impl.libspec_markdown_conversion import _ConversionQueue
+
+    queue = _ConversionQueue()
+    queue.put("a.libspec", "a.json")
+    queue.put("b.libspec", "b.json")
+    queue.put("c.libspec", "c.json")
+
+    batch = queue.get_batch(10)
+    assert batch == [
+        ("a.libspec", "a.json"),
+        ("b.libspec", "b.json"),
+        ("c.libspec", "c.json"),
+    ]
+    assert queue.retry(batch) == []
+
+    # Retried entries are converted alone.
+    assert queue.get_batch(10) == [("a.libspec", "a.json")]
+    assert queue.retry([("a.libspec", "a.json")]) == []
+    batch = queue.get_batch(10)
+    assert batch == [("b.libspec", "b.json")]
+    queue.mark_done(batch)
+    batch = queue.get_batch(10)
+    assert batch == [("c.libspec", "c.json")]
+    queue.mark_done(batch)
+
+    # Already retried MAX_RETRIES times: it's dropped.
+    assert queue.get_batch(10) == [("a.libspec", "a.json")]
+    assert queue.retry([("a.libspec", "a.json")]) == ["a.libspec"]
+
+    queue.put("d.libspec", "d.json")
+    assert queue.get_batch(10) == [("d.libspec", "d.json")]
+    queue.dispose()
+
+
+def test_libspec_markdown_conversion_worker_crash(monkeypatch):
+    from robotframework_ls.impl import libspec_markdown_conversion
+    from robotframework_ls.impl.libspec_markdown_conversion import (
+        _ConversionQueue,
+        _ConversionThread,
+        _ConversionWorkerError,
+    )
+    from robocorp_ls_core.basic import wait_for_condition
+
+    converted = []
+
+    class _CrashOnceWorker(object):
+        crashed = False
+
+        def is_alive(self):
+            return True
+
+        def convert(self, batch):
+            if not _CrashOnceWorker.crashed:
+                _CrashOnceWorker.crashed = True
+                raise _ConversionWorkerError("Worker crashed.")
+            converted.extend(spec_filename for spec_filename, _ in batch)
+            return [None] * len(batch)
+
+        def dispose(self):
+            pass
+
+    monkeypatch.setattr(
+        libspec_markdown_conversion, "_ConversionWorker", _CrashOnceWorker
+    )
+
+    queue = _ConversionQueue()
+    thread = _ConversionThread(queue)
+    thread.start()
+    try:
+        queue.put("a.libspec", "a.json")
+        queue.put("b.libspec", "b.json")
+
+        # The batch whose conversion crashed is converted again.
+        wait_for_condition(lambda: sorted(converted) == ["a.libspec", "b.libspec"])
+    finally:
+        queue.dispose()
+        thread.join(5)
+
+
+def _get_library_doc(libspec_manager, name, builtin=True):
+    for lib_info in libspec_manager.iter_lib_info(builtin=builtin):
+        if lib_info.library_doc.name == name:
+            return lib_info.library_doc
+    raise AssertionError(f"Unable to find library: {name}")
+
+
+def test_libspec_markdown_conversion_forwarded(libspec_manager):
+    from robotframework_ls.impl import libspec_markdown_conversion
+
+    notifications = []
+
+    class _Endpoint(object):
+        def notify(self, method, params):
+            notifications.append((method, params))
+
+    # i.e.: the libspec manager of an api which doesn't do the conversion.
+    assert libspec_manager.libspec_markdown_conversion is None
+    libspec_manager._endpoint = _Endpoint()
+    libspec_manager.MARKDOWN_RELOAD_CHECK_INTERVAL = 0
+
+    library_doc = _get_library_doc(libspec_manager, "Easter")
+    assert library_doc.doc_format != "markdown"
+    spec_filename = library_doc.filename
+
+    libspec_manager.schedule_conversion_to_markdown(spec_filename, prioritize=True)
+    libspec_manager.schedule_conversion_to_markdown(spec_filename, prioritize=True)
+    assert notifications == [
+        ("$/prioritizeMarkdownConversion", {"specFilename": spec_filename})
+    ]
+
+    # Still not converted.
+    assert _get_library_doc(libspec_manager, "Easter").doc_format != "markdown"
+
+    # Once converted (by the process which does the conversion) it's reloaded.
+    libspec_markdown_conversion._convert_to_markdown_if_needed(
+        spec_filename,
+        libspec_markdown_conversion._get_markdown_json_version_filename(
+            libspec_manager, spec_filename
+        ),
+    )
+    assert _get_library_doc(libspec_manager, "Easter").doc_format == "markdown"
+
+
+def test_libspec_markdown_conversion_forwarded_text_format(libspec_manager):
+    from robotframework_ls.impl import libspec_markdown_conversion
+
+    notifications = []
+
+    class _Endpoint(object):
+        def notify(self, method, params):
+            notifications.append((method, params))
+
+    libspec_manager._endpoint = _Endpoint()
+    libspec_manager.MARKDOWN_RELOAD_CHECK_INTERVAL = 0
+
+    # TEXT docs have no conversion to markdown.
+    spec_filename = os.path.join(libspec_manager.user_libspec_dir, "MyLib.libspec")
+    with open(spec_filename, "w", encoding="utf-8") as stream:
+        stream.write(
+            (_LIBSPEC_TEMPLATE % ("",)).replace('format="ROBOT"', 'format="TEXT"')
+        )
+    libspec_manager.synchronize_internal_libspec_folders()
+    assert (
+        _get_library_doc(libspec_manager, "MyLib", builtin=False).doc_format == "TEXT"
+    )
+
+    libspec_manager.schedule_conversion_to_markdown(spec_filename, prioritize=True)
+    assert len(notifications) == 1
+
+    libspec_markdown_conversion._convert_to_markdown_if_needed(
+        spec_filename,
+        libspec_markdown_conversion._get_markdown_json_version_filename(
+            libspec_manager, spec_filename
+        ),
+    )
+
+    # It's reloaded once and then it's no longer checked.
+    library_doc = _get_library_doc(libspec_manager, "MyLib", builtin=False)
+    assert library_doc.doc_format == "TEXT"
+    assert not libspec_manager._markdown_conversion_forwarded
+    assert _get_library_doc(libspec_manager, "MyLib", builtin=False) is library_doc
+
+
+def test_libspec_markdown_conversion_server_prioritize(tmpdir, remote_fs_observer):
+    from io import BytesIO
+    from robocorp_ls_core.basic import wait_for_condition
+    from robotframework_ls.impl.libspec_manager import LibspecManager
+    from robotframework_ls.server_api.server import RobotFrameworkServerApi
+
+    # i.e.: the libspec manager of the lint api (which does the conversion).
+    libspec_manager = LibspecManager(
+        user_libspec_dir=str(tmpdir.join("user_libspec")),
+        cache_libspec_dir=str(tmpdir.join("cache_libspec")),
+        observer=remote_fs_observer,
+        dir_cache_dir=str(tmpdir.join(".cache")),
+        pre_generate_libspecs=True,
+    )
+    api = RobotFrameworkServerApi(BytesIO(), BytesIO(), libspec_manager=libspec_manager)
+    try:
+        conversion = libspec_manager.libspec_markdown_conversion
+        assert conversion is not None
+
+        spec_filename = _get_library_doc(libspec_manager, "Easter").filename
+        target_json = conversion.get_markdown_json_version_filename(spec_filename)
+        api.m_prioritize_markdown_conversion(spec_filename=spec_filename)
+        wait_for_condition(lambda: os.path.exists(target_json))
+    finally:
+        libspec_manager.dispose()
+
+
+_LIBSPEC_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<keywordspec name="MyLib" type="LIBRARY" format="ROBOT" scope="GLOBAL" specversion="3" source="MyLib.py" lineno="1">
+<version/>
+<doc>Documentation for *MyLib*.</doc>
+<tags>
+</tags>
+<inits>
+</inits>
+<keywords>
+%s
+</keywords>
+<datatypes>
+</datatypes>
+</keywordspec>
+"""
+
+_KEYWORD_TEMPLATE = """<kw name="%(name)s" lineno="1">
+<arguments repr="">
+</arguments>
+<doc>%(doc)s</doc>
+<shortdoc/>
+</kw>"""
+
+
+def _write_libspec(spec_filename, docs):
+    keywords = "\n".join(
+        _KEYWORD_TEMPLATE % {"name": "Keyword %s" % i, "doc": doc}
+        for i, doc in enumerate(docs)
+    )
+    with open(spec_filename, "w", encoding="utf-8") as stream:
+        stream.write(_LIBSPEC_TEMPLATE % (keywords,))
+
+
+def test_libspec_markdown_conversion_incremental(tmpdir, monkeypatch):
+    from robotframework_ls import robot_to_markdown
+    from robotframework_ls.impl import libspec_markdown_conversion
+    from robotframework_ls.impl import robot_specbuilder
+
+    converted = []
+    original_convert = robot_to_markdown.convert
+
+    def convert(doc):
+        converted.append(doc)
+        return original_convert(doc)
+
+    monkeypatch.setattr(robot_to_markdown, "convert", convert)
+
+    spec_filename = str(tmpdir.join("MyLib.libspec"))
+    target_json = str(tmpdir.join("json", "MyLib.json"))
+
+    _write_libspec(spec_filename, ["Doc *one*.", "Doc *two*.", "Doc *three*."])
+    libspec_markdown_conversion._convert_to_markdown_if_needed(
+        spec_filename, target_json
+    )
+    assert sorted(converted) == sorted(
+        ["Documentation for *MyLib*.", "Doc *one*.", "Doc *two*.", "Doc *three*."]
+    )
+
+    del converted[:]
+    _write_libspec(spec_filename, ["Doc *one*.", "Doc *changed*.", "Doc *three*."])
+    mtime = os.path.getmtime(spec_filename) + 10
+    os.utime(spec_filename, (mtime, mtime))
+    libspec_markdown_conversion._convert_to_markdown_if_needed(
+        spec_filename, target_json
+    )
+
+    # Only the doc which changed had to be converted again.
+    assert converted == ["Doc *changed*."]
+
+    with open(target_json, "r", encoding="utf-8") as stream:
+        stream.readline()  # mtime line
+        library_doc = robot_specbuilder.JsonDocBuilder().build_from_stream(
+            spec_filename, stream
+        )
+    assert library_doc.doc_format == "markdown"
+    assert [kw.doc.strip() for kw in library_doc.keywords] == [
+        "Doc **one**.",
+        "Doc **changed**.",
+        "Doc **three**.",
+    ]
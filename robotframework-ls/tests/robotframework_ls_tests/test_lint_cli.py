@@ -0,0 +1,219 @@
+import json
+import os
+
+import pytest
+
+
+def _write(path, contents):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as stream:
+        stream.write(contents)
+
+
+@pytest.fixture
+def lint_root(tmpdir):
+    root = str(tmpdir.join("ws"))
+    _write(
+        os.path.join(root, "case.robot"),
+        """
+*** Settings ***
+Resource    sub/res.resource
+
+*** Test Cases ***
+Test
+    My Keyword
+    Undefined Keyword
+""",
+    )
+    _write(
+        os.path.join(root, "sub", "res.resource"),
+        """
+*** Keywords ***
+My Keyword
+    Log    Something
+""",
+    )
+    _write(
+        os.path.join(root, "other.robot"),
+        """
+*** Test Cases ***
+Test
+    Log    Something
+""",
+    )
+    return root
+
+
+def _get_messages(path_to_diagnostics, path):
+    return [d["message"] for d in path_to_diagnostics[path]]
+
+
+def test_lint_cli_incremental(lint_root, tmpdir):
+    from robotframework_ls import lint_cli
+
+    state_file = str(tmpdir.join("state.json"))
+    case = os.path.join(lint_root, "case.robot")
+    res = os.path.join(lint_root, "sub", "res.resource")
+    other = os.path.join(lint_root, "other.robot")
+
+    path_to_diagnostics, analyzed = lint_cli.lint(
+        [lint_root], lint_root, {}, state_file=state_file
+    )
+    assert sorted(analyzed) == sorted([case, res, other])
+    assert _get_messages(path_to_diagnostics, case) == [
+        "Undefined keyword: Undefined Keyword."
+    ]
+    assert path_to_diagnostics[res] == []
+    assert path_to_diagnostics[other] == []
+
+    # Nothing changed: nothing is analyzed again.
+    path_to_diagnostics2, analyzed = lint_cli.lint(
+        [lint_root], lint_root, {}, state_file=state_file
+    )
+    assert analyzed == []
+    assert path_to_diagnostics2 == path_to_diagnostics
+
+    # Changing a resource must re-analyze the files which depend on it.
+    _write(
+        res,
+        """
+*** Keywords ***
+My Keyword
+    Log    Something
+
+Undefined Keyword
+    Log    Something
+""",
+    )
+    stat = os.stat(res)
+    os.utime(res, (stat.st_atime, stat.st_mtime + 5))
+
+    path_to_diagnostics, analyzed = lint_cli.lint(
+        [lint_root], lint_root, {}, state_file=state_file
+    )
+    assert sorted(analyzed) == sorted([case, res])
+    assert path_to_diagnostics[case] == []
+
+
+def test_lint_cli_incremental_robocop_config(lint_root, tmpdir):
+    from robotframework_ls import lint_cli
+
+    state_file = str(tmpdir.join("state.json"))
+    res = os.path.join(lint_root, "sub", "res.resource")
+    settings = {"robot.lint.robocop.enabled": True}
+
+    _path_to_diagnostics, analyzed = lint_cli.lint(
+        [lint_root], lint_root, settings, state_file=state_file
+    )
+    assert len(analyzed) == 3
+
+    _path_to_diagnostics, analyzed = lint_cli.lint(
+        [lint_root], lint_root, settings, state_file=state_file
+    )
+    assert analyzed == []
+
+    # A new Robocop config only affects the files in its directory.
+    _write(os.path.join(lint_root, "sub", ".robocop"), "--exclude 0202\n")
+    _path_to_diagnostics, analyzed = lint_cli.lint(
+        [lint_root], lint_root, settings, state_file=state_file
+    )
+    assert analyzed == [res]
+
+
+def test_lint_cli_main(lint_root, tmpdir):
+    from robotframework_ls import lint_cli
+
+    output = str(tmpdir.join("output.sarif"))
+    exit_code = lint_cli.main(
+        [lint_root, "--root", lint_root, "--format", "sarif", "--output", output]
+    )
+    assert exit_code == 1
+
+    with open(output, "r", encoding="utf-8") as stream:
+        sarif = json.load(stream)
+    results = sarif["runs"][0]["results"]
+    assert len(results) == 1
+    result = results[0]
+    assert result["ruleId"] == "undefined_keyword"
+    assert result["level"] == "error"
+    region = result["locations"][0]["physicalLocation"]["region"]
+    assert region["startLine"] == 8
+    assert region["startColumn"] == 5
+
+    exit_code = lint_cli.main(
+        [
+            os.path.join(lint_root, "other.robot"),
+            "--root",
+            lint_root,
+            "--output",
+            output,
+        ]
+    )
+    assert exit_code == 0
+
+
+def test_lint_cli_process_pool(tmpdir):
+    from robotframework_ls import lint_cli
+
+    root = str(tmpdir.join("ws"))
+    expected = {}
+    for i in range(lint_cli._BATCH_SIZE + 5):
+        path = os.path.join(root, "dir%s" % (i % 3,), "case%s.robot" % (i,))
+        _write(
+            path,
+            """
+*** Test Cases ***
+Test
+    Undefined Keyword %s
+"""
+            % (i,),
+        )
+        expected[path] = ["Undefined keyword: Undefined Keyword %s." % (i,)]
+
+    path_to_diagnostics, analyzed = lint_cli.lint([root], root, {}, jobs=2)
+    assert len(analyzed) == len(expected)
+    assert (
+        dict((path, _get_messages(path_to_diagnostics, path)) for path in expected)
+        == expected
+    )
+
+
+def test_lint_cli_incremental_library_keyword_sources(tmpdir):
+    from robotframework_ls import lint_cli
+
+    root = str(tmpdir.join("ws"))
+    case = os.path.join(root, "case.robot")
+    helper = os.path.join(root, "helper.py")
+    _write(
+        case,
+        """
+*** Settings ***
+Library    my_lib.py
+
+*** Test Cases ***
+Test
+    Helper Keyword
+""",
+    )
+    _write(os.path.join(root, "my_lib.py"), "from helper import helper_keyword\n")
+    _write(helper, "def helper_keyword():\n    pass\n")
+
+    state_file = str(tmpdir.join("state.json"))
+    path_to_diagnostics, analyzed = lint_cli.lint(
+        [root], root, {}, state_file=state_file
+    )
+    assert analyzed == [case]
+    assert path_to_diagnostics[case] == []
+
+    # The keyword is defined in a module imported by the library.
+    _write(helper, "def helper_keyword(arg):\n    pass\n")
+    stat = os.stat(helper)
+    os.utime(helper, (stat.st_atime, stat.st_mtime + 5))
+
+    path_to_diagnostics, analyzed = lint_cli.lint(
+        [root], root, {}, state_file=state_file
+    )
+    assert analyzed == [case]
+    assert _get_messages(path_to_diagnostics, case) == [
+        "Mandatory argument missing: arg"
+    ]
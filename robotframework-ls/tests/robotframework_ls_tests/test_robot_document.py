@@ -1,3 +1,6 @@
+import os
+
+
 def test_get_ast():
     from robotframework_ls.impl.robot_workspace import RobotDocument
 
@@ -67,3 +70,97 @@ def test_document_from_file(workspace, workspace_dir, cases):
 
     # The old one in memory doesn't change after the file is removed
     assert cached_doc3.source == "new contents"
+
+
+def test_get_ast_incremental(workspace, workspace_dir):
+    import io
+    from robocorp_ls_core import uris
+    from robocorp_ls_core.lsp import TextDocumentItem
+    from robocorp_ls_core.lsp import TextDocumentContentChangeEvent
+    from robotframework_ls.impl import ast_utils
+
+    def dump(ast):
+        stream = io.StringIO()
+        ast_utils.print_ast(ast, stream)
+        return stream.getvalue()
+
+    os.makedirs(workspace_dir)
+    workspace.set_root(workspace_dir)
+    ws = workspace.ws
+
+    uri = uris.from_fs_path(os.path.join(workspace_dir, "my.robot"))
+    ws.put_document(
+        TextDocumentItem(
+            uri,
+            text="""*** Settings ***
+Library    Collections
+
+*** Test Cases ***
+Test 1
+    Log    1
+
+Test 2
+    Log    2
+
+*** Keywords ***
+My Keyword
+    Log    3
+""",
+        )
+    )
+    doc = ws.get_document(uri, accept_from_file=False)
+    contents = [doc.source]
+    initial_ast = doc.get_ast()
+    keywords_section = initial_ast.sections[-1]
+
+    def change(old, new):
+        doc = ws.get_document(uri, accept_from_file=False)
+        offset = doc.source.index(old)
+        line, col = doc.offset_to_line_col(offset)
+        end_line, end_col = doc.offset_to_line_col(offset + len(old))
+        ws.update_document(
+            TextDocumentItem(uri),
+            TextDocumentContentChangeEvent(
+                {
+                    "start": {"line": line, "character": col},
+                    "end": {"line": end_line, "character": end_col},
+                },
+                None,
+                new,
+            ),
+        )
+        doc = ws.get_document(uri, accept_from_file=False)
+        assert doc.source == contents[0].replace(old, new, 1)
+        contents[0] = doc.source
+
+        ast = doc.get_ast()
+        assert dump(ast) == dump(doc.generate_ast_uncached())
+        assert ast.__localization_info__ is not None
+        for _stack, node in ast_utils.iter_all_nodes_recursive(ast):
+            assert node.__localization_info__ is not None
+        return ast
+
+    # Same number of lines: the sections/blocks not changed are reused.
+    ast = change("Log    1", "Log    11")
+    assert ast.sections[-1] is keywords_section
+    assert ast.sections[1].body[1] is initial_ast.sections[1].body[1]
+    assert ast.sections[1].body[0] is not initial_ast.sections[1].body[0]
+
+    # New lines: the nodes which follow have the lines fixed.
+    ast = change("    Log    11\n", "    Log    11\n    Log    new\n")
+    assert ast.sections[-1] is not keywords_section
+
+    # New test
+    change("Test 2\n", "Test 3\n    Log    3\n\nTest 2\n")
+
+    # Removed lines
+    change("Test 1\n    Log    11\n    Log    new\n\n", "")
+
+    # Change in the settings (full parse).
+    change("Library", "Test Template    My Keyword\nLibrary")
+
+    # Change in keyword.
+    ast = change("My Keyword\n    Log    3", "My Keyword\n    No Operation")
+
+    keywords = [k.node.name for k in ast_utils.iter_keywords(ast)]
+    assert keywords == ["My Keyword"]
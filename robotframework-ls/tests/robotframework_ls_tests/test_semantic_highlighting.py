@@ -1392,3 +1392,99 @@ Test case 1
             ("foo", "argumentValue"),
         ],
     )
+
+
+def test_semantic_tokens_range(workspace):
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.semantic_tokens import semantic_tokens_range
+
+    doc = _setup_doc(
+        workspace,
+        """
+*** Test Cases ***
+Test case 1
+    Log    foo
+
+Test case 2
+    Log    bar
+
+*** Keywords ***
+My keyword
+    No operation
+""",
+    )
+    context = CompletionContext(doc, workspace=workspace.ws)
+    semantic_tokens = semantic_tokens_range(
+        context,
+        {"start": {"line": 5, "character": 0}, "end": {"line": 6, "character": 0}},
+    )
+    check(
+        (semantic_tokens, doc),
+        [
+            ("Test case 2", "testCaseName"),
+            ("Log", "keywordNameCall"),
+            ("bar", "argumentValue"),
+        ],
+    )
+
+
+def test_semantic_tokens_cache_delta(workspace, monkeypatch):
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl import semantic_tokens
+    from robotframework_ls.impl.semantic_tokens import SemanticTokensCache
+    from robotframework_ls.impl.semantic_tokens import semantic_tokens_full
+
+    tokenized = []
+    original_compute_unit_tokens = semantic_tokens._compute_unit_tokens
+
+    def _compute_unit_tokens(stack, node, *args, **kwargs):
+        tokenized.append(node.__class__.__name__)
+        return original_compute_unit_tokens(stack, node, *args, **kwargs)
+
+    monkeypatch.setattr(semantic_tokens, "_compute_unit_tokens", _compute_unit_tokens)
+
+    doc = _setup_doc(
+        workspace,
+        """
+*** Test Cases ***
+Test case 1
+    Log    foo
+
+Test case 2
+    Log    bar
+
+*** Keywords ***
+My keyword
+    No operation
+""",
+    )
+    cache = SemanticTokensCache()
+    result = cache.semantic_tokens_full(CompletionContext(doc, workspace=workspace.ws))
+    assert result["resultId"]
+    assert [x for x in tokenized if x != "EmptyLine"] == [
+        "SectionHeader",
+        "TestCase",
+        "TestCase",
+        "SectionHeader",
+        "Keyword",
+    ]
+    del tokenized[:]
+
+    doc.source = doc.source.replace("Log    bar", "Log    bar    another")
+    delta = cache.semantic_tokens_full_delta(
+        CompletionContext(doc, workspace=workspace.ws), result["resultId"]
+    )
+    # Only the changed test is tokenized again.
+    assert tokenized == ["TestCase"]
+    assert delta["resultId"] != result["resultId"]
+
+    data = list(result["data"])
+    for edit in delta["edits"]:
+        data[edit["start"] : edit["start"] + edit["deleteCount"]] = edit["data"]
+    assert data == semantic_tokens_full(CompletionContext(doc, workspace=workspace.ws))
+
+    # An unknown previous id provides all the tokens.
+    full = cache.semantic_tokens_full_delta(
+        CompletionContext(doc, workspace=workspace.ws), "unknown"
+    )
+    assert full["data"] == data
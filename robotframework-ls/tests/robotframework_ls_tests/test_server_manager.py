@@ -9,6 +9,7 @@ from robotframework_ls.ep_resolve_interpreter import (
     DefaultInterpreterInfo,
 )
 import sys
+import threading
 from robocorp_ls_core.constants import NULL
 
 
@@ -44,6 +45,14 @@ def pm():
 class _DummyLanguageServer(object):
     def __init__(self):
         self._fs_observer = None
+        self.prioritized_markdown_conversions = []
+        self.prioritized_markdown_conversion_event = threading.Event()
+
+    def prioritize_markdown_conversion(self, markdown_conversion_api, spec_filename):
+        self.prioritized_markdown_conversions.append(
+            (markdown_conversion_api, spec_filename)
+        )
+        self.prioritized_markdown_conversion_event.set()
 
     def get_remote_fs_observer_port(self):
         if self._fs_observer is None:
@@ -171,3 +180,57 @@ def test_server_manager_dont_forward_setting_unless_changed(
         "textDocument/didOpen": 1,
         "completeAll": 3,
     }
+
+
+def test_server_manager_prioritize_markdown_conversion(
+    server_manager, dummy_language_server, workspace, workspace_dir
+) -> None:
+    import os
+    from robocorp_ls_core import uris
+    from robocorp_ls_core.config import Config
+
+    os.makedirs(workspace_dir, exist_ok=True)
+    with open(os.path.join(workspace_dir, "my_library.py"), "w") as stream:
+        stream.write(
+            '''
+def my_keyword():
+    """
+    Some *documentation* for the keyword.
+    """
+'''
+        )
+    workspace.set_root(workspace_dir)
+    server_manager.set_workspace(workspace.ws)
+    server_manager.set_config(Config())
+
+    api = server_manager._get_regular_api("")
+    client = api.get_robotframework_api_client()
+    assert client is not None
+
+    uri = uris.from_fs_path(os.path.join(workspace_dir, "case.robot"))
+    client.open(
+        uri,
+        1,
+        "*** Settings ***\n"
+        "Library    my_library.py\n"
+        "\n"
+        "*** Test Cases ***\n"
+        "Test\n"
+        "    My Keyword\n",
+    )
+    message_matcher = client.request_hover(uri, 5, 8)
+    assert message_matcher is not None
+    assert message_matcher.event.wait(30)
+    assert "documentation" in str(message_matcher.msg)
+
+    # The api which shows the docs asks the lint api (which does the
+    # conversion to markdown) to prioritize the library.
+    assert dummy_language_server.prioritized_markdown_conversion_event.wait(10)
+    (
+        markdown_conversion_api,
+        spec_filename,
+    ) = dummy_language_server.prioritized_markdown_conversions[0]
+    assert markdown_conversion_api is server_manager._get_lint_api("")
+    assert spec_filename.endswith(".libspec")
+    with open(spec_filename, "r", encoding="utf-8") as stream:
+        assert 'name="my_library"' in stream.read()
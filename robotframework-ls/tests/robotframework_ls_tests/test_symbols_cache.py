@@ -42,6 +42,8 @@ def test_symbols_cache_inverse_index(workspace, libspec_manager):
     from robotframework_ls.impl.completion_context import CompletionContext
 
     workspace.set_root("case2", libspec_manager=libspec_manager, index_workspace=True)
+    # A full reindex is requested again if the initial scan is still running.
+    workspace.ws.wait_for_check_done(5)
     doc = workspace.put_doc("case2.robot")
     doc.source = """
 *** Test Cases ***
@@ -78,26 +80,82 @@ Some Keyword
     reverse_index.synchronize(context)
     assert reverse_index._reindex_count == 1
 
+    # Changes are applied incrementally (without reindexing everything).
     symbols_cache_reverse_index.notify_uri_changed("foo")
     reverse_index.synchronize(context)
+    assert reverse_index._reindex_count == 1
+    assert reverse_index._incremental_update_count == 2
+
+    reverse_index.synchronize(context)
+    assert reverse_index._incremental_update_count == 2
+
+    symbols_cache_reverse_index.request_full_reindex()
+    reverse_index.synchronize(context)
     assert reverse_index._reindex_count == 2
 
     reverse_index.synchronize(context)
     assert reverse_index._reindex_count == 2
 
-    symbols_cache_reverse_index.notify_uri_changed("foo")
+    for i in range(reverse_index.MAX_URIS_CHANGED_FOR_INCREMENTAL_UPDATE + 1):
+        symbols_cache_reverse_index.notify_uri_changed(f"foo{i}")
     reverse_index.synchronize(context)
     assert reverse_index._reindex_count == 3
+    assert reverse_index._incremental_update_count == 2
+    assert reverse_index.has_global_variable("someglobalvar")
 
-    symbols_cache_reverse_index.request_full_reindex()
-    reverse_index.synchronize(context)
-    assert reverse_index._reindex_count == 4
 
-    reverse_index.synchronize(context)
-    assert reverse_index._reindex_count == 4
+def test_symbols_cache_inverse_index_keyword_usages(workspace, libspec_manager):
+    from robocorp_ls_core.config import Config
+    from robotframework_ls.impl.completion_context import CompletionContext
+    from robotframework_ls.impl.protocols import KeywordUsageLocation
 
-    reverse_index.synchronize(context)
-    assert reverse_index._reindex_count == 4
+    workspace.set_root("case2", libspec_manager=libspec_manager, index_workspace=True)
+    # A full reindex is requested again if the initial scan is still running.
+    workspace.ws.wait_for_check_done(5)
+    doc = workspace.put_doc("case2.robot")
+    doc.source = """
+*** Test Cases ***
+Some Test Case
+    Some Keyword    ${SOME_GLOBAL_VAR}
+    case2a.Some Keyword
+"""
+
+    doc2 = workspace.put_doc("case2a.robot")
+    doc2.source = """
+*** Keywords ***
+Some Keyword
+    Set Global Variable    ${some globalvar}
+"""
+
+    context = CompletionContext(doc, workspace=workspace.ws, config=Config())
+    reverse_index = context.obtain_symbols_cache_reverse_index()
+    assert reverse_index is not None
+
+    assert reverse_index.get_keyword_usages("somekeyword") == {
+        doc.uri: [
+            KeywordUsageLocation(3, 4, 4, 16, "Some Keyword"),
+            KeywordUsageLocation(4, 4, 11, 23, "case2a.Some Keyword"),
+        ]
+    }
+    assert reverse_index.get_variable_reference_uris("someglobalvar") == {
+        doc.uri,
+        doc2.uri,
+    }
+
+    # Change the document (only that uri should be reindexed).
+    doc.source = """
+*** Test Cases ***
+Some Test Case
+    Log    Nothing
+"""
+    workspace.ws.workspace_indexer.on_updated_document(doc.uri)
+    context = CompletionContext(doc, workspace=workspace.ws, config=Config())
+    reverse_index = context.obtain_symbols_cache_reverse_index()
+    assert reverse_index is not None
+    assert reverse_index._reindex_count == 1
+    assert reverse_index.get_keyword_usages("somekeyword") == {}
+    assert reverse_index.get_variable_reference_uris("someglobalvar") == {doc2.uri}
+    assert doc.uri in reverse_index.get_keyword_usages("log")
 
 
 def test_symbols_cache_reindex_on_demand(workspace, libspec_manager):
@@ -171,3 +229,122 @@ New Keyword
     assert new_uri_to_cache[doc2.uri].has_keyword_usage(
         normalize_robot_name("new keyword")
     )
+
+
+def test_symbols_cache_persisted(workspace, libspec_manager, workspace_dir):
+    import os
+    from robotframework_ls.impl._symbols_cache_store import _SymbolsCacheFromStore
+    from robotframework_ls.impl.text_utilities import normalize_robot_name
+
+    os.makedirs(workspace_dir)
+    with open(os.path.join(workspace_dir, "my.robot"), "w") as stream:
+        stream.write(
+            """
+*** Test Cases ***
+My Test
+    Log    ${SOME_GLOBAL_VAR}
+
+*** Keywords ***
+Some Keyword
+    [Documentation]    Some docs.
+    Set Global Variable    ${some globalvar}
+"""
+        )
+
+    def collect():
+        workspace.set_absolute_path_root(workspace_dir, libspec_manager=libspec_manager)
+        workspace.ws.wait_for_check_done(5)
+        workspace.ws.setup_workspace_indexer()
+        workspace_indexer = workspace.ws.workspace_indexer
+        uri_to_cache = dict(workspace_indexer.iter_uri_and_symbols_cache())
+        assert len(uri_to_cache) == 1
+        return workspace_indexer, list(uri_to_cache.values())[0]
+
+    workspace_indexer, symbols_cache = collect()
+    assert not isinstance(symbols_cache, _SymbolsCacheFromStore)
+    # Note: the indexer thread may have already saved it (in which case there
+    # are no changes to be saved anymore).
+    workspace_indexer.save_symbols_cache_store()
+    assert os.path.exists(workspace_indexer._symbols_cache_store.filename)
+    workspace.ws.dispose()
+
+    # A new workspace must load it from the disk.
+    workspace_indexer, from_store = collect()
+    assert isinstance(from_store, _SymbolsCacheFromStore)
+    assert from_store.get_json_list() == symbols_cache.get_json_list()
+    assert from_store.get_test_info() == symbols_cache.get_test_info()
+    assert from_store.has_keyword_usage(normalize_robot_name("Log"))
+    assert dict(from_store.iter_keyword_usage_locations()) == dict(
+        symbols_cache.iter_keyword_usage_locations()
+    )
+    assert from_store.has_global_variable_definition("someglobalvar")
+    assert from_store.has_variable_reference("someglobalvar")
+    keyword_infos = list(from_store.iter_keyword_info())
+    assert [k.name for k in keyword_infos] == ["Some Keyword"]
+    assert "Some docs." in keyword_infos[0].get_documentation()["value"]
+    assert not workspace_indexer.save_symbols_cache_store()
+    workspace.ws.dispose()
+
+    # If the file changes it must be recomputed.
+    with open(os.path.join(workspace_dir, "my.robot"), "a") as stream:
+        stream.write("\nAnother Keyword\n    No Operation\n")
+
+    workspace_indexer, symbols_cache = collect()
+    assert not isinstance(symbols_cache, _SymbolsCacheFromStore)
+    assert len(symbols_cache.get_json_list()) == 2
+    workspace.ws.dispose()
+
+
+def test_symbols_cache_process_pool(
+    workspace, libspec_manager, workspace_dir, monkeypatch
+):
+    import os
+    from robotframework_ls.impl._symbols_cache_pool import ENV_INDEXING_PROCESSES
+    from robotframework_ls.impl._symbols_cache_store import _SymbolsCacheFromStore
+
+    os.makedirs(workspace_dir)
+    for i in range(5):
+        with open(os.path.join(workspace_dir, "my%s.robot" % (i,)), "w") as stream:
+            stream.write(
+                f"""
+*** Test Cases ***
+My Test {i}
+    Keyword {i}
+
+*** Keywords ***
+Keyword {i}
+    Set Global Variable    ${{var{i}}}
+"""
+            )
+
+    def collect():
+        workspace.set_absolute_path_root(workspace_dir, libspec_manager=libspec_manager)
+        workspace.ws.wait_for_check_done(5)
+        workspace.ws.setup_workspace_indexer()
+        workspace_indexer = workspace.ws.workspace_indexer
+        # Don't use the contents persisted.
+        workspace_indexer._symbols_cache_store = None
+        uri_to_cache = dict(workspace_indexer.iter_uri_and_symbols_cache())
+        workspace.ws.dispose()
+        return uri_to_cache
+
+    in_process = collect()
+
+    monkeypatch.setenv(ENV_INDEXING_PROCESSES, "2")
+    in_pool = collect()
+
+    assert len(in_pool) == 5
+    assert set(in_pool.keys()) == set(in_process.keys())
+    for uri, symbols_cache in in_pool.items():
+        expected = in_process[uri]
+        assert isinstance(symbols_cache, _SymbolsCacheFromStore)
+        assert symbols_cache.get_json_list() == expected.get_json_list()
+        assert symbols_cache.get_test_info() == expected.get_test_info()
+        assert symbols_cache._keywords_used == expected._keywords_used
+        assert dict(symbols_cache.iter_keyword_usage_locations()) == dict(
+            expected.iter_keyword_usage_locations()
+        )
+        assert (
+            symbols_cache._global_variables_defined
+            == expected._global_variables_defined
+        )
@@ -51,3 +51,95 @@ def test_virtual_fs(tmpdir, remote_fs_observer):
     finally:
         virtual_fs.dispose()
         fs_observer.dispose()
+
+
+def test_virtual_fs_snapshot(tmpdir, remote_fs_observer, monkeypatch):
+    from robocorp_ls_core.workspace import _VirtualFS
+    import os
+    import time
+
+    root = tmpdir.join("root")
+    root.mkdir()
+    root.join("dir1").mkdir()
+    root.join("dir1").join("my1.py").write_text("foo", encoding="utf-8")
+    root.join("dir2").mkdir()
+    root.join("dir2").join("my2.py").write_text("foo", encoding="utf-8")
+    root.join("dir2").join("ignored.txt").write_text("foo", encoding="utf-8")
+    snapshot_dir = str(tmpdir.join("snapshot"))
+
+    # Directories changed too recently aren't trusted in the snapshot.
+    past = time.time() - 100
+    for d in (root, root.join("dir1"), root.join("dir2")):
+        os.utime(str(d), (past, past))
+
+    def create_and_check(expected_basenames):
+        virtual_fs = _VirtualFS(
+            str(root),
+            (".py",),
+            fs_observer=remote_fs_observer,
+            snapshot_dir=snapshot_dir,
+        )
+        try:
+            assert virtual_fs._virtual_fsthread.first_check_done.wait(5)
+            found = list(virtual_fs._iter_all_doc_uris((".py",)))
+            assert set(os.path.basename(x) for x in found) == set(expected_basenames)
+        finally:
+            virtual_fs.dispose()
+
+    create_and_check(["my1.py", "my2.py"])
+    assert len(os.listdir(snapshot_dir)) == 1
+
+    # Change dir1 (and track which directories are listed afterwards).
+    root.join("dir1").join("my3.py").write_text("foo", encoding="utf-8")
+    os.utime(str(root.join("dir1")), (past + 10, past + 10))
+
+    listed = []
+    original_scandir = os.scandir
+
+    def scandir(path):
+        listed.append(os.path.basename(path))
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    create_and_check(["my1.py", "my2.py", "my3.py"])
+    assert listed == ["dir1"]
+
+
+def test_virtual_fs_subtree_changed(tmpdir):
+    from robocorp_ls_core.workspace import _VirtualFS
+    from robocorp_ls_core.watchdog_wrapper import create_observer
+    from robocorp_ls_core.watchdog_wrapper import ChangesBatch
+    from robocorp_ls_core.basic import wait_for_condition
+    import os
+
+    root = tmpdir.join("root")
+    root.mkdir()
+    root.join("dir1").mkdir()
+    root.join("dir1").join("my1.py").write_text("foo", encoding="utf-8")
+
+    # Changes are notified manually.
+    fs_observer = create_observer("dummy", None)
+    virtual_fs = _VirtualFS(str(root), (".py",), fs_observer=fs_observer)
+    try:
+        assert virtual_fs._virtual_fsthread.first_check_done.wait(5)
+        batches = []
+        virtual_fs.on_files_changed.register(batches.append)
+
+        root.join("dir1").join("my1.py").remove()
+        root.join("dir1").join("sub").mkdir()
+        root.join("dir1").join("sub").join("my2.py").write_text("foo", encoding="utf-8")
+
+        # When too many files change only the subtree is reported.
+        subtree = str(root.join("dir1"))
+        virtual_fs._virtual_fsthread._on_changes(ChangesBatch((), (subtree,)))
+
+        def check():
+            found = list(virtual_fs._iter_all_doc_uris((".py",)))
+            return set(os.path.basename(x) for x in found) == {"my2.py"}
+
+        wait_for_condition(check)
+        wait_for_condition(lambda: len(batches) == 1)
+        assert batches[0].subtrees == (subtree,)
+    finally:
+        virtual_fs.dispose()
+        fs_observer.dispose()